@@ -0,0 +1,249 @@
+"""
+Cold-storage archive of audit history.
+
+Closed months (or any date range) of ``audit_logs`` are exported to
+append-only segment files under AUDIT_ARCHIVE_DIR:
+
+  audit-20270101-20270201.ndjson.gz   one gzip member per UTC day, NDJSON rows
+  audit-20270101-20270201.idx.json    per-day byte offset/length, row count,
+                                      user ids and UPL-sensitive user ids
+
+Because every day is its own gzip member, a reader seeks straight to the days
+the index says a user touched and decompresses only those, so "all
+UPL-sensitive actions for user X in 2027" reads a few kilobytes per segment
+instead of re-importing years of history. Segments are never rewritten;
+exporting an overlapping range is refused.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, time
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+
+from .models import AuditLog
+
+INDEX_VERSION = 1
+
+_EXPORT_FIELDS = (
+    "id",
+    "user_id",
+    "action",
+    "resource_type",
+    "resource_id",
+    "upl_sensitive",
+    "timestamp",
+    "ip_address",
+    "user_agent",
+    "details",
+)
+
+
+class ArchiveError(Exception):
+    """Raised when a segment cannot be written or fails verification."""
+
+
+@dataclass
+class DayEntry:
+    day: str
+    offset: int
+    length: int
+    rows: int
+    users: list[int] = field(default_factory=list)
+    upl_users: list[int] = field(default_factory=list)
+
+
+@dataclass
+class Segment:
+    data_path: Path
+    start: date
+    end: date  # exclusive
+    rows: int
+    days: list[DayEntry]
+
+    @property
+    def index_path(self) -> Path:
+        return _index_path(self.data_path)
+
+
+def archive_dir() -> Path:
+    return Path(settings.AUDIT_ARCHIVE_DIR)
+
+
+def segment_paths(start: date, end: date, directory: Path | None = None) -> tuple[Path, Path]:
+    base = (directory or archive_dir()) / f"audit-{start:%Y%m%d}-{end:%Y%m%d}"
+    return base.with_name(base.name + ".ndjson.gz"), base.with_name(base.name + ".idx.json")
+
+
+def _index_path(data_path: Path) -> Path:
+    return data_path.with_name(data_path.name.removesuffix(".ndjson.gz") + ".idx.json")
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+def export_range(start: date, end: date, directory: Path | None = None) -> Segment:
+    """
+    Stream audit rows with start <= timestamp < end (UTC days) into a new segment.
+
+    Rows are read with a server-side iterator and written one gzip member per
+    day, so memory stays flat however large the range is.
+    """
+    if end <= start:
+        raise ArchiveError("end must be after start")
+    directory = directory or archive_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    for existing in list_segments(directory):
+        if existing.start < end and start < existing.end:
+            raise ArchiveError(f"{existing.data_path.name} already covers part of this range")
+
+    data_path, index_path = segment_paths(start, end, directory)
+    tmp_data = data_path.with_name(data_path.name + ".tmp")
+    rows = (
+        AuditLog.objects.filter(timestamp__gte=_day_start(start), timestamp__lt=_day_start(end))
+        .order_by("timestamp", "id")
+        .values(*_EXPORT_FIELDS)
+        .iterator(chunk_size=2000)
+    )
+
+    days: list[DayEntry] = []
+    total = 0
+    digest = hashlib.sha256()
+    with open(tmp_data, "wb") as raw:
+        current: DayEntry | None = None
+        member: gzip.GzipFile | None = None
+        users: set[int] = set()
+        upl_users: set[int] = set()
+
+        def close_member() -> None:
+            member.close()
+            current.length = raw.tell() - current.offset
+            current.users, current.upl_users = sorted(users), sorted(upl_users)
+            days.append(current)
+
+        for row in rows:
+            day = row["timestamp"].astimezone(UTC).date().isoformat()
+            if current is None or current.day != day:
+                if current is not None:
+                    close_member()
+                current = DayEntry(day=day, offset=raw.tell(), length=0, rows=0)
+                member = gzip.GzipFile(fileobj=raw, mode="wb", mtime=0)
+                users, upl_users = set(), set()
+            line = (json.dumps(_serialize(row), separators=(",", ":")) + "\n").encode()
+            member.write(line)
+            digest.update(line)
+            current.rows += 1
+            total += 1
+            if row["user_id"] is not None:
+                users.add(row["user_id"])
+                if row["upl_sensitive"]:
+                    upl_users.add(row["user_id"])
+        if current is not None:
+            close_member()
+        raw.flush()
+        os.fsync(raw.fileno())
+
+    index = {
+        "version": INDEX_VERSION,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "rows": total,
+        "sha256": digest.hexdigest(),
+        "days": [entry.__dict__ for entry in days],
+    }
+    os.replace(tmp_data, data_path)
+    tmp_index = index_path.with_name(index_path.name + ".tmp")
+    tmp_index.write_text(json.dumps(index, indent=1))
+    os.replace(tmp_index, index_path)
+    return Segment(data_path=data_path, start=start, end=end, rows=total, days=days)
+
+
+def list_segments(directory: Path | None = None) -> list[Segment]:
+    directory = directory or archive_dir()
+    if not directory.is_dir():
+        return []
+    segments = []
+    for index_path in sorted(directory.glob("audit-*.idx.json")):
+        index = json.loads(index_path.read_text())
+        segments.append(
+            Segment(
+                data_path=index_path.with_name(
+                    index_path.name.removesuffix(".idx.json") + ".ndjson.gz"
+                ),
+                start=date.fromisoformat(index["start"]),
+                end=date.fromisoformat(index["end"]),
+                rows=index["rows"],
+                days=[DayEntry(**entry) for entry in index["days"]],
+            )
+        )
+    return segments
+
+
+def verify_segment(segment: Segment) -> None:
+    """Re-read every member and check row counts and the content hash."""
+    index = json.loads(segment.index_path.read_text())
+    digest = hashlib.sha256()
+    rows = 0
+    with open(segment.data_path, "rb") as raw:
+        for entry in segment.days:
+            raw.seek(entry.offset)
+            lines = gzip.decompress(raw.read(entry.length)).splitlines(keepends=True)
+            if len(lines) != entry.rows:
+                raise ArchiveError(f"{segment.data_path.name} {entry.day}: row count mismatch")
+            for line in lines:
+                digest.update(line)
+            rows += len(lines)
+    if rows != index["rows"] or digest.hexdigest() != index["sha256"]:
+        raise ArchiveError(f"{segment.data_path.name} failed verification")
+
+
+def query(
+    *,
+    user_id: int | None = None,
+    start: date | None = None,
+    end: date | None = None,
+    upl_sensitive: bool | None = None,
+    action: str | None = None,
+    directory: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream archived rows matching every given filter, oldest first.
+
+    ``start``/``end`` are UTC days (end exclusive). Only day members whose
+    index entry can match are decompressed.
+    """
+    for segment in list_segments(directory):
+        if (start and segment.end <= start) or (end and segment.start >= end):
+            continue
+        with open(segment.data_path, "rb") as raw:
+            for entry in segment.days:
+                day = date.fromisoformat(entry.day)
+                if (start and day < start) or (end and day >= end):
+                    continue
+                if user_id is not None:
+                    candidates = entry.upl_users if upl_sensitive else entry.users
+                    if user_id not in candidates:
+                        continue
+                raw.seek(entry.offset)
+                for line in gzip.decompress(raw.read(entry.length)).splitlines():
+                    row = json.loads(line)
+                    if user_id is not None and row["user_id"] != user_id:
+                        continue
+                    if upl_sensitive is not None and row["upl_sensitive"] != upl_sensitive:
+                        continue
+                    if action is not None and row["action"] != action:
+                        continue
+                    yield row
+
+
+def _serialize(row: dict[str, Any]) -> dict[str, Any]:
+    out = dict(row)
+    out["timestamp"] = row["timestamp"].astimezone(UTC).isoformat()
+    return out
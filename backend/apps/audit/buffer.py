@@ -0,0 +1,438 @@
+"""
+Buffered audit log writer.
+
+AuditLoggingMiddleware used to INSERT one AuditLog row per authenticated
+request, on a table with several indexes, inside the request. The sink here
+queues entries in memory and a background thread writes them with
+``bulk_create`` once ``AUDIT_BUFFER_BATCH_SIZE`` entries are waiting or
+``AUDIT_BUFFER_FLUSH_SECONDS`` have passed.
+
+Durability: UPL-sensitive entries are appended to a per-process write-ahead
+spool file (``AUDIT_SPOOL_DIR``) before they are queued. The file is deleted
+only after its entries are committed, so a crashed worker leaves them on
+disk. A failed flush (database down) or a full queue writes entries to a
+``.pending`` spool file instead of dropping them; only non-UPL entries are
+ever dropped. Spool files are replayed when a sink starts and by the
+``replay_audit_spool`` command. Every spool file is held under an exclusive
+``flock`` while in use, so replay never touches a live worker's file.
+
+A batch the database rejects is retried one row at a time. Rows that still
+fail (an FK to a user deleted in between, a malformed spool line) are moved
+to the ``quarantine`` subdirectory with the error, so one bad row can neither
+fail its whole batch nor keep a spool file from ever being replayed.
+"""
+
+import atexit
+import fcntl
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections, transaction
+from django.utils import timezone
+
+from config.metrics import AUDIT_BUFFER_DEPTH
+
+from .models import AuditLog, build_search_text
+
+logger = logging.getLogger("dignifi.audit")
+
+_FIELDS = (
+    "action",
+    "user_id",
+    "resource_type",
+    "resource_id",
+    "upl_sensitive",
+    "ip_address",
+    "user_agent",
+    "details",
+    "timestamp",
+)
+
+# Errors caused by the row itself; anything else (database unreachable) fails
+# the write and leaves the remaining rows spooled.
+_ROW_ERRORS = (DataError, IntegrityError, TypeError, ValueError)
+
+
+@dataclass
+class AuditBufferStats:
+    """Counters exposed on the metrics endpoint."""
+
+    enqueued: int = 0
+    flushed: int = 0
+    spooled: int = 0
+    dropped: int = 0
+    replayed: int = 0
+    quarantined: int = 0
+    flushes: int = 0
+    last_flush_seconds: float = 0.0
+    max_flush_seconds: float = 0.0
+    flush_seconds_total: float = 0.0
+
+    def as_dict(self, depth: int) -> dict[str, Any]:
+        return {
+            "depth": depth,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "spooled": self.spooled,
+            "dropped": self.dropped,
+            "replayed": self.replayed,
+            "quarantined": self.quarantined,
+            "flushes": self.flushes,
+            "last_flush_ms": round(self.last_flush_seconds * 1000, 2),
+            "max_flush_ms": round(self.max_flush_seconds * 1000, 2),
+            "mean_flush_ms": round(
+                self.flush_seconds_total / self.flushes * 1000 if self.flushes else 0.0, 2
+            ),
+        }
+
+
+@dataclass
+class _Segment:
+    """The write-ahead spool file covering the entries currently buffered."""
+
+    path: Path
+    handle: Any = None
+    entries: int = 0
+
+    def append(self, line: str, fsync: bool) -> None:
+        if self.handle is None:
+            self.handle = open(self.path, "a", encoding="utf-8")
+            fcntl.flock(self.handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        self.handle.write(line)
+        self.handle.flush()
+        if fsync:
+            os.fsync(self.handle.fileno())
+        self.entries += 1
+
+    def discard(self) -> None:
+        if self.handle is None:
+            return
+        self.path.unlink(missing_ok=True)
+        self.handle.close()
+        self.handle = None
+
+
+class AuditSink:
+    """In-process audit queue with a background bulk writer and a disk spool."""
+
+    def __init__(
+        self,
+        spool_dir: Path | str,
+        batch_size: int = 200,
+        flush_seconds: float = 1.0,
+        max_queue: int = 10_000,
+        fsync: bool = False,
+    ):
+        self.spool_dir = Path(spool_dir)
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.max_queue = max_queue
+        self.fsync = fsync
+        self.stats = AuditBufferStats()
+        self._token = f"{os.getpid()}-{secrets.token_hex(4)}"
+        self._seq = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._segment = self._new_segment()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # -- producer side ------------------------------------------------------
+
+    def enqueue(
+        self,
+        action: str,
+        *,
+        user=None,
+        resource_type: str | None = None,
+        resource_id: int | None = None,
+        upl_sensitive: bool = False,
+        ip_address: str | None = None,
+        user_agent: str | None = None,
+        **details: Any,
+    ) -> None:
+        """Queue an entry; same arguments as ``AuditLog.log_action``."""
+        entry = {
+            "action": action,
+            "user_id": getattr(user, "pk", None),
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "upl_sensitive": upl_sensitive,
+            "ip_address": ip_address,
+            "user_agent": user_agent or "",
+            "details": details,
+            "timestamp": timezone.now().isoformat(),
+        }
+        wake = False
+        with self._lock:
+            self.stats.enqueued += 1
+            if len(self._buffer) >= self.max_queue:
+                if upl_sensitive:
+                    self._spool([entry])
+                else:
+                    self.stats.dropped += 1
+                return
+            if upl_sensitive:
+                try:
+                    self._segment.append(json.dumps(entry) + "\n", self.fsync)
+                except OSError:
+                    # Still queued; it just isn't crash-safe until flushed.
+                    logger.exception("Audit write-ahead spool append failed")
+            self._buffer.append(entry)
+            AUDIT_BUFFER_DEPTH.set(len(self._buffer))
+            wake = len(self._buffer) >= self.batch_size
+        if wake:
+            self._wake.set()
+
+    # -- consumer side ------------------------------------------------------
+
+    def start(self) -> None:
+        """Replay orphaned spool files, then start the background writer."""
+        if self._thread is not None:
+            return
+        try:
+            self.replay()
+        except Exception:
+            logger.exception("Audit spool replay failed; files kept for the next attempt")
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    def flush(self) -> int:
+        """Write everything queued so far. Returns the number of rows inserted."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                segment, self._segment = self._segment, self._new_segment()
+                AUDIT_BUFFER_DEPTH.set(0)
+            if not batch:
+                segment.discard()
+                return 0
+
+            started = time.perf_counter()
+            pending = list(batch)
+            try:
+                inserted = self._insert(pending)
+            except Exception:
+                logger.exception("Audit flush of %d entries failed; spooling to disk", len(pending))
+                with self._lock:
+                    self._spool(pending)
+                segment.discard()
+                return 0
+            finally:
+                elapsed = time.perf_counter() - started
+                with self._lock:
+                    self.stats.flushes += 1
+                    self.stats.last_flush_seconds = elapsed
+                    self.stats.flush_seconds_total += elapsed
+                    self.stats.max_flush_seconds = max(self.stats.max_flush_seconds, elapsed)
+
+            segment.discard()
+            with self._lock:
+                self.stats.flushed += inserted
+            return inserted
+
+    def replay(self) -> int:
+        """Insert entries from spool files no live process holds. Returns rows inserted."""
+        if not self.spool_dir.is_dir():
+            return 0
+        inserted = 0
+        for path in sorted(self.spool_dir.glob("audit-*.ndjson")):
+            inserted += self._replay_file(path)
+        with self._lock:
+            self.stats.replayed += inserted
+        return inserted
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_seconds + 5)
+        self.flush()
+
+    def depth(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return self.stats.as_dict(depth=len(self._buffer))
+
+    # -- internals ----------------------------------------------------------
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(timeout=self.flush_seconds)
+            self._wake.clear()
+            try:
+                close_old_connections()
+                self.flush()
+            except Exception:
+                logger.exception("Audit sink flush loop error")
+
+    def _new_segment(self) -> _Segment:
+        self._seq += 1
+        return _Segment(self.spool_dir / f"audit-{self._token}-{self._seq}.wal.ndjson")
+
+    def _spool(self, entries: list[dict[str, Any]]) -> None:
+        """Persist entries that could not be queued or committed. Caller holds ``_lock``."""
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._seq += 1
+        path = self.spool_dir / f"audit-{self._token}-{self._seq}.pending.ndjson"
+        try:
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.writelines(json.dumps(entry) + "\n" for entry in entries)
+                handle.flush()
+                os.fsync(handle.fileno())
+        except OSError:
+            # Last resort: the log stream is shipped off-host.
+            logger.critical("Audit spool write failed; entries follow", exc_info=True)
+            for entry in entries:
+                logger.critical("audit_spool_entry %s", json.dumps(entry))
+            self.stats.dropped += len(entries)
+            return
+        self.stats.spooled += len(entries)
+
+    def _insert(self, entries: list[dict[str, Any]]) -> int:
+        """
+        Insert ``entries``, returning the number of rows written.
+
+        When the batch fails, rows are inserted one at a time and those that
+        raise a row error are quarantined. Any other error propagates with
+        ``entries`` trimmed to the rows not yet handled, so the caller spools
+        only those.
+        """
+        try:
+            with transaction.atomic():
+                AuditLog.objects.bulk_create(
+                    [_to_model(entry) for entry in entries], batch_size=self.batch_size
+                )
+            written = len(entries)
+            entries.clear()
+            return written
+        except _ROW_ERRORS:
+            logger.warning(
+                "Audit batch of %d entries rejected; inserting rows singly", len(entries)
+            )
+
+        written = handled = 0
+        try:
+            for entry in entries:
+                try:
+                    with transaction.atomic():
+                        AuditLog.objects.bulk_create([_to_model(entry)])
+                except _ROW_ERRORS as exc:
+                    self._quarantine([{"error": repr(exc), "entry": entry}])
+                else:
+                    written += 1
+                handled += 1
+        finally:
+            del entries[:handled]
+        return written
+
+    def _quarantine(self, records: list[dict[str, Any]]) -> None:
+        """Set aside rows that can never be inserted, with the reason, for manual review."""
+        for record in records:
+            logger.error("Audit entry quarantined: %s", json.dumps(record))
+        directory = self.spool_dir / "quarantine"
+        with self._lock:
+            self._seq += 1
+            path = directory / f"audit-{self._token}-{self._seq}.ndjson"
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.writelines(json.dumps(record) + "\n" for record in records)
+            except OSError:
+                logger.critical("Audit quarantine write failed", exc_info=True)
+            self.stats.quarantined += len(records)
+
+    def _replay_file(self, path: Path) -> int:
+        try:
+            handle = open(path, encoding="utf-8")
+        except FileNotFoundError:
+            return 0
+        with handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # a live writer (or another replayer) owns it
+            try:
+                if os.fstat(handle.fileno()).st_ino != path.stat().st_ino:
+                    return 0
+            except FileNotFoundError:
+                return 0  # replayed and removed while we waited for the lock
+            entries, malformed = [], []
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError as exc:
+                    malformed.append({"error": repr(exc), "line": line.rstrip("\n")})
+            if malformed:
+                self._quarantine(malformed)
+            total = len(entries)
+            try:
+                inserted = self._insert(entries)
+            except Exception:
+                if malformed or len(entries) < total:
+                    # Part of the file is handled; keep only the rest.
+                    with self._lock:
+                        self._spool(entries)
+                    path.unlink(missing_ok=True)
+                raise
+            path.unlink(missing_ok=True)
+            return inserted
+
+
+def _to_model(entry: dict[str, Any]) -> AuditLog:
+    values = {name: entry.get(name) for name in _FIELDS}
+    values["timestamp"] = datetime.fromisoformat(values["timestamp"])
+    values["user_agent"] = values["user_agent"] or ""
+    values["details"] = values["details"] or {}
+    values["search_text"] = build_search_text(
+        values["action"], values["resource_type"], values["details"]
+    )
+    return AuditLog(**values)
+
+
+_sink: AuditSink | None = None
+_sink_pid: int | None = None
+_sink_lock = threading.Lock()
+
+
+def get_audit_sink() -> AuditSink:
+    """The process-wide sink, started on first use (and again after a fork)."""
+    global _sink, _sink_pid
+    if _sink is None or _sink_pid != os.getpid():
+        with _sink_lock:
+            if _sink is None or _sink_pid != os.getpid():
+                sink = AuditSink(
+                    spool_dir=Path(settings.AUDIT_SPOOL_DIR),
+                    batch_size=settings.AUDIT_BUFFER_BATCH_SIZE,
+                    flush_seconds=settings.AUDIT_BUFFER_FLUSH_SECONDS,
+                    max_queue=settings.AUDIT_BUFFER_MAX_QUEUE,
+                    fsync=settings.AUDIT_SPOOL_FSYNC,
+                )
+                sink.spool_dir.mkdir(parents=True, exist_ok=True)
+                sink.start()
+                atexit.register(sink.close)
+                _sink, _sink_pid = sink, os.getpid()
+    return _sink
+
+
+def audit_buffer_metrics() -> dict[str, Any]:
+    """Stats for the metrics endpoint; zeros when no sink has started in this process."""
+    if _sink is None or _sink_pid != os.getpid():
+        return AuditBufferStats().as_dict(depth=0)
+    return _sink.snapshot()
@@ -0,0 +1,110 @@
+"""
+export_audit_archive - Move closed audit history into cold-storage segments.
+
+Exports whole months (or an explicit date range) from audit_logs into
+AUDIT_ARCHIVE_DIR as gzip'd NDJSON with a per-user/per-day index (see
+apps.audit.archive), verifies the segment, and with ``--prune`` removes the
+exported rows from the database: the month's partition is detached and
+dropped when audit_logs is partitioned, otherwise rows are deleted.
+
+  python manage.py export_audit_archive --month 2027-01 --prune
+  python manage.py export_audit_archive --start 2027-01-01 --end 2027-04-01
+  python manage.py export_audit_archive --expired --prune   # before maintain_audit_partitions
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.audit import archive, partitions
+from apps.audit.models import AuditLog
+
+
+class Command(BaseCommand):
+    help = "Export audit_logs months or date ranges to compressed archive segments."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--month", action="append", default=[], help="YYYY-MM (repeatable)")
+        parser.add_argument("--start", type=date.fromisoformat, help="YYYY-MM-DD, inclusive")
+        parser.add_argument("--end", type=date.fromisoformat, help="YYYY-MM-DD, exclusive")
+        parser.add_argument(
+            "--expired",
+            action="store_true",
+            help="Every unarchived month past AUDIT_LOG_RETENTION_DAYS",
+        )
+        parser.add_argument("--prune", action="store_true", help="Remove exported rows")
+
+    def handle(self, *args, **options):
+        ranges = self._ranges(options)
+        if not ranges:
+            raise CommandError("Nothing to export: pass --month, --start/--end or --expired")
+
+        for start, end in ranges:
+            try:
+                segment = archive.export_range(start, end)
+                archive.verify_segment(segment)
+            except archive.ArchiveError as exc:
+                raise CommandError(str(exc)) from exc
+            self.stdout.write(f"Exported {segment.rows} rows to {segment.data_path.name}")
+            if options["prune"]:
+                self._prune(start, end, segment.rows)
+
+    def _ranges(self, options) -> list[tuple[date, date]]:
+        ranges = []
+        for month in options["month"]:
+            try:
+                start = date.fromisoformat(f"{month}-01")
+            except ValueError as exc:
+                raise CommandError(f"Invalid --month {month!r}; expected YYYY-MM") from exc
+            ranges.append((start, partitions.add_months(start, 1)))
+        if options["start"] or options["end"]:
+            if not (options["start"] and options["end"]):
+                raise CommandError("--start and --end go together")
+            ranges.append((options["start"], options["end"]))
+        if options["expired"]:
+            ranges.extend(self._expired_months())
+        return ranges
+
+    @staticmethod
+    def _expired_months() -> list[tuple[date, date]]:
+        oldest = AuditLog.objects.order_by("timestamp").values_list("timestamp", flat=True).first()
+        if oldest is None:
+            return []
+        archived = [(s.start, s.end) for s in archive.list_segments()]
+        cutoff = partitions.retention_cutoff().date()
+        months = []
+        month = partitions.month_start(oldest)
+        while partitions.add_months(month, 1) <= cutoff:
+            end = partitions.add_months(month, 1)
+            if not any(s < end and month < e for s, e in archived):
+                months.append((month, end))
+            month = end
+        return months
+
+    def _prune(self, start: date, end: date, exported: int) -> None:
+        partition = partitions.parse_partition(partitions.partition_name(start))
+        whole_month = start == partition.start and end == partition.end
+        if whole_month and partitions.is_partitioned():
+            if partition.name in {p.name for p in partitions.list_partitions()}:
+                with transaction.atomic():
+                    # Replay can still add late rows to a month already exported.
+                    if partitions.count_partition_rows(partition) != exported:
+                        raise CommandError(
+                            f"{partition.name} changed since export; not pruning "
+                            "(re-run after review)"
+                        )
+                    partitions.detach_partition(partition)
+                self.stdout.write(f"Dropped partition {partition.name}")
+            return
+
+        rows = AuditLog.objects.filter(
+            timestamp__gte=archive._day_start(start), timestamp__lt=archive._day_start(end)
+        )
+        with transaction.atomic():
+            if rows.count() != exported:
+                raise CommandError(
+                    f"{start}..{end} changed since export; not pruning (re-run after review)"
+                )
+            deleted, _ = rows.delete()
+        self.stdout.write(f"Deleted {deleted} archived rows")
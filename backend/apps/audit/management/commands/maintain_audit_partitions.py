@@ -0,0 +1,68 @@
+"""
+maintain_audit_partitions - Keep audit_logs partitions ahead of time and prune old months.
+
+Creates monthly partitions through ``--months-ahead`` months from now so new
+rows never land in the DEFAULT partition, then detaches every partition that
+lies entirely before now - AUDIT_LOG_RETENTION_DAYS and drops it, or moves it
+to the audit_archive schema with ``--archive``. Run daily from the scheduler.
+
+On a database without partitioning (SQLite in development) expired rows are
+deleted with a single queryset delete instead.
+
+  python manage.py maintain_audit_partitions
+  python manage.py maintain_audit_partitions --months-ahead 6 --archive --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.audit import partitions
+from apps.audit.models import AuditLog
+
+
+class Command(BaseCommand):
+    help = "Create upcoming audit_logs partitions and drop or archive expired ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months-ahead", type=int, default=3)
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help=f"Move expired partitions to the {partitions.ARCHIVE_SCHEMA} schema",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Report without changing")
+
+    def handle(self, *args, **options):
+        cutoff = partitions.retention_cutoff()
+        dry_run = options["dry_run"]
+
+        if not partitions.is_partitioned():
+            expired_rows = AuditLog.objects.filter(timestamp__lt=cutoff)
+            count = expired_rows.count() if dry_run else expired_rows.delete()[0]
+            verb = "Would delete" if dry_run else "Deleted"
+            self.stdout.write(f"audit_logs is not partitioned; {verb} {count} expired rows")
+            return
+
+        through = partitions.add_months(
+            partitions.month_start(timezone.now()), options["months_ahead"]
+        )
+        expired = partitions.expired(partitions.list_partitions(), cutoff)
+        if dry_run:
+            self.stdout.write(f"Would ensure partitions through {through:%Y-%m}")
+            for partition in expired:
+                self.stdout.write(f"Would detach {partition.name}")
+            return
+
+        with transaction.atomic():
+            created = partitions.ensure_partitions(through)
+        for name in created:
+            self.stdout.write(f"Created {name}")
+        for partition in expired:
+            with transaction.atomic():
+                partitions.detach_partition(partition, archive=options["archive"])
+            action = "Archived" if options["archive"] else "Dropped"
+            self.stdout.write(f"{action} {partition.name}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(created)} partitions created, {len(expired)} pruned")
+        )
@@ -0,0 +1,46 @@
+"""
+query_audit_archive - Search cold-storage audit segments without re-importing them.
+
+Prints matching rows as NDJSON, e.g. every UPL-sensitive action for a user
+in 2027:
+
+  python manage.py query_audit_archive --user 42 --year 2027 --upl-sensitive
+"""
+
+import json
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.audit import archive
+
+
+class Command(BaseCommand):
+    help = "Query archived audit history by user, date range, action and UPL sensitivity."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, help="User id")
+        parser.add_argument("--year", type=int, help="Shorthand for --start YYYY-01-01 --end +1y")
+        parser.add_argument("--start", type=date.fromisoformat, help="YYYY-MM-DD, inclusive")
+        parser.add_argument("--end", type=date.fromisoformat, help="YYYY-MM-DD, exclusive")
+        parser.add_argument("--action", type=str)
+        parser.add_argument("--upl-sensitive", action="store_true", default=None)
+
+    def handle(self, *args, **options):
+        start, end = options["start"], options["end"]
+        if options["year"]:
+            if start or end:
+                raise CommandError("--year cannot be combined with --start/--end")
+            start, end = date(options["year"], 1, 1), date(options["year"] + 1, 1, 1)
+
+        matched = 0
+        for row in archive.query(
+            user_id=options["user"],
+            start=start,
+            end=end,
+            upl_sensitive=options["upl_sensitive"],
+            action=options["action"],
+        ):
+            self.stdout.write(json.dumps(row))
+            matched += 1
+        self.stderr.write(f"{matched} archived rows matched")
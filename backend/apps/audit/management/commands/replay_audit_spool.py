@@ -0,0 +1,33 @@
+"""
+replay_audit_spool - Insert audit entries left in the spool directory.
+
+The buffered audit writer journals UPL-sensitive entries to AUDIT_SPOOL_DIR
+and spools whole batches there when the database is unreachable. Sinks replay
+orphaned files on startup; run this after an outage, or from the scheduler,
+to drain them without waiting for a worker restart. Files still held by a
+live worker are skipped. Entries the database rejects are moved to the
+``quarantine`` subdirectory for manual review instead of blocking the file.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.audit.buffer import AuditSink
+
+
+class Command(BaseCommand):
+    help = "Replay spooled audit log entries into the audit_logs table."
+
+    def handle(self, *args, **options):
+        sink = AuditSink(spool_dir=Path(settings.AUDIT_SPOOL_DIR))
+        replayed = sink.replay()
+        self.stdout.write(self.style.SUCCESS(f"Replayed {replayed} spooled audit entries"))
+        if sink.stats.quarantined:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Quarantined {sink.stats.quarantined} entries in "
+                    f"{sink.spool_dir / 'quarantine'}"
+                )
+            )
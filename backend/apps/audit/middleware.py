@@ -7,8 +7,10 @@ This middleware logs all requests/responses for UPL compliance auditing.
 import logging
 from collections.abc import Callable
 
+from django.conf import settings
 from django.http import HttpRequest, HttpResponse
 
+from .buffer import get_audit_sink
 from .models import AuditLog
 
 logger = logging.getLogger("dignifi.audit")
@@ -23,6 +25,9 @@ class AuditLoggingMiddleware:
     - IP addresses
     - Request paths
     - Response status codes
+
+    With AUDIT_BUFFER_ENABLED, entries go to the buffered sink and are written
+    in batches after the response; otherwise each is inserted inline.
     """
 
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
@@ -39,7 +44,12 @@ class AuditLoggingMiddleware:
                 upl_sensitive = self._is_upl_sensitive(request.path)
 
                 # Log the action
-                AuditLog.log_action(
+                log = (
+                    get_audit_sink().enqueue
+                    if settings.AUDIT_BUFFER_ENABLED
+                    else AuditLog.log_action
+                )
+                log(
                     action=f"{request.method} {request.path}",
                     user=request.user,
                     resource_type="http_request",
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0004_timestamp_default_now"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="auditlog",
+            name="audit_logs_user_id_e11c73_idx",
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(
+                fields=["user", "-timestamp", "-id"], name="audit_logs_user_ts_id_idx"
+            ),
+        ),
+    ]
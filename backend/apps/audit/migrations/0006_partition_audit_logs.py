@@ -0,0 +1,101 @@
+"""
+Convert audit_logs into a monthly RANGE-partitioned table on PostgreSQL.
+
+The table is rebuilt as ``PARTITION BY RANGE ("timestamp")`` with partitions
+from the oldest row's month through three months ahead, plus a DEFAULT
+partition. Existing rows are copied across and the original indexes are
+recreated under their Django names on the partitioned parent, so later
+AddIndex/RemoveIndex migrations keep working. The primary key becomes
+(id, timestamp) because PostgreSQL requires the partition key in every
+unique constraint. id is still unique, drawn from audit_logs_id_seq.
+
+The copy rewrites the whole table, so run it during a maintenance window on
+large installations. Other databases are left untouched.
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.db import migrations
+
+MONTHS_AHEAD = 3
+
+
+def _add_months(value, months):
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_audit_logs(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    user_table = apps.get_model(settings.AUTH_USER_MODEL)._meta.db_table
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'audit_logs'::regclass"
+        )
+        if cursor.fetchone():
+            return
+
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes "
+            "WHERE schemaname = current_schema() AND tablename = 'audit_logs' "
+            "AND indexname <> 'audit_logs_pkey'"
+        )
+        index_defs = [row[0] for row in cursor.fetchall()]
+        cursor.execute('SELECT min("timestamp"), now() FROM audit_logs')
+        oldest, now = cursor.fetchone()
+
+        cursor.execute("ALTER TABLE audit_logs RENAME TO audit_logs_unpartitioned")
+        cursor.execute(
+            "CREATE TABLE audit_logs (LIKE audit_logs_unpartitioned INCLUDING DEFAULTS) "
+            'PARTITION BY RANGE ("timestamp")'
+        )
+
+        month = date((oldest or now).year, (oldest or now).month, 1)
+        last = _add_months(date(now.year, now.month, 1), MONTHS_AHEAD)
+        while month <= last:
+            cursor.execute(
+                f'CREATE TABLE "audit_logs_p{month:%Y_%m}" PARTITION OF audit_logs '
+                f"FOR VALUES FROM ('{month.isoformat()}') "
+                f"TO ('{_add_months(month, 1).isoformat()}')"
+            )
+            month = _add_months(month, 1)
+        cursor.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+        cursor.execute("INSERT INTO audit_logs SELECT * FROM audit_logs_unpartitioned")
+        cursor.execute("DROP TABLE audit_logs_unpartitioned")
+
+        cursor.execute(
+            'ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_pkey PRIMARY KEY (id, "timestamp")'
+        )
+        for index_def in index_defs:
+            cursor.execute(index_def)
+        cursor.execute(
+            "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_user_id_fk "
+            f'FOREIGN KEY (user_id) REFERENCES "{user_table}" (id) DEFERRABLE INITIALLY DEFERRED'
+        )
+
+        cursor.execute("CREATE SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+        cursor.execute(
+            "ALTER TABLE audit_logs ALTER COLUMN id SET DEFAULT nextval('audit_logs_id_seq')"
+        )
+        cursor.execute(
+            "SELECT setval('audit_logs_id_seq', COALESCE(max(id), 0) + 1, false) FROM audit_logs"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0005_user_timestamp_id_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Irreversible in place, but harmless to leave: the ORM sees the
+        # partitioned table exactly as it saw the plain one.
+        migrations.RunPython(partition_audit_logs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,86 @@
+"""
+Add AuditLog.search_text and, on PostgreSQL, a GIN full-text index over it.
+
+Existing rows are backfilled in batches. The index expression matches what
+``apps.audit.search.search_vector`` queries. It is created on the parent
+table, which also covers every monthly partition on a partitioned audit_logs
+(migration 0006).
+
+The flattening and the index expression are frozen copies of
+``apps.audit.models.build_search_text`` and ``search_vector`` as of this
+migration, so later changes to either cannot change what it does.
+"""
+
+from django.db import migrations, models
+
+INDEX_NAME = "audit_logs_search_gin"
+BATCH_SIZE = 2000
+SEARCH_CONFIG = "simple"
+SEARCH_TEXT_MAX_LENGTH = 2000
+
+
+def build_search_text(action, resource_type, details):
+    parts = [action or "", resource_type or ""]
+    stack = [details]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in reversed(value.items()):
+                stack.append(item)
+                stack.append(str(key))
+        elif isinstance(value, list | tuple):
+            stack.extend(reversed(value))
+        elif value is not None and value != "":
+            parts.append(str(value))
+    return " ".join(part for part in parts if part)[:SEARCH_TEXT_MAX_LENGTH]
+
+
+def backfill_search_text(apps, schema_editor):
+    AuditLog = apps.get_model("audit", "AuditLog")
+    db = schema_editor.connection.alias
+    batch = []
+    rows = AuditLog.objects.using(db).only("id", "action", "resource_type", "details")
+    for log in rows.iterator(chunk_size=BATCH_SIZE):
+        log.search_text = build_search_text(log.action, log.resource_type, log.details)
+        batch.append(log)
+        if len(batch) >= BATCH_SIZE:
+            AuditLog.objects.using(db).bulk_update(batch, ["search_text"])
+            batch = []
+    if batch:
+        AuditLog.objects.using(db).bulk_update(batch, ["search_text"])
+
+
+def _search_index():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector("search_text", config=SEARCH_CONFIG), name=INDEX_NAME)
+
+
+def add_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.add_index(apps.get_model("audit", "AuditLog"), _search_index())
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.remove_index(apps.get_model("audit", "AuditLog"), _search_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0006_partition_audit_logs"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="auditlog",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(add_search_index, remove_search_index),
+    ]
@@ -9,6 +9,32 @@ from typing import Any
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+SEARCH_TEXT_MAX_LENGTH = 2000
+
+
+def build_search_text(action: str, resource_type: str | None, details: Any) -> str:
+    """
+    Flatten an entry into the text AuditLogViewSet searches.
+
+    Nested ``details`` are walked depth-first; keys and scalar values are kept
+    so "path /api/intake/" and "result passes_means_test" both match. Capped at
+    SEARCH_TEXT_MAX_LENGTH so one huge payload cannot bloat the index.
+    """
+    parts = [action or "", resource_type or ""]
+    stack = [details]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            for key, item in reversed(value.items()):
+                stack.append(item)
+                stack.append(str(key))
+        elif isinstance(value, list | tuple):
+            stack.extend(reversed(value))
+        elif value is not None and value != "":
+            parts.append(str(value))
+    return " ".join(part for part in parts if part)[:SEARCH_TEXT_MAX_LENGTH]
 
 
 class AuditLog(models.Model):
@@ -57,8 +83,9 @@ class AuditLog(models.Model):
         help_text="True if this action involved legal information/guidance",
     )
 
-    # When it happened
-    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
+    # When it happened. Not auto_now_add: buffered entries (apps.audit.buffer)
+    # are inserted after the request and must keep the time it happened.
+    timestamp = models.DateTimeField(default=timezone.now, editable=False, db_index=True)
 
     # Where it came from
     ip_address = models.GenericIPAddressField(
@@ -72,20 +99,30 @@ class AuditLog(models.Model):
     # Additional context
     details = models.JSONField(default=dict, help_text="Additional context about the action")
 
+    # Flattened action + details, maintained on save for AuditLogViewSet search
+    # (GIN full-text index on PostgreSQL; see apps.audit.search).
+    search_text = models.TextField(blank=True, default="", editable=False)
+
     class Meta:
+        # Range-partitioned by month on PostgreSQL; see apps.audit.partitions.
         db_table = "audit_logs"
         verbose_name = "Audit Log"
         verbose_name_plural = "Audit Logs"
         ordering = ["-timestamp"]
         indexes = [
             models.Index(fields=["-timestamp"]),
-            models.Index(fields=["user", "-timestamp"]),
+            # Per-user listing (AuditLogViewSet): newest first, id as tiebreak.
+            models.Index(fields=["user", "-timestamp", "-id"], name="audit_logs_user_ts_id_idx"),
             models.Index(fields=["upl_sensitive", "-timestamp"]),
         ]
 
     def __str__(self) -> str:
         return f"[{self.timestamp}] {self.action} by {self.user or 'anonymous'}"
 
+    def save(self, *args, **kwargs):
+        self.search_text = build_search_text(self.action, self.resource_type, self.details)
+        super().save(*args, **kwargs)
+
     @classmethod
     def log_action(
         cls,
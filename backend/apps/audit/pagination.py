@@ -0,0 +1,14 @@
+from config.pagination import KeysetPagination
+
+
+class AuditLogCursorPagination(KeysetPagination):
+    """
+    Newest first over the per-user (user, -timestamp, -id) index.
+
+    ``timestamp`` is not unique; ``id`` fixes the order of rows sharing one,
+    and the cursor's offset within that timestamp tells them apart.
+    AuditLogViewSet.ordering must match, since CursorPagination defers to
+    the view's OrderingFilter.
+    """
+
+    ordering = ("-timestamp", "-id")
@@ -0,0 +1,185 @@
+"""
+Monthly range partitions for the audit_logs table (PostgreSQL).
+
+Migration 0006 turns ``audit_logs`` into a table partitioned by RANGE
+("timestamp"), with one partition per calendar month named
+``audit_logs_pYYYY_MM`` plus a DEFAULT partition for anything outside them;
+rows that land in the default move to their month once it is created.
+``maintain_audit_partitions`` runs from the scheduler to create upcoming
+months ahead of time and to detach expired ones once they fall entirely
+outside AUDIT_LOG_RETENTION_DAYS. Detaching and dropping a partition removes
+a month in constant time, with no row-by-row DELETE, no table bloat and no
+vacuum debt. ``archive`` moves the detached table to a separate schema
+instead of dropping it.
+
+On other databases (SQLite in development and tests) the table is not
+partitioned and pruning falls back to a queryset delete.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from django.conf import settings
+from django.db import connection as default_connection
+from django.db import transaction
+from django.utils import timezone
+
+PARENT_TABLE = "audit_logs"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+ARCHIVE_SCHEMA = "audit_archive"
+
+_PARTITION_RE = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})_(\d{{2}})$")
+
+
+@dataclass(frozen=True)
+class Partition:
+    name: str
+    start: date  # first day of the month, inclusive
+
+    @property
+    def end(self) -> date:
+        """First day of the following month, exclusive."""
+        return add_months(self.start, 1)
+
+
+def month_start(value: date | datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y_%m}"
+
+
+def parse_partition(name: str) -> Partition | None:
+    match = _PARTITION_RE.match(name)
+    if match is None:
+        return None
+    return Partition(name=name, start=date(int(match[1]), int(match[2]), 1))
+
+
+def create_partition_sql(month: date) -> str:
+    start = month_start(month)
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(start)}" PARTITION OF "{PARENT_TABLE}" '
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{add_months(start, 1).isoformat()}')"
+    )
+
+
+def retention_cutoff(now: datetime | None = None) -> datetime:
+    """Rows older than this are past AUDIT_LOG_RETENTION_DAYS."""
+    return (now or timezone.now()) - timedelta(days=settings.AUDIT_LOG_RETENTION_DAYS)
+
+
+def expired(partitions: list[Partition], cutoff: datetime) -> list[Partition]:
+    """Partitions whose every row is older than ``cutoff`` (safe to drop whole)."""
+    return [p for p in partitions if p.end <= cutoff.date()]
+
+
+def is_partitioned(connection=default_connection) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s)",
+            [PARENT_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def list_partitions(connection=default_connection) -> list[Partition]:
+    """Monthly partitions currently attached to audit_logs, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = to_regclass(%s)
+            """,
+            [PARENT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = [p for p in map(parse_partition, names) if p is not None]
+    return sorted(partitions, key=lambda p: p.start)
+
+
+def ensure_partitions(
+    through: date, since: date | None = None, connection=default_connection
+) -> list[str]:
+    """
+    Create missing monthly partitions from ``since`` (default: this month) to ``through``.
+
+    PostgreSQL refuses to create a partition while the DEFAULT partition holds
+    rows in its range, which happens when rows arrived before their month was
+    created. For such a month the default is detached, the month created, its
+    rows moved out of the default and the default reattached, in one
+    transaction.
+    """
+    month = month_start(since or timezone.now())
+    existing = {p.name for p in list_partitions(connection)}
+    created = []
+    while month <= month_start(through):
+        if partition_name(month) not in existing:
+            with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+                if _default_has_rows(cursor, month):
+                    _create_from_default(cursor, month)
+                else:
+                    cursor.execute(create_partition_sql(month))
+            created.append(partition_name(month))
+        month = add_months(month, 1)
+    return created
+
+
+def _month_range_sql(month: date) -> str:
+    return (
+        f"\"timestamp\" >= '{month.isoformat()}' "
+        f"AND \"timestamp\" < '{add_months(month, 1).isoformat()}'"
+    )
+
+
+def _default_has_rows(cursor, month: date) -> bool:
+    cursor.execute(
+        f'SELECT EXISTS (SELECT 1 FROM "{DEFAULT_PARTITION}" WHERE {_month_range_sql(month)})'
+    )
+    return cursor.fetchone()[0]
+
+
+def _create_from_default(cursor, month: date) -> None:
+    name, where = partition_name(month), _month_range_sql(month)
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{DEFAULT_PARTITION}"')
+    cursor.execute(create_partition_sql(month))
+    cursor.execute(f'INSERT INTO "{name}" SELECT * FROM "{DEFAULT_PARTITION}" WHERE {where}')
+    cursor.execute(f'DELETE FROM "{DEFAULT_PARTITION}" WHERE {where}')
+    cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT')
+
+
+def count_partition_rows(partition: Partition, connection=default_connection) -> int:
+    """
+    Row count of ``partition``, taken under a SHARE lock.
+
+    The lock blocks inserts into the partition until the surrounding
+    transaction ends, so the count still holds when the caller detaches it.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE "{partition.name}" IN SHARE MODE')
+        cursor.execute(f'SELECT count(*) FROM "{partition.name}"')
+        return cursor.fetchone()[0]
+
+
+def detach_partition(
+    partition: Partition, archive: bool = False, connection=default_connection
+) -> None:
+    """Detach ``partition`` and drop it (or move it to ARCHIVE_SCHEMA)."""
+    with connection.cursor() as cursor:
+        cursor.execute(f'ALTER TABLE "{PARENT_TABLE}" DETACH PARTITION "{partition.name}"')
+        if archive:
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{ARCHIVE_SCHEMA}"')
+            cursor.execute(f'ALTER TABLE "{partition.name}" SET SCHEMA "{ARCHIVE_SCHEMA}"')
+        else:
+            cursor.execute(f'DROP TABLE "{partition.name}"')
@@ -0,0 +1,80 @@
+"""
+Search backend for AuditLogViewSet.
+
+DRF's SearchFilter turned ``?search=`` into ``ILIKE '%term%'`` over ``action``
+and the ``details`` JSON (plus a join to users), which scans every row the
+user owns. Entries now carry a flattened ``search_text`` column, maintained on
+save (see ``models.build_search_text``), and this backend searches that one
+column:
+
+- PostgreSQL: prefix full-text match against the GIN index created by
+  migration 0007 (``to_tsvector('simple', search_text)``).
+- Other databases (SQLite in development and tests): every term must appear
+  as a substring.
+
+Terms are reduced to word characters on both sides, so ``/api/intake/`` finds
+"intake" whichever backend runs.
+"""
+
+import re
+
+from django.db import connections
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+SEARCH_CONFIG = "simple"
+MAX_TERMS = 8
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def search_terms(value: str) -> list[str]:
+    """Lower-cased word tokens from a ``?search=`` value (at most MAX_TERMS)."""
+    return [term.lower() for term in _WORD_RE.findall(value or "")][:MAX_TERMS]
+
+
+def search_vector():
+    """The indexed expression; must stay identical to migration 0007's frozen copy."""
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector("search_text", config=SEARCH_CONFIG)
+
+
+class AuditLogSearchFilter(BaseFilterBackend):
+    """``?search=`` over AuditLog.search_text; all terms must match."""
+
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        terms = search_terms(request.query_params.get(self.search_param, ""))
+        if not terms:
+            return queryset
+        if connections[queryset.db].vendor == "postgresql":
+            return self.full_text(queryset, terms)
+        return self.substring(queryset, terms)
+
+    @staticmethod
+    def full_text(queryset, terms: list[str]):
+        from django.contrib.postgres.search import SearchQuery
+
+        query = SearchQuery(
+            " & ".join(f"{term}:*" for term in terms), config=SEARCH_CONFIG, search_type="raw"
+        )
+        return queryset.annotate(search_vector=search_vector()).filter(search_vector=query)
+
+    @staticmethod
+    def substring(queryset, terms: list[str]):
+        for term in terms:
+            queryset = queryset.filter(search_text__icontains=term)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Words to find in the action, path or details (all must match).",
+                "schema": {"type": "string"},
+            }
+        ]
@@ -5,6 +5,8 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from apps.audit.models import AuditLog
+from apps.audit.pagination import AuditLogCursorPagination
+from apps.audit.views import AuditLogViewSet
 
 User = get_user_model()
 
@@ -78,3 +80,24 @@ class AuditLogViewSetTests(TestCase):
 
         response = self.client.get(self.url, {"search": "nonexistent"})
         self.assertEqual(len(response.data["results"]), 0)
+
+    def test_pages_rows_sharing_a_timestamp_newest_id_first(self):
+        """Rows with one timestamp page in -id order, each exactly once"""
+        for i in range(5):
+            AuditLog.objects.create(user=self.user, action=f"tied_{i}", resource_type="tied")
+        tied = AuditLog.objects.filter(resource_type="tied")
+        tied.update(timestamp=self.audit_log.timestamp)
+        expected = list(tied.order_by("-id").values_list("id", flat=True))
+
+        # Filtered so the entries the audit middleware adds per request stay out.
+        seen, url = [], self.url + "?resource_type=tied&page_size=2"
+        while url:
+            response = self.client.get(url)
+            seen += [row["id"] for row in response.data["results"]]
+            url = response.data["next"]
+        self.assertEqual(seen, expected)
+
+    def test_view_and_cursor_orderings_match(self):
+        """CursorPagination defers to the view's ordering, so both break ties on id"""
+        self.assertEqual(tuple(AuditLogViewSet.ordering), AuditLogCursorPagination.ordering)
+        self.assertEqual(AuditLogCursorPagination.ordering, ("-timestamp", "-id"))
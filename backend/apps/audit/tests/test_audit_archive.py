@@ -0,0 +1,160 @@
+"""Tests for cold-storage export and querying of audit history."""
+
+import gzip
+import json
+from datetime import UTC, date, datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import override_settings
+
+from apps.audit import archive, partitions
+from apps.audit.models import AuditLog
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def archive_dir(tmp_path):
+    with override_settings(AUDIT_ARCHIVE_DIR=str(tmp_path)):
+        yield tmp_path
+
+
+@pytest.fixture
+def users():
+    model = get_user_model()
+    return model.objects.create_user("ann", "a@t.com", "pw"), model.objects.create_user(
+        "ben", "b@t.com", "pw"
+    )
+
+
+def _log(user, when, action="GET /api/x/", upl=False):
+    log = AuditLog.log_action(action, user=user, resource_type="http_request", upl_sensitive=upl)
+    AuditLog.objects.filter(pk=log.pk).update(timestamp=when)
+    return log
+
+
+def _at(day, hour=12):
+    return datetime(day.year, day.month, day.day, hour, tzinfo=UTC)
+
+
+@pytest.fixture
+def january(users):
+    ann, ben = users
+    _log(ann, _at(date(2027, 1, 3)), "POST /api/intake/sessions/", upl=True)
+    _log(ann, _at(date(2027, 1, 3), 13), "GET /api/auth/me/")
+    _log(ben, _at(date(2027, 1, 9)), "POST /api/forms/generate/", upl=True)
+    _log(ann, _at(date(2027, 1, 20)), "POST /api/means-test/", upl=True)
+    _log(ann, _at(date(2027, 2, 1)), "GET /api/auth/me/")  # outside the month
+    return ann, ben
+
+
+def test_export_writes_one_member_per_day_with_index(archive_dir, january):
+    segment = archive.export_range(date(2027, 1, 1), date(2027, 2, 1))
+    archive.verify_segment(segment)
+
+    assert segment.rows == 4
+    assert [d.day for d in segment.days] == ["2027-01-03", "2027-01-09", "2027-01-20"]
+    ann, ben = january
+    assert segment.days[0].users == [ann.id]
+    assert segment.days[1].upl_users == [ben.id]
+
+    raw = segment.data_path.read_bytes()
+    first = segment.days[0]
+    lines = gzip.decompress(raw[first.offset : first.offset + first.length]).splitlines()
+    assert [json.loads(line)["action"] for line in lines] == [
+        "POST /api/intake/sessions/",
+        "GET /api/auth/me/",
+    ]
+    # The whole file is still a valid (multi-member) gzip stream.
+    assert len(gzip.decompress(raw).splitlines()) == 4
+
+
+def test_query_reads_only_days_the_user_touched(archive_dir, january):
+    ann, _ = january
+    archive.export_range(date(2027, 1, 1), date(2027, 2, 1))
+
+    with patch("apps.audit.archive.gzip.decompress", wraps=gzip.decompress) as decompress:
+        rows = list(
+            archive.query(
+                user_id=ann.id, start=date(2027, 1, 1), end=date(2028, 1, 1), upl_sensitive=True
+            )
+        )
+    assert [r["action"] for r in rows] == ["POST /api/intake/sessions/", "POST /api/means-test/"]
+    assert decompress.call_count == 2  # Jan 9 (ben only) is never decompressed
+    assert rows[0]["timestamp"] == "2027-01-03T12:00:00+00:00"
+
+
+def test_overlapping_export_is_refused(archive_dir, january):
+    archive.export_range(date(2027, 1, 1), date(2027, 2, 1))
+    with pytest.raises(archive.ArchiveError):
+        archive.export_range(date(2027, 1, 15), date(2027, 1, 16))
+
+
+def test_tampered_segment_fails_verification(archive_dir, january):
+    segment = archive.export_range(date(2027, 1, 1), date(2027, 2, 1))
+    index = json.loads(segment.index_path.read_text())
+    index["rows"] = 3
+    segment.index_path.write_text(json.dumps(index))
+    with pytest.raises(archive.ArchiveError):
+        archive.verify_segment(segment)
+
+
+def test_export_command_prunes_exported_rows(archive_dir, january):
+    out = StringIO()
+    call_command("export_audit_archive", month=["2027-01"], prune=True, stdout=out)
+    assert "Exported 4 rows" in out.getvalue()
+    assert "Deleted 4 archived rows" in out.getvalue()
+    assert AuditLog.objects.count() == 1
+
+
+@pytest.mark.parametrize("in_partition, detached", [(4, True), (5, False)])
+def test_export_command_counts_the_partition_before_detaching(
+    archive_dir, january, in_partition, detached
+):
+    january_partition = partitions.parse_partition("audit_logs_p2027_01")
+    with (
+        patch.object(partitions, "is_partitioned", return_value=True),
+        patch.object(partitions, "list_partitions", return_value=[january_partition]),
+        patch.object(partitions, "count_partition_rows", return_value=in_partition),
+        patch.object(partitions, "detach_partition") as detach,
+    ):
+        if detached:
+            call_command("export_audit_archive", month=["2027-01"], prune=True, stdout=StringIO())
+        else:
+            with pytest.raises(CommandError, match="changed since export"):
+                call_command(
+                    "export_audit_archive", month=["2027-01"], prune=True, stdout=StringIO()
+                )
+
+    assert detach.called is detached
+
+
+@override_settings(AUDIT_LOG_RETENTION_DAYS=30)
+def test_export_command_expired_months(archive_dir, users):
+    ann, _ = users
+    old = datetime.now(UTC) - timedelta(days=120)
+    _log(ann, old)
+    call_command("export_audit_archive", expired=True, stdout=StringIO())
+    assert len(archive.list_segments()) >= 1
+    assert sum(s.rows for s in archive.list_segments()) == 1
+
+
+def test_export_command_requires_a_range(archive_dir):
+    with pytest.raises(CommandError):
+        call_command("export_audit_archive", stdout=StringIO())
+
+
+def test_query_command_year_filter(archive_dir, january):
+    ann, _ = january
+    archive.export_range(date(2027, 1, 1), date(2027, 2, 1))
+    out, err = StringIO(), StringIO()
+    call_command(
+        "query_audit_archive", user=ann.id, year=2027, upl_sensitive=True, stdout=out, stderr=err
+    )
+    assert len(out.getvalue().splitlines()) == 2
+    assert "2 archived rows matched" in err.getvalue()
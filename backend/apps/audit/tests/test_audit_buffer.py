@@ -0,0 +1,238 @@
+"""Tests for the buffered AuditLog writer and its disk spool."""
+
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import RequestFactory, override_settings
+from django.utils import timezone
+
+from apps.audit.buffer import AuditSink
+from apps.audit.middleware import AuditLoggingMiddleware
+from apps.audit.models import AuditLog
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def user():
+    return get_user_model().objects.create_user("buffered", "b@test.com", "pw")
+
+
+@pytest.fixture
+def sink(tmp_path):
+    return AuditSink(spool_dir=tmp_path, batch_size=50)
+
+
+def _spool_files(sink):
+    return sorted(p.name for p in sink.spool_dir.glob("audit-*.ndjson"))
+
+
+def test_entries_are_written_in_one_batch_with_request_time(sink, user):
+    before = timezone.now()
+    for i in range(3):
+        sink.enqueue(f"GET /api/intake/{i}/", user=user, resource_type="http_request", path="/x")
+    assert AuditLog.objects.count() == 0
+    assert sink.depth() == 3
+
+    with patch.object(AuditLog.objects, "bulk_create", wraps=AuditLog.objects.bulk_create) as bc:
+        assert sink.flush() == 3
+    bc.assert_called_once()
+
+    logs = list(AuditLog.objects.order_by("id"))
+    assert [log.action for log in logs] == [f"GET /api/intake/{i}/" for i in range(3)]
+    assert logs[0].user == user
+    assert logs[0].details == {"path": "/x"}
+    assert before <= logs[0].timestamp <= timezone.now()
+    assert sink.snapshot()["flushed"] == 3
+    assert sink.snapshot()["depth"] == 0
+
+
+def test_only_upl_entries_are_journaled_until_flushed(sink, user):
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    assert _spool_files(sink) == []
+
+    sink.enqueue(
+        "POST /api/intake/sessions/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+    [wal] = _spool_files(sink)
+    assert wal.endswith(".wal.ndjson")
+    assert "POST /api/intake/sessions/" in (sink.spool_dir / wal).read_text()
+
+    sink.flush()
+    assert _spool_files(sink) == []
+    assert AuditLog.objects.count() == 2
+
+
+def test_crashed_worker_journal_is_replayed(sink, user, tmp_path):
+    sink.enqueue(
+        "POST /api/forms/generate/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+    sink._segment.handle.close()  # process dies: lock released, buffer lost
+
+    recovered = AuditSink(spool_dir=tmp_path)
+    assert recovered.replay() == 1
+    log = AuditLog.objects.get()
+    assert log.action == "POST /api/forms/generate/"
+    assert log.upl_sensitive is True
+    assert _spool_files(recovered) == []
+
+
+def test_replay_skips_files_held_by_a_live_worker(sink, user, tmp_path):
+    sink.enqueue(
+        "POST /api/intake/sessions/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+    assert AuditSink(spool_dir=tmp_path).replay() == 0
+    assert AuditLog.objects.count() == 0
+
+    sink.flush()
+    assert AuditLog.objects.count() == 1
+
+
+def test_failed_flush_spools_whole_batch(sink, user):
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    sink.enqueue(
+        "POST /api/means-test/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+    with patch.object(AuditLog.objects, "bulk_create", side_effect=RuntimeError("db down")):
+        assert sink.flush() == 0
+
+    [pending] = _spool_files(sink)
+    assert pending.endswith(".pending.ndjson")
+    assert sink.snapshot()["spooled"] == 2
+
+    assert sink.replay() == 2
+    assert AuditLog.objects.count() == 2
+    assert _spool_files(sink) == []
+
+
+def _quarantined(sink):
+    return [
+        json.loads(line)
+        for path in sorted((sink.spool_dir / "quarantine").glob("*.ndjson"))
+        for line in path.read_text().splitlines()
+    ]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rejected_row_is_quarantined_and_the_rest_inserted(sink, user):
+    gone = get_user_model().objects.create_user("deleted", "d@test.com", "pw")
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    sink.enqueue("POST /api/means-test/", user=gone, resource_type="http_request")
+    sink.enqueue("GET /api/forms/", user=user, resource_type="http_request")
+    gone.delete()
+
+    assert sink.flush() == 2
+
+    assert sorted(AuditLog.objects.values_list("action", flat=True)) == [
+        "GET /api/auth/me/",
+        "GET /api/forms/",
+    ]
+    [record] = _quarantined(sink)
+    assert record["entry"]["action"] == "POST /api/means-test/"
+    assert "IntegrityError" in record["error"]
+    assert _spool_files(sink) == []
+    assert sink.snapshot()["quarantined"] == 1
+
+
+def test_replay_quarantines_bad_lines_and_removes_the_file(sink, user):
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    sink.enqueue("GET /api/forms/", user=user, resource_type="http_request")
+    with patch.object(AuditLog.objects, "bulk_create", side_effect=RuntimeError("db down")):
+        sink.flush()
+    [pending] = sink.spool_dir.glob("audit-*.pending.ndjson")
+    lines = pending.read_text().splitlines()
+    bad = json.loads(lines[1]) | {"timestamp": "yesterday"}
+    pending.write_text("\n".join([lines[0], json.dumps(bad), "{truncated"]) + "\n")
+
+    assert sink.replay() == 1
+    assert sink.replay() == 0
+
+    assert AuditLog.objects.get().action == "GET /api/auth/me/"
+    assert _spool_files(sink) == []
+    quarantined = _quarantined(sink)
+    assert {record.get("line") for record in quarantined} == {None, "{truncated"}
+    assert [r["entry"]["action"] for r in quarantined if "entry" in r] == ["GET /api/forms/"]
+
+
+def test_outage_during_row_fallback_spools_only_unwritten_rows(sink, user):
+    for i in range(3):
+        sink.enqueue(f"GET /api/intake/{i}/", user=user, resource_type="http_request")
+    real = AuditLog.objects.bulk_create
+    calls = []
+
+    def flaky(objs, **kwargs):
+        calls.append(len(objs))
+        if len(calls) == 1:
+            raise IntegrityError("batch rejected")
+        if len(calls) == 3:
+            raise RuntimeError("db down")
+        return real(objs, **kwargs)
+
+    with patch.object(AuditLog.objects, "bulk_create", side_effect=flaky):
+        assert sink.flush() == 0
+
+    assert list(AuditLog.objects.values_list("action", flat=True)) == ["GET /api/intake/0/"]
+    assert sink.replay() == 2
+    assert AuditLog.objects.count() == 3
+
+
+def test_full_queue_drops_routine_entries_but_spools_upl(tmp_path, user):
+    sink = AuditSink(spool_dir=tmp_path, max_queue=1)
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+    sink.enqueue(
+        "POST /api/intake/sessions/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+
+    stats = sink.snapshot()
+    assert stats["dropped"] == 1
+    assert stats["spooled"] == 1
+    assert sink.flush() == 1
+    assert sink.replay() == 1
+    assert AuditLog.objects.filter(upl_sensitive=True).count() == 1
+
+
+def test_background_writer_flushes_on_interval(tmp_path, user):
+    sink = AuditSink(spool_dir=tmp_path, flush_seconds=0.05)
+    with patch.object(sink, "flush", wraps=sink.flush) as flush:
+        sink.start()
+        sink.enqueue("GET /api/auth/me/", user=user, resource_type="http_request")
+        deadline = timezone.now() + timedelta(seconds=2)
+        while flush.call_count == 0 and timezone.now() < deadline:
+            pass
+        sink._stopped.set()
+        sink._wake.set()
+        sink._thread.join()
+    assert flush.call_count >= 1
+
+
+@override_settings(AUDIT_BUFFER_ENABLED=True)
+def test_middleware_enqueues_instead_of_inserting(user):
+    request = RequestFactory().post("/api/intake/sessions/")
+    request.user = user
+    mock_sink = MagicMock()
+    with patch("apps.audit.middleware.get_audit_sink", return_value=mock_sink):
+        AuditLoggingMiddleware(get_response=lambda r: MagicMock(status_code=201))(request)
+
+    assert AuditLog.objects.count() == 0
+    kwargs = mock_sink.enqueue.call_args.kwargs
+    assert kwargs["action"] == "POST /api/intake/sessions/"
+    assert kwargs["upl_sensitive"] is True
+    assert kwargs["status_code"] == 201
+
+
+def test_replay_command(tmp_path, user):
+    sink = AuditSink(spool_dir=tmp_path)
+    sink.enqueue(
+        "POST /api/forms/generate/", user=user, resource_type="http_request", upl_sensitive=True
+    )
+    sink._segment.handle.close()
+
+    with override_settings(AUDIT_SPOOL_DIR=str(tmp_path)):
+        call_command("replay_audit_spool", verbosity=0)
+    assert AuditLog.objects.count() == 1
@@ -0,0 +1,130 @@
+"""Tests for audit_logs partition bookkeeping and the maintenance command."""
+
+import re
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.audit import partitions
+from apps.audit.models import AuditLog
+
+
+def test_partition_names_round_trip():
+    name = partitions.partition_name(date(2026, 3, 17))
+    assert name == "audit_logs_p2026_03"
+    parsed = partitions.parse_partition(name)
+    assert parsed.start == date(2026, 3, 1)
+    assert parsed.end == date(2026, 4, 1)
+    assert partitions.parse_partition(partitions.DEFAULT_PARTITION) is None
+
+
+def test_add_months_crosses_years():
+    assert partitions.add_months(date(2026, 11, 1), 3) == date(2027, 2, 1)
+    assert partitions.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_create_partition_sql_bounds():
+    sql = partitions.create_partition_sql(date(2026, 12, 5))
+    assert '"audit_logs_p2026_12" PARTITION OF "audit_logs"' in sql
+    assert "FROM ('2026-12-01') TO ('2027-01-01')" in sql
+
+
+def test_only_fully_expired_partitions_are_pruned():
+    months = [
+        partitions.Partition(partitions.partition_name(date(2016, m, 1)), date(2016, m, 1))
+        for m in (8, 9, 10)
+    ]
+    cutoff = timezone.make_aware(datetime(2016, 10, 15))
+    # September ends on Oct 1 (<= cutoff); October still holds live rows.
+    assert [p.name for p in partitions.expired(months, cutoff)] == [
+        "audit_logs_p2016_08",
+        "audit_logs_p2016_09",
+    ]
+
+
+class _PartitionedTable:
+    """
+    Stand-in for a PostgreSQL connection: records the SQL it is sent and keeps
+    the timestamps held by the DEFAULT partition, so the tests can see which
+    rows a new month takes over.
+    """
+
+    alias = "default"
+
+    def __init__(self, default_rows):
+        self.default_rows = list(default_rows)
+        self.statements = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        self._result = None
+        bounds = [date.fromisoformat(d) for d in re.findall(r"'(\d{4}-\d{2}-\d{2})'", sql)]
+        in_range = [row for row in self.default_rows if bounds and bounds[0] <= row < bounds[1]]
+        if sql.startswith("SELECT EXISTS"):
+            self._result = (bool(in_range),)
+        elif sql.startswith("DELETE"):
+            self.default_rows = [row for row in self.default_rows if row not in in_range]
+
+    def fetchone(self):
+        return self._result
+
+
+@pytest.mark.django_db
+def test_ensure_partitions_moves_default_rows_into_the_new_month():
+    # Partitions exist through March; a row for May already sits in DEFAULT.
+    table = _PartitionedTable(default_rows=[date(2027, 5, 3)])
+    march = partitions.parse_partition("audit_logs_p2027_03")
+    with patch.object(partitions, "list_partitions", return_value=[march]):
+        created = partitions.ensure_partitions(
+            through=date(2027, 5, 1), since=date(2027, 3, 1), connection=table
+        )
+
+    assert created == ["audit_logs_p2027_04", "audit_logs_p2027_05"]
+    assert table.default_rows == []
+    writes = [sql.split(" WHERE")[0] for sql in table.statements if not sql.startswith("SELECT")]
+    assert writes == [
+        partitions.create_partition_sql(date(2027, 4, 1)),
+        'ALTER TABLE "audit_logs" DETACH PARTITION "audit_logs_default"',
+        partitions.create_partition_sql(date(2027, 5, 1)),
+        'INSERT INTO "audit_logs_p2027_05" SELECT * FROM "audit_logs_default"',
+        'DELETE FROM "audit_logs_default"',
+        'ALTER TABLE "audit_logs" ATTACH PARTITION "audit_logs_default" DEFAULT',
+    ]
+
+
+@override_settings(AUDIT_LOG_RETENTION_DAYS=30)
+def test_retention_cutoff_uses_setting():
+    now = timezone.now()
+    assert partitions.retention_cutoff(now) == now - timedelta(days=30)
+
+
+@pytest.mark.django_db
+@override_settings(AUDIT_LOG_RETENTION_DAYS=30)
+def test_command_falls_back_to_row_delete_when_unpartitioned():
+    user = get_user_model().objects.create_user("old", "o@test.com", "pw")
+    old = AuditLog.log_action("old", user=user, resource_type="t")
+    AuditLog.objects.filter(pk=old.pk).update(timestamp=timezone.now() - timedelta(days=31))
+    AuditLog.log_action("new", user=user, resource_type="t")
+
+    out = StringIO()
+    call_command("maintain_audit_partitions", dry_run=True, stdout=out)
+    assert "Would delete 1 expired rows" in out.getvalue()
+    assert AuditLog.objects.count() == 2
+
+    call_command("maintain_audit_partitions", stdout=StringIO())
+    assert list(AuditLog.objects.values_list("action", flat=True)) == ["new"]
@@ -0,0 +1,123 @@
+"""Tests for the AuditLog search column, search filter and cursor pagination."""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.audit.buffer import _to_model
+from apps.audit.models import SEARCH_TEXT_MAX_LENGTH, AuditLog, build_search_text
+from apps.audit.search import MAX_TERMS, search_terms
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username="searcher", password="pw")
+
+
+@pytest.fixture
+def client(user):
+    api = APIClient()
+    api.force_authenticate(user=user)
+    return api
+
+
+def _ids(response):
+    return [row["id"] for row in response.data["results"]]
+
+
+def test_build_search_text_flattens_nested_details():
+    text = build_search_text(
+        "POST /api/means-test/",
+        "http_request",
+        {"path": "/api/means-test/", "result": {"passes": True, "codes": ["A", "B"]}},
+    )
+    assert text == (
+        "POST /api/means-test/ http_request path /api/means-test/ result passes True codes A B"
+    )
+
+
+def test_build_search_text_is_capped():
+    text = build_search_text("x", "y", {"blob": "z" * (SEARCH_TEXT_MAX_LENGTH * 2)})
+    assert len(text) == SEARCH_TEXT_MAX_LENGTH
+
+
+def test_search_terms_are_word_tokens():
+    assert search_terms("/api/Intake/ sessions!") == ["api", "intake", "sessions"]
+    assert len(search_terms(" ".join(["w"] * 20))) == MAX_TERMS
+
+
+def test_save_and_buffered_entries_maintain_search_text(user):
+    log = AuditLog.log_action("viewed_form", user=user, resource_type="form", form="B106")
+    assert log.search_text == "viewed_form form form B106"
+
+    log.details = {"form": "B122A"}
+    log.save()
+    log.refresh_from_db()
+    assert log.search_text == "viewed_form form form B122A"
+
+    buffered = _to_model(
+        {
+            "action": "GET /api/x/",
+            "resource_type": "http_request",
+            "details": {"path": "/api/x/"},
+            "timestamp": timezone.now().isoformat(),
+        }
+    )
+    assert buffered.search_text == "GET /api/x/ http_request path /api/x/"
+
+
+def test_search_matches_path_and_detail_values(client, user):
+    intake = AuditLog.log_action(
+        "POST /api/intake/sessions/",
+        user=user,
+        resource_type="http_request",
+        path="/api/intake/sessions/",
+    )
+    means = AuditLog.log_action(
+        "viewed_means_test_result", user=user, resource_type="means_test", result="passes"
+    )
+    url = reverse("auditlog-list")
+
+    assert _ids(client.get(url, {"search": "/api/intake/"})) == [intake.id]
+    assert _ids(client.get(url, {"search": "PASSES means"})) == [means.id]
+    assert _ids(client.get(url, {"search": "intake passes"})) == []
+
+
+def test_search_never_crosses_users(client):
+    other = User.objects.create_user(username="other", password="pw")
+    AuditLog.log_action("secret_lookup", user=other, resource_type="x")
+    response = client.get(reverse("auditlog-list"), {"search": "secret"})
+    assert _ids(response) == []
+
+
+def test_cursor_pagination_walks_every_row_once(client, user):
+    now = timezone.now()
+    created = []
+    for i in range(7):
+        log = AuditLog.objects.create(
+            user=user, action=f"a{i}", resource_type="x", timestamp=now - timedelta(minutes=i)
+        )
+        created.append(log.id)
+    # Two rows sharing a timestamp must not be skipped or repeated.
+    tied = AuditLog.objects.create(user=user, action="tied", resource_type="x", timestamp=now)
+    created.append(tied.id)
+
+    response = client.get(reverse("auditlog-list"), {"page_size": 3})
+    assert "count" not in response.data
+    seen = _ids(response)
+    while response.data["next"]:
+        response = client.get(response.data["next"])
+        seen += _ids(response)
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+    order = dict(AuditLog.objects.filter(id__in=seen).values_list("id", "timestamp"))
+    assert [order[pk] for pk in seen] == sorted(order.values(), reverse=True)
@@ -1,8 +1,9 @@
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, permissions, viewsets
-from rest_framework.pagination import PageNumberPagination
 
 from .models import AuditLog
+from .pagination import AuditLogCursorPagination
+from .search import AuditLogSearchFilter
 from .serializers import AuditLogSerializer
 
 
@@ -10,16 +11,15 @@ class AuditLogViewSet(viewsets.ModelViewSet):
     queryset = AuditLog.objects.all()
     serializer_class = AuditLogSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = PageNumberPagination
+    pagination_class = AuditLogCursorPagination
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        AuditLogSearchFilter,
         filters.OrderingFilter,
     ]
     filterset_fields = ["action", "resource_type", "upl_sensitive"]
-    search_fields = ["action", "details", "user__username", "user__email"]
     ordering_fields = ["timestamp", "action"]
-    ordering = ["-timestamp"]
+    ordering = ["-timestamp", "-id"]
 
     # Audit trail is per-user and append-only: no cross-tenant reads, no edits/deletes.
     http_method_names = ["get", "post", "head", "options"]
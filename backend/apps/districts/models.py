@@ -124,20 +124,24 @@ class MedianIncome(models.Model):
         Raises:
             ValueError: If family_size is less than 1.
         """
-        if family_size < 1:
-            raise ValueError("Family size must be at least 1.")
-
-        if family_size <= 8:
-            return getattr(self, f"family_size_{family_size}")
-
-        # For family size > 8, extrapolate
-        additional_people = family_size - 8
-        additional_amount = (
-            self.family_size_additional
-            if self.family_size_additional is not None
-            else Decimal("9900.00")
+        return self.as_table().median(family_size)
+
+    def as_table(self):
+        """This row as the catalog's compact ``MedianIncomeTable``."""
+        from apps.eligibility.services.standards import MedianIncomeTable
+
+        amounts = (
+            getattr(self, field)
+            for field in (
+                "family_size_additional",
+                *(f"family_size_{size}" for size in range(1, 9)),
+            )
+        )
+        # Unsaved rows may still hold the float default or plain numbers.
+        return MedianIncomeTable.from_row(
+            self.effective_date,
+            *(None if amount is None else Decimal(str(amount)) for amount in amounts),
         )
-        return self.family_size_8 + (Decimal(additional_people) * additional_amount)
 
 
 class ExemptionSchedule(models.Model):
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class DocumentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.documents'
+
+    def ready(self):
+        from .services import aggregator, session_summary
+
+        aggregator.connect_signals()
+        session_summary.connect_signals()
@@ -0,0 +1,125 @@
+"""
+benchmark_ocr - Time the document pipeline offline with the stub provider.
+
+Runs the same batch twice: once through the synchronous ``process`` loop (one
+document at a time, as the upload view does today) and once through
+``aprocess_many``, which overlaps text extraction / rasterization with the
+simulated LLM round trips. No network, no API key.
+
+  python manage.py benchmark_ocr --documents 20 --latency 0.5 --concurrency 8
+  python manage.py benchmark_ocr --file ~/scans/paystub.pdf --document-type pay_stub
+"""
+
+import asyncio
+import statistics
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.models import DocumentType
+from apps.documents.services.processor import DocumentProcessor
+from apps.documents.services.providers.stub import StubOCRProvider
+
+_MIME_BY_SUFFIX = {
+    ".pdf": "application/pdf",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+
+_SAMPLE_PAY_STUB_LINES = (
+    "ACME CORPORATION - EARNINGS STATEMENT",
+    "Employee: Jordan Sample",
+    "Pay period: 2026-01-01 to 2026-01-15",
+    "Gross pay: $3,240.00",
+    "Deductions: $790.00",
+    "Net pay: $2,450.00",
+    "YTD gross: $3,240.00",
+)
+
+
+def build_sample_pdf() -> bytes:
+    """A one-page, digitally generated pay stub with a real text layer."""
+    import fitz  # pymupdf
+
+    doc = fitz.open()
+    page = doc.new_page()
+    for i, line in enumerate(_SAMPLE_PAY_STUB_LINES):
+        page.insert_text((72, 72 + i * 18), line, fontsize=11)
+    return doc.tobytes()
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list (0 for empty input)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the OCR pipeline (sync vs async) against the offline stub provider."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--documents", type=int, default=10, help="Batch size")
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.25,
+            help="Simulated provider round trip in seconds",
+        )
+        parser.add_argument("--concurrency", type=int, default=4, help="Async in-flight limit")
+        parser.add_argument("--file", type=str, help="Benchmark this PDF/image instead of a sample")
+        parser.add_argument(
+            "--document-type",
+            type=str,
+            default=DocumentType.PAY_STUB,
+            choices=list(DocumentType.values),
+        )
+
+    def handle(self, *args, **options):
+        file_bytes, mime_type = self._load_input(options.get("file"))
+        doc_type = options["document_type"]
+        batch = [(file_bytes, mime_type, doc_type)] * options["documents"]
+        processor = DocumentProcessor(provider=StubOCRProvider(latency=options["latency"]))
+
+        per_doc: list[float] = []
+        started = time.perf_counter()
+        for doc in batch:
+            t0 = time.perf_counter()
+            processor.process(*doc)
+            per_doc.append(time.perf_counter() - t0)
+        sync_total = time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = asyncio.run(processor.aprocess_many(batch, concurrency=options["concurrency"]))
+        async_total = time.perf_counter() - started
+
+        errors = [r.error for r in results if r.error]
+        per_doc.sort()
+        self.stdout.write(f"documents={len(batch)} mime={mime_type} type={doc_type}")
+        self.stdout.write(
+            f"sync   total={sync_total:.3f}s mean={statistics.fmean(per_doc or [0]):.3f}s "
+            f"p50={percentile(per_doc, 50):.3f}s p95={percentile(per_doc, 95):.3f}s"
+        )
+        self.stdout.write(
+            f"async  total={async_total:.3f}s concurrency={options['concurrency']} "
+            f"speedup={sync_total / async_total if async_total else 0:.1f}x"
+        )
+        if errors:
+            self.stdout.write(self.style.WARNING(f"{len(errors)} errors, first: {errors[0]}"))
+
+    @staticmethod
+    def _load_input(path: str | None) -> tuple[bytes, str]:
+        if not path:
+            return build_sample_pdf(), "application/pdf"
+        file_path = Path(path).expanduser()
+        mime_type = _MIME_BY_SUFFIX.get(file_path.suffix.lower())
+        if mime_type is None:
+            raise CommandError(f"Unsupported file type: {file_path.suffix}")
+        try:
+            return file_path.read_bytes(), mime_type
+        except OSError as exc:
+            raise CommandError(f"Cannot read {file_path}: {exc}") from exc
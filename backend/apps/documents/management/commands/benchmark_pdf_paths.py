@@ -0,0 +1,84 @@
+"""
+benchmark_pdf_paths - Per-document latency of the three PDF front ends.
+
+  pymupdf  in-process text layer (tried first for every PDF)
+  odl      opendataloader-pdf via the shared batch converter (needs `java`)
+  vision   page rasterization for the vision provider (scans)
+
+Only the local work is timed; no provider call is made.
+
+  python manage.py benchmark_pdf_paths --documents 20
+  python manage.py benchmark_pdf_paths --file ~/scans/statement.pdf --paths pymupdf vision
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.management.commands.benchmark_ocr import build_sample_pdf, percentile
+from apps.documents.services import processor, rasterize
+
+_PATHS = ("pymupdf", "odl", "vision")
+
+
+class Command(BaseCommand):
+    help = "Compare per-document PDF latency: PyMuPDF text, opendataloader-pdf, rasterization."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--documents", type=int, default=10, help="Documents per path")
+        parser.add_argument("--file", type=str, help="Benchmark this PDF instead of a sample")
+        parser.add_argument("--paths", nargs="+", choices=_PATHS, default=list(_PATHS))
+        parser.add_argument(
+            "--pages",
+            type=int,
+            default=processor._MAX_SCANNED_PAGES,
+            help="Pages rasterized on the vision path",
+        )
+
+    def handle(self, *args, **options):
+        pdf_bytes = self._load_input(options.get("file"))
+        runners = {
+            "pymupdf": processor._extract_text_layer,
+            "odl": self._odl,
+            "vision": lambda data: list(rasterize.iter_page_images(data, options["pages"])),
+        }
+        self.stdout.write(f"documents={options['documents']} bytes={len(pdf_bytes)}")
+        for path in options["paths"]:
+            timings = self._time(path, runners[path], pdf_bytes, options["documents"])
+            if timings is None:
+                continue
+            self.stdout.write(
+                f"{path:<8} mean={statistics.fmean(timings) * 1000:.1f}ms "
+                f"p50={percentile(timings, 50) * 1000:.1f}ms "
+                f"p95={percentile(timings, 95) * 1000:.1f}ms"
+            )
+
+    def _time(self, path: str, run, pdf_bytes: bytes, documents: int) -> list[float] | None:
+        timings: list[float] = []
+        for _ in range(documents):
+            started = time.perf_counter()
+            try:
+                run(pdf_bytes)
+            except Exception as exc:
+                self.stdout.write(self.style.WARNING(f"{path:<8} skipped: {exc}"))
+                return None
+            timings.append(time.perf_counter() - started)
+        return sorted(timings)
+
+    @staticmethod
+    def _odl(pdf_bytes: bytes) -> str:
+        if processor.opendataloader_pdf is None:
+            raise CommandError("opendataloader-pdf is not installed")
+        return processor.get_odl_converter().convert(pdf_bytes)
+
+    @staticmethod
+    def _load_input(path: str | None) -> bytes:
+        if not path:
+            return build_sample_pdf()
+        file_path = Path(path).expanduser()
+        try:
+            return file_path.read_bytes()
+        except OSError as exc:
+            raise CommandError(f"Cannot read {file_path}: {exc}") from exc
@@ -0,0 +1,18 @@
+"""
+purge_extraction_cache - Evict cached OCR extractions past DOCUMENT_RETENTION_DAYS.
+
+Cached extractions hold the same parsed PII as OCRResult rows, so they must not
+outlive the documents they came from. Run daily by ``scheduler.sh``.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.documents.services.extraction_cache import purge_expired
+
+
+class Command(BaseCommand):
+    help = "Delete cached OCR extractions whose retention window has passed."
+
+    def handle(self, *args, **options):
+        deleted = purge_expired()
+        self.stdout.write(self.style.SUCCESS(f"Purged {deleted} expired cached extractions"))
@@ -0,0 +1,35 @@
+"""
+rebuild_ingested_aggregates - Recompute document aggregates from scratch.
+
+Uploads and validations maintain IngestedAggregate rows incrementally from
+per-document contributions. If those running sums are ever suspected to have
+drifted (manual data fixes, a failed transaction, a new aggregator), this
+rebuilds contributions, accumulators and aggregates from the OCR results.
+
+  python manage.py rebuild_ingested_aggregates
+  python manage.py rebuild_ingested_aggregates --session 42 --session 43
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.documents.models import UploadedDocument
+from apps.documents.services.aggregator import AggregateIngestionService
+
+
+class Command(BaseCommand):
+    help = "Rebuild IngestedAggregate rows from OCR results (all sessions with uploads by default)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--session", type=int, action="append", dest="sessions", help="Session id (repeatable)"
+        )
+
+    def handle(self, *args, **options):
+        session_ids = options["sessions"] or list(
+            UploadedDocument.objects.values_list("session_id", flat=True).distinct().order_by()
+        )
+        for session_id in session_ids:
+            AggregateIngestionService.recalculate(session_id)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt ingested aggregates for {len(session_ids)} sessions")
+        )
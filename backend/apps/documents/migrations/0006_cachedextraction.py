@@ -0,0 +1,74 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:02
+
+import encrypted_model_fields.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documents", "0005_alter_ocrresult_extracted_data"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CachedExtraction",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("cache_key", models.CharField(max_length=64, unique=True)),
+                (
+                    "document_type",
+                    models.CharField(
+                        choices=[
+                            ("pay_stub", "Pay Stub"),
+                            ("bank_statement", "Bank Statement"),
+                            ("credit_cert", "Credit Counseling Certificate"),
+                            ("credit_report", "Credit Report"),
+                            ("tax_return_personal", "Personal Tax Return (1040)"),
+                            ("special_circumstances", "Supporting Document"),
+                            ("balance_sheet", "Balance Sheet"),
+                            ("profit_loss", "Profit & Loss Statement"),
+                            ("cash_flow", "Cash Flow Statement"),
+                            ("tax_return_business", "Business Tax Return"),
+                            ("accounts_receivable", "Accounts Receivable Aging"),
+                            ("accounts_payable", "Accounts Payable Aging"),
+                            ("operating_agreement", "Operating Agreement"),
+                            ("corporate_resolution", "Corporate Resolution"),
+                            ("lease_agreement", "Lease Agreement"),
+                            ("loan_agreement", "Loan Agreement"),
+                            ("judgment", "Court Judgment"),
+                            ("lien_notice", "Lien Notice"),
+                            ("creditor_bill", "Creditor Bill / Statement"),
+                        ],
+                        max_length=50,
+                    ),
+                ),
+                ("prompt_version", models.CharField(max_length=16)),
+                ("ocr_provider", models.CharField(default="gemini", max_length=50)),
+                (
+                    "extracted_data",
+                    encrypted_model_fields.fields.EncryptedTextField(
+                        help_text="Encrypted JSON of extracted fields"
+                    ),
+                ),
+                ("confidence_scores", models.JSONField(default=dict)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "expires_at",
+                    models.DateTimeField(help_text="Evicted after DOCUMENT_RETENTION_DAYS"),
+                ),
+                ("hit_count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "db_table": "cached_extractions",
+                "indexes": [
+                    models.Index(fields=["expires_at"], name="cached_extr_expires_c4f2a9_idx")
+                ],
+            },
+        ),
+    ]
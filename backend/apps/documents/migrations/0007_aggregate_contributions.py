@@ -0,0 +1,93 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documents", "0006_cachedextraction"),
+        ("intake", "0010_add_adversary_proceedings"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AggregateAccumulator",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("aggregator", models.CharField(max_length=50)),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "sums",
+                    models.JSONField(default=dict, help_text="Decimal strings keyed by term name"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aggregate_accumulators",
+                        to="intake.intakesession",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "aggregate_accumulators",
+                "unique_together": {("session", "aggregator")},
+            },
+        ),
+        migrations.CreateModel(
+            name="AggregateContribution",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "aggregator",
+                    models.CharField(help_text="Aggregator key, e.g. 'paystub'", max_length=50),
+                ),
+                ("terms", models.JSONField(default=dict)),
+                (
+                    "sort_date",
+                    models.DateField(
+                        blank=True, help_text="Recency for 'latest' values", null=True
+                    ),
+                ),
+                ("label", models.CharField(blank=True, default="", max_length=255)),
+                (
+                    "ocr_result",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aggregate_contribution",
+                        to="documents.ocrresult",
+                    ),
+                ),
+                (
+                    "session",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aggregate_contributions",
+                        to="intake.intakesession",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "aggregate_contributions",
+                "indexes": [
+                    models.Index(
+                        fields=["session", "aggregator", "sort_date"],
+                        name="aggregate_c_session_1c896c_idx",
+                    )
+                ],
+            },
+        ),
+    ]
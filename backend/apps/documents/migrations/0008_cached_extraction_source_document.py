@@ -0,0 +1,31 @@
+# Generated by Django 5.0.14 on 2026-10-19 15:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def drop_shared_entries(apps, schema_editor):
+    # Existing keys were shared across users and have no source document.
+    apps.get_model("documents", "CachedExtraction").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("documents", "0007_aggregate_contributions"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_shared_entries, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="cachedextraction",
+            name="source_document",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="cached_extractions",
+                to="documents.uploadeddocument",
+            ),
+        ),
+    ]
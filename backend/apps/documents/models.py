@@ -172,3 +172,93 @@ class IngestedAggregate(models.Model):
 
     def __str__(self):
         return f"{self.ingest_key}: {self.value}"
+
+
+class AggregateContribution(models.Model):
+    """
+    One OCRResult's share of a session's ingested aggregates.
+
+    ``terms`` are the Decimal amounts (as strings) this document adds to its
+    AggregateAccumulator, so removing or re-validating the document can
+    subtract exactly what it added without re-reading the other documents.
+    """
+
+    session = models.ForeignKey(
+        "intake.IntakeSession", on_delete=models.CASCADE, related_name="aggregate_contributions"
+    )
+    ocr_result = models.OneToOneField(
+        OCRResult, on_delete=models.CASCADE, related_name="aggregate_contribution"
+    )
+    aggregator = models.CharField(max_length=50, help_text="Aggregator key, e.g. 'paystub'")
+    terms = models.JSONField(default=dict)
+    sort_date = models.DateField(null=True, blank=True, help_text="Recency for 'latest' values")
+    label = models.CharField(max_length=255, blank=True, default="")
+
+    class Meta:
+        db_table = "aggregate_contributions"
+        indexes = [
+            models.Index(fields=["session", "aggregator", "sort_date"]),
+        ]
+
+    def __str__(self):
+        return f"{self.aggregator} contribution from OCR {self.ocr_result_id}"
+
+
+class AggregateAccumulator(models.Model):
+    """Running sums and contribution count for one aggregator in one session."""
+
+    session = models.ForeignKey(
+        "intake.IntakeSession", on_delete=models.CASCADE, related_name="aggregate_accumulators"
+    )
+    aggregator = models.CharField(max_length=50)
+    count = models.PositiveIntegerField(default=0)
+    sums = models.JSONField(default=dict, help_text="Decimal strings keyed by term name")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "aggregate_accumulators"
+        unique_together = [["session", "aggregator"]]
+
+    def __str__(self):
+        return f"{self.aggregator}: {self.count} documents"
+
+
+class CachedExtraction(models.Model):
+    """
+    Content-addressed cache of successful OCR extractions.
+
+    Keyed by SHA-256 over the uploader, upload bytes, document type and prompt
+    version, so a re-upload of the same pay stub or credit report by the same
+    user reuses the prior result instead of paying for text extraction and an
+    LLM call again. Entries are deleted with the document they were extracted
+    from and otherwise carry the same retention window.
+    """
+
+    cache_key = models.CharField(max_length=64, unique=True)
+    source_document = models.ForeignKey(
+        UploadedDocument,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="cached_extractions",
+    )
+    document_type = models.CharField(max_length=50, choices=DocumentType.choices)
+    prompt_version = models.CharField(max_length=16)
+    ocr_provider = models.CharField(max_length=50, default="gemini")
+
+    # Same at-rest protection as OCRResult.extracted_data.
+    extracted_data = EncryptedTextField(help_text="Encrypted JSON of extracted fields")
+    confidence_scores = models.JSONField(default=dict)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(help_text="Evicted after DOCUMENT_RETENTION_DAYS")
+    hit_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "cached_extractions"
+        indexes = [
+            models.Index(fields=["expires_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.document_type} extraction {self.cache_key[:12]}"
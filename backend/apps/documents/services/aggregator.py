@@ -1,34 +1,239 @@
 import json
 import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import date
 from decimal import Decimal
 
-from apps.documents.models import DocumentType, IngestedAggregate, OCRResult, OCRStatus
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import pre_delete
+
+from apps.documents.models import (
+    AggregateAccumulator,
+    AggregateContribution,
+    DocumentType,
+    IngestedAggregate,
+    OCRResult,
+    OCRStatus,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Contribution:
+    """What one document adds to its aggregator's running sums."""
+
+    terms: dict[str, Decimal]
+    sort_date: date | None = None
+    label: str = ""
+
+
+@dataclass(frozen=True)
+class AggregateState:
+    """Accumulator snapshot handed to ``BaseAggregator.outputs``."""
+
+    count: int
+    sums: dict[str, Decimal] = field(default_factory=dict)
+    latest: AggregateContribution | None = None
+
+
+class BaseAggregator(ABC):
+    """
+    Maps one document type onto ``<key>.*`` IngestedAggregate rows.
+
+    ``contribution`` parses a single OCRResult's fields once, when the document
+    is added or re-validated; ``outputs`` turns the running sums (plus the most
+    recent contribution, when ``uses_latest``) into ingest values.
+    """
+
+    key: str = ""
+    document_type: str = ""
+    uses_latest: bool = False
+
+    @abstractmethod
+    def contribution(self, data: dict) -> Contribution | None:
+        """Parse one document's fields; None when it contributes nothing."""
+
+    @abstractmethod
+    def outputs(self, state: AggregateState) -> dict[str, str]:
+        """Ingest key -> value for the current running sums."""
+
+
+class PayStubAggregator(BaseAggregator):
+    """Average monthly gross across stubs; employer from the latest pay period."""
+
+    key = "paystub"
+    document_type = DocumentType.PAY_STUB
+    uses_latest = True
+
+    def contribution(self, data: dict) -> Contribution | None:
+        from apps.documents.schemas.paystub import PayStubExtraction
+
+        parsed = PayStubExtraction(**data)
+        days = (parsed.pay_period_end - parsed.pay_period_start).days + 1
+        if days <= 0:
+            return None
+        daily_gross = parsed.gross_pay / Decimal(str(days))
+        return Contribution(
+            terms={"monthly_gross": daily_gross * Decimal("30.41667")},
+            sort_date=parsed.pay_period_end,
+            label=parsed.employer_name or "",
+        )
+
+    def outputs(self, state: AggregateState) -> dict[str, str]:
+        average = state.sums["monthly_gross"] / Decimal(str(state.count))
+        return {
+            "paystub.gross": str(average.quantize(Decimal("0.01"))),
+            "paystub.employer_name": state.latest.label if state.latest else "",
+        }
+
+
+class CreditorBillAggregator(BaseAggregator):
+    """Totals across uploaded creditor bills."""
+
+    key = "creditor_bill"
+    document_type = DocumentType.CREDITOR_BILL
+
+    def contribution(self, data: dict) -> Contribution | None:
+        from apps.documents.schemas.creditor_bill import CreditorBillExtraction
+
+        parsed = CreditorBillExtraction(**data)
+        return Contribution(
+            terms={
+                "amount_owed": parsed.amount_owed,
+                "minimum_payment": parsed.minimum_payment or Decimal("0"),
+            },
+            sort_date=parsed.due_date,
+            label=parsed.creditor_name,
+        )
+
+    def outputs(self, state: AggregateState) -> dict[str, str]:
+        return {
+            "creditor_bill.count": str(state.count),
+            "creditor_bill.total_owed": str(state.sums["amount_owed"].quantize(Decimal("0.01"))),
+            "creditor_bill.total_minimum_payment": str(
+                state.sums["minimum_payment"].quantize(Decimal("0.01"))
+            ),
+        }
+
+
+class CreditReportAggregator(BaseAggregator):
+    """
+    Tradeline totals from the most recently uploaded credit report.
+
+    Reports from different bureaus list the same accounts, so only the report
+    count is summed; balances come from the latest report rather than adding
+    up the same debts three times.
+    """
+
+    key = "credit_report"
+    document_type = DocumentType.CREDIT_REPORT
+    uses_latest = True
+
+    def contribution(self, data: dict) -> Contribution | None:
+        from apps.documents.schemas.credit_report import CreditReportExtraction
+
+        parsed = CreditReportExtraction(**data)
+        total = sum((t.amount_owed for t in parsed.tradelines), Decimal("0"))
+        return Contribution(
+            terms={"tradelines": Decimal(len(parsed.tradelines)), "amount_owed": total},
+        )
+
+    def outputs(self, state: AggregateState) -> dict[str, str]:
+        latest = state.latest.terms if state.latest else {}
+        return {
+            "credit_report.count": str(state.count),
+            "credit_report.tradeline_count": str(int(Decimal(latest.get("tradelines", "0")))),
+            "credit_report.total_owed": str(
+                Decimal(latest.get("amount_owed", "0")).quantize(Decimal("0.01"))
+            ),
+        }
+
+
+AGGREGATORS: dict[str, BaseAggregator] = {
+    aggregator.document_type: aggregator
+    for aggregator in (PayStubAggregator(), CreditorBillAggregator(), CreditReportAggregator())
+}
+
+
 class AggregateIngestionService:
+    """
+    Keeps IngestedAggregate rows current as documents come and go.
+
+    ``apply`` and ``remove`` adjust one aggregator's running sums by a single
+    document's contribution (constant work regardless of how many documents
+    the session holds). ``remove`` runs from a ``pre_delete`` receiver, so
+    deleting an OCR result or its document (directly, by cascade or from the
+    admin) takes its amounts out of the sums. ``recalculate`` rebuilds
+    everything for a session from the OCR results and is kept for repair (see
+    ``rebuild_ingested_aggregates``).
+    """
+
+    @classmethod
+    def apply(cls, ocr: OCRResult) -> None:
+        """Add, replace or drop ``ocr``'s contribution to match its current state."""
+        aggregator = AGGREGATORS.get(ocr.document.document_type)
+        if aggregator is None:
+            return
+        new = cls._contribution(aggregator, ocr) if ocr.status == OCRStatus.COMPLETED else None
+        cls._replace(aggregator, ocr, new)
+
+    @classmethod
+    def remove(cls, ocr: OCRResult) -> None:
+        """Subtract ``ocr``'s contribution; called before it is deleted."""
+        aggregator = AGGREGATORS.get(ocr.document.document_type)
+        if aggregator is not None:
+            cls._replace(aggregator, ocr, None)
+
     @classmethod
     def recalculate(cls, session_id: int) -> None:
+        """Rebuild every aggregate for the session from its completed OCR results."""
         try:
             results = list(
                 OCRResult.objects.filter(
                     document__session_id=session_id, status=OCRStatus.COMPLETED
                 ).select_related("document")
             )
+            with transaction.atomic():
+                AggregateContribution.objects.filter(session_id=session_id).delete()
+                AggregateAccumulator.objects.filter(session_id=session_id).delete()
 
-            # Group by document type
-            by_type = {}
-            for res in results:
-                by_type.setdefault(res.document.document_type, []).append(res)
+                accumulators = {
+                    aggregator.key: AggregateAccumulator(
+                        session_id=session_id, aggregator=aggregator.key
+                    )
+                    for aggregator in AGGREGATORS.values()
+                }
+                sums: dict[str, dict[str, Decimal]] = {key: {} for key in accumulators}
+                contributions = []
+                for ocr in results:
+                    aggregator = AGGREGATORS.get(ocr.document.document_type)
+                    if aggregator is None:
+                        continue
+                    contribution = cls._contribution(aggregator, ocr)
+                    if contribution is None:
+                        continue
+                    contributions.append(
+                        AggregateContribution(
+                            session_id=session_id,
+                            ocr_result=ocr,
+                            aggregator=aggregator.key,
+                            terms=_encode(contribution.terms),
+                            sort_date=contribution.sort_date,
+                            label=contribution.label,
+                        )
+                    )
+                    _add(sums[aggregator.key], contribution.terms, sign=1)
+                    accumulators[aggregator.key].count += 1
+                AggregateContribution.objects.bulk_create(contributions)
 
-            # Recalculate each type
-            if DocumentType.PAY_STUB in by_type:
-                cls._calc_paystubs(session_id, by_type[DocumentType.PAY_STUB])
-            else:
-                IngestedAggregate.objects.filter(
-                    session_id=session_id, ingest_key__startswith="paystub."
-                ).delete()
+                for key, accumulator in accumulators.items():
+                    accumulator.sums = _encode(sums[key])
+                AggregateAccumulator.objects.bulk_create(accumulators.values())
+                for aggregator in AGGREGATORS.values():
+                    cls._publish(aggregator, accumulators[aggregator.key])
 
         except Exception as exc:
             logger.exception(
@@ -36,50 +241,101 @@ class AggregateIngestionService:
             )
 
     @classmethod
-    def _calc_paystubs(cls, session_id: int, results: list[OCRResult]) -> None:
-        from apps.documents.schemas.paystub import PayStubExtraction
-
-        total_monthly_gross = Decimal("0")
-        valid_stubs = 0
-        most_recent_end = None
-        most_recent_employer: str = ""
-
-        for ocr in results:
-            try:
-                data = json.loads(ocr.extracted_data or "{}")
-                parsed = PayStubExtraction(**data)
-
-                days = (parsed.pay_period_end - parsed.pay_period_start).days + 1
-                if days <= 0:
-                    continue
+    def _replace(cls, aggregator: BaseAggregator, ocr: OCRResult, new: Contribution | None) -> None:
+        try:
+            with transaction.atomic():
+                old = AggregateContribution.objects.filter(ocr_result=ocr).first()
+                if old is None and new is None:
+                    return
+                accumulator = cls._lock_accumulator(ocr.document.session_id, aggregator.key)
+                sums = _decode(accumulator.sums)
+                if old is not None:
+                    _add(sums, _decode(old.terms), sign=-1)
+                    accumulator.count -= 1
+                if new is not None:
+                    AggregateContribution.objects.update_or_create(
+                        ocr_result=ocr,
+                        defaults={
+                            "session_id": ocr.document.session_id,
+                            "aggregator": aggregator.key,
+                            "terms": _encode(new.terms),
+                            "sort_date": new.sort_date,
+                            "label": new.label,
+                        },
+                    )
+                    _add(sums, new.terms, sign=1)
+                    accumulator.count += 1
+                else:
+                    old.delete()
+                accumulator.sums = _encode(sums)
+                accumulator.save(update_fields=["count", "sums", "updated_at"])
+                cls._publish(aggregator, accumulator)
+        except Exception as exc:
+            logger.exception(
+                "Failed to update ingestion aggregates for OCRResult %s: %s", ocr.pk, exc
+            )
 
-                daily_gross = parsed.gross_pay / Decimal(str(days))
-                monthly_gross = daily_gross * Decimal("30.41667")
+    @staticmethod
+    def _contribution(aggregator: BaseAggregator, ocr: OCRResult) -> Contribution | None:
+        try:
+            return aggregator.contribution(json.loads(ocr.extracted_data or "{}"))
+        except Exception as e:
+            logger.warning("Skipping invalid %s OCRResult %s: %s", aggregator.key, ocr.id, e)
+            return None
 
-                total_monthly_gross += monthly_gross
-                valid_stubs += 1
+    @staticmethod
+    def _lock_accumulator(session_id: int, key: str) -> AggregateAccumulator:
+        accumulator, _ = AggregateAccumulator.objects.select_for_update().get_or_create(
+            session_id=session_id, aggregator=key
+        )
+        return accumulator
 
-                if most_recent_end is None or parsed.pay_period_end > most_recent_end:
-                    most_recent_end = parsed.pay_period_end
-                    most_recent_employer = parsed.employer_name or ""
-            except Exception as e:
-                logger.warning("Skipping invalid paystub OCRResult %s: %s", ocr.id, e)
+    @staticmethod
+    def _publish(aggregator: BaseAggregator, accumulator: AggregateAccumulator) -> None:
+        session_id = accumulator.session_id
+        if accumulator.count == 0:
+            IngestedAggregate.objects.filter(
+                session_id=session_id, ingest_key__startswith=f"{aggregator.key}."
+            ).delete()
+            return
 
-        if valid_stubs > 0:
-            avg_monthly_gross = (total_monthly_gross / Decimal(str(valid_stubs))).quantize(
-                Decimal("0.01")
-            )
-            IngestedAggregate.objects.update_or_create(
-                session_id=session_id,
-                ingest_key="paystub.gross",
-                defaults={"value": str(avg_monthly_gross)},
+        latest = None
+        if aggregator.uses_latest:
+            latest = (
+                AggregateContribution.objects.filter(
+                    session_id=session_id, aggregator=aggregator.key
+                )
+                .order_by(F("sort_date").desc(nulls_last=True), "-id")
+                .first()
             )
+        state = AggregateState(
+            count=accumulator.count, sums=_decode(accumulator.sums), latest=latest
+        )
+        for ingest_key, value in aggregator.outputs(state).items():
             IngestedAggregate.objects.update_or_create(
-                session_id=session_id,
-                ingest_key="paystub.employer_name",
-                defaults={"value": most_recent_employer},
+                session_id=session_id, ingest_key=ingest_key, defaults={"value": value}
             )
-        else:
-            IngestedAggregate.objects.filter(
-                session_id=session_id, ingest_key__startswith="paystub."
-            ).delete()
+
+
+def _on_ocr_result_delete(sender, instance, **kwargs):
+    AggregateIngestionService.remove(instance)
+
+
+def connect_signals() -> None:
+    """Attach the delete receiver; called from DocumentsConfig.ready."""
+    pre_delete.connect(
+        _on_ocr_result_delete, sender=OCRResult, dispatch_uid="ingested_aggregates:remove"
+    )
+
+
+def _decode(values: dict[str, str]) -> dict[str, Decimal]:
+    return {name: Decimal(value) for name, value in values.items()}
+
+
+def _encode(values: dict[str, Decimal]) -> dict[str, str]:
+    return {name: str(value) for name, value in values.items()}
+
+
+def _add(sums: dict[str, Decimal], terms: dict[str, Decimal], sign: int) -> None:
+    for name, value in terms.items():
+        sums[name] = sums.get(name, Decimal("0")) + sign * value
@@ -2,6 +2,7 @@ from decimal import Decimal, InvalidOperation
 
 from apps.documents.models import DocumentType, UploadedDocument
 from apps.documents.services.processor import ExtractionResult
+from apps.intake import summaries
 from apps.intake.models import DebtInfo, IntakeSession
 
 _VALID_DEBT_TYPES = {c[0] for c in DebtInfo.DEBT_TYPE_CHOICES}
@@ -46,12 +47,17 @@ class DraftDebtCreator:
         session: IntakeSession,
         source_document: UploadedDocument,
     ) -> list[DebtInfo]:
-        """Create draft DebtInfo records from each non-zero tradeline."""
-        created = []
+        """
+        Create draft DebtInfo records from each non-zero tradeline.
+
+        One INSERT for the whole report; bulk_create sends no signals, so the
+        session summary is refreshed once afterwards.
+        """
+        drafts = []
         for tradeline in result.tradelines:
             if tradeline.amount_owed == 0:
                 continue
-            debt = DebtInfo.objects.create(
+            debt = DebtInfo(
                 session=session,
                 source_document=source_document,
                 is_draft=True,
@@ -64,7 +70,11 @@ class DraftDebtCreator:
                 priority_classification=self._priority_for_type(tradeline.account_type),
                 data_source="credit_report",
             )
-            created.append(debt)
+            drafts.append(debt)
+        if not drafts:
+            return []
+        created = DebtInfo.objects.bulk_create(drafts)
+        summaries.refresh(session.pk, create=False)
         return created
 
     @staticmethod
@@ -0,0 +1,98 @@
+"""
+Content-hash deduplication for OCR extractions.
+
+Users re-upload the same document after a failed validation or from another
+device; each upload would otherwise pay for a PDF conversion and an LLM call.
+``cache_key`` fingerprints (uploader, file bytes, document type, prompt
+version); ``lookup`` returns a copy of a prior successful ExtractionResult,
+``store`` records a new one.
+
+Entries are never shared between users: a cache hit would otherwise tell one
+user that someone else uploaded the same file. Each entry belongs to the
+document whose extraction it holds and is deleted with it; the rest expire
+with DOCUMENT_RETENTION_DAYS and are removed by ``purge_expired`` (the
+``purge_extraction_cache`` command, run daily by ``scheduler.sh``).
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from apps.documents.models import CachedExtraction
+from apps.documents.services.processor import ExtractionResult
+from apps.documents.services.providers.prompts import prompt_version
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(file_bytes: bytes, document_type: str, user_id: int) -> str:
+    """SHA-256 over the uploader, the upload bytes, the document type and the prompt version."""
+    sha = hashlib.sha256()
+    sha.update(str(user_id).encode())
+    sha.update(b"\0")
+    sha.update(hashlib.sha256(file_bytes).digest())
+    sha.update(b"\0")
+    sha.update(str(document_type).encode())
+    sha.update(b"\0")
+    sha.update(prompt_version(document_type).encode())
+    return sha.hexdigest()
+
+
+def lookup(key: str) -> ExtractionResult | None:
+    """Return a fresh ExtractionResult copied from an unexpired entry, or None."""
+    entry = CachedExtraction.objects.filter(cache_key=key, expires_at__gt=timezone.now()).first()
+    if entry is None:
+        return None
+    CachedExtraction.objects.filter(pk=entry.pk).update(hit_count=F("hit_count") + 1)
+    return ExtractionResult(
+        fields=json.loads(entry.extracted_data or "{}"),
+        confidence=dict(entry.confidence_scores),
+        detected_type=entry.document_type,
+    )
+
+
+def store(
+    key: str,
+    document_type: str,
+    result: ExtractionResult,
+    provider: str,
+    source_document=None,
+) -> None:
+    """
+    Cache a successful extraction. Failed results are never cached.
+
+    The entry is deleted along with ``source_document`` (the upload it was
+    extracted from).
+    """
+    if result.error:
+        return
+    now = timezone.now()
+    try:
+        CachedExtraction.objects.update_or_create(
+            cache_key=key,
+            defaults={
+                "document_type": document_type,
+                "source_document": source_document,
+                "prompt_version": prompt_version(document_type),
+                "ocr_provider": provider,
+                "extracted_data": json.dumps(result.fields),
+                "confidence_scores": result.confidence,
+                "created_at": now,
+                "expires_at": now + timedelta(days=settings.DOCUMENT_RETENTION_DAYS),
+            },
+        )
+    except IntegrityError:
+        # Two workers raced on the same upload; either copy is correct.
+        logger.info("Extraction cache entry %s already stored", key[:12])
+
+
+def purge_expired() -> int:
+    """Delete entries past their retention window. Returns the number removed."""
+    deleted, _ = CachedExtraction.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
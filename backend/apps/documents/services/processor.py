@@ -1,7 +1,14 @@
+import asyncio
 import json
 import logging
 import os
+import queue
 import tempfile
+import threading
+import time
+import typing
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -10,14 +17,20 @@ try:
 except ImportError:
     opendataloader_pdf = None
 
+from apps.documents.services import rasterize
 from apps.documents.services.providers.base import BaseOCRProvider
 from apps.documents.services.providers.prompts.image_extraction import build_image_extraction_prompt
 from apps.documents.services.providers.prompts.text_extraction import build_text_extraction_prompt
+from config.metrics import OCR_PROVIDER_SECONDS
+from config.perf import span
 
 logger = logging.getLogger(__name__)
 
 _MIN_TEXT_LENGTH = 30
 _MAX_SCANNED_PAGES = 3
+_MAX_TEXT_PAGES = 30
+_ODL_SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+_IMAGE_MIME_TYPES = ("image/jpeg", "image/png", "image/webp")
 
 
 @dataclass
@@ -28,32 +41,243 @@ class ExtractionResult:
     error: str = ""
 
 
-def _read_odl_output(output_dir: str) -> str:
-    for fname in os.listdir(output_dir):
-        if fname.endswith(".md") or fname.endswith(".txt"):
+def _read_odl_output(output_dir: str, stem: str | None = None) -> str:
+    for fname in sorted(os.listdir(output_dir)):
+        name, ext = os.path.splitext(fname)
+        if ext in (".md", ".txt") and (stem is None or name == stem):
             with open(os.path.join(output_dir, fname)) as f:
                 return f.read()
     return ""
 
 
-def _pdf_to_image_bytes(pdf_bytes: bytes, page_index: int = 0) -> bytes:
+def _pdf_page_images(pdf_bytes: bytes, max_pages: int) -> Iterator[bytes]:
+    return rasterize.iter_page_images(pdf_bytes, max_pages)
+
+
+def _list_fields(doc_type: str) -> set[str]:
+    """Schema fields typed ``list[...]`` (e.g. credit report tradelines)."""
+    from apps.documents.schemas.registry import SCHEMA_MAP
+
+    schema = SCHEMA_MAP.get(doc_type)
+    if schema is None:
+        return set()
+    return {
+        name
+        for name, info in schema.model_fields.items()
+        if typing.get_origin(info.annotation) is list
+    }
+
+
+def _merge_page_fields(doc_type: str, pages: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Merge per-page extractions into one document by schema.
+
+    List fields are concatenated across pages (duplicates dropped, since
+    statements often repeat a row at a page break); scalar fields keep the
+    first non-empty value, which is usually the page-1 header.
+    """
+    list_fields = _list_fields(doc_type)
+    merged: dict[str, Any] = {}
+    for page in pages:
+        for key, value in page.items():
+            if key in list_fields or isinstance(value, list):
+                items = merged.setdefault(key, [])
+                for item in value or []:
+                    if item not in items:
+                        items.append(item)
+            elif merged.get(key) in (None, "") and value not in (None, ""):
+                merged[key] = value
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+
+def _extract_text_layer(pdf_bytes: bytes) -> str:
+    """
+    Embedded text via PyMuPDF, in-process.
+
+    Digitally generated pay stubs and bills carry a text layer, so this avoids
+    the JVM, temp files and disk round trip for most uploads. Returns "" for
+    scans and for bytes PyMuPDF cannot open.
+    """
     import fitz  # pymupdf
 
-    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    if page_index >= len(doc):
-        page_index = 0
-    page = doc[page_index]
-    pix = page.get_pixmap(dpi=150)
-    return pix.tobytes("jpeg")
+    try:
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            pages = [
+                doc[i].get_text("text", sort=True) for i in range(min(len(doc), _MAX_TEXT_PAGES))
+            ]
+    except Exception as exc:
+        logger.info("PyMuPDF could not read PDF text layer (%s)", exc)
+        return ""
+    return "\n\n".join(page.strip() for page in pages if page.strip())
+
+
+def _extract_pdf_text(pdf_bytes: bytes) -> str:
+    """Text layer via PyMuPDF, else opendataloader-pdf; "" when both come up empty."""
+    text = _extract_text_layer(pdf_bytes)
+    if _has_text_layer(text):
+        return text
+
+    # opendataloader-pdf shells out to `java`; if the JRE (or the
+    # package itself) is missing, degrade to the vision path rather
+    # than failing the whole upload.
+    if opendataloader_pdf is None:
+        logger.warning("opendataloader-pdf not installed; using vision OCR for PDF")
+        return ""
+    try:
+        return get_odl_converter().convert(pdf_bytes)
+    except Exception as exc:
+        logger.warning(
+            "opendataloader-pdf text extraction failed (%s); falling back to vision OCR",
+            exc,
+        )
+        return ""
+
+
+class OdlBatchConverter:
+    """
+    Batches opendataloader-pdf conversions from concurrent uploads.
+
+    This is not a persistent JVM: the CLI jar has no server mode, so every
+    conversion still starts a JVM. A single background thread drains a queue
+    of pending documents and converts whatever arrived within
+    ``batch_window`` seconds (up to ``batch_size``) in one JVM invocation,
+    writing to one scratch directory on tmpfs where available. Concurrent
+    uploads therefore share a JVM start instead of paying one each.
+
+    If a batch fails, its documents are converted again one at a time, so a
+    file the converter cannot handle fails only its own upload.
+    """
+
+    def __init__(self, batch_size: int = 8, batch_window: float = 0.05, timeout: float = 120.0):
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.timeout = timeout
+        self._queue: queue.Queue[tuple[bytes, Future]] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def convert(self, pdf_bytes: bytes) -> str:
+        """Markdown for ``pdf_bytes``; raises whatever the converter raised."""
+        self._ensure_running()
+        future: Future = Future()
+        self._queue.put((pdf_bytes, future))
+        return future.result(timeout=self.timeout)
+
+    def _ensure_running(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="odl-batch-converter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._convert_batch(batch)
+
+    def _convert_batch(self, batch: list[tuple[bytes, Future]]) -> None:
+        try:
+            self._write_and_convert(batch)
+        except Exception as exc:
+            pending = [item for item in batch if not item[1].done()]
+            if len(pending) > 1:
+                logger.warning(
+                    "opendataloader-pdf batch of %d failed (%s); converting one at a time",
+                    len(pending),
+                    exc,
+                )
+                for item in pending:
+                    self._convert_batch([item])
+                return
+            # Scratch files, the converter or reading its output: whatever failed,
+            # fail the caller still waiting rather than leaving it to time out.
+            for _, future in pending:
+                future.set_exception(exc)
+
+    def _write_and_convert(self, batch: list[tuple[bytes, Future]]) -> None:
+        with (
+            tempfile.TemporaryDirectory(dir=_ODL_SCRATCH_DIR) as tmp_in,
+            tempfile.TemporaryDirectory(dir=_ODL_SCRATCH_DIR) as tmp_out,
+        ):
+            paths = []
+            for index, (pdf_bytes, _) in enumerate(batch):
+                pdf_path = os.path.join(tmp_in, f"document-{index}.pdf")
+                with open(pdf_path, "wb") as f:
+                    f.write(pdf_bytes)
+                paths.append(pdf_path)
+            opendataloader_pdf.convert(
+                input_path=paths,
+                output_dir=tmp_out,
+                format="markdown",
+                hybrid="docling-fast",
+            )
+            for index, (_, future) in enumerate(batch):
+                future.set_result(_read_odl_output(tmp_out, stem=f"document-{index}"))
+
+
+_odl_converter: OdlBatchConverter | None = None
+
+
+def get_odl_converter() -> OdlBatchConverter:
+    global _odl_converter
+    if _odl_converter is None:
+        _odl_converter = OdlBatchConverter()
+    return _odl_converter
+
+
+def _has_text_layer(text: str) -> bool:
+    return len(text.strip()) >= _MIN_TEXT_LENGTH
 
 
 class DocumentProcessor:
-    def __init__(self, provider: BaseOCRProvider):
+    """
+    Routes an upload to the provider's text or vision path and parses the reply.
+
+    Scanned PDFs (no text layer) are rasterized up to ``max_scanned_pages``
+    pages, extracted page by page and merged by schema.
+
+    PDFs try PyMuPDF's in-process text layer first, then the shared
+    opendataloader-pdf batch converter, then the vision path.
+
+    ``process`` is the synchronous single-document pipeline. ``aprocess`` is its
+    async twin: PDF text extraction and rasterization run on worker threads
+    while the provider call is awaited, so ``aprocess_many`` overlaps the
+    CPU/JVM work of one document with the LLM round trip of another.
+    """
+
+    def __init__(self, provider: BaseOCRProvider, max_scanned_pages: int = _MAX_SCANNED_PAGES):
         self._provider = provider
+        self._max_scanned_pages = max_scanned_pages
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.name
+
+    def _extract(self, image_bytes: bytes, prompt: str) -> str:
+        with span("ocr_provider"), OCR_PROVIDER_SECONDS.labels(self.provider_name).time():
+            return self._provider.extract(image_bytes, prompt)
+
+    async def _aextract(self, image_bytes: bytes, prompt: str) -> str:
+        with span("ocr_provider"), OCR_PROVIDER_SECONDS.labels(self.provider_name).time():
+            return await self._provider.aextract(image_bytes, prompt)
 
     def process(self, file_bytes: bytes, mime_type: str, doc_type: str) -> ExtractionResult:
         try:
-            if mime_type in ("image/jpeg", "image/png", "image/webp"):
+            if mime_type in _IMAGE_MIME_TYPES:
                 return self._process_image(file_bytes, doc_type)
             elif mime_type == "application/pdf":
                 return self._process_pdf(file_bytes, doc_type)
@@ -62,49 +286,100 @@ class DocumentProcessor:
         except Exception as exc:
             return ExtractionResult(error=str(exc))
 
+    async def aprocess(self, file_bytes: bytes, mime_type: str, doc_type: str) -> ExtractionResult:
+        try:
+            if mime_type in _IMAGE_MIME_TYPES:
+                prompt = build_image_extraction_prompt(doc_type)
+                raw = await self._aextract(file_bytes, prompt)
+            elif mime_type == "application/pdf":
+                text = await asyncio.to_thread(_extract_pdf_text, file_bytes)
+                if _has_text_layer(text):
+                    prompt = build_text_extraction_prompt(doc_type, text)
+                    raw = await self._aextract(b"", prompt)
+                else:
+                    return await self._aprocess_scanned_pdf(file_bytes, doc_type)
+            else:
+                return ExtractionResult(error=f"Unsupported MIME type: {mime_type}")
+            return self._parse_result(raw, doc_type)
+        except Exception as exc:
+            return ExtractionResult(error=str(exc))
+
+    async def aprocess_many(
+        self,
+        documents: Iterable[tuple[bytes, str, str]],
+        *,
+        concurrency: int = 4,
+    ) -> list[ExtractionResult]:
+        """
+        Process ``(file_bytes, mime_type, doc_type)`` triples concurrently.
+
+        At most ``concurrency`` documents are in flight; results keep input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _one(doc: tuple[bytes, str, str]) -> ExtractionResult:
+            async with semaphore:
+                return await self.aprocess(*doc)
+
+        return list(await asyncio.gather(*(_one(doc) for doc in documents)))
+
+    def process_many(
+        self,
+        documents: Iterable[tuple[bytes, str, str]],
+        *,
+        concurrency: int = 4,
+    ) -> list[ExtractionResult]:
+        """Blocking wrapper around ``aprocess_many`` for sync callers."""
+        return asyncio.run(self.aprocess_many(documents, concurrency=concurrency))
+
     def _process_image(self, image_bytes: bytes, doc_type: str) -> ExtractionResult:
         prompt = build_image_extraction_prompt(doc_type)
-        raw = self._provider.extract(image_bytes, prompt)
+        raw = self._extract(image_bytes, prompt)
         return self._parse_result(raw, doc_type)
 
     def _process_pdf(self, pdf_bytes: bytes, doc_type: str) -> ExtractionResult:
-        text = ""
-        with tempfile.TemporaryDirectory() as tmp_in, tempfile.TemporaryDirectory() as tmp_out:
-            pdf_path = os.path.join(tmp_in, "document.pdf")
-            with open(pdf_path, "wb") as f:
-                f.write(pdf_bytes)
-
-            # opendataloader-pdf shells out to `java`; if the JRE (or the
-            # package itself) is missing, degrade to the vision path rather
-            # than failing the whole upload.
-            if opendataloader_pdf is not None:
-                try:
-                    opendataloader_pdf.convert(
-                        input_path=[pdf_path],
-                        output_dir=tmp_out,
-                        format="markdown",
-                        hybrid="docling-fast",
-                    )
-                    text = _read_odl_output(tmp_out)
-                except Exception as exc:
-                    logger.warning(
-                        "opendataloader-pdf text extraction failed (%s); "
-                        "falling back to vision OCR",
-                        exc,
-                    )
-            else:
-                logger.warning("opendataloader-pdf not installed; using vision OCR for PDF")
+        text = _extract_pdf_text(pdf_bytes)
 
-        if len(text.strip()) >= _MIN_TEXT_LENGTH:
+        if _has_text_layer(text):
             prompt = build_text_extraction_prompt(doc_type, text)
-            raw = self._provider.extract(b"", prompt)
+            raw = self._extract(b"", prompt)
         else:
-            image_bytes = _pdf_to_image_bytes(pdf_bytes, page_index=0)
+            # Each page goes to the provider as soon as it is rendered; the
+            # pool keeps rendering the following pages in the meantime.
             prompt = build_image_extraction_prompt(doc_type)
-            raw = self._provider.extract(image_bytes, prompt)
+            raws = [
+                self._extract(image_bytes, prompt)
+                for image_bytes in _pdf_page_images(pdf_bytes, self._max_scanned_pages)
+            ]
+            return self._merge_pages(raws, doc_type)
 
         return self._parse_result(raw, doc_type)
 
+    async def _aprocess_scanned_pdf(self, pdf_bytes: bytes, doc_type: str) -> ExtractionResult:
+        prompt = build_image_extraction_prompt(doc_type)
+        pages = _pdf_page_images(pdf_bytes, self._max_scanned_pages)
+        calls = []
+        while (image_bytes := await asyncio.to_thread(next, pages, None)) is not None:
+            calls.append(asyncio.create_task(self._aextract(image_bytes, prompt)))
+        return self._merge_pages(list(await asyncio.gather(*calls)), doc_type)
+
+    def _merge_pages(self, raws: list[str], doc_type: str) -> ExtractionResult:
+        if len(raws) == 1:
+            return self._parse_result(raws[0], doc_type)
+        parsed = [self._parse_result(raw, doc_type) for raw in raws]
+        pages = [result for result in parsed if not result.error]
+        if not pages:
+            return parsed[0] if parsed else ExtractionResult(error="PDF has no pages")
+        page_confidence = [result.confidence["overall"] for result in pages]
+        return ExtractionResult(
+            fields=_merge_page_fields(doc_type, [result.fields for result in pages]),
+            confidence={
+                "overall": round(sum(page_confidence) / len(page_confidence)),
+                "pages": page_confidence,
+            },
+            detected_type=doc_type,
+        )
+
     def _parse_result(self, raw: str, doc_type: str) -> ExtractionResult:
         try:
             clean = raw.strip()
@@ -4,10 +4,14 @@
 ``google-genai`` SDK at module load, which would make the entire documents
 URLconf (and app boot) hard-depend on the OCR SDK. Import it lazily where used:
 ``from apps.documents.services.providers.gemini import GeminiProvider``.
+
+``StubOCRProvider`` has no third-party dependencies and is safe to import here.
 """
 
 from .base import BaseOCRProvider
+from .stub import StubOCRProvider
 
 __all__ = [
     "BaseOCRProvider",
+    "StubOCRProvider",
 ]
@@ -1,5 +1,6 @@
 """Abstract base class for OCR providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -7,9 +8,16 @@ class BaseOCRProvider(ABC):
     """
     Abstract base class for OCR providers.
 
-    Implementations: GeminiProvider
+    Implementations: GeminiProvider, StubOCRProvider
+
+    ``classify``/``extract`` are required. ``aclassify``/``aextract`` default to
+    running the sync call on a worker thread; providers with a native async
+    client should override them so concurrent documents share one event loop.
     """
 
+    # Recorded on OCRResult.ocr_provider / CachedExtraction.ocr_provider.
+    name: str = ""
+
     @abstractmethod
     def classify(self, image_data: bytes, prompt: str) -> str:
         """
@@ -37,3 +45,11 @@ class BaseOCRProvider(ABC):
             JSON string with extracted data
         """
         pass
+
+    async def aclassify(self, image_data: bytes, prompt: str) -> str:
+        """Async variant of ``classify``."""
+        return await asyncio.to_thread(self.classify, image_data, prompt)
+
+    async def aextract(self, image_data: bytes, prompt: str) -> str:
+        """Async variant of ``extract``."""
+        return await asyncio.to_thread(self.extract, image_data, prompt)
@@ -1,12 +1,38 @@
 """Google Gemini provider for document OCR via google-genai SDK."""
 
 import os
+import threading
 
 from google import genai
 from google.genai import types
 
 from .base import BaseOCRProvider
 
+# One genai.Client per API key for the whole process. The client owns the
+# HTTP connection pools (sync and ``.aio``), so sharing it lets every upload
+# reuse warm TLS connections instead of handshaking per document.
+_clients: dict[str, genai.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_shared_client(api_key: str | None = None) -> genai.Client:
+    """Return the process-wide genai.Client for ``api_key`` (default: GEMINI_API_KEY)."""
+    key = api_key or os.environ["GEMINI_API_KEY"]
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = genai.Client(api_key=key)
+                _clients[key] = client
+    return client
+
+
+def reset_shared_clients() -> None:
+    """Drop cached clients (key rotation, tests)."""
+    with _clients_lock:
+        _clients.clear()
+
 
 class GeminiProvider(BaseOCRProvider):
     """
@@ -15,45 +41,48 @@ class GeminiProvider(BaseOCRProvider):
     Uses text mode (opendataloader-pdf extracted markdown → prompt) when image_data is empty.
     Uses vision mode (pymupdf JPEG or direct image upload) when image_data is non-empty.
     extract() sets response_mime_type="application/json" for reliable structured output.
+    aclassify()/aextract() go through the client's native async surface (``client.aio``).
     """
 
-    def __init__(self, model: str = "gemini-2.0-flash"):
+    name = "gemini"
+
+    def __init__(self, model: str = "gemini-2.0-flash", client: genai.Client | None = None):
         self.model = model
-        self._client = genai.Client(api_key=os.environ["GEMINI_API_KEY"])
+        self._client = client if client is not None else get_shared_client()
 
     def classify(self, image_data: bytes, prompt: str) -> str:
-        if image_data:
-            return self._vision(image_data, prompt)
-        return self._text(prompt)
+        response = self._client.models.generate_content(
+            **self._request(image_data, prompt, json_mode=False)
+        )
+        return response.text or ""
 
     def extract(self, image_data: bytes, prompt: str) -> str:
-        if image_data:
-            return self._vision(image_data, prompt, json_mode=True)
-        return self._text(prompt, json_mode=True)
+        response = self._client.models.generate_content(
+            **self._request(image_data, prompt, json_mode=True)
+        )
+        return response.text or ""
 
-    def _text(self, prompt: str, *, json_mode: bool = False) -> str:
-        config = (
-            types.GenerateContentConfig(response_mime_type="application/json")
-            if json_mode
-            else None
+    async def aclassify(self, image_data: bytes, prompt: str) -> str:
+        response = await self._client.aio.models.generate_content(
+            **self._request(image_data, prompt, json_mode=False)
         )
-        response = self._client.models.generate_content(
-            model=self.model,
-            contents=prompt,
-            config=config,
+        return response.text or ""
+
+    async def aextract(self, image_data: bytes, prompt: str) -> str:
+        response = await self._client.aio.models.generate_content(
+            **self._request(image_data, prompt, json_mode=True)
         )
         return response.text or ""
 
-    def _vision(self, image_data: bytes, prompt: str, *, json_mode: bool = False) -> str:
+    def _request(self, image_data: bytes, prompt: str, *, json_mode: bool) -> dict:
         config = (
             types.GenerateContentConfig(response_mime_type="application/json")
             if json_mode
             else None
         )
-        image_part = types.Part.from_bytes(data=image_data, mime_type="image/jpeg")
-        response = self._client.models.generate_content(
-            model=self.model,
-            contents=[image_part, prompt],
-            config=config,
-        )
-        return response.text or ""
+        if image_data:
+            image_part = types.Part.from_bytes(data=image_data, mime_type="image/jpeg")
+            contents = [image_part, prompt]
+        else:
+            contents = prompt
+        return {"model": self.model, "contents": contents, "config": config}
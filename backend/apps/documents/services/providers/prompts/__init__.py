@@ -0,0 +1,25 @@
+"""Extraction prompt builders and their version fingerprint."""
+
+import hashlib
+
+from .image_extraction import build_image_extraction_prompt
+from .text_extraction import build_text_extraction_prompt
+
+__all__ = [
+    "build_image_extraction_prompt",
+    "build_text_extraction_prompt",
+    "prompt_version",
+]
+
+
+def prompt_version(document_type: str) -> str:
+    """
+    Short fingerprint of the prompts used for ``document_type``.
+
+    Derived from the rendered prompt text, so any wording or field-hint change
+    produces a new version and invalidates cached extractions automatically.
+    """
+    sha = hashlib.sha256()
+    sha.update(build_image_extraction_prompt(document_type).encode())
+    sha.update(build_text_extraction_prompt(document_type, "").encode())
+    return sha.hexdigest()[:16]
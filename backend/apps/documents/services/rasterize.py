@@ -0,0 +1,127 @@
+"""
+Page rasterization for the vision OCR path.
+
+Scanned bank statements and credit reports run to several pages, and PyMuPDF
+rendering is CPU-bound, so pages are rendered in a shared process pool and
+streamed back in page order. At most ``_MAX_WORKERS`` pages are in flight and
+each worker frees its pixmap before returning JPEG bytes, so memory stays
+bounded by a handful of compressed pages rather than the whole document's
+pixmaps. Single-page documents are rendered in-process (no pool round trip).
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+# DPI is chosen so the page's long edge lands near _TARGET_LONG_EDGE_PX:
+# small receipts get sharper renders, legal/tabloid pages stay within the
+# provider's image budget.
+_TARGET_LONG_EDGE_PX = 1800
+_MIN_DPI = 100
+_MAX_DPI = 200
+_JPEG_QUALITY = 85
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def adaptive_dpi(width_pt: float, height_pt: float) -> int:
+    """DPI that renders a ``width_pt`` x ``height_pt`` page at ~_TARGET_LONG_EDGE_PX."""
+    long_edge_in = max(width_pt, height_pt) / 72
+    if long_edge_in <= 0:
+        return _MIN_DPI
+    return max(_MIN_DPI, min(_MAX_DPI, round(_TARGET_LONG_EDGE_PX / long_edge_in)))
+
+
+def page_count(pdf_bytes: bytes) -> int:
+    import fitz  # pymupdf
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        return len(doc)
+
+
+def render_page(pdf_bytes: bytes, page_index: int = 0) -> bytes:
+    """JPEG bytes for one page at its adaptive DPI. Runs in pool workers."""
+    import fitz  # pymupdf
+
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        if page_index >= len(doc):
+            page_index = 0
+        page = doc[page_index]
+        pix = page.get_pixmap(dpi=adaptive_dpi(page.rect.width, page.rect.height))
+        try:
+            return pix.tobytes("jpeg", jpg_quality=_JPEG_QUALITY)
+        finally:
+            del pix
+
+
+def iter_page_images(pdf_bytes: bytes, max_pages: int) -> Iterator[bytes]:
+    """
+    Yield JPEG bytes for the first ``max_pages`` pages, in page order.
+
+    Rendering runs ahead of the consumer by at most ``_MAX_WORKERS`` pages,
+    so the caller can send page 1 to the provider while later pages render.
+    """
+    count = min(page_count(pdf_bytes), max_pages)
+    if count <= 1 or _MAX_WORKERS <= 1:
+        for index in range(count):
+            yield render_page(pdf_bytes, index)
+        return
+
+    try:
+        pool = _get_pool()
+        pending: deque[Future] = deque()
+        next_index = 0
+        while next_index < count and len(pending) < _MAX_WORKERS:
+            pending.append(pool.submit(render_page, pdf_bytes, next_index))
+            next_index += 1
+    except (BrokenProcessPool, OSError) as exc:
+        logger.warning("Rasterization pool unavailable (%s); rendering in-process", exc)
+        shutdown_pool()
+        for index in range(count):
+            yield render_page(pdf_bytes, index)
+        return
+
+    try:
+        while pending:
+            image = pending.popleft().result()
+            if next_index < count:
+                pending.append(pool.submit(render_page, pdf_bytes, next_index))
+                next_index += 1
+            yield image
+    finally:
+        # Consumer stopped early (error, generator closed): drop queued renders.
+        for future in pending:
+            future.cancel()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn, not fork: the web process is multi-threaded, and the
+                # workers only need pymupdf, not Django.
+                _pool = ProcessPoolExecutor(
+                    max_workers=_MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def shutdown_pool() -> None:
+    """Tear down the shared pool (tests, broken workers). Recreated on next use."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
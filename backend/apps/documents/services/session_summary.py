@@ -0,0 +1,60 @@
+"""
+Documents still waiting for OCR on the session summary (``apps.intake.summaries``).
+"""
+
+from django.db.models import F
+
+from apps.intake import summaries
+
+from ..models import OCRResult, OCRStatus, UploadedDocument
+
+OCR_PENDING = frozenset({OCRStatus.PENDING, OCRStatus.PROCESSING})
+
+
+def summarize(session_id: int) -> dict:
+    pending = OCRResult.objects.filter(document__session_id=session_id, status__in=OCR_PENDING)
+    return {"ocr_pending_count": pending.count()}
+
+
+def _remember_ocr_status(sender, instance, **kwargs):
+    instance._summarized = instance.__dict__.get("status")
+
+
+def _ocr_session_id(ocr: OCRResult) -> int | None:
+    if OCRResult.document.is_cached(ocr):
+        return ocr.document.session_id
+    return (
+        UploadedDocument.objects.filter(pk=ocr.document_id)
+        .values_list("session_id", flat=True)
+        .first()
+    )
+
+
+def _bump_ocr_pending(ocr: OCRResult, delta: int) -> None:
+    session_id = _ocr_session_id(ocr)
+    if session_id is not None:
+        summaries.update(session_id, ocr_pending_count=F("ocr_pending_count") + delta)
+
+
+def _on_ocr_save(sender, instance, created, **kwargs):
+    previous = None if created else getattr(instance, "_summarized", None)
+    if not created and previous is None:
+        session_id = _ocr_session_id(instance)  # loaded without the status
+        if session_id is not None:
+            summaries.mark_stale(session_id)
+    else:
+        was_pending, pending = previous in OCR_PENDING, instance.status in OCR_PENDING
+        if was_pending != pending:
+            _bump_ocr_pending(instance, 1 if pending else -1)
+    instance._summarized = instance.status
+
+
+def _on_ocr_delete(sender, instance, **kwargs):
+    if getattr(instance, "_summarized", instance.status) in OCR_PENDING:
+        _bump_ocr_pending(instance, -1)
+
+
+def connect_signals() -> None:
+    """Attach the receivers; called from DocumentsConfig.ready."""
+    summaries.register(summarize)
+    summaries.connect(OCRResult, _on_ocr_save, _on_ocr_delete, _remember_ocr_status)
@@ -1,11 +1,15 @@
 import json
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
 
 from apps.districts.models import District
 from apps.documents.models import (
+    AggregateAccumulator,
+    AggregateContribution,
     DocumentType,
     IngestedAggregate,
     OCRResult,
@@ -97,3 +101,192 @@ class TestAggregateIngestionService(TestCase):
 
         agg = IngestedAggregate.objects.get(session=session, ingest_key="paystub.employer_name")
         self.assertEqual(agg.value, "New Job")
+
+
+class TestIncrementalAggregates(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("incuser", "inc@test.com", "pass")
+        district = District.objects.create(
+            name="ILND3", code="ILND3", state="IL", filing_fee_chapter_7=Decimal("338.00")
+        )
+        self.session = IntakeSession.objects.create(user=self.user, district=district)
+
+    def _ocr(self, document_type, data, status=OCRStatus.COMPLETED):
+        doc = UploadedDocument.objects.create(
+            session=self.session,
+            uploaded_by=self.user,
+            document_type=document_type,
+            file="doc.pdf",
+            original_filename="doc.pdf",
+            file_size=100,
+            mime_type="application/pdf",
+        )
+        return OCRResult.objects.create(
+            document=doc,
+            status=status,
+            extracted_data=json.dumps(data),
+            overall_confidence=Decimal("100"),
+        )
+
+    def _stub(self, employer, gross, start, end):
+        return self._ocr(
+            DocumentType.PAY_STUB,
+            {
+                "employer_name": employer,
+                "gross_pay": gross,
+                "pay_period_start": start,
+                "pay_period_end": end,
+                "confidence_score": 100,
+            },
+        )
+
+    def _aggregates(self):
+        return dict(
+            IngestedAggregate.objects.filter(session=self.session).values_list(
+                "ingest_key", "value"
+            )
+        )
+
+    def test_apply_matches_full_recalculation(self):
+        stubs = [
+            self._stub("Old Job", "1000.00", "2026-01-01", "2026-01-14"),
+            self._stub("New Job", "1500.00", "2026-02-01", "2026-02-15"),
+            self._stub("Mid Job", "900.00", "2026-01-15", "2026-01-28"),
+        ]
+        for ocr in stubs:
+            AggregateIngestionService.apply(ocr)
+        incremental = self._aggregates()
+
+        AggregateIngestionService.recalculate(self.session.id)
+        assert self._aggregates() == incremental
+        assert incremental["paystub.employer_name"] == "New Job"
+
+    def test_apply_reads_only_the_changed_document(self):
+        for i in range(5):
+            AggregateIngestionService.apply(
+                self._stub(f"Job {i}", "1000.00", "2026-01-01", "2026-01-14")
+            )
+        ocr = self._stub("Job 5", "1000.00", "2026-01-01", "2026-01-14")
+        with patch("apps.documents.services.aggregator.OCRResult.objects") as mock_results:
+            AggregateIngestionService.apply(ocr)
+        mock_results.filter.assert_not_called()
+        assert AggregateAccumulator.objects.get(session=self.session).count == 6
+
+    def test_revalidation_replaces_contribution(self):
+        ocr = self._stub("Acme", "1000.00", "2026-01-01", "2026-01-14")
+        AggregateIngestionService.apply(ocr)
+        ocr.extracted_data = json.dumps(
+            {
+                "employer_name": "Acme Corp",
+                "gross_pay": "1400.00",
+                "pay_period_start": "2026-01-01",
+                "pay_period_end": "2026-01-14",
+                "confidence_score": 100,
+            }
+        )
+        ocr.save()
+        AggregateIngestionService.apply(ocr)
+
+        # 1400 / 14 * 30.41667 = 3041.667
+        assert self._aggregates() == {
+            "paystub.gross": "3041.67",
+            "paystub.employer_name": "Acme Corp",
+        }
+        assert AggregateContribution.objects.filter(session=self.session).count() == 1
+
+    def test_remove_subtracts_and_clears_when_empty(self):
+        first = self._stub("Old Job", "1000.00", "2026-01-01", "2026-01-14")
+        second = self._stub("New Job", "2000.00", "2026-02-01", "2026-02-14")
+        AggregateIngestionService.apply(first)
+        AggregateIngestionService.apply(second)
+
+        AggregateIngestionService.remove(second)
+        assert self._aggregates() == {
+            "paystub.gross": "2172.62",
+            "paystub.employer_name": "Old Job",
+        }
+
+        AggregateIngestionService.remove(first)
+        assert self._aggregates() == {}
+        assert not AggregateContribution.objects.exists()
+
+    def test_deleting_a_document_removes_its_contribution(self):
+        first = self._stub("Old Job", "1000.00", "2026-01-01", "2026-01-14")
+        second = self._stub("New Job", "2000.00", "2026-02-01", "2026-02-14")
+        AggregateIngestionService.apply(first)
+        AggregateIngestionService.apply(second)
+
+        second.document.delete()  # cascades to the OCR result
+        assert self._aggregates() == {
+            "paystub.gross": "2172.62",
+            "paystub.employer_name": "Old Job",
+        }
+        first.delete()
+        assert self._aggregates() == {}
+
+    def test_deleting_the_session_cascades_cleanly(self):
+        AggregateIngestionService.apply(self._stub("Acme", "1000.00", "2026-01-01", "2026-01-14"))
+        self._ocr(DocumentType.PAY_STUB, {}, status=OCRStatus.PENDING)  # never contributed
+
+        self.session.delete()
+        assert not IngestedAggregate.objects.exists()
+        assert not AggregateContribution.objects.exists()
+
+    def test_failed_reprocess_drops_contribution(self):
+        ocr = self._stub("Acme", "1000.00", "2026-01-01", "2026-01-14")
+        AggregateIngestionService.apply(ocr)
+        ocr.status = OCRStatus.FAILED
+        ocr.save()
+        AggregateIngestionService.apply(ocr)
+        assert self._aggregates() == {}
+
+    def test_creditor_bill_totals(self):
+        for amount, minimum in (("1200.00", "35.00"), ("300.50", None)):
+            AggregateIngestionService.apply(
+                self._ocr(
+                    DocumentType.CREDITOR_BILL,
+                    {
+                        "creditor_name": "Chase",
+                        "amount_owed": amount,
+                        "minimum_payment": minimum,
+                        "creditor_type": "credit_card",
+                        "confidence_score": 90,
+                    },
+                )
+            )
+        assert self._aggregates() == {
+            "creditor_bill.count": "2",
+            "creditor_bill.total_owed": "1500.50",
+            "creditor_bill.total_minimum_payment": "35.00",
+        }
+
+    def test_credit_report_uses_latest_report(self):
+        tradeline = {
+            "creditor_name": "Capital One",
+            "amount_owed": "2450.00",
+            "account_type": "credit_card",
+            "account_status": "open",
+        }
+        AggregateIngestionService.apply(
+            self._ocr(DocumentType.CREDIT_REPORT, {"tradelines": [tradeline]})
+        )
+        AggregateIngestionService.apply(
+            self._ocr(
+                DocumentType.CREDIT_REPORT,
+                {"tradelines": [tradeline, {**tradeline, "amount_owed": "550.00"}]},
+            )
+        )
+        assert self._aggregates() == {
+            "credit_report.count": "2",
+            "credit_report.tradeline_count": "2",
+            "credit_report.total_owed": "3000.00",
+        }
+
+    def test_rebuild_command_repairs_drift(self):
+        ocr = self._stub("Acme", "1000.00", "2026-01-01", "2026-01-14")
+        AggregateIngestionService.apply(ocr)
+        AggregateAccumulator.objects.update(sums={"monthly_gross": "1.00"})
+        IngestedAggregate.objects.filter(ingest_key="paystub.gross").update(value="0.00")
+
+        call_command("rebuild_ingested_aggregates", session=[self.session.id], verbosity=0)
+        assert self._aggregates()["paystub.gross"] == "2172.62"
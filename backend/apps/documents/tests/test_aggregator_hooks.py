@@ -43,18 +43,21 @@ class TestAggregatorHooks(TestCase):
         )
 
     @patch("apps.documents.views._get_processor")
-    @patch("apps.documents.views.AggregateIngestionService.recalculate")
-    def test_run_processing_hook(self, mock_recalc, mock_get_processor):
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    def test_run_processing_hook(self, mock_apply, mock_get_processor):
         mock_get_processor.return_value.process.return_value.error = None
         mock_get_processor.return_value.process.return_value.fields = {}
         mock_get_processor.return_value.process.return_value.confidence = {}
+        mock_get_processor.return_value.provider_name = "gemini"
 
         _run_processing(self.doc.id)
-        mock_recalc.assert_called_once_with(self.session.id)
+        mock_apply.assert_called_once()
+        self.assertEqual(mock_apply.call_args[0][0].pk, self.ocr.pk)
 
-    @patch("apps.documents.views.AggregateIngestionService.recalculate")
-    def test_validate_hook(self, mock_recalc):
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    def test_validate_hook(self, mock_apply):
         url = reverse("documents:validate", args=[self.doc.id])
         resp = self.client.post(url, {"fields": {"gross_pay": "2000.00"}}, format="json")
         self.assertEqual(resp.status_code, 200)
-        mock_recalc.assert_called_once_with(self.session.id)
+        mock_apply.assert_called_once()
+        self.assertEqual(mock_apply.call_args[0][0].pk, self.ocr.pk)
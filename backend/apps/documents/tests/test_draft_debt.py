@@ -243,3 +243,31 @@ class TestDraftDebtCreatorCreditReport:
         )
         debts = DraftDebtCreator().create_from_credit_report(result, session, uploaded_doc)
         assert debts[0].is_in_collections is False
+
+    def test_inserts_every_tradeline_at_once_and_updates_the_summary(
+        self, db, session, uploaded_doc, django_assert_num_queries
+    ):
+        from decimal import Decimal
+
+        from apps.documents.schemas.credit_report import CreditReportExtraction, TradelineItem
+        from apps.intake.models import SessionSummary
+
+        result = CreditReportExtraction(
+            tradelines=[
+                TradelineItem(
+                    creditor_name=f"Creditor {i}",
+                    account_number=None,
+                    amount_owed=Decimal("100.00"),
+                    account_type="credit_card",
+                    account_status="open",
+                )
+                for i in range(1, 11)
+            ]
+        )
+        with django_assert_num_queries(10):  # the INSERT, then summaries.refresh (9)
+            debts = DraftDebtCreator().create_from_credit_report(result, session, uploaded_doc)
+
+        assert len(debts) == 10 and all(debt.pk for debt in debts)
+        summary = SessionSummary.objects.get(session=session)
+        assert summary.debt_count == 10
+        assert summary.total_debt_amount == Decimal("1000.00")
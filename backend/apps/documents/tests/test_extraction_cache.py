@@ -0,0 +1,197 @@
+"""Tests for content-hash deduplication of OCR extractions."""
+
+import json
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.districts.models import District
+from apps.documents.models import (
+    CachedExtraction,
+    DocumentType,
+    OCRResult,
+    OCRStatus,
+    UploadedDocument,
+)
+from apps.documents.services import extraction_cache
+from apps.documents.services.processor import ExtractionResult
+from apps.documents.views import _run_processing
+from apps.intake.models import IntakeSession
+
+_RESULT = ExtractionResult(
+    fields={"creditor_name": "Chase", "account_number": "4111", "amount_owed": "1200.00"},
+    confidence={"overall": 85},
+    detected_type=DocumentType.CREDITOR_BILL,
+)
+
+
+class TestCacheKey(TestCase):
+    def test_same_bytes_and_type_share_a_key(self):
+        a = extraction_cache.cache_key(b"%PDF-1.4 bill", DocumentType.CREDITOR_BILL, 1)
+        b = extraction_cache.cache_key(b"%PDF-1.4 bill", DocumentType.CREDITOR_BILL, 1)
+        assert a == b
+        assert len(a) == 64
+
+    def test_uploader_changes_the_key(self):
+        a = extraction_cache.cache_key(b"%PDF-1.4 bill", DocumentType.CREDITOR_BILL, 1)
+        b = extraction_cache.cache_key(b"%PDF-1.4 bill", DocumentType.CREDITOR_BILL, 2)
+        assert a != b
+
+    def test_document_type_changes_the_key(self):
+        a = extraction_cache.cache_key(b"%PDF-1.4 doc", DocumentType.CREDITOR_BILL, 1)
+        b = extraction_cache.cache_key(b"%PDF-1.4 doc", DocumentType.PAY_STUB, 1)
+        assert a != b
+
+    def test_prompt_version_changes_the_key(self):
+        before = extraction_cache.cache_key(b"%PDF-1.4 doc", DocumentType.PAY_STUB, 1)
+        with patch(
+            "apps.documents.services.extraction_cache.prompt_version", return_value="v-next"
+        ):
+            after = extraction_cache.cache_key(b"%PDF-1.4 doc", DocumentType.PAY_STUB, 1)
+        assert before != after
+
+
+class TestStoreAndLookup(TestCase):
+    def test_round_trip_returns_independent_copy(self):
+        key = extraction_cache.cache_key(b"bill", DocumentType.CREDITOR_BILL, 1)
+        extraction_cache.store(key, DocumentType.CREDITOR_BILL, _RESULT, "gemini")
+
+        hit = extraction_cache.lookup(key)
+        assert hit.fields == _RESULT.fields
+        assert hit.confidence == {"overall": 85}
+        assert hit.detected_type == DocumentType.CREDITOR_BILL
+        hit.fields["creditor_name"] = "mutated"
+        assert extraction_cache.lookup(key).fields["creditor_name"] == "Chase"
+        assert CachedExtraction.objects.get(cache_key=key).hit_count == 2
+
+    def test_failed_results_are_not_cached(self):
+        key = extraction_cache.cache_key(b"bad", DocumentType.CREDITOR_BILL, 1)
+        extraction_cache.store(key, DocumentType.CREDITOR_BILL, ExtractionResult(error="x"), "g")
+        assert extraction_cache.lookup(key) is None
+
+    def test_entry_expires_with_document_retention(self):
+        key = extraction_cache.cache_key(b"bill", DocumentType.CREDITOR_BILL, 1)
+        with self.settings(DOCUMENT_RETENTION_DAYS=22):
+            extraction_cache.store(key, DocumentType.CREDITOR_BILL, _RESULT, "gemini")
+        entry = CachedExtraction.objects.get(cache_key=key)
+        assert entry.expires_at - entry.created_at >= timedelta(days=22) - timedelta(seconds=5)
+
+        CachedExtraction.objects.filter(pk=entry.pk).update(
+            expires_at=timezone.now() - timedelta(seconds=1)
+        )
+        assert extraction_cache.lookup(key) is None
+        assert extraction_cache.purge_expired() == 1
+        assert not CachedExtraction.objects.exists()
+
+    def test_extracted_data_is_encrypted_at_rest(self):
+        key = extraction_cache.cache_key(b"bill", DocumentType.CREDITOR_BILL, 1)
+        extraction_cache.store(key, DocumentType.CREDITOR_BILL, _RESULT, "gemini")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT extracted_data FROM {CachedExtraction._meta.db_table} WHERE cache_key=%s",
+                [key],
+            )
+            raw = cursor.fetchone()[0]
+        assert "Chase" not in raw
+        assert "4111" not in raw
+
+    def test_purge_command(self):
+        key = extraction_cache.cache_key(b"bill", DocumentType.CREDITOR_BILL, 1)
+        extraction_cache.store(key, DocumentType.CREDITOR_BILL, _RESULT, "gemini")
+        CachedExtraction.objects.update(expires_at=timezone.now() - timedelta(days=1))
+        call_command("purge_extraction_cache", verbosity=0)
+        assert not CachedExtraction.objects.exists()
+
+
+class TestRunProcessingUsesCache(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user("cacheuser", "c@t.com", "pw")
+        district = District.objects.create(
+            code="ILND", name="ILND", state="IL", filing_fee_chapter_7=Decimal("338.00")
+        )
+        self.session = IntakeSession.objects.create(user=self.user, district=district)
+
+    def _upload(self, content: bytes, session=None) -> UploadedDocument:
+        session = session or self.session
+        doc = UploadedDocument.objects.create(
+            session=session,
+            uploaded_by=session.user,
+            document_type=DocumentType.CREDITOR_BILL,
+            user_declared_type=DocumentType.CREDITOR_BILL,
+            original_filename="bill.pdf",
+            file_size=len(content),
+            mime_type="application/pdf",
+            file=SimpleUploadedFile("bill.pdf", content),
+        )
+        OCRResult.objects.create(
+            document=doc, status=OCRStatus.PENDING, extracted_data="{}", overall_confidence=0
+        )
+        return doc
+
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    @patch("apps.documents.views._get_processor")
+    def test_identical_reupload_is_not_ocrd_twice(self, mock_get_processor, _apply):
+        processor = mock_get_processor.return_value
+        processor.process.return_value = _RESULT
+        processor.provider_name = "gemini"
+
+        first = self._upload(b"%PDF-1.4 same bill")
+        second = self._upload(b"%PDF-1.4 same bill")
+        _run_processing(first.id)
+        _run_processing(second.id)
+
+        assert processor.process.call_count == 1
+        second_ocr = OCRResult.objects.get(document=second)
+        assert second_ocr.status == OCRStatus.COMPLETED
+        assert second_ocr.ocr_provider == "cache"
+        assert json.loads(second_ocr.extracted_data)["creditor_name"] == "Chase"
+        # The cache hit still produces the draft debt a fresh extraction would.
+        assert second.draft_debts.count() == 1
+
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    @patch("apps.documents.views._get_processor")
+    def test_different_bytes_miss(self, mock_get_processor, _apply):
+        processor = mock_get_processor.return_value
+        processor.process.return_value = _RESULT
+        processor.provider_name = "gemini"
+
+        _run_processing(self._upload(b"%PDF-1.4 bill A").id)
+        _run_processing(self._upload(b"%PDF-1.4 bill B").id)
+        assert processor.process.call_count == 2
+
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    @patch("apps.documents.views._get_processor")
+    def test_other_users_never_share_an_entry(self, mock_get_processor, _apply):
+        processor = mock_get_processor.return_value
+        processor.process.return_value = _RESULT
+        processor.provider_name = "gemini"
+        other = get_user_model().objects.create_user("otheruser", "o@t.com", "pw")
+        other_session = IntakeSession.objects.create(user=other, district=self.session.district)
+
+        _run_processing(self._upload(b"%PDF-1.4 same bill").id)
+        theirs = self._upload(b"%PDF-1.4 same bill", session=other_session)
+        _run_processing(theirs.id)
+
+        assert processor.process.call_count == 2
+        assert OCRResult.objects.get(document=theirs).ocr_provider == "gemini"
+
+    @patch("apps.documents.views.AggregateIngestionService.apply")
+    @patch("apps.documents.views._get_processor")
+    def test_entry_is_deleted_with_its_document(self, mock_get_processor, _apply):
+        processor = mock_get_processor.return_value
+        processor.process.return_value = _RESULT
+        processor.provider_name = "gemini"
+
+        doc = self._upload(b"%PDF-1.4 bill")
+        _run_processing(doc.id)
+        assert CachedExtraction.objects.get().source_document_id == doc.id
+
+        doc.delete()
+        assert not CachedExtraction.objects.exists()
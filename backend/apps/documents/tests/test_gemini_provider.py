@@ -1,21 +1,31 @@
 """Unit tests for GeminiProvider."""
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from apps.documents.services.providers.gemini import GeminiProvider
+from apps.documents.services.providers.gemini import (
+    GeminiProvider,
+    get_shared_client,
+    reset_shared_clients,
+)
 
 
 @pytest.fixture
 def mock_genai_client():
+    reset_shared_clients()
     with patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"}):
         with patch("apps.documents.services.providers.gemini.genai") as mock_genai:
             mock_response = MagicMock()
             mock_response.text = '{"document_type": "pay_stub"}'
             mock_genai.Client.return_value.models.generate_content.return_value = mock_response
+            mock_genai.Client.return_value.aio.models.generate_content = AsyncMock(
+                return_value=mock_response
+            )
             yield mock_genai.Client.return_value
+    reset_shared_clients()
 
 
 @pytest.fixture
@@ -77,3 +87,37 @@ class TestGeminiProviderExtract:
         assert isinstance(contents, list)
         # first element is the image Part, second is the prompt string
         assert isinstance(contents[1], str)
+
+
+class TestSharedClient:
+    def test_providers_share_one_client(self, mock_genai_client):
+        with patch("apps.documents.services.providers.gemini.genai") as mock_g:
+            first = GeminiProvider()
+            second = GeminiProvider(model="gemini-2.0-pro")
+        assert first._client is second._client
+        mock_g.Client.assert_called_once_with(api_key="test-key")
+
+    def test_client_is_per_api_key(self, mock_genai_client):
+        with patch("apps.documents.services.providers.gemini.genai") as mock_g:
+            mock_g.Client.side_effect = lambda api_key: MagicMock(name=api_key)
+            assert get_shared_client("key-a") is get_shared_client("key-a")
+            assert get_shared_client("key-a") is not get_shared_client("key-b")
+
+    def test_explicit_client_bypasses_cache(self, mock_genai_client):
+        own = MagicMock()
+        assert GeminiProvider(client=own)._client is own
+
+
+class TestGeminiProviderAsync:
+    def test_aextract_uses_aio_surface_with_json_mime(self, provider, mock_genai_client):
+        result = asyncio.run(provider.aextract(b"", "Extract"))
+        call_args = mock_genai_client.aio.models.generate_content.call_args
+        assert call_args.kwargs["config"].response_mime_type == "application/json"
+        assert result == '{"document_type": "pay_stub"}'
+        mock_genai_client.models.generate_content.assert_not_called()
+
+    def test_aclassify_vision_mode(self, provider, mock_genai_client):
+        asyncio.run(provider.aclassify(b"\xff\xd8\xff", "Classify"))
+        call_args = mock_genai_client.aio.models.generate_content.call_args
+        assert isinstance(call_args.kwargs["contents"], list)
+        assert call_args.kwargs["config"] is None
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -16,6 +17,12 @@ def mock_provider():
     return provider
 
 
+@pytest.fixture
+def mock_async_provider(mock_provider):
+    mock_provider.aextract = AsyncMock(return_value=mock_provider.extract.return_value)
+    return mock_provider
+
+
 @pytest.fixture
 def processor(mock_provider):
     return DocumentProcessor(provider=mock_provider)
@@ -75,8 +82,8 @@ def test_pdf_falls_back_to_vision_when_java_missing(processor, mock_provider):
     with patch("apps.documents.services.processor.opendataloader_pdf") as mock_odl:
         mock_odl.convert.side_effect = FileNotFoundError("java not found")
         with patch(
-            "apps.documents.services.processor._pdf_to_image_bytes",
-            return_value=fake_page_image,
+            "apps.documents.services.processor._pdf_page_images",
+            return_value=iter([fake_page_image]),
         ):
             result = processor.process(b"%PDF-1.4", "application/pdf", DocumentType.CREDITOR_BILL)
 
@@ -89,11 +96,213 @@ def test_pdf_falls_back_to_vision_when_opendataloader_not_installed(processor, m
     fake_page_image = b"\xff\xd8fake-jpeg"
     with patch("apps.documents.services.processor.opendataloader_pdf", None):
         with patch(
-            "apps.documents.services.processor._pdf_to_image_bytes",
-            return_value=fake_page_image,
+            "apps.documents.services.processor._pdf_page_images",
+            return_value=iter([fake_page_image]),
         ):
             result = processor.process(b"%PDF-1.4", "application/pdf", DocumentType.CREDITOR_BILL)
 
     assert result.error == ""
     call_args = mock_provider.extract.call_args
     assert call_args[0][0] == fake_page_image
+
+
+def test_aprocess_image_awaits_provider(processor, mock_async_provider):
+    result = asyncio.run(processor.aprocess(b"\xff\xd8", "image/jpeg", DocumentType.CREDITOR_BILL))
+    assert result.fields["creditor_name"] == "Chase"
+    mock_async_provider.aextract.assert_awaited_once()
+    mock_async_provider.extract.assert_not_called()
+
+
+def test_aprocess_pdf_falls_back_to_vision(processor, mock_async_provider):
+    fake_page_image = b"\xff\xd8fake-jpeg"
+    with patch("apps.documents.services.processor.opendataloader_pdf", None):
+        with patch(
+            "apps.documents.services.processor._pdf_page_images",
+            return_value=iter([fake_page_image]),
+        ):
+            result = asyncio.run(
+                processor.aprocess(b"%PDF-1.4", "application/pdf", DocumentType.CREDITOR_BILL)
+            )
+    assert result.error == ""
+    assert mock_async_provider.aextract.call_args[0][0] == fake_page_image
+
+
+def test_aprocess_unsupported_mime(processor):
+    result = asyncio.run(processor.aprocess(b"x", "text/plain", DocumentType.CREDITOR_BILL))
+    assert "Unsupported MIME type" in result.error
+
+
+def test_aprocess_provider_error_is_captured(processor, mock_async_provider):
+    mock_async_provider.aextract.side_effect = RuntimeError("quota exceeded")
+    result = asyncio.run(processor.aprocess(b"\xff\xd8", "image/jpeg", DocumentType.CREDITOR_BILL))
+    assert result.error == "quota exceeded"
+
+
+def test_process_many_overlaps_provider_calls():
+    """Four 0.2s round trips at concurrency 4 finish in ~one round trip, in input order."""
+    import time
+
+    from apps.documents.services.providers.stub import StubOCRProvider
+
+    processor = DocumentProcessor(provider=StubOCRProvider(latency=0.2))
+    docs = [
+        (b"\xff\xd8", "image/jpeg", DocumentType.PAY_STUB),
+        (b"\xff\xd8", "image/jpeg", DocumentType.CREDITOR_BILL),
+    ] * 2
+
+    started = time.perf_counter()
+    results = processor.process_many(docs, concurrency=4)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert [r.detected_type for r in results] == [d[2] for d in docs]
+    assert all(r.error == "" for r in results)
+
+
+def test_scanned_pdf_extracts_each_page_and_merges_by_schema(processor, mock_provider):
+    pages = [b"\xff\xd8page-1", b"\xff\xd8page-2", b"\xff\xd8page-3"]
+    mock_provider.extract.side_effect = [
+        '{"bureau": "Experian", "tradelines": [{"creditor_name": "Chase"}], '
+        '"confidence_score": 90}',
+        '{"bureau": null, "tradelines": [{"creditor_name": "Chase"}, '
+        '{"creditor_name": "Discover"}], "confidence_score": 80}',
+        "not json",
+    ]
+    with patch("apps.documents.services.processor.opendataloader_pdf", None):
+        with patch(
+            "apps.documents.services.processor._pdf_page_images", return_value=iter(pages)
+        ) as mock_pages:
+            result = processor.process(b"%PDF-1.4", "application/pdf", DocumentType.CREDIT_REPORT)
+
+    mock_pages.assert_called_once_with(b"%PDF-1.4", 3)
+    assert [c[0][0] for c in mock_provider.extract.call_args_list] == pages
+    assert result.error == ""
+    assert result.fields["bureau"] == "Experian"
+    assert result.fields["tradelines"] == [
+        {"creditor_name": "Chase"},
+        {"creditor_name": "Discover"},
+    ]
+    assert result.confidence == {"overall": 85, "pages": [90, 80]}
+
+
+def test_scanned_pdf_with_no_parseable_page_fails(processor, mock_provider):
+    mock_provider.extract.return_value = "not json"
+    with patch("apps.documents.services.processor.opendataloader_pdf", None):
+        with patch(
+            "apps.documents.services.processor._pdf_page_images",
+            return_value=iter([b"\xff\xd81", b"\xff\xd82"]),
+        ):
+            result = processor.process(b"%PDF-1.4", "application/pdf", DocumentType.CREDIT_REPORT)
+    assert "Failed to parse" in result.error
+
+
+def test_aprocess_scanned_pdf_extracts_pages_concurrently(mock_async_provider):
+    processor = DocumentProcessor(provider=mock_async_provider, max_scanned_pages=2)
+    with patch("apps.documents.services.processor.opendataloader_pdf", None):
+        with patch(
+            "apps.documents.services.processor._pdf_page_images",
+            return_value=iter([b"\xff\xd81", b"\xff\xd82"]),
+        ) as mock_pages:
+            result = asyncio.run(
+                processor.aprocess(b"%PDF-1.4", "application/pdf", DocumentType.CREDITOR_BILL)
+            )
+    mock_pages.assert_called_once_with(b"%PDF-1.4", 2)
+    assert mock_async_provider.aextract.await_count == 2
+    assert result.fields["creditor_name"] == "Chase"
+    assert result.confidence["overall"] == 85
+
+
+def test_digital_pdf_uses_in_process_text_layer(processor, mock_provider):
+    from apps.documents.management.commands.benchmark_ocr import build_sample_pdf
+
+    with patch("apps.documents.services.processor.opendataloader_pdf") as mock_odl:
+        processor.process(build_sample_pdf(), "application/pdf", DocumentType.PAY_STUB)
+
+    mock_odl.convert.assert_not_called()
+    image_arg, prompt = mock_provider.extract.call_args[0]
+    assert image_arg == b""
+    assert "Gross pay: $3,240.00" in prompt
+
+
+def test_odl_converter_converts_concurrent_documents_in_one_jvm_call(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from apps.documents.services.processor import OdlBatchConverter
+
+    def fake_convert(input_path, output_dir, **kwargs):
+        for path in input_path:
+            stem = path.rsplit("/", 1)[-1].removesuffix(".pdf")
+            with open(path, "rb") as f, open(f"{output_dir}/{stem}.md", "w") as out:
+                out.write(f.read().decode())
+
+    converter = OdlBatchConverter(batch_window=0.2)
+    with patch("apps.documents.services.processor.opendataloader_pdf") as mock_odl:
+        mock_odl.convert.side_effect = fake_convert
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            texts = list(pool.map(converter.convert, [b"doc a", b"doc b", b"doc c"]))
+
+    assert texts == ["doc a", "doc b", "doc c"]
+    assert mock_odl.convert.call_count == 1
+
+
+def test_odl_converter_propagates_converter_errors():
+    from apps.documents.services.processor import OdlBatchConverter
+
+    converter = OdlBatchConverter(batch_window=0)
+    with patch("apps.documents.services.processor.opendataloader_pdf") as mock_odl:
+        mock_odl.convert.side_effect = FileNotFoundError("java")
+        with pytest.raises(FileNotFoundError):
+            converter.convert(b"%PDF-1.4")
+        mock_odl.convert.side_effect = None
+        with patch("apps.documents.services.processor._read_odl_output", return_value="recovered"):
+            assert converter.convert(b"%PDF-1.4") == "recovered"
+
+
+def test_odl_converter_retries_a_failed_batch_one_document_at_a_time():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from apps.documents.services.processor import OdlBatchConverter
+
+    def fake_convert(input_path, output_dir, **kwargs):
+        for path in input_path:
+            with open(path, "rb") as f:
+                content = f.read()
+            if content == b"corrupt":
+                raise RuntimeError("cannot parse document")
+            stem = path.rsplit("/", 1)[-1].removesuffix(".pdf")
+            with open(f"{output_dir}/{stem}.md", "w") as out:
+                out.write(content.decode())
+
+    converter = OdlBatchConverter(batch_window=0.2, timeout=5)
+    with patch("apps.documents.services.processor.opendataloader_pdf") as mock_odl:
+        mock_odl.convert.side_effect = fake_convert
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(converter.convert, doc) for doc in (b"a", b"corrupt", b"c")]
+            good = [futures[0].result(), futures[2].result()]
+            with pytest.raises(RuntimeError, match="cannot parse"):
+                futures[1].result()
+
+    assert good == ["a", "c"]
+    assert mock_odl.convert.call_count == 4  # the batch, then each document alone
+
+
+@pytest.mark.parametrize("failing", ["scratch", "output"])
+def test_odl_converter_fails_the_batch_and_survives_any_error(failing):
+    from apps.documents.services.processor import OdlBatchConverter
+
+    converter = OdlBatchConverter(batch_window=0, timeout=5)
+    with patch("apps.documents.services.processor.opendataloader_pdf"):
+        if failing == "scratch":
+            broken = patch(
+                "apps.documents.services.processor.tempfile.TemporaryDirectory",
+                side_effect=OSError("no space left on device"),
+            )
+        else:
+            broken = patch(
+                "apps.documents.services.processor._read_odl_output",
+                side_effect=UnicodeDecodeError("utf-8", b"", 0, 1, "bad"),
+            )
+        with broken, pytest.raises((OSError, UnicodeDecodeError)):
+            converter.convert(b"%PDF-1.4")
+        with patch("apps.documents.services.processor._read_odl_output", return_value="ok"):
+            assert converter.convert(b"%PDF-1.4") == "ok"
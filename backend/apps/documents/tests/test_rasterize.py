@@ -0,0 +1,61 @@
+import pytest
+
+from apps.documents.services import rasterize
+
+
+def _scanned_pdf(pages: int, size=(612, 792)) -> bytes:
+    """A PDF whose pages carry only a filled rectangle (no text layer)."""
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=size[0], height=size[1])
+        page.draw_rect(fitz.Rect(50, 50, 100 + 40 * i, 100), fill=(0, 0, 0))
+    return doc.tobytes()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    yield
+    rasterize.shutdown_pool()
+
+
+def test_adaptive_dpi_targets_long_edge():
+    assert rasterize.adaptive_dpi(612, 792) == 164  # US letter
+    assert rasterize.adaptive_dpi(612, 1008) == 129  # US legal
+    assert rasterize.adaptive_dpi(216, 288) == rasterize._MAX_DPI  # receipt
+    assert rasterize.adaptive_dpi(2448, 3168) == rasterize._MIN_DPI  # poster
+    assert rasterize.adaptive_dpi(0, 0) == rasterize._MIN_DPI
+
+
+def test_render_page_is_jpeg_at_adaptive_size():
+    import fitz
+
+    image = rasterize.render_page(_scanned_pdf(1), 0)
+    assert image[:2] == b"\xff\xd8"
+    pix = fitz.Pixmap(image)
+    assert max(pix.width, pix.height) == pytest.approx(rasterize._TARGET_LONG_EDGE_PX, abs=10)
+
+
+def test_iter_page_images_caps_pages_and_keeps_order(monkeypatch):
+    monkeypatch.setattr(rasterize, "_MAX_WORKERS", 2)
+    pdf = _scanned_pdf(5)
+    expected = [rasterize.render_page(pdf, i) for i in range(3)]
+    assert list(rasterize.iter_page_images(pdf, max_pages=3)) == expected
+
+
+def test_iter_page_images_single_page_skips_pool(monkeypatch):
+    def _no_pool():
+        raise AssertionError("pool used for a single page")
+
+    monkeypatch.setattr(rasterize, "_get_pool", _no_pool)
+    assert len(list(rasterize.iter_page_images(_scanned_pdf(1), max_pages=3))) == 1
+
+
+def test_iter_page_images_falls_back_when_pool_unavailable(monkeypatch):
+    def _broken():
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(rasterize, "_MAX_WORKERS", 2)
+    monkeypatch.setattr(rasterize, "_get_pool", _broken)
+    assert len(list(rasterize.iter_page_images(_scanned_pdf(2), max_pages=3))) == 2
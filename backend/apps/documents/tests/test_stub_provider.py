@@ -0,0 +1,78 @@
+"""Tests for the offline StubOCRProvider and the OCR benchmark commands."""
+
+import asyncio
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from apps.documents.models import DocumentType
+from apps.documents.services.processor import DocumentProcessor
+from apps.documents.services.providers.prompts.image_extraction import (
+    build_image_extraction_prompt,
+)
+from apps.documents.services.providers.prompts.text_extraction import (
+    build_text_extraction_prompt,
+)
+from apps.documents.services.providers.stub import StubOCRProvider
+
+
+def test_extract_returns_schema_example_for_prompted_type():
+    provider = StubOCRProvider()
+    raw = provider.extract(b"", build_text_extraction_prompt(DocumentType.PAY_STUB, "Gross $1"))
+    data = json.loads(raw)
+    assert data["employer_name"] == "Acme Corporation"
+    assert data["confidence_score"] == 92
+
+
+def test_credit_report_uses_fallback_example():
+    provider = StubOCRProvider()
+    data = json.loads(
+        provider.extract(b"\xff", build_image_extraction_prompt(DocumentType.CREDIT_REPORT))
+    )
+    assert data["tradelines"][0]["creditor_name"] == "Capital One"
+
+
+def test_custom_responses_override_examples():
+    provider = StubOCRProvider(responses={"creditor_bill": {"creditor_name": "X"}})
+    data = json.loads(
+        provider.extract(b"\xff", build_image_extraction_prompt(DocumentType.CREDITOR_BILL))
+    )
+    assert data == {"creditor_name": "X"}
+
+
+def test_async_and_sync_paths_agree_and_count_calls():
+    provider = StubOCRProvider()
+    prompt = build_image_extraction_prompt(DocumentType.CREDITOR_BILL)
+    assert asyncio.run(provider.aextract(b"\xff", prompt)) == provider.extract(b"\xff", prompt)
+    assert provider.calls == 2
+
+
+def test_stub_drives_processor_end_to_end():
+    result = DocumentProcessor(provider=StubOCRProvider()).process(
+        b"\xff\xd8", "image/jpeg", DocumentType.CREDITOR_BILL
+    )
+    assert result.error == ""
+    assert result.fields["creditor_name"] == "Capital One"
+    assert result.confidence["overall"] == 88
+
+
+@pytest.mark.django_db
+def test_benchmark_command_reports_both_pipelines():
+    out = StringIO()
+    call_command("benchmark_ocr", documents=2, latency=0, concurrency=2, stdout=out)
+    output = out.getvalue()
+    assert "sync   total=" in output
+    assert "async  total=" in output
+
+
+def test_pdf_paths_benchmark_reports_each_path():
+    out = StringIO()
+    with patch("apps.documents.services.processor.opendataloader_pdf", None):
+        call_command("benchmark_pdf_paths", documents=2, stdout=out)
+    output = out.getvalue()
+    assert "pymupdf  mean=" in output
+    assert "odl      skipped: opendataloader-pdf is not installed" in output
+    assert "vision   mean=" in output
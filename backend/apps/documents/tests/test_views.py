@@ -1,11 +1,16 @@
+import io
 import json
+import logging
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
 from rest_framework.test import APIClient
 
 from apps.districts.models import District
+from apps.documents import views
 from apps.documents.models import DocumentType, OCRResult, OCRStatus, UploadedDocument
 from apps.intake.models import IntakeSession
 from apps.users.models import User
@@ -58,6 +63,55 @@ def test_upload_returns_202(db, auth_client, session):
     assert data["status"] == "processing"
 
 
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def stub_processor():
+    views._get_processor.cache_clear()
+    with override_settings(OCR_PROVIDER="stub", OCR_STUB_LATENCY_SECONDS=0.0):
+        yield
+    views._get_processor.cache_clear()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_upload_perf_line_includes_the_background_ocr_span(
+    auth_client, session, stub_processor, settings, tmp_path
+):
+    settings.MEDIA_ROOT = str(tmp_path)
+    client, _ = auth_client
+    image = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(image, format="PNG")
+    png = SimpleUploadedFile("bill.png", image.getvalue(), content_type="image/png")
+    perf_logger = logging.getLogger("dignifi.perf")  # does not propagate to caplog
+    handler = _ListHandler()
+    perf_logger.addHandler(handler)
+    try:
+        with override_settings(PERF_INSTRUMENTATION_ENABLED=True, PERF_SAMPLE_RATE=1.0):
+            response = client.post(
+                "/api/documents/upload/",
+                {
+                    "file": png,
+                    "document_type": DocumentType.CREDITOR_BILL,
+                    "session_id": session.id,
+                },
+                format="multipart",
+            )
+    finally:
+        perf_logger.removeHandler(handler)
+
+    assert response.status_code == 202
+    assert OCRResult.objects.get(document_id=response.json()["id"]).status == OCRStatus.COMPLETED
+    (record,) = [r for r in handler.records if r.path == "/api/documents/upload/"]
+    assert record.perf["spans"]["ocr_provider"]["count"] == 1
+
+
 def test_list_scoped_to_session(db, auth_client, session):
     client, user = auth_client
     UploadedDocument.objects.create(
@@ -1,7 +1,11 @@
+import contextvars
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
@@ -9,17 +13,32 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 
 from apps.documents.models import DocumentType, OCRResult, OCRStatus, UploadedDocument
+from apps.documents.services import extraction_cache
 from apps.documents.services.aggregator import AggregateIngestionService
 from apps.documents.services.draft_debt import DraftDebtCreator
 from apps.documents.services.processor import DocumentProcessor
+from apps.intake import summaries
 from apps.intake.models import IntakeSession
+from config.metrics import OCR_IN_FLIGHT, OCR_QUEUE_WAIT_SECONDS
+from config.query_budget import query_budget
 
 logger = logging.getLogger(__name__)
 
 ALLOWED_MIME_TYPES = {"application/pdf", "image/jpeg", "image/png", "image/webp"}
 
 
+@cache
 def _get_processor() -> DocumentProcessor:
+    # One processor (and provider/client) per worker process: the genai client
+    # holds the HTTP connection pool, so rebuilding it per upload would pay a
+    # fresh TLS handshake on every document.
+    if settings.OCR_PROVIDER == "stub":
+        from apps.documents.services.providers.stub import StubOCRProvider
+
+        return DocumentProcessor(
+            provider=StubOCRProvider(latency=settings.OCR_STUB_LATENCY_SECONDS)
+        )
+
     # Imported lazily so the documents URLconf doesn't pull the google-genai SDK
     # at module load (and so a missing SDK/key surfaces at OCR time, not app boot).
     from apps.documents.services.providers.gemini import GeminiProvider
@@ -30,51 +49,66 @@ def _get_processor() -> DocumentProcessor:
     return DocumentProcessor(provider=provider)
 
 
+@OCR_IN_FLIGHT.track_inprogress()
 def _run_processing(doc_id: int) -> None:
     try:
-        doc = UploadedDocument.objects.select_related("session").get(pk=doc_id)
-        ocr = OCRResult.objects.get(document=doc)
-        ocr.status = OCRStatus.PROCESSING
-        ocr.save(update_fields=["status"])
-
-        file_bytes = doc.file.read()
-        processor = _get_processor()
-        result = processor.process(file_bytes, doc.mime_type, doc.document_type)
-
-        if result.error:
-            ocr.status = OCRStatus.FAILED
-            ocr.error_message = result.error
-            ocr.extracted_data = "{}"
-            ocr.overall_confidence = 0
-        else:
-            ocr.status = OCRStatus.COMPLETED
-            ocr.extracted_data = json.dumps(result.fields)
-            ocr.confidence_scores = result.confidence
-            ocr.overall_confidence = result.confidence.get("overall", 0)
-
-            if doc.document_type == DocumentType.CREDITOR_BILL:
-                try:
-                    DraftDebtCreator().create_from_result(result, doc.session, doc)
-                except Exception as exc:
-                    logger.warning("DraftDebtCreator failed for doc %s: %s", doc_id, exc)
-            elif doc.document_type == DocumentType.CREDIT_REPORT:
-                try:
-                    from apps.documents.schemas.credit_report import CreditReportExtraction
-
-                    schema_obj = CreditReportExtraction.model_validate(result.fields)
-                    DraftDebtCreator().create_from_credit_report(schema_obj, doc.session, doc)
-                except Exception as exc:
-                    logger.warning(
-                        "DraftDebtCreator (credit report) failed for doc %s: %s", doc_id, exc
-                    )
-
-        ocr.save()
+        # Counted in this worker thread: the OCR row, the extraction cache and
+        # one INSERT for all the draft debts, so the same however many tradelines.
+        with query_budget(25, "documents.process"):
+            doc = UploadedDocument.objects.select_related("session").get(pk=doc_id)
+            OCR_QUEUE_WAIT_SECONDS.observe(
+                max(0.0, (timezone.now() - doc.uploaded_at).total_seconds())
+            )
+            ocr = OCRResult.objects.select_related("document").get(document=doc)
+            ocr.status = OCRStatus.PROCESSING
+            ocr.save(update_fields=["status"])
+
+            file_bytes = doc.file.read()
+            key = extraction_cache.cache_key(file_bytes, doc.document_type, doc.uploaded_by_id)
+            result = extraction_cache.lookup(key)
+            if result is not None:
+                ocr.ocr_provider = "cache"
+            else:
+                processor = _get_processor()
+                result = processor.process(file_bytes, doc.mime_type, doc.document_type)
+                ocr.ocr_provider = processor.provider_name or ocr.ocr_provider
+                extraction_cache.store(
+                    key, doc.document_type, result, ocr.ocr_provider, source_document=doc
+                )
+
+            if result.error:
+                ocr.status = OCRStatus.FAILED
+                ocr.error_message = result.error
+                ocr.extracted_data = "{}"
+                ocr.overall_confidence = 0
+            else:
+                ocr.status = OCRStatus.COMPLETED
+                ocr.extracted_data = json.dumps(result.fields)
+                ocr.confidence_scores = result.confidence
+                ocr.overall_confidence = result.confidence.get("overall", 0)
+
+                if doc.document_type == DocumentType.CREDITOR_BILL:
+                    try:
+                        DraftDebtCreator().create_from_result(result, doc.session, doc)
+                    except Exception as exc:
+                        logger.warning("DraftDebtCreator failed for doc %s: %s", doc_id, exc)
+                elif doc.document_type == DocumentType.CREDIT_REPORT:
+                    try:
+                        from apps.documents.schemas.credit_report import CreditReportExtraction
+
+                        schema_obj = CreditReportExtraction.model_validate(result.fields)
+                        DraftDebtCreator().create_from_credit_report(schema_obj, doc.session, doc)
+                    except Exception as exc:
+                        logger.warning(
+                            "DraftDebtCreator (credit report) failed for doc %s: %s", doc_id, exc
+                        )
+
+            ocr.save()
 
-        if ocr.status == OCRStatus.COMPLETED:
             try:
-                AggregateIngestionService.recalculate(doc.session_id)
+                AggregateIngestionService.apply(ocr)
             except Exception as exc:
-                logger.warning("Recalculate failed for doc %s: %s", doc_id, exc)
+                logger.warning("Aggregate update failed for doc %s: %s", doc_id, exc)
 
     except Exception as exc:
         logger.exception("Processing failed for document %s: %s", doc_id, exc)
@@ -82,6 +116,14 @@ def _run_processing(doc_id: int) -> None:
             OCRResult.objects.filter(document_id=doc_id).update(
                 status=OCRStatus.FAILED, error_message=str(exc)
             )
+            # update() sends no signals; recount the session's pending OCR.
+            session_id = (
+                UploadedDocument.objects.filter(pk=doc_id)
+                .values_list("session_id", flat=True)
+                .first()
+            )
+            if session_id is not None:
+                summaries.refresh(session_id, create=False)
         except Exception:
             pass
 
@@ -89,7 +131,9 @@ def _run_processing(doc_id: int) -> None:
 class DocumentViewSet(ViewSet):
     permission_classes = [IsAuthenticated]
 
+    # Request thread only; the background OCR run is budgeted in _run_processing.
     @action(detail=False, methods=["post"], url_path="upload")
+    @query_budget(5, "documents.upload")
     def upload(self, request):
         file = request.FILES.get("file")
         document_type = request.data.get("document_type")
@@ -130,8 +174,10 @@ class DocumentViewSet(ViewSet):
             overall_confidence=0,
         )
 
+        # Pool threads don't inherit context variables; run in a copy of this
+        # request's context so the OCR run's spans reach its perf stats.
         with ThreadPoolExecutor(max_workers=1) as executor:
-            executor.submit(_run_processing, doc.id)
+            executor.submit(contextvars.copy_context().run, _run_processing, doc.id)
 
         return Response({"id": doc.id, "status": "processing"}, status=status.HTTP_202_ACCEPTED)
 
@@ -174,14 +220,16 @@ class DocumentViewSet(ViewSet):
         ocr.save()
 
         if doc.document_type == DocumentType.CREDITOR_BILL:
-            doc.draft_debts.filter(is_draft=True).update(
+            updated = doc.draft_debts.filter(is_draft=True).update(
                 **{k: v for k, v in fields.items() if k in ("creditor_name", "amount_owed")}
             )
+            if updated and "amount_owed" in fields:
+                summaries.refresh(doc.session_id, create=False)  # update() sends no signals
 
         try:
-            AggregateIngestionService.recalculate(doc.session_id)
+            AggregateIngestionService.apply(ocr)
         except Exception as exc:
-            logger.warning("Recalculate failed on validate for doc %s: %s", pk, exc)
+            logger.warning("Aggregate update failed on validate for doc %s: %s", pk, exc)
 
         return Response(_serialize_ocr(ocr))
 
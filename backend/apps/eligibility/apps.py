@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EligibilityConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.eligibility"
+
+    def ready(self):
+        from .services import session_summary, standards
+
+        standards.connect_signals()
+        session_summary.connect_signals()
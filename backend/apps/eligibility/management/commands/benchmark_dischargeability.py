@@ -0,0 +1,113 @@
+"""
+benchmark_dischargeability - Time the compiled dischargeability rule table.
+
+Builds synthetic sessions of DebtInfo ``values()`` rows (no database),
+classifies each session with the compiled decision tree, then with the
+rule-by-rule reference matcher, and checks that they agree on every debt.
+
+  python manage.py benchmark_dischargeability --debts 500
+  python manage.py benchmark_dischargeability --debts 500 --sessions 1000 --rules rules.json
+"""
+
+import random
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.dischargeability_rules import RuleTableError, load_rule_table
+
+DEBT_TYPES = (
+    "credit_card",
+    "medical",
+    "personal_loan",
+    "student_loan",
+    "auto_loan",
+    "mortgage",
+    "utility",
+    "other",
+    "taxes",
+    "child_support",
+    "alimony",
+    "restitution",
+)
+
+
+def synthetic_debts(count: int, rng: random.Random, as_of: date) -> list[dict]:
+    """``count`` plausible DebtInfo rows with the columns the rule table reads."""
+    return [
+        {
+            "id": i,
+            "creditor_name": f"Creditor {i}",
+            "debt_type": rng.choice(DEBT_TYPES),
+            "priority_classification": rng.choice(("unsecured", "secured", "priority")),
+            "consumer_business_classification": rng.choice(("consumer", "business")),
+            "data_source": rng.choice(("manual", "credit_report", "uploaded_document")),
+            "is_priority": rng.random() < 0.2,
+            "is_secured": rng.random() < 0.2,
+            "is_in_collections": rng.random() < 0.3,
+            "is_disputed": rng.random() < 0.05,
+            "is_contingent": rng.random() < 0.05,
+            "is_unliquidated": rng.random() < 0.05,
+            "date_incurred": (
+                None if rng.random() < 0.3 else as_of - timedelta(days=rng.randrange(0, 15 * 365))
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the compiled dischargeability rule table against rule-by-rule matching."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--debts", type=int, default=500, help="Debts per session")
+        parser.add_argument("--sessions", type=int, default=200, help="Synthetic sessions")
+        parser.add_argument("--rules", help="Rule table JSON (default: the shipped table)")
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        debts, sessions = options["debts"], options["sessions"]
+        if debts < 1 or sessions < 1:
+            raise CommandError("--debts and --sessions must be at least 1")
+        try:
+            table = load_rule_table(options["rules"])
+        except (OSError, RuleTableError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        as_of = date.today()
+        rng = random.Random(options["seed"])
+        batches = [synthetic_debts(debts, rng, as_of) for _ in range(sessions)]
+
+        started = time.perf_counter()
+        evaluations = [table.evaluate(rows, as_of) for rows in batches]
+        compiled_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reference = [[table.match_linear(row, as_of) for row in rows] for rows in batches]
+        linear_seconds = time.perf_counter() - started
+
+        mismatches = sum(
+            compiled is not expected
+            for evaluation, expected_rules in zip(evaluations, reference, strict=True)
+            for compiled, expected in zip(evaluation.matches, expected_rules, strict=True)
+        )
+        hits = sum((evaluation.hits for evaluation in evaluations), Counter())
+
+        self.stdout.write(
+            f"rules={len(table.rules)} version={table.version} sessions={sessions} debts={debts}"
+        )
+        self.stdout.write(" ".join(f"{rule}={count}" for rule, count in hits.most_common()))
+        self.stdout.write(
+            f"compiled  per_session={compiled_seconds / sessions * 1000:.2f}ms "
+            f"rate={sessions * debts / compiled_seconds if compiled_seconds else 0:,.0f} debts/s"
+        )
+        self.stdout.write(
+            f"linear    per_session={linear_seconds / sessions * 1000:.2f}ms "
+            f"speedup={linear_seconds / compiled_seconds if compiled_seconds else 0:.1f}x"
+        )
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"{mismatches} debts disagree with the reference"))
+        else:
+            self.stdout.write(self.style.SUCCESS("Reference matcher agrees on every debt"))
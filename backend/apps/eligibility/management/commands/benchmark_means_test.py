@@ -0,0 +1,195 @@
+"""
+benchmark_means_test - Time the cohort means-test engine on synthetic sessions.
+
+Builds N synthetic sessions directly as columnar arrays (no database), times
+the vectorized evaluation, and checks a sample of rows against the per-row
+Decimal kernel that MeansTest.calculate runs (``means_test_kernel``),
+timing that too.
+
+  python manage.py benchmark_means_test --sessions 100000
+  python manage.py benchmark_means_test --sessions 1000000 --reference 20000
+"""
+
+import time
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.cohort_means_test import (
+    CohortInputs,
+    StandardsTable,
+    evaluate,
+    to_cents,
+)
+from apps.eligibility.services.irs_standards import LOCAL_STANDARDS, NATIONAL_STANDARDS
+from apps.eligibility.services.means_test_kernel import (
+    DeductionStandards,
+    MeansTestInputs,
+    means_test,
+)
+from apps.eligibility.services.poverty_guidelines import (
+    GUIDELINES,
+    REGIONS,
+    PovertyGuideline,
+)
+from apps.eligibility.services.standards import MedianIncomeTable
+
+# ILND 2025 medians (family sizes 1-8, then per additional person).
+_MEDIANS = (71304, 91526, 110712, 129374, 138500, 147600, 156700, 165800, 9900)
+_POVERTY_DATE = max(GUIDELINES)  # latest HHS guidelines, for every region
+
+
+def synthetic_inputs(count: int, seed: int) -> tuple[CohortInputs, StandardsTable]:
+    """Random but plausible sessions in one district with ILND tables.
+
+    Each session is randomly placed in the 48-state, Alaska or Hawaii
+    poverty region, so all three guidelines are exercised.
+    """
+    rng = np.random.default_rng(seed)
+    local = LOCAL_STANDARDS["ILND"]
+    standards = StandardsTable(
+        median_cents=np.array([[amount * 100 for amount in _MEDIANS]], dtype=np.int64),
+        has_median=np.array([True]),
+        housing_cents=np.array(
+            [[to_cents(local["housing"][size]) for size in range(1, 6)]], dtype=np.int64
+        ),
+        transport_cents=np.array([to_cents(local["transport_operating"])], dtype=np.int64),
+        food_cents=np.array(
+            [to_cents(NATIONAL_STANDARDS["food"][size]) for size in range(1, 6)], dtype=np.int64
+        ),
+        health_under_65_cents=np.array(
+            [to_cents(NATIONAL_STANDARDS["health_care_under_65"][size]) for size in range(1, 6)],
+            dtype=np.int64,
+        ),
+        health_65_plus_cents=np.array(
+            [to_cents(NATIONAL_STANDARDS["health_care_65_plus"][size]) for size in range(1, 6)],
+            dtype=np.int64,
+        ),
+        poverty_cents=np.array(
+            [[amount * 100 for amount in GUIDELINES[_POVERTY_DATE][region]] for region in REGIONS],
+            dtype=np.int64,
+        ),
+    )
+
+    def money(low: int, high: int) -> np.ndarray:
+        return rng.integers(low * 100, high * 100, size=count, dtype=np.int64)
+
+    inputs = CohortInputs(
+        session_ids=np.arange(1, count + 1, dtype=np.int64),
+        valid=np.ones(count, dtype=bool),
+        income_cents=money(1_000, 14_000) * 6,
+        family_size=rng.integers(1, 11, size=count, dtype=np.int64),
+        district=np.zeros(count, dtype=np.int64),
+        region=rng.integers(0, len(REGIONS), size=count, dtype=np.int64),
+        under_65=rng.random(count) < 0.85,
+        food_cents=money(0, 1_500),
+        health_cents=money(0, 400),
+        housing_cents=money(0, 3_000),
+        transport_cents=money(0, 600),
+        priority_cents=np.where(rng.random(count) < 0.3, money(0, 10_000), 0),
+    )
+    return inputs, standards
+
+
+def kernel_standards(
+    standards: StandardsTable,
+) -> tuple[DeductionStandards, MedianIncomeTable, tuple[PovertyGuideline, ...]]:
+    """The synthetic district's tables (and a guideline per region) as kernel inputs."""
+
+    def dollars(cents) -> Decimal:
+        return Decimal(int(cents)).scaleb(-2)
+
+    medians = tuple(dollars(v) for v in standards.median_cents[0])
+    deduction = DeductionStandards(
+        food=tuple(dollars(v) for v in standards.food_cents),
+        health_under_65=tuple(dollars(v) for v in standards.health_under_65_cents),
+        health_65_plus=tuple(dollars(v) for v in standards.health_65_plus_cents),
+        housing=tuple(dollars(v) for v in standards.housing_cents[0]),
+        transport_operating=dollars(standards.transport_cents[0]),
+    )
+    poverty = tuple(
+        PovertyGuideline.from_amounts(_POVERTY_DATE, region, *map(dollars, amounts))
+        for region, amounts in zip(REGIONS, standards.poverty_cents, strict=True)
+    )
+    return deduction, MedianIncomeTable(date.min, medians[:8], medians[8]), poverty
+
+
+def reference_row(
+    inputs: CohortInputs,
+    standards: tuple[DeductionStandards, MedianIncomeTable, tuple[PovertyGuideline, ...]],
+    i: int,
+) -> tuple[bool, bool]:
+    """(passes, fee waiver) for row ``i`` through the kernel MeansTest.calculate uses."""
+
+    def dollars(column) -> Decimal:
+        return Decimal(int(column[i])).scaleb(-2)
+
+    deduction, median, poverty = standards
+    zero = Decimal("0")
+    outcome = means_test(
+        MeansTestInputs(
+            # Only the six-month total matters to CMI.
+            monthly_income=(dollars(inputs.income_cents), zero, zero, zero, zero, zero),
+            family_size=int(inputs.family_size[i]),
+            under_65=bool(inputs.under_65[i]),
+            food=dollars(inputs.food_cents),
+            health=dollars(inputs.health_cents),
+            housing=dollars(inputs.housing_cents),
+            transport=dollars(inputs.transport_cents),
+            total_expenses=zero,
+            priority_debts_monthly=dollars(inputs.priority_cents),
+            standards=deduction,
+            median=median,
+            poverty=poverty[int(inputs.region[i])],
+        )
+    )
+    return outcome.passes_means_test, outcome.qualifies_for_fee_waiver
+
+
+class Command(BaseCommand):
+    help = "Benchmark the vectorized cohort means test against a per-row Decimal loop."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sessions", type=int, default=100_000, help="Synthetic sessions")
+        parser.add_argument(
+            "--reference", type=int, default=5_000, help="Rows to check with the Decimal loop"
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        count = options["sessions"]
+        if count < 1:
+            raise CommandError("--sessions must be at least 1")
+        inputs, standards = synthetic_inputs(count, options["seed"])
+
+        started = time.perf_counter()
+        result = evaluate(inputs, standards)
+        vector_seconds = time.perf_counter() - started
+
+        sample = min(options["reference"], count)
+        reference = kernel_standards(standards)
+        started = time.perf_counter()
+        mismatches = sum(
+            reference_row(inputs, reference, i)
+            != (bool(result.passes_means_test[i]), bool(result.qualifies_for_fee_waiver[i]))
+            for i in range(sample)
+        )
+        reference_seconds = time.perf_counter() - started
+        per_row = reference_seconds / sample if sample else 0
+
+        summary = result.summary()
+        self.stdout.write(" ".join(f"{key}={value}" for key, value in summary.items()))
+        self.stdout.write(
+            f"vectorized  total={vector_seconds * 1000:.1f}ms "
+            f"rate={count / vector_seconds if vector_seconds else 0:,.0f} sessions/s"
+        )
+        self.stdout.write(
+            f"decimal     sample={sample} per_row={per_row * 1e6:.1f}us "
+            f"projected={per_row * count:.2f}s speedup={per_row * count / vector_seconds if vector_seconds else 0:.0f}x"
+        )
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"{mismatches} rows disagree with the Decimal loop"))
+        else:
+            self.stdout.write(self.style.SUCCESS("Decimal reference agrees on every sampled row"))
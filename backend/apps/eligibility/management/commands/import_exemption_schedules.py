@@ -0,0 +1,30 @@
+"""
+import_exemption_schedules - Bulk load exemption amounts for any districts.
+
+The file is a CSV or XLSX with district, exemption_type, amount,
+statute_citation and description columns. Rows are matched on district,
+exemption type and citation, so re-importing updates amounts in place.
+
+  python manage.py import_exemption_schedules exemptions_2025.csv
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.standards_import import (
+    StandardsImportError,
+    import_exemption_schedules,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import ExemptionSchedule rows from CSV or XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Exemption schedule file")
+
+    def handle(self, *args, **options):
+        try:
+            count = import_exemption_schedules(options["path"])
+        except (OSError, StandardsImportError) as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(self.style.SUCCESS(f"Imported {count} exemption schedule row(s)"))
@@ -0,0 +1,41 @@
+"""
+import_irs_standards - Load one release of the IRS National/Local Standards.
+
+The file is a CSV or XLSX in the normalised long layout described in
+``apps.eligibility.services.standards_import``. Calculations for cases dated
+on or after --effective-date use the new release; earlier cases keep the one
+that was in force for them.
+
+  python manage.py import_irs_standards irs_2025.csv --effective-date 2025-04-01
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.standards_import import StandardsImportError, import_irs_release
+
+
+class Command(BaseCommand):
+    help = "Import an IRS National/Local Standards release (CSV or XLSX)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Normalised standards file")
+        parser.add_argument(
+            "--effective-date",
+            type=date.fromisoformat,
+            required=True,
+            help="First date the release applies to (YYYY-MM-DD)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            release = import_irs_release(options["path"], options["effective_date"])
+        except (OSError, StandardsImportError) as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {release} ({len(release.national)} national tables, "
+                f"{len(release.local)} districts)"
+            )
+        )
@@ -0,0 +1,65 @@
+"""
+import_local_standards - Bulk load IRS Local Standards for any districts.
+
+Reads the published wide layout (one row per county or region, one column
+per household size or vehicle count) described in
+``apps.eligibility.services.standards_import``. Files that hold one table for
+one district can name them with --district and --table instead of columns.
+Tables given only per county also get a district-wide amount (the lowest
+county amount), which is what means tests read.
+
+  python manage.py import_local_standards housing_il.csv --effective-date 2025-04-01 \\
+      --district ilnd --table housing
+  python manage.py import_local_standards all_districts.xlsx --effective-date 2025-04-01
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.local_standards import CATEGORIES
+from apps.eligibility.services.standards import get_catalog
+from apps.eligibility.services.standards_import import (
+    StandardsImportError,
+    import_local_standards,
+)
+
+
+class Command(BaseCommand):
+    help = "Bulk import IRS Local Standards (housing, transportation) from CSV or XLSX."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Local standards file")
+        parser.add_argument(
+            "--effective-date",
+            type=date.fromisoformat,
+            required=True,
+            help="First date the amounts apply to (YYYY-MM-DD)",
+        )
+        parser.add_argument("--district", help="District code when the file has no column")
+        parser.add_argument("--table", choices=CATEGORIES, help="Table when the file has no column")
+
+    def handle(self, *args, **options):
+        try:
+            count, derived = import_local_standards(
+                options["path"],
+                options["effective_date"],
+                district=options["district"],
+                table=options["table"],
+            )
+        except (OSError, StandardsImportError) as exc:
+            raise CommandError(str(exc)) from exc
+        if derived:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Derived {derived} district-wide amount(s) from the lowest county amounts"
+                )
+            )
+        store = get_catalog().local
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {count} local standard amount(s) effective "
+                f"{options['effective_date']}; resident store now holds {len(store)} rows "
+                f"for {len(store.districts())} district(s) in {store.nbytes // 1024} KiB"
+            )
+        )
@@ -0,0 +1,43 @@
+"""
+import_median_incomes - Load Census median family incomes for the means test.
+
+The file is a CSV or XLSX with one row per district (see
+``apps.eligibility.services.standards_import``). Rows for --effective-date
+are created or replaced; older releases stay in place for earlier cases.
+
+  python manage.py import_median_incomes medians_2025.csv --effective-date 2025-04-01
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.eligibility.services.standards_import import (
+    StandardsImportError,
+    import_median_incomes,
+)
+
+
+class Command(BaseCommand):
+    help = "Import Census median family incomes per district (CSV or XLSX)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Median income file")
+        parser.add_argument(
+            "--effective-date",
+            type=date.fromisoformat,
+            required=True,
+            help="First date the medians apply to (YYYY-MM-DD)",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            count = import_median_incomes(options["path"], options["effective_date"])
+        except (OSError, StandardsImportError) as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported median incomes for {count} district(s) "
+                f"effective {options['effective_date']}"
+            )
+        )
@@ -0,0 +1,58 @@
+"""
+rescreen_means_tests - Re-screen a caseload after medians or standards change.
+
+Evaluates every session with income data (or one district's) through the
+cohort means-test engine and reports how many outcomes differ from the stored
+MeansTest rows. With --recalculate, only the changed and never-screened
+sessions are recalculated and saved through MeansTestCalculator.
+
+  python manage.py rescreen_means_tests
+  python manage.py rescreen_means_tests --district ilnd --recalculate
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.eligibility.services import MeansTestCalculator
+from apps.eligibility.services.cohort_means_test import rescreen
+from apps.intake.models import IntakeSession
+
+
+class Command(BaseCommand):
+    help = "Re-screen sessions with the vectorized means test and report changed outcomes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--district", type=str, help="Only sessions in this district code")
+        parser.add_argument(
+            "--recalculate",
+            action="store_true",
+            help="Recalculate and save changed and unscreened sessions",
+        )
+
+    def handle(self, *args, **options):
+        sessions = None
+        if options["district"]:
+            sessions = IntakeSession.objects.filter(district__code__iexact=options["district"])
+
+        report = rescreen(sessions)
+        summary = report.result.summary()
+        self.stdout.write(" ".join(f"{key}={value}" for key, value in summary.items()))
+        self.stdout.write(
+            f"changed={len(report.changed_session_ids)} "
+            f"unscreened={len(report.unscreened_session_ids)}"
+        )
+        if not options["recalculate"]:
+            return
+
+        targets = report.changed_session_ids + report.unscreened_session_ids
+        failed = 0
+        for session in IntakeSession.objects.filter(pk__in=targets).select_related(
+            "district", "income_info"
+        ):
+            try:
+                MeansTestCalculator(session).calculate()
+            except ValueError as exc:
+                failed += 1
+                self.stderr.write(self.style.WARNING(f"  session {session.pk}: {exc}"))
+        self.stdout.write(
+            self.style.SUCCESS(f"Recalculated {len(targets) - failed} sessions ({failed} failed)")
+        )
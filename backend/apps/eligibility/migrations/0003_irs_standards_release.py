@@ -0,0 +1,57 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("eligibility", "0002_add_above_median_fields"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IRSStandardsRelease",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("effective_date", models.DateField(unique=True)),
+                (
+                    "source",
+                    models.CharField(blank=True, help_text="Imported file name", max_length=255),
+                ),
+                ("national", models.JSONField(help_text='{"food": {"1": "713", ...}, ...}')),
+                (
+                    "local",
+                    models.JSONField(
+                        help_text='{"ILND": {"housing": {"1": "1730", ...}, "transport_operating": "283"}}'
+                    ),
+                ),
+                ("imported_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "irs_standards_releases",
+                "ordering": ["effective_date"],
+            },
+        ),
+        migrations.CreateModel(
+            name="StandardsVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "standards_version",
+            },
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("districts", "0002_alter_district_state_and_more"),
+        ("eligibility", "0003_irs_standards_release"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocalStandard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "county",
+                    models.CharField(
+                        blank=True, help_text="Blank for district-wide", max_length=64
+                    ),
+                ),
+                (
+                    "category",
+                    models.CharField(
+                        choices=[
+                            ("housing", "Housing and utilities"),
+                            ("transport_owned", "Vehicle ownership costs"),
+                            ("transport_operating", "Vehicle operating costs"),
+                        ],
+                        max_length=24,
+                    ),
+                ),
+                (
+                    "family_size",
+                    models.PositiveSmallIntegerField(default=0, help_text="0 for flat amounts"),
+                ),
+                ("effective_date", models.DateField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=10)),
+                (
+                    "district",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="local_standards",
+                        to="districts.district",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "irs_local_standards",
+                "ordering": ["district", "county", "category", "family_size", "effective_date"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="localstandard",
+            constraint=models.UniqueConstraint(
+                fields=("district", "county", "category", "family_size", "effective_date"),
+                name="unique_local_standard",
+            ),
+        ),
+    ]
@@ -1,6 +1,7 @@
 """Means test and eligibility models."""
 
 import json
+from datetime import date
 from decimal import Decimal
 
 from django.db import models
@@ -88,77 +89,42 @@ class MeansTest(models.Model):
     def __str__(self) -> str:
         return f"Means Test {self.id} - {'Passes' if self.passes_means_test else 'Fails'}"
 
-    def calculate(self) -> bool:
+    def calculate(self, as_of: date | None = None) -> bool:
         """
         Calculate means test using 11 U.S.C. § 707(b) methodology.
 
+        Args:
+            as_of: Filing date whose median income and IRS tables apply
+                (default: today)
+
         Returns:
             bool: True if debtor passes means test (CMI < median income)
 
         Raises:
             ValueError: If required intake data is missing
         """
-        # Get income info from session
-        try:
-            income_info = self.session.income_info
-        except AttributeError as err:
-            raise ValueError("IntakeSession must have income_info to calculate means test") from err
-
-        # Calculate Current Monthly Income (CMI) - average of last 6 months
-        monthly_income_data = income_info.monthly_income
-        if not isinstance(monthly_income_data, list) or len(monthly_income_data) != 6:
-            raise ValueError("monthly_income must be a list of 6 monthly income values")
-
-        total_6_month_income = sum(Decimal(str(amt)) for amt in monthly_income_data)
-        cmi = total_6_month_income / Decimal("6")
-
-        # Get family size for median income lookup. The wizard collects
-        # household_size on the debtor step; sessions without it fall back
-        # to deriving family size from marital status + dependents.
-        debtor_info = getattr(self.session, "debtor_info", None)
-        if debtor_info is not None and (debtor_info.household_size or 0) >= 1:
-            family_size = debtor_info.household_size
-        else:
-            family_size = income_info.number_of_dependents + 1  # Filer + dependents
-            if income_info.marital_status in ["married_joint", "married_separate"]:
-                family_size += 1  # Add spouse
-
-        # Get median income threshold from district
-        try:
-            median_income_record = self.district.median_incomes.latest("effective_date")
-        except Exception as err:
-            raise ValueError(
-                f"No median income data found for district {self.district.code}"
-            ) from err
-
-        median_income_threshold = median_income_record.get_median_income(family_size)
-
-        # Determine if passes means test. CMI is monthly; the Census median
-        # is annual, so annualize per 11 U.S.C. § 707(b)(7).
-        annualized_cmi = cmi * Decimal("12")
-        passes_test = annualized_cmi < median_income_threshold
-
-        # Initialize calculation details (used by above-median pathway below)
+        from apps.eligibility.services.means_test_kernel import load_inputs, means_test
+
+        as_of = as_of or timezone.localdate()
+        inputs = load_inputs(self.session, as_of, district_code=self.district.code)
+        outcome = means_test(inputs)
+        income_info = self.session.income_info
+        cmi = outcome.cmi
+        median_income_threshold = outcome.median_income_threshold
+        passes_test = outcome.passes_means_test
+        qualifies_fee_waiver = outcome.qualifies_for_fee_waiver
+
+        # Initialize calculation details (filled by above-median pathway below)
         details: dict = {}
 
-        # Above-median pathway: calculate allowable expenses
-        if not passes_test:
-            from apps.eligibility.services.expense_deduction_calculator import (
-                ExpenseDeductionCalculator,
-            )
-
-            ded_calc = ExpenseDeductionCalculator(self.session)
-            ded_result = ded_calc.calculate()
-
+        # Above-median pathway: allowable expenses and disposable income
+        ded_result = outcome.deductions
+        if ded_result is not None:
             self.total_allowable_expenses = ded_result.allowable_expenses
             self.disposable_income = ded_result.disposable_income
             self.priority_debts_monthly = ded_result.priority_debts_monthly
             self.above_median_calculated = True
-
-            # $756.25/mo = $9,075 over 60 months (2024 threshold)
-            threshold = Decimal("756.25")
-            self.passes_above_median = ded_result.disposable_income < threshold
-            passes_test = self.passes_above_median
+            self.passes_above_median = outcome.passes_above_median
 
             details["above_median"] = {
                 "allowable_expenses": float(ded_result.allowable_expenses),
@@ -167,22 +133,20 @@ class MeansTest(models.Model):
                 "passes_above_median": self.passes_above_median,
             }
 
-        # Calculate fee waiver eligibility (CMI < 150% of poverty line)
-        # For MVP, simplified: qualifies if income is very low (< 60% of median)
-        qualifies_fee_waiver = annualized_cmi < (median_income_threshold * Decimal("0.60"))
-
         # Store calculation details (encrypted)
         details.update(
             {
                 "cmi": float(cmi),
-                "annualized_cmi": float(annualized_cmi),
+                "annualized_cmi": float(outcome.annualized_cmi),
                 "median_income_threshold": float(median_income_threshold),
-                "family_size": family_size,
-                "monthly_income_breakdown": monthly_income_data,
+                "median_income_effective_date": inputs.median.effective_date.isoformat(),
+                "family_size": inputs.family_size,
+                "monthly_income_breakdown": income_info.monthly_income,
                 "marital_status": income_info.marital_status,
                 "number_of_dependents": income_info.number_of_dependents,
                 "passes_test": passes_test,
                 "qualifies_fee_waiver": qualifies_fee_waiver,
+                "poverty_guideline": f"{inputs.poverty.year} {inputs.poverty.region}",
                 "calculated_at": timezone.now().isoformat(),
                 "statute_citation": "11 U.S.C. § 707(b)",
             }
@@ -196,3 +160,89 @@ class MeansTest(models.Model):
         self.set_calculation_details(details)
 
         return passes_test
+
+
+class IRSStandardsRelease(models.Model):
+    """
+    One imported release of the IRS National and Local Standards.
+
+    Releases are immutable once imported; a new IRS publication is imported
+    as a new row with its own effective date. Amounts are stored as strings
+    so they round-trip exactly into Decimal.
+    """
+
+    effective_date = models.DateField(unique=True)
+    source = models.CharField(max_length=255, blank=True, help_text="Imported file name")
+    national = models.JSONField(help_text='{"food": {"1": "713", ...}, ...}')
+    local = models.JSONField(
+        help_text='{"ILND": {"housing": {"1": "1730", ...}, "transport_operating": "283"}}'
+    )
+    imported_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "irs_standards_releases"
+        ordering = ["effective_date"]
+
+    def __str__(self) -> str:
+        return f"IRS standards effective {self.effective_date}"
+
+
+class LocalStandard(models.Model):
+    """
+    One amount from the IRS Local Standards for one district and county.
+
+    Housing and utilities amounts are published per county, transportation
+    per Census region or metropolitan area; both are stored under ``county``.
+    A blank county is the district-wide amount used when the debtor's county
+    is unknown. ``family_size`` is the household size (housing) or number of
+    vehicles (ownership costs), and 0 for flat amounts.
+    """
+
+    HOUSING = "housing"
+    TRANSPORT_OWNED = "transport_owned"
+    TRANSPORT_OPERATING = "transport_operating"
+
+    CATEGORY_CHOICES = [
+        (HOUSING, "Housing and utilities"),
+        (TRANSPORT_OWNED, "Vehicle ownership costs"),
+        (TRANSPORT_OPERATING, "Vehicle operating costs"),
+    ]
+
+    district = models.ForeignKey(
+        "districts.District", on_delete=models.CASCADE, related_name="local_standards"
+    )
+    county = models.CharField(max_length=64, blank=True, help_text="Blank for district-wide")
+    category = models.CharField(max_length=24, choices=CATEGORY_CHOICES)
+    family_size = models.PositiveSmallIntegerField(default=0, help_text="0 for flat amounts")
+    effective_date = models.DateField()
+    amount = models.DecimalField(max_digits=10, decimal_places=2)
+
+    class Meta:
+        db_table = "irs_local_standards"
+        ordering = ["district", "county", "category", "family_size", "effective_date"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["district", "county", "category", "family_size", "effective_date"],
+                name="unique_local_standard",
+            )
+        ]
+
+    def __str__(self) -> str:
+        where = f"{self.district_id}/{self.county or '*'}"
+        return f"{where} {self.category}[{self.family_size}] {self.amount} ({self.effective_date})"
+
+
+class StandardsVersion(models.Model):
+    """
+    Single-row counter bumped whenever a median income or IRS standards table
+    changes, so every worker's in-process standards cache knows to reload.
+    """
+
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "standards_version"
+
+    def __str__(self) -> str:
+        return f"Standards version {self.version}"
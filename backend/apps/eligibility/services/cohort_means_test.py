@@ -0,0 +1,333 @@
+"""
+Cohort means test: screen thousands of sessions at once.
+
+``MeansTest.calculate`` evaluates one session through the ORM, which is right
+for the intake flow but far too slow to re-screen a clinic's whole caseload
+after the Census medians or IRS standards change. This module loads the
+inputs for N sessions through the kernel's ``load_inputs_many`` (two queries
+in total), so family size, age, the six-month income check and the tables in
+force are exactly what ``MeansTest.calculate`` would use, then lays them out
+as columnar numpy arrays and applies the kernel's ``means_test`` rules to all
+of them in a handful of array operations. Only that arithmetic is restated
+here, with the kernel's constants; ``test_kernel_matches_cohort_engine``
+checks the two agree row for row.
+
+All money is held as int64 cents and every decision is an exact integer
+comparison. Because CMI is the six-month total divided by 6, each test is
+multiplied through by 6 instead of dividing:
+
+- below median:      CMI * 12 < median        ->  total * 2  < median
+- fee waiver:        CMI < 150% of the poverty line / 12
+                                              ->  total * 4  < poverty line * 3
+- above-median pass: CMI - allowable - priority < 756.25
+                                              ->  total - 6 * (allowable + priority) < 6 * 75625
+
+CMI and disposable income are rounded half-even to the cent for reporting
+only. Results are not persisted; ``rescreen`` reports which sessions' stored
+outcome would change so the caller can recalculate just those through
+``MeansTestCalculator`` (which writes the audit-ready calculation details).
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.eligibility.services.means_test_kernel import (
+    ABOVE_MEDIAN_THRESHOLD,
+    ZERO,
+    MeansTestInputs,
+    load_inputs_many,
+)
+
+_MEDIAN_SIZES = 8  # MedianIncome.family_size_1..8, then family_size_additional
+_STANDARD_SIZES = 5  # IRS standards tables stop at a household of 5
+
+
+def to_cents(value) -> int:
+    """Decimal-exact conversion to integer cents (sub-cent input rounds half-even)."""
+    return int((Decimal(str(value)) * 100).to_integral_value(ROUND_HALF_EVEN))
+
+
+ABOVE_MEDIAN_THRESHOLD_CENTS = to_cents(ABOVE_MEDIAN_THRESHOLD)
+
+
+@dataclass
+class CohortInputs:
+    """Columnar means-test inputs; row i of every array is one session."""
+
+    session_ids: np.ndarray  # int64
+    valid: np.ndarray  # bool: the kernel loaded the session without a ValueError
+    income_cents: np.ndarray  # int64: six-month income total
+    family_size: np.ndarray  # int64
+    district: np.ndarray  # int64 row of the StandardsTable district tables
+    region: np.ndarray  # int64 row of StandardsTable.poverty_cents
+    under_65: np.ndarray  # bool
+    food_cents: np.ndarray  # int64 actual monthly expenses ...
+    health_cents: np.ndarray
+    housing_cents: np.ndarray
+    transport_cents: np.ndarray
+    priority_cents: np.ndarray  # int64: monthly priority debt payments
+
+    def __len__(self) -> int:
+        return len(self.session_ids)
+
+
+@dataclass
+class StandardsTable:
+    """Median incomes, IRS standards and poverty lines laid out for array lookups."""
+
+    median_cents: np.ndarray  # (districts, 9): sizes 1..8, then per additional person
+    has_median: np.ndarray  # (districts,) bool
+    housing_cents: np.ndarray  # (districts, 5)
+    transport_cents: np.ndarray  # (districts,)
+    food_cents: np.ndarray  # (5,)
+    health_under_65_cents: np.ndarray  # (5,)
+    health_65_plus_cents: np.ndarray  # (5,)
+    poverty_cents: np.ndarray  # (guidelines, 2): annual poverty line for 1, per additional person
+
+
+@dataclass
+class CohortResult:
+    session_ids: np.ndarray
+    valid: np.ndarray
+    passes_means_test: np.ndarray
+    below_median: np.ndarray
+    above_median_calculated: np.ndarray
+    passes_above_median: np.ndarray
+    qualifies_for_fee_waiver: np.ndarray
+    cmi_cents: np.ndarray
+    median_cents: np.ndarray
+    allowable_cents: np.ndarray
+    disposable_cents: np.ndarray
+
+    def summary(self) -> dict[str, int]:
+        valid = self.valid
+        return {
+            "sessions": len(self.session_ids),
+            "evaluated": int(valid.sum()),
+            "passes": int(self.passes_means_test[valid].sum()),
+            "below_median": int(self.below_median[valid].sum()),
+            "passes_above_median": int(self.passes_above_median[valid].sum()),
+            "fee_waiver": int(self.qualifies_for_fee_waiver[valid].sum()),
+        }
+
+
+def load_cohort(
+    sessions: QuerySet | None = None, as_of: date | None = None
+) -> tuple[CohortInputs, StandardsTable]:
+    """
+    Load means-test inputs and tables for ``sessions`` (default: every session).
+
+    Sessions without income_info are left out, as MeansTestCalculator
+    refuses them; sessions the kernel refuses otherwise are rows that are
+    not ``valid``.
+    """
+    from apps.intake.models import IntakeSession
+
+    rows = IntakeSession.objects.all() if sessions is None else sessions
+    loaded = load_inputs_many(rows.filter(income_info__isnull=False), as_of or timezone.localdate())
+    return to_columns(loaded)
+
+
+_COLUMNS = (
+    "session_ids",
+    "valid",
+    "income_cents",
+    "family_size",
+    "district",
+    "region",
+    "under_65",
+    "food_cents",
+    "health_cents",
+    "housing_cents",
+    "transport_cents",
+    "priority_cents",
+)
+_REFUSED = dict.fromkeys(_COLUMNS[2:], 0) | {"valid": False, "family_size": 1, "under_65": True}
+
+
+def to_columns(
+    loaded: Mapping[int, MeansTestInputs | ValueError],
+) -> tuple[CohortInputs, StandardsTable]:
+    """
+    Kernel inputs by session id as columns, with one table row per distinct
+    district tables and poverty guideline.
+
+    Row 0 of each is empty (no median) and serves the refused sessions.
+    """
+    tables: dict = {None: 0}  # (DeductionStandards, MedianIncomeTable) -> row
+    guidelines: dict = {None: 0}  # PovertyGuideline -> row
+    columns: dict[str, list] = {name: [] for name in _COLUMNS}
+    for session_id, inputs in loaded.items():
+        if isinstance(inputs, ValueError):
+            row = _REFUSED
+        else:
+            row = {
+                "valid": True,
+                "income_cents": to_cents(sum(inputs.monthly_income, ZERO)),
+                "family_size": inputs.family_size,
+                "district": tables.setdefault((inputs.standards, inputs.median), len(tables)),
+                "region": guidelines.setdefault(inputs.poverty, len(guidelines)),
+                "under_65": inputs.under_65,
+                "food_cents": to_cents(inputs.food),
+                "health_cents": to_cents(inputs.health),
+                "housing_cents": to_cents(inputs.housing),
+                "transport_cents": to_cents(inputs.transport),
+                "priority_cents": to_cents(inputs.priority_debts_monthly),
+            }
+        columns["session_ids"].append(session_id)
+        for name in _COLUMNS[1:]:
+            columns[name].append(row[name])
+
+    cohort = CohortInputs(
+        **{
+            name: np.array(values, dtype=bool if name in ("valid", "under_65") else np.int64)
+            for name, values in columns.items()
+        }
+    )
+    return cohort, _standards_table(list(tables), list(guidelines))
+
+
+def _standards_table(tables: list, guidelines: list) -> StandardsTable:
+    count = len(tables)
+    median = np.zeros((count, _MEDIAN_SIZES + 1), dtype=np.int64)
+    has_median = np.zeros(count, dtype=bool)
+    housing = np.zeros((count, _STANDARD_SIZES), dtype=np.int64)
+    transport = np.zeros(count, dtype=np.int64)
+    national = {
+        "food": np.zeros(_STANDARD_SIZES, dtype=np.int64),
+        "health_under_65": np.zeros(_STANDARD_SIZES, dtype=np.int64),
+        "health_65_plus": np.zeros(_STANDARD_SIZES, dtype=np.int64),
+    }
+    for i, key in enumerate(tables):
+        if key is None:
+            continue
+        deduction, table = key
+        has_median[i] = True
+        median[i, :_MEDIAN_SIZES] = [to_cents(amount) for amount in table.sizes]
+        median[i, _MEDIAN_SIZES] = to_cents(table.additional)
+        housing[i] = [to_cents(amount) for amount in deduction.housing]
+        transport[i] = to_cents(deduction.transport_operating)
+        # One as_of for the whole cohort, so every row has the same National Standards.
+        for name, column in national.items():
+            column[:] = [to_cents(amount) for amount in getattr(deduction, name)]
+
+    poverty = np.zeros((len(guidelines), 2), dtype=np.int64)
+    for i, guideline in enumerate(guidelines):
+        if guideline is not None:
+            poverty[i] = to_cents(guideline.base), to_cents(guideline.increment)
+
+    return StandardsTable(
+        median_cents=median,
+        has_median=has_median,
+        housing_cents=housing,
+        transport_cents=transport,
+        food_cents=national["food"],
+        health_under_65_cents=national["health_under_65"],
+        health_65_plus_cents=national["health_65_plus"],
+        poverty_cents=poverty,
+    )
+
+
+def _round_div(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Integer division rounded half-even, element-wise."""
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return quotient + round_up
+
+
+def evaluate(inputs: CohortInputs, standards: StandardsTable) -> CohortResult:
+    """Apply the means test to every row of ``inputs`` at once."""
+    district = inputs.district
+    size = inputs.family_size
+    income = inputs.income_cents
+
+    median_rows = standards.median_cents[district]
+    capped = np.minimum(size, _MEDIAN_SIZES)
+    median = np.take_along_axis(median_rows, (capped - 1)[:, None], axis=1)[:, 0]
+    median = median + np.maximum(size - _MEDIAN_SIZES, 0) * median_rows[:, _MEDIAN_SIZES]
+
+    valid = inputs.valid & standards.has_median[district]
+    below_median = 2 * income < median
+    poverty = standards.poverty_cents[inputs.region]
+    poverty_line = poverty[:, 0] + (size - 1) * poverty[:, 1]
+    fee_waiver = 4 * income < 3 * poverty_line
+
+    standard = np.minimum(size, _STANDARD_SIZES) - 1
+    health_standard = np.where(
+        inputs.under_65,
+        standards.health_under_65_cents[standard],
+        standards.health_65_plus_cents[standard],
+    )
+    allowable = (
+        np.minimum(inputs.food_cents, standards.food_cents[standard])
+        + np.minimum(inputs.health_cents, health_standard)
+        + np.minimum(inputs.housing_cents, standards.housing_cents[district, standard])
+        + np.minimum(inputs.transport_cents, standards.transport_cents[district])
+    )
+    disposable_x6 = income - 6 * (allowable + inputs.priority_cents)
+
+    above = ~below_median
+    passes_above = above & (disposable_x6 < 6 * ABOVE_MEDIAN_THRESHOLD_CENTS)
+    zero = np.zeros_like(income)
+    return CohortResult(
+        session_ids=inputs.session_ids,
+        valid=valid,
+        passes_means_test=valid & (below_median | passes_above),
+        below_median=valid & below_median,
+        above_median_calculated=valid & above,
+        passes_above_median=valid & passes_above,
+        qualifies_for_fee_waiver=valid & fee_waiver,
+        cmi_cents=np.where(valid, _round_div(income, 6), zero),
+        median_cents=np.where(valid, median, zero),
+        allowable_cents=np.where(valid & above, allowable, zero),
+        disposable_cents=np.where(valid & above, _round_div(disposable_x6, 6), zero),
+    )
+
+
+@dataclass
+class RescreenReport:
+    result: CohortResult
+    changed_session_ids: list[int]  # stored pass/fail or fee-waiver flag differs
+    unscreened_session_ids: list[int]  # no stored MeansTest yet
+
+
+def rescreen(sessions: QuerySet | None = None, as_of: date | None = None) -> RescreenReport:
+    """Evaluate ``sessions`` against the current tables and diff with stored results."""
+    from apps.eligibility.models import MeansTest
+
+    result = evaluate(*load_cohort(sessions, as_of=as_of))
+
+    stored_rows = MeansTest.objects.all()
+    if sessions is not None:
+        stored_rows = stored_rows.filter(session__in=sessions.values("pk"))
+    stored = {
+        session_id: (passes, fee_waiver)
+        for session_id, passes, fee_waiver in stored_rows.values_list(
+            "session_id", "passes_means_test", "qualifies_for_fee_waiver"
+        ).iterator(chunk_size=5000)
+    }
+    changed, unscreened = [], []
+    for session_id, valid, passes, fee_waiver in zip(
+        result.session_ids.tolist(),
+        result.valid.tolist(),
+        result.passes_means_test.tolist(),
+        result.qualifies_for_fee_waiver.tolist(),
+        strict=True,
+    ):
+        if not valid:
+            continue
+        previous = stored.get(session_id)
+        if previous is None:
+            unscreened.append(session_id)
+        elif previous != (passes, fee_waiver):
+            changed.append(session_id)
+    return RescreenReport(
+        result=result, changed_session_ids=changed, unscreened_session_ids=unscreened
+    )
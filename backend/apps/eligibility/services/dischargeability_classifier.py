@@ -1,24 +1,39 @@
 """Classify debts as dischargeable or non-dischargeable in Chapter 7."""
 
+from collections.abc import Iterable
+
+from apps.eligibility.services.dischargeability_rules import (
+    FACT_COLUMNS,
+    RuleEvaluation,
+    load_rule_table,
+)
 from apps.intake.models import IntakeSession
 
-NON_DISCHARGEABLE_TYPES = {
-    "student_loan": "11 U.S.C. § 523(a)(8) — requires adversary proceeding",
-    "child_support": "11 U.S.C. § 523(a)(5) — domestic support obligation",
-    "alimony": "11 U.S.C. § 523(a)(5) — domestic support obligation",
-    "taxes": "11 U.S.C. § 523(a)(1) — certain tax debts",
-    "restitution": "11 U.S.C. § 523(a)(6) — willful and malicious injury",
-}
+# The only DebtInfo columns classification reads; evaluating through a
+# ``values()`` projection skips decrypting amount_owed and account_number.
+DEBT_FIELDS = tuple(dict.fromkeys(("id", "creditor_name", *FACT_COLUMNS)))
 
 
 def classify_debt(debt) -> dict:
-    reason = NON_DISCHARGEABLE_TYPES.get(debt.debt_type)
-    proceeding_needed = debt.debt_type == "student_loan"
-    return {
-        "dischargeable": reason is None,
-        "reason": reason or "",
-        "proceeding_needed": proceeding_needed,
-    }
+    """Classification for one debt (or any object with DebtInfo attributes)."""
+    row = {column: getattr(debt, column, None) for column in FACT_COLUMNS}
+    return load_rule_table().match(row).classification()
+
+
+def classify_rows(rows: Iterable[dict]) -> tuple[list[dict], RuleEvaluation]:
+    """Results for ``DEBT_FIELDS`` rows, and the rule hits behind them."""
+    rows = list(rows)
+    evaluation = load_rule_table().evaluate(rows)
+    results = [
+        {
+            "debt_id": row["id"],
+            "creditor": row["creditor_name"],
+            "debt_type": row["debt_type"],
+            **rule.classification(),
+        }
+        for row, rule in zip(rows, evaluation.matches, strict=True)
+    ]
+    return results, evaluation
 
 
 class DischargeabilityClassifier:
@@ -26,15 +41,5 @@ class DischargeabilityClassifier:
         self.session = session
 
     def evaluate(self) -> list[dict]:
-        results = []
-        for debt in self.session.debts.all():
-            classification = classify_debt(debt)
-            results.append(
-                {
-                    "debt_id": debt.id,
-                    "creditor": debt.creditor_name,
-                    "debt_type": debt.debt_type,
-                    **classification,
-                }
-            )
+        results, _ = classify_rows(self.session.debts.values(*DEBT_FIELDS))
         return results
@@ -0,0 +1,318 @@
+"""
+Declarative § 523 rule table, compiled into a decision-tree matcher.
+
+The rules live in ``data/dischargeability/rules.json``
+(``DISCHARGEABILITY_RULES_PATH``) and carry a version, like the form schemas.
+Each rule lists the facts it requires under ``when``. The first matching rule
+wins, and the table must end with a catch-all. Supported conditions:
+
+- choice facts (``debt_type``, ``priority_classification``, ...): a list of
+  values;
+- flag facts (``is_priority``, ``is_disputed``, ...): ``true`` or ``false``;
+- ``years_since_incurred``: ``{"min": 3}`` and/or ``{"max": 10}``
+  (``min <= years < max``; an unknown ``date_incurred`` never matches).
+
+``RuleTable`` validates and compiles a table once. Every fact is reduced to
+a small key: a choice value some rule mentions (anything else shares one
+key), a boolean, or the bucket of a numeric fact between the thresholds the
+rules use. A decision tree over those keys then replaces testing every rule
+against every debt: classifying a debt is at most one dict lookup per fact.
+``evaluate`` classifies a batch of ``values()`` rows, reuses the result for
+rows with identical keys and counts hits per rule for the audit log.
+
+Results are information only: a reason cites the statute and never tells the
+filer what to do, and the loader rejects reasons that do.
+"""
+
+import json
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+
+# fact -> (kind, DebtInfo column it is read from)
+FACTS: dict[str, tuple[str, str]] = {
+    "debt_type": ("choice", "debt_type"),
+    "priority_classification": ("choice", "priority_classification"),
+    "consumer_business_classification": ("choice", "consumer_business_classification"),
+    "data_source": ("choice", "data_source"),
+    "is_priority": ("flag", "is_priority"),
+    "is_secured": ("flag", "is_secured"),
+    "is_in_collections": ("flag", "is_in_collections"),
+    "is_disputed": ("flag", "is_disputed"),
+    "is_contingent": ("flag", "is_contingent"),
+    "is_unliquidated": ("flag", "is_unliquidated"),
+    "years_since_incurred": ("range", "date_incurred"),
+}
+# Every column a rule can read; never an encrypted one.
+FACT_COLUMNS = tuple(dict.fromkeys(column for _, column in FACTS.values()))
+
+# Directive wording that would turn information into legal advice.
+ADVICE_PHRASES = ("you should", "you must", "you need to", "we recommend", "we advise")
+
+_RULE_KEYS = {"id", "when", "dischargeable", "proceeding_needed", "reason"}
+
+
+class RuleTableError(ValueError):
+    """The rule table is malformed or would give advice."""
+
+
+@dataclass(frozen=True, slots=True)
+class Rule:
+    id: str
+    when: Mapping[str, object]  # fact -> frozenset | bool | (min, max)
+    dischargeable: bool
+    proceeding_needed: bool
+    reason: str
+
+    def classification(self) -> dict:
+        return {
+            "dischargeable": self.dischargeable,
+            "reason": self.reason,
+            "proceeding_needed": self.proceeding_needed,
+            "rule": self.id,
+        }
+
+
+@dataclass
+class RuleEvaluation:
+    matches: list[Rule]  # one per row, in order
+    hits: Counter  # rule id -> rows it matched
+
+
+def years_between(start: date, end: date) -> int:
+    """Whole years from ``start`` to ``end``."""
+    return end.year - start.year - ((end.month, end.day) < (start.month, start.day))
+
+
+def _satisfies(condition, value) -> bool:
+    if isinstance(condition, frozenset):
+        return value in condition
+    if isinstance(condition, bool):
+        return value is condition
+    low, high = condition
+    return value is not None and (low is None or value >= low) and (high is None or value < high)
+
+
+def _fact_value(fact: str, row: Mapping, as_of: date):
+    kind, column = FACTS[fact]
+    value = row.get(column)
+    if kind == "flag":
+        return bool(value)
+    if kind == "range":
+        return None if value is None else years_between(value, as_of)
+    return value
+
+
+def _condition(rule_id: str, fact: str, value):
+    if fact not in FACTS:
+        raise RuleTableError(f"Rule {rule_id!r}: unknown fact {fact!r}")
+    kind = FACTS[fact][0]
+    if kind == "choice":
+        if not isinstance(value, list) or not value or not all(isinstance(v, str) for v in value):
+            raise RuleTableError(f"Rule {rule_id!r}: {fact} needs a non-empty list of values")
+        return frozenset(value)
+    if kind == "flag":
+        if not isinstance(value, bool):
+            raise RuleTableError(f"Rule {rule_id!r}: {fact} must be true or false")
+        return value
+    if (
+        not isinstance(value, dict)
+        or not value
+        or set(value) - {"min", "max"}
+        or not all(isinstance(v, int | float) and not isinstance(v, bool) for v in value.values())
+    ):
+        raise RuleTableError(f"Rule {rule_id!r}: {fact} needs numeric min and/or max")
+    return (value.get("min"), value.get("max"))
+
+
+def _rule(raw) -> Rule:
+    if not isinstance(raw, dict) or not isinstance(raw.get("id"), str) or not raw["id"]:
+        raise RuleTableError("Every rule needs a string id")
+    rule_id = raw["id"]
+    unknown = set(raw) - _RULE_KEYS
+    if unknown:
+        raise RuleTableError(f"Rule {rule_id!r}: unknown keys {', '.join(sorted(unknown))}")
+    if not isinstance(raw.get("when"), dict):
+        raise RuleTableError(f"Rule {rule_id!r}: 'when' must be an object")
+    for key in ("dischargeable", "proceeding_needed"):
+        if not isinstance(raw.get(key), bool):
+            raise RuleTableError(f"Rule {rule_id!r}: {key} must be true or false")
+    reason = raw.get("reason")
+    if not isinstance(reason, str):
+        raise RuleTableError(f"Rule {rule_id!r}: reason must be a string")
+    if raw["proceeding_needed"] and raw["dischargeable"]:
+        raise RuleTableError(f"Rule {rule_id!r}: a proceeding is only needed for excepted debts")
+    if not raw["dischargeable"] and not reason:
+        raise RuleTableError(f"Rule {rule_id!r}: excepted debts need a reason")
+    advice = [phrase for phrase in ADVICE_PHRASES if phrase in reason.casefold()]
+    if advice:
+        raise RuleTableError(f"Rule {rule_id!r}: reason gives advice ({advice[0]!r})")
+    return Rule(
+        id=rule_id,
+        when={fact: _condition(rule_id, fact, value) for fact, value in raw["when"].items()},
+        dischargeable=raw["dischargeable"],
+        proceeding_needed=raw["proceeding_needed"],
+        reason=reason,
+    )
+
+
+class RuleTable:
+    """A validated rule table and its compiled decision tree."""
+
+    __slots__ = ("version", "rules", "_facts", "_encoders", "_tree")
+
+    def __init__(self, version: str, rules: Iterable[Rule]):
+        self.version = version
+        self.rules = tuple(rules)
+        if not self.rules or self.rules[-1].when:
+            raise RuleTableError("The last rule must be a catch-all with an empty 'when'")
+        ids = [rule.id for rule in self.rules]
+        if len(set(ids)) != len(ids):
+            raise RuleTableError("Rule ids must be unique")
+
+        used = {fact for rule in self.rules for fact in rule.when}
+        self._facts = tuple(fact for fact in FACTS if fact in used)
+        self._encoders = []
+        domains = []
+        for fact in self._facts:
+            encoder, domain = self._encoder(fact)
+            self._encoders.append(encoder)
+            domains.append(domain)
+        self._tree = self._compile(domains)
+
+    @classmethod
+    def from_dict(cls, raw: Mapping) -> "RuleTable":
+        if not isinstance(raw.get("version"), str) or not raw["version"]:
+            raise RuleTableError("The rule table needs a version")
+        if not isinstance(raw.get("rules"), list):
+            raise RuleTableError("The rule table needs a list of rules")
+        return cls(raw["version"], (_rule(rule) for rule in raw["rules"]))
+
+    # -- compilation --------------------------------------------------------
+
+    def _encoder(self, fact: str):
+        """(row value -> key, [(key, value the conditions are tested with)])."""
+        kind = FACTS[fact][0]
+        conditions = [rule.when[fact] for rule in self.rules if fact in rule.when]
+        if kind == "flag":
+            return bool, [(False, False), (True, True)]
+        if kind == "choice":
+            mentioned = frozenset().union(*conditions)
+            # Any value no rule mentions behaves like every other such value.
+            return (
+                lambda value: value if value in mentioned else None,
+                [(value, value) for value in sorted(mentioned)] + [(None, None)],
+            )
+        thresholds = sorted(
+            {bound for bounds in conditions for bound in bounds if bound is not None}
+        )
+        floors = [thresholds[0] - 1, *thresholds]  # the lowest value in each bucket
+        return (
+            lambda value: None if value is None else bisect_right(thresholds, value),
+            [(None, None)] + [(bucket, floor) for bucket, floor in enumerate(floors)],
+        )
+
+    def _compile(self, domains: list):
+        """Leaves are rule indexes; nodes are ``(fact index, {key: subtree})``."""
+        memo: dict[tuple, object] = {}
+        facts = self._facts
+
+        def build(depth: int, candidates: tuple[int, ...]):
+            # Skip facts none of the remaining candidates looks at.
+            while depth < len(facts) and not any(
+                facts[depth] in self.rules[i].when for i in candidates
+            ):
+                depth += 1
+            # The first candidate wins once nothing further down can rule it out.
+            first = self.rules[candidates[0]]
+            if not any(fact in first.when for fact in facts[depth:]):
+                return candidates[0]
+            key = (depth, candidates)
+            if key not in memo:
+                fact = facts[depth]
+                memo[key] = (
+                    depth,
+                    {
+                        code: build(
+                            depth + 1,
+                            tuple(
+                                i
+                                for i in candidates
+                                if fact not in self.rules[i].when
+                                or _satisfies(self.rules[i].when[fact], value)
+                            ),
+                        )
+                        for code, value in domains[depth]
+                    },
+                )
+            return memo[key]
+
+        return build(0, tuple(range(len(self.rules))))
+
+    # -- evaluation ---------------------------------------------------------
+
+    def _keys(self, row: Mapping, as_of: date) -> tuple:
+        return tuple(
+            encode(_fact_value(fact, row, as_of))
+            for fact, encode in zip(self._facts, self._encoders, strict=True)
+        )
+
+    def _walk(self, keys: tuple) -> Rule:
+        node = self._tree
+        while not isinstance(node, int):
+            depth, children = node
+            node = children[keys[depth]]
+        return self.rules[node]
+
+    def match(self, row: Mapping, as_of: date | None = None) -> Rule:
+        """The rule for one row of DebtInfo columns (missing columns read as unset)."""
+        return self._walk(self._keys(row, as_of or timezone.localdate()))
+
+    def match_linear(self, row: Mapping, as_of: date | None = None) -> Rule:
+        """Reference matcher: test each rule in order. Used to check the tree."""
+        as_of = as_of or timezone.localdate()
+        for rule in self.rules:
+            if all(
+                _satisfies(condition, _fact_value(fact, row, as_of))
+                for fact, condition in rule.when.items()
+            ):
+                return rule
+        raise AssertionError("the catch-all rule always matches")
+
+    def evaluate(self, rows: Iterable[Mapping], as_of: date | None = None) -> RuleEvaluation:
+        """Classify ``rows`` (DebtInfo ``values()`` dicts) and count hits per rule."""
+        as_of = as_of or timezone.localdate()
+        seen: dict[tuple, Rule] = {}
+        matches = []
+        hits: Counter = Counter()
+        for row in rows:
+            keys = self._keys(row, as_of)
+            rule = seen.get(keys)
+            if rule is None:
+                rule = seen[keys] = self._walk(keys)
+            matches.append(rule)
+            hits[rule.id] += 1
+        return RuleEvaluation(matches, hits)
+
+
+@lru_cache(maxsize=4)
+def load_rule_table(path: str | None = None) -> RuleTable:
+    """
+    Load and compile the rule table (default ``DISCHARGEABILITY_RULES_PATH``).
+
+    Raises:
+        FileNotFoundError: If the rule file does not exist
+        RuleTableError: If the table is malformed or a reason gives advice
+    """
+    rules_path = Path(path or settings.DISCHARGEABILITY_RULES_PATH)
+    if not rules_path.exists():
+        raise FileNotFoundError(f"Dischargeability rules not found: {rules_path}")
+    with open(rules_path) as f:
+        return RuleTable.from_dict(json.load(f))
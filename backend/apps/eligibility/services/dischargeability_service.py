@@ -1,7 +1,22 @@
-"""Evaluate dischargeability and create adversary proceedings."""
+"""
+Evaluate dischargeability and create adversary proceedings.
 
-from apps.eligibility.services.dischargeability_classifier import classify_debt
-from apps.intake.models import AdversaryProceeding, IntakeSession
+Evaluation is set-based: one ``values()`` read of the columns the rule table
+needs (see ``dischargeability_rules``), at most one UPDATE per classification
+outcome for flags that changed, one read and one ``bulk_create`` for missing
+proceedings and one DELETE for stale ones. The query count does not grow
+with the number of debts. Each evaluation records the rule table version
+and per-rule hit counts in the audit log.
+"""
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.audit.buffer import get_audit_sink
+from apps.audit.models import AuditLog
+from apps.eligibility.services.dischargeability_classifier import DEBT_FIELDS, classify_rows
+from apps.eligibility.services.dischargeability_rules import load_rule_table
+from apps.intake.models import AdversaryProceeding, DebtInfo, IntakeSession
 
 
 class DischargeabilityService:
@@ -9,49 +24,69 @@ class DischargeabilityService:
         self.session = session
 
     def evaluate(self) -> list[dict]:
-        results = []
-        debts_to_update = []
-        for debt in self.session.debts.all():
-            classification = classify_debt(debt)
-
-            # Update fields but don't save immediately
-            if (
-                debt.is_dischargeable != classification["dischargeable"]
-                or debt.adversary_proceeding_needed != classification["proceeding_needed"]
-            ):
-                debt.is_dischargeable = classification["dischargeable"]
-                debt.adversary_proceeding_needed = classification["proceeding_needed"]
-                debts_to_update.append(debt)
-
-            if classification["proceeding_needed"]:
-                self._ensure_proceeding(debt, classification)
-
-            results.append(
-                {
-                    "debt_id": debt.id,
-                    "creditor": debt.creditor_name,
-                    "debt_type": debt.debt_type,
-                    **classification,
-                }
+        rows = list(
+            self.session.debts.values(
+                *DEBT_FIELDS, "is_dischargeable", "adversary_proceeding_needed"
             )
+        )
+        results, evaluation = classify_rows(rows)
 
-        if debts_to_update:
-            from apps.intake.models import DebtInfo
+        # (is_dischargeable, adversary_proceeding_needed) -> ids whose flags differ
+        flags_to_update: dict[tuple[bool, bool], list[int]] = {}
+        proceeding_debt_ids = []
+        for row, rule in zip(rows, evaluation.matches, strict=True):
+            flags = (rule.dischargeable, rule.proceeding_needed)
+            if (row["is_dischargeable"], row["adversary_proceeding_needed"]) != flags:
+                flags_to_update.setdefault(flags, []).append(row["id"])
+            if rule.proceeding_needed:
+                proceeding_debt_ids.append(row["id"])
 
-            DebtInfo.objects.bulk_update(
-                debts_to_update, ["is_dischargeable", "adversary_proceeding_needed"]
-            )
+        with transaction.atomic():
+            for (dischargeable, proceeding_needed), ids in flags_to_update.items():
+                DebtInfo.objects.filter(pk__in=ids).update(
+                    is_dischargeable=dischargeable,
+                    adversary_proceeding_needed=proceeding_needed,
+                )
+            self._sync_proceedings(proceeding_debt_ids)
 
+        log = get_audit_sink().enqueue if settings.AUDIT_BUFFER_ENABLED else AuditLog.log_action
+        log(
+            action="evaluated_dischargeability",
+            user=self.session.user,
+            resource_type="intake_session",
+            resource_id=self.session.pk,
+            upl_sensitive=True,
+            rules_version=load_rule_table().version,
+            rule_hits=dict(evaluation.hits),
+        )
         return results
 
-    def _ensure_proceeding(self, debt, classification):
-        # Only creates for student loans as per classification
-        AdversaryProceeding.objects.get_or_create(
-            session=self.session,
-            debt=debt,
-            defaults={
-                "proceeding_type": "student_loan",
-                "lender_name": debt.creditor_name,
-                "loan_amount": debt.amount_owed,
-            },
-        )
+    def _sync_proceedings(self, debt_ids: list[int]) -> None:
+        """Create missing student loan proceedings; drop untouched ones no longer needed."""
+        proceedings = AdversaryProceeding.objects.filter(session=self.session, debt__isnull=False)
+        if debt_ids:
+            # Only debts without a proceeding are read, so only their amounts are decrypted.
+            missing = (
+                DebtInfo.objects.filter(pk__in=debt_ids)
+                .exclude(pk__in=proceedings.values("debt"))
+                .order_by()
+                .values("id", "creditor_name", "amount_owed")
+            )
+            AdversaryProceeding.objects.bulk_create(
+                [
+                    AdversaryProceeding(
+                        session=self.session,
+                        debt_id=debt["id"],
+                        proceeding_type="student_loan",
+                        lender_name=debt["creditor_name"],
+                        loan_amount=debt["amount_owed"],
+                    )
+                    for debt in missing
+                ],
+                ignore_conflicts=True,
+            )
+
+        # Proceedings the debtor has started working on are never removed.
+        proceedings.filter(
+            proceeding_type="student_loan", status="identified", hardship_narrative=""
+        ).exclude(debt_id__in=debt_ids).delete()
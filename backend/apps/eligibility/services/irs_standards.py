@@ -1,7 +1,16 @@
-"""IRS National and Local Standards for means test expense deductions (2024)."""
+"""
+IRS National and Local Standards for means test expense deductions (2024).
 
+These are the built-in release. Calculations look tables up by effective
+date through ``standards.get_catalog()``, which layers releases imported
+with ``import_irs_standards`` over this one.
+"""
+
+from datetime import date
 from decimal import Decimal
 
+BUILTIN_EFFECTIVE_DATE = date(2024, 4, 1)
+
 NATIONAL_STANDARDS = {
     "food": {
         1: Decimal("713"),
@@ -5,6 +5,7 @@ Implements Chapter 7 bankruptcy means test calculation (11 U.S.C. § 707(b))
 following service layer pattern for separation of business logic.
 """
 
+from datetime import date
 from decimal import Decimal
 from typing import Any
 
@@ -22,12 +23,13 @@ class MeansTestCalculator:
     including UPL-compliant result messaging and audit logging.
     """
 
-    def __init__(self, intake_session: IntakeSession):
+    def __init__(self, intake_session: IntakeSession, as_of: date | None = None):
         """
         Initialize calculator with intake session.
 
         Args:
             intake_session: IntakeSession containing debtor information
+            as_of: Filing date whose tables apply (default: today)
 
         Raises:
             ValueError: If intake_session is invalid or incomplete
@@ -40,6 +42,7 @@ class MeansTestCalculator:
 
         self.intake_session = intake_session
         self.district = intake_session.district
+        self.as_of = as_of
 
     @transaction.atomic
     def calculate(self) -> dict[str, Any]:
@@ -80,7 +83,7 @@ class MeansTestCalculator:
 
         # Perform calculation
         try:
-            means_test.calculate()
+            means_test.calculate(as_of=self.as_of)
         except ValueError as e:
             raise ValueError(f"Means test calculation failed: {str(e)}") from e
 
@@ -0,0 +1,375 @@
+"""
+Pure means-test kernel: 11 U.S.C. § 707(b) over plain, immutable inputs.
+
+``MeansTest.calculate`` and ``ExpenseDeductionCalculator`` used to read the
+ORM in the middle of the arithmetic, so nothing could be batched, cached or
+re-run on edited inputs. The arithmetic now lives here as functions of a
+frozen ``MeansTestInputs``; nothing in this section touches the database
+or the clock:
+
+- ``expense_deductions(inputs)``: IRS-standard-capped allowable expenses
+  and disposable income (the ExpenseDeductionCalculator rules);
+- ``means_test(inputs)``: the below-median test, the above-median pathway
+  and fee waiver screening (the MeansTest.calculate rules). Fee waiver
+  screening is ``poverty_guidelines.fee_waiver_test``: CMI below 150% of
+  the HHS poverty guideline for the family size, year and region.
+
+The loaders at the bottom build inputs from a session (``load_inputs``) or
+from many sessions in two queries (``load_inputs_many``, which the cohort
+engine's ``load_cohort`` lays out as arrays for re-screening). Every caller
+(MeansTest.calculate, ExpenseDeductionCalculator, the scenario simulator,
+the cohort engine and benchmark and the Form 122A-1 household size) goes
+through the same functions.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from .poverty_guidelines import PovertyGuideline, fee_waiver_test, guideline_for
+from .standards import MedianIncomeTable, StandardsCatalog, get_catalog
+
+ZERO = Decimal("0")
+SIX = Decimal("6")
+TWELVE = Decimal("12")
+ABOVE_MEDIAN_THRESHOLD = Decimal("756.25")  # $9,075 over 60 months (2024)
+_STANDARD_SIZES = 5  # IRS tables stop at a household of 5
+
+
+@dataclass(frozen=True, slots=True)
+class DeductionStandards:
+    """IRS standards for one district and date, by household size 1..5."""
+
+    food: tuple[Decimal, ...]
+    health_under_65: tuple[Decimal, ...]
+    health_65_plus: tuple[Decimal, ...]
+    housing: tuple[Decimal, ...]  # zero where the district has no amount
+    transport_operating: Decimal
+
+    @classmethod
+    def resolve(
+        cls, catalog: StandardsCatalog, district_code: str, as_of: date
+    ) -> "DeductionStandards":
+        irs = catalog.irs(as_of)
+        sizes = range(1, _STANDARD_SIZES + 1)
+        return cls(
+            food=tuple(irs.national_standard("food", size) for size in sizes),
+            health_under_65=tuple(irs.national_standard("health_care", size) for size in sizes),
+            health_65_plus=tuple(
+                irs.national_standard("health_care", size, age_under_65=False) for size in sizes
+            ),
+            housing=tuple(
+                catalog.local_standard(district_code, "housing", size, as_of) or ZERO
+                for size in sizes
+            ),
+            transport_operating=(
+                catalog.local_standard(district_code, "transport_operating", as_of=as_of) or ZERO
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MeansTestInputs:
+    """Everything the means test reads about one household, as plain values."""
+
+    monthly_income: tuple[Decimal, ...]  # the six months before filing
+    family_size: int
+    under_65: bool
+    food: Decimal  # actual monthly expenses ...
+    health: Decimal
+    housing: Decimal
+    transport: Decimal
+    total_expenses: Decimal
+    priority_debts_monthly: Decimal
+    standards: DeductionStandards
+    median: MedianIncomeTable | None = None  # required by means_test only
+    poverty: PovertyGuideline | None = None  # required by means_test only
+
+
+@dataclass
+class ExpenseDeductionResult:
+    national_food_allowance: Decimal
+    national_health_allowance: Decimal
+    local_housing_allowance: Decimal
+    local_transport_allowance: Decimal
+    actual_total_expenses: Decimal
+    allowable_expenses: Decimal
+    priority_debts_monthly: Decimal
+    disposable_income: Decimal
+    family_size: int
+
+
+@dataclass(frozen=True, slots=True)
+class MeansTestOutcome:
+    cmi: Decimal
+    annualized_cmi: Decimal
+    median_income_threshold: Decimal
+    passes_means_test: bool
+    qualifies_for_fee_waiver: bool
+    deductions: ExpenseDeductionResult | None  # set on the above-median pathway
+
+    @property
+    def above_median_calculated(self) -> bool:
+        return self.deductions is not None
+
+    @property
+    def passes_above_median(self) -> bool | None:
+        return self.passes_means_test if self.deductions is not None else None
+
+
+def derive_family_size(
+    number_of_dependents: int, marital_status: str, household_size: int | None = None
+) -> int:
+    """The debtor step's household size, else filer + spouse (if married) + dependents."""
+    if (household_size or 0) >= 1:
+        return household_size
+    size = number_of_dependents + 1
+    if marital_status in ("married_joint", "married_separate"):
+        size += 1
+    return size
+
+
+def is_under_65(date_of_birth: date | None, as_of: date) -> bool:
+    if date_of_birth is None:
+        return True
+    return (as_of - date_of_birth).days // 365 < 65
+
+
+def current_monthly_income(monthly_income: tuple[Decimal, ...]) -> Decimal:
+    """Six-month total / 6, unrounded (11 U.S.C. § 101(10A))."""
+    total = sum(monthly_income, ZERO)
+    return total / SIX if total else ZERO
+
+
+def expense_deductions(inputs: MeansTestInputs) -> ExpenseDeductionResult:
+    """Actual expenses capped at the IRS standards, and what is left of CMI."""
+    standards = inputs.standards
+    index = min(inputs.family_size, _STANDARD_SIZES) - 1
+    health_standard = (standards.health_under_65 if inputs.under_65 else standards.health_65_plus)[
+        index
+    ]
+
+    food = min(inputs.food, standards.food[index])
+    health = min(inputs.health, health_standard)
+    housing = min(inputs.housing, standards.housing[index])
+    transport = min(inputs.transport, standards.transport_operating)
+    allowable = food + health + housing + transport
+
+    cmi = current_monthly_income(inputs.monthly_income)
+    return ExpenseDeductionResult(
+        national_food_allowance=food,
+        national_health_allowance=health,
+        local_housing_allowance=housing,
+        local_transport_allowance=transport,
+        actual_total_expenses=inputs.total_expenses,
+        allowable_expenses=allowable,
+        priority_debts_monthly=inputs.priority_debts_monthly,
+        disposable_income=cmi - allowable - inputs.priority_debts_monthly,
+        family_size=inputs.family_size,
+    )
+
+
+def means_test(inputs: MeansTestInputs) -> MeansTestOutcome:
+    """
+    Below-median test, then the above-median pathway if needed.
+
+    Raises:
+        ValueError: if there are not six months of income, or no median table
+            or poverty guideline.
+    """
+    if len(inputs.monthly_income) != 6:
+        raise ValueError("monthly_income must be a list of 6 monthly income values")
+    if inputs.median is None:
+        raise ValueError("No median income data found for the district")
+    if inputs.poverty is None:
+        raise ValueError("No poverty guideline for the district")
+
+    total = sum(inputs.monthly_income, ZERO)
+    cmi = total / SIX
+    annualized = cmi * TWELVE
+    median = inputs.median.median(inputs.family_size)
+
+    passes = annualized < median
+    deductions = None
+    if not passes:
+        deductions = expense_deductions(inputs)
+        passes = deductions.disposable_income < ABOVE_MEDIAN_THRESHOLD
+
+    return MeansTestOutcome(
+        cmi=cmi,
+        annualized_cmi=annualized,
+        median_income_threshold=median,
+        passes_means_test=passes,
+        qualifies_for_fee_waiver=fee_waiver_test(
+            inputs.poverty, inputs.family_size, cmi
+        ).below_threshold,
+        deductions=deductions,
+    )
+
+
+# -- Loaders: the only part that reads the ORM --
+
+_INCOME_REQUIRED = "IntakeSession must have income_info to calculate means test"
+_SIX_MONTHS_REQUIRED = "monthly_income must be a list of 6 monthly income values"
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or ZERO))
+
+
+def _income(monthly_income, strict: bool) -> tuple[Decimal, ...]:
+    if strict and (not isinstance(monthly_income, list) or len(monthly_income) != 6):
+        raise ValueError(_SIX_MONTHS_REQUIRED)
+    try:
+        return tuple(Decimal(str(amount)) for amount in monthly_income or ())
+    except (ArithmeticError, TypeError, ValueError):
+        if strict:
+            raise
+        return ()
+
+
+def _build(
+    session,
+    income_info,
+    priority: Decimal,
+    standards: DeductionStandards,
+    median: MedianIncomeTable | None,
+    as_of: date,
+    strict: bool,
+) -> MeansTestInputs:
+    """Inputs from a session whose income/debtor/expense rows are already loaded."""
+    from apps.intake.models import ExpenseInfo
+
+    debtor_info = getattr(session, "debtor_info", None)
+    try:
+        expense_info = session.expense_info
+    except ExpenseInfo.DoesNotExist:
+        expense_info = None
+
+    household_size = debtor_info.household_size if debtor_info else None
+    if income_info is not None:
+        family_size = derive_family_size(
+            income_info.number_of_dependents, income_info.marital_status, household_size
+        )
+    else:
+        family_size = household_size if (household_size or 0) >= 1 else 1
+
+    monthly_income = _income(income_info.monthly_income if income_info else None, strict)
+    if strict and median is None:
+        raise ValueError(f"No median income data found for district {session.district.code}")
+
+    if expense_info is not None:
+        food, health, housing, transport = (
+            _money(expense_info.food_and_groceries),
+            _money(expense_info.medical_expenses),
+            _money(expense_info.rent_or_mortgage),
+            _money(expense_info.vehicle_payment),
+        )
+        total_expenses = _money(expense_info.calculate_total_monthly_expenses())
+    else:
+        food = health = housing = transport = total_expenses = ZERO
+
+    return MeansTestInputs(
+        monthly_income=monthly_income,
+        family_size=family_size,
+        under_65=is_under_65(debtor_info.date_of_birth if debtor_info else None, as_of),
+        food=food,
+        health=health,
+        housing=housing,
+        transport=transport,
+        total_expenses=total_expenses,
+        priority_debts_monthly=priority,
+        standards=standards,
+        median=median,
+        poverty=guideline_for(session.district.state, as_of),
+    )
+
+
+def load_inputs(
+    session, as_of: date, district_code: str | None = None, strict: bool = True
+) -> MeansTestInputs:
+    """
+    Inputs for one session from its related rows.
+
+    ``strict`` (MeansTest.calculate) requires income_info with six months and
+    a median table, raising ValueError otherwise; without it (the standalone
+    ExpenseDeductionCalculator) missing rows count as zero.
+    """
+    from apps.intake.models import DebtInfo
+
+    try:
+        income_info = session.income_info
+    except AttributeError as err:
+        if strict:
+            raise ValueError(_INCOME_REQUIRED) from err
+        income_info = None
+
+    priority = sum(
+        (
+            d.monthly_payment or ZERO
+            for d in DebtInfo.objects.filter(session=session, is_priority=True)
+        ),
+        ZERO,
+    )
+    catalog = get_catalog()
+    code = district_code or session.district.code
+    return _build(
+        session,
+        income_info,
+        priority,
+        DeductionStandards.resolve(catalog, code, as_of),
+        catalog.median_table(code, as_of),
+        as_of,
+        strict,
+    )
+
+
+def load_inputs_many(sessions, as_of: date) -> dict[int, MeansTestInputs | ValueError]:
+    """
+    Strict inputs for every session in ``sessions`` (a queryset), in two queries.
+
+    Sessions that ``load_inputs`` would refuse map to the ValueError it raises.
+    Standards and median tables are resolved once per district.
+    """
+    from django.db.models import Sum
+
+    from apps.intake.models import DebtInfo, IncomeInfo, IntakeSession
+
+    priority = dict(
+        DebtInfo.objects.filter(session__in=sessions.values("pk"), is_priority=True)
+        .values("session_id")
+        .annotate(total=Sum("monthly_payment"))
+        .values_list("session_id", "total")
+    )
+    catalog = get_catalog()
+    tables: dict[str, tuple[DeductionStandards, MedianIncomeTable | None]] = {}
+    loaded: dict[int, MeansTestInputs | ValueError] = {}
+    rows = IntakeSession.objects.filter(pk__in=sessions.values("pk")).select_related(
+        "district", "income_info", "debtor_info", "expense_info"
+    )
+    for session in rows.iterator(chunk_size=2000):
+        try:
+            income_info = session.income_info
+        except IncomeInfo.DoesNotExist:
+            loaded[session.pk] = ValueError(_INCOME_REQUIRED)
+            continue
+        code = session.district.code
+        if code not in tables:
+            tables[code] = (
+                DeductionStandards.resolve(catalog, code, as_of),
+                catalog.median_table(code, as_of),
+            )
+        standards, median = tables[code]
+        try:
+            loaded[session.pk] = _build(
+                session,
+                income_info,
+                priority.get(session.pk) or ZERO,
+                standards,
+                median,
+                as_of,
+                strict=True,
+            )
+        except (ArithmeticError, ValueError) as exc:
+            loaded[session.pk] = exc if isinstance(exc, ValueError) else ValueError(str(exc))
+    return loaded
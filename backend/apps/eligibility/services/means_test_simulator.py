@@ -0,0 +1,139 @@
+"""
+What-if means test: evaluate many edited copies of one session at once.
+
+Re-POSTing ``calculate_means_test`` for every tweak writes a MeansTest row,
+re-encrypts its details and takes a transaction. ``simulate`` instead loads
+the session's ``MeansTestInputs`` once (two queries), derives one edited
+copy per scenario with ``dataclasses.replace`` and runs each through
+``means_test_kernel.means_test``: the same function ``MeansTest.calculate``
+uses. Nothing is written and the scenarios themselves never touch the
+database.
+
+A scenario is a list of changes to the baseline. Each change names a field
+and either adds ``delta`` to it or replaces it with ``value``:
+
+- ``income``: monthly gross income, applied to each of the six months;
+- ``household``: number of people in the household;
+- ``food``, ``health``, ``housing``, ``transport``: monthly expenses;
+- ``priority``: monthly payments on priority debts.
+
+Amounts never go below zero and the household never below one person.
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import date
+from decimal import Decimal
+
+from django.utils import timezone
+
+from .means_test_kernel import (
+    MeansTestInputs,
+    current_monthly_income,
+    expense_deductions,
+    load_inputs,
+    means_test,
+)
+
+# Scenario field -> (MeansTestInputs attribute, minimum). Income changes apply
+# to each of the six months; household changes are whole people.
+FIELDS: dict[str, tuple[str, int]] = {
+    "income": ("monthly_income", 0),
+    "household": ("family_size", 1),
+    "food": ("food", 0),
+    "health": ("health", 0),
+    "housing": ("housing", 0),
+    "transport": ("transport", 0),
+    "priority": ("priority_debts_monthly", 0),
+}
+
+MAX_SCENARIOS = 100
+CENT = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class Change:
+    field: str
+    delta: Decimal | None = None
+    value: Decimal | None = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    label: str
+    changes: tuple[Change, ...] = field(default_factory=tuple)
+
+
+def _changed(current, change: Change, minimum: int):
+    if change.value is not None:
+        updated = change.value
+    else:
+        updated = current + (change.delta or 0)
+    return max(updated, minimum)
+
+
+def apply_scenario(base: MeansTestInputs, scenario: Scenario) -> MeansTestInputs:
+    """``base`` with ``scenario``'s changes applied in order."""
+    inputs = base
+    for change in scenario.changes:
+        attribute, minimum = FIELDS[change.field]
+        current = getattr(inputs, attribute)
+        if attribute == "monthly_income":
+            updated = tuple(_changed(month, change, minimum) for month in current)
+        elif attribute == "family_size":
+            updated = int(_changed(current, change, minimum))
+        else:
+            updated = _changed(current, change, minimum)
+        inputs = replace(inputs, **{attribute: updated})
+    return inputs
+
+
+def _outcome(label: str, inputs: MeansTestInputs) -> dict:
+    outcome = means_test(inputs)
+    deductions = outcome.deductions or expense_deductions(inputs)
+    return {
+        "label": label,
+        "passes_means_test": outcome.passes_means_test,
+        "qualifies_for_fee_waiver": outcome.qualifies_for_fee_waiver,
+        "below_median": not outcome.above_median_calculated,
+        "family_size": inputs.family_size,
+        "cmi": current_monthly_income(inputs.monthly_income).quantize(CENT),
+        "median_income_threshold": outcome.median_income_threshold,
+        "total_allowable_expenses": deductions.allowable_expenses,
+        "disposable_income": deductions.disposable_income.quantize(CENT),
+    }
+
+
+def simulate(session, scenarios: list[Scenario], as_of: date | None = None) -> dict:
+    """
+    Baseline and scenario outcomes for ``session``; nothing is saved.
+
+    Raises:
+        ValueError: if the session has no usable income data or its district
+            has no median income table (the same cases MeansTestCalculator
+            refuses).
+    """
+    if len(scenarios) > MAX_SCENARIOS:
+        raise ValueError(f"At most {MAX_SCENARIOS} scenarios can be simulated at once.")
+    unknown = {c.field for s in scenarios for c in s.changes} - FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown scenario field(s): {', '.join(sorted(unknown))}")
+
+    from apps.intake.models import IntakeSession
+
+    session = IntakeSession.objects.select_related(
+        "district", "income_info", "debtor_info", "expense_info"
+    ).get(pk=session.pk)
+    if not hasattr(session, "income_info"):
+        raise ValueError("Income information is required to simulate the means test.")
+    try:
+        base = load_inputs(session, as_of or timezone.localdate())
+    except ValueError as err:
+        raise ValueError(
+            "Unable to simulate the means test: six months of income and a median "
+            "income table for the district are required."
+        ) from err
+
+    return {
+        "baseline": _outcome("baseline", base),
+        "scenarios": [_outcome(s.label, apply_scenario(base, s)) for s in scenarios],
+    }
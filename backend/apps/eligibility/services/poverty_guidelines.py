@@ -0,0 +1,250 @@
+"""
+HHS poverty guidelines and the Chapter 7 fee waiver income test.
+
+28 U.S.C. § 1930(f) lets the court waive the filing fee for a debtor whose
+income is less than 150% of the official poverty line for a household of
+their size. HHS publishes the guidelines every January, with separate
+figures for the 48 contiguous states and DC, Alaska, and Hawaii. Each one
+is an amount for one person plus the same increment per additional person.
+
+``GUIDELINES`` is compiled at import into ``PovertyGuideline`` objects that
+hold the monthly 150% threshold for households of 1..8 as a tuple. After
+that, ``guideline_for(state, as_of)`` and ``PovertyGuideline.monthly_threshold``
+are a bisect over a few publication dates and a tuple index; nothing
+touches the database.
+
+A new year's figures have to be added to ``GUIDELINES`` when HHS publishes
+them. Until then the latest year stays in force, and a lookup more than a
+year past its publication date logs a warning (once per calendar year of
+``as_of``) so the missing release is noticed.
+
+``fee_waiver_test`` is the only income test. It serves:
+
+- the means test, for CMI and the derived family size
+  (``means_test_kernel``);
+- the cohort engine, as an equivalent integer comparison;
+- the Form 103B generator and the ``fee_waiver_*`` derivations, for the
+  household size and income on the application.
+
+The 103B paths go through ``evaluate_application``. It evaluates a
+FeeWaiverApplication once and caches the result on the instance, so one PDF
+fill reads the household size and income from a single evaluation.
+"""
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from functools import cache
+from types import MappingProxyType
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+REGION_CONTIGUOUS = "contiguous"  # the 48 contiguous states and DC
+REGION_ALASKA = "alaska"
+REGION_HAWAII = "hawaii"
+REGIONS = (REGION_CONTIGUOUS, REGION_ALASKA, REGION_HAWAII)
+
+_REGION_BY_STATE = {"AK": REGION_ALASKA, "HI": REGION_HAWAII}
+
+# Publication date -> region -> (one person, each additional person), annual dollars.
+GUIDELINES = {
+    date(2023, 1, 19): {
+        REGION_CONTIGUOUS: (14580, 5140),
+        REGION_ALASKA: (18210, 6430),
+        REGION_HAWAII: (16770, 5910),
+    },
+    date(2024, 1, 17): {
+        REGION_CONTIGUOUS: (15060, 5380),
+        REGION_ALASKA: (18810, 6730),
+        REGION_HAWAII: (17310, 6190),
+    },
+    date(2025, 1, 15): {
+        REGION_CONTIGUOUS: (15650, 5500),
+        REGION_ALASKA: (19550, 6880),
+        REGION_HAWAII: (17990, 6330),
+    },
+    date(2026, 1, 15): {
+        REGION_CONTIGUOUS: (15960, 5680),
+        REGION_ALASKA: (19950, 7100),
+        REGION_HAWAII: (18360, 6530),
+    },
+}
+
+FEE_WAIVER_MULTIPLIER = Decimal("1.5")  # 150% per 28 U.S.C. § 1930(f)
+MONTHS_PER_YEAR = Decimal("12")
+_PRECOMPUTED_SIZES = 8
+
+# Qualification basis identifiers
+BASIS_INCOME = "income"
+BASIS_BENEFITS = "benefits"
+BASIS_NONE = "none"
+
+
+@dataclass(frozen=True, slots=True)
+class PovertyGuideline:
+    """One year's guideline for one region, with the 150% monthly thresholds."""
+
+    year: int
+    region: str
+    effective_date: date
+    base: Decimal  # annual poverty line for one person
+    increment: Decimal  # per additional person
+    thresholds: tuple[Decimal, ...]  # monthly 150% line, households of 1..8
+    threshold_step: Decimal  # monthly 150% increment
+
+    @classmethod
+    def from_amounts(cls, effective_date: date, region: str, base, increment) -> "PovertyGuideline":
+        base, increment = Decimal(str(base)), Decimal(str(increment))
+        per_month = FEE_WAIVER_MULTIPLIER / MONTHS_PER_YEAR
+        return cls(
+            year=effective_date.year,
+            region=region,
+            effective_date=effective_date,
+            base=base,
+            increment=increment,
+            thresholds=tuple(
+                (base + increment * size) * per_month for size in range(_PRECOMPUTED_SIZES)
+            ),
+            threshold_step=increment * per_month,
+        )
+
+    def poverty_line(self, household_size: int) -> Decimal:
+        """Annual HHS poverty line for ``household_size`` people."""
+        if household_size < 1:
+            raise ValueError("Household size must be at least 1.")
+        return self.base + self.increment * (household_size - 1)
+
+    def monthly_threshold(self, household_size: int) -> Decimal:
+        """150% of the poverty line, per month."""
+        if household_size < 1:
+            raise ValueError("Household size must be at least 1.")
+        if household_size <= _PRECOMPUTED_SIZES:
+            return self.thresholds[household_size - 1]
+        return self.thresholds[-1] + self.threshold_step * (household_size - _PRECOMPUTED_SIZES)
+
+
+# (year, region) -> guideline, for direct lookups; publication dates for ``as_of`` lookups.
+GUIDELINE_TABLE = MappingProxyType(
+    {
+        (effective.year, region): PovertyGuideline.from_amounts(effective, region, *amounts)
+        for effective, regions in GUIDELINES.items()
+        for region, amounts in regions.items()
+    }
+)
+_EFFECTIVE_DATES = sorted(GUIDELINES)
+# HHS publishes every January; a year after the latest release the next one is missing.
+_OUTDATED_AFTER = _EFFECTIVE_DATES[-1].replace(year=_EFFECTIVE_DATES[-1].year + 1)
+
+
+def region_for_state(state: str | None) -> str:
+    """Guideline region for a two-letter state code (DC and territories use the 48-state table)."""
+    return _REGION_BY_STATE.get((state or "").upper(), REGION_CONTIGUOUS)
+
+
+def guidelines_outdated(as_of: date) -> bool:
+    """True when ``as_of`` is more than a year past the latest guidelines in ``GUIDELINES``."""
+    return as_of > _OUTDATED_AFTER
+
+
+@cache
+def _warn_outdated(year: int) -> None:
+    logger.warning(
+        "No HHS poverty guidelines newer than %s for %s; add the current release to GUIDELINES",
+        _EFFECTIVE_DATES[-1].isoformat(),
+        year,
+    )
+
+
+def guideline_year(as_of: date) -> int:
+    """Year of the guidelines published on or before ``as_of`` (the earliest if none)."""
+    if guidelines_outdated(as_of):
+        _warn_outdated(as_of.year)
+    return _EFFECTIVE_DATES[max(bisect_right(_EFFECTIVE_DATES, as_of) - 1, 0)].year
+
+
+def guideline_in_force(region: str, as_of: date | None = None) -> PovertyGuideline:
+    """The ``region`` guideline in force on ``as_of`` (default today)."""
+    return GUIDELINE_TABLE[(guideline_year(as_of or timezone.localdate()), region)]
+
+
+def guideline_for(state: str | None, as_of: date | None = None) -> PovertyGuideline:
+    """The guideline in force on ``as_of`` (default today) for a district's state."""
+    return guideline_in_force(region_for_state(state), as_of)
+
+
+@dataclass(frozen=True, slots=True)
+class FeeWaiverEvaluation:
+    """Outcome of the fee waiver test for one household."""
+
+    household_size: int
+    monthly_income: Decimal
+    monthly_expenses: Decimal
+    receives_public_benefits: bool
+    guideline: PovertyGuideline
+    threshold_monthly: Decimal  # 150% of the poverty line, per month
+    below_threshold: bool
+
+    @property
+    def basis(self) -> str:
+        """Benefits take precedence over income (the strongest qualification path)."""
+        if self.receives_public_benefits:
+            return BASIS_BENEFITS
+        if self.below_threshold:
+            return BASIS_INCOME
+        return BASIS_NONE
+
+    @property
+    def qualifies(self) -> bool:
+        return self.basis != BASIS_NONE
+
+
+def fee_waiver_test(
+    guideline: PovertyGuideline,
+    household_size: int,
+    monthly_income: Decimal,
+    monthly_expenses: Decimal = Decimal("0"),
+    receives_public_benefits: bool = False,
+) -> FeeWaiverEvaluation:
+    """Income below 150% of ``guideline`` for the household, or public benefits."""
+    household_size = max(household_size, 1)
+    threshold = guideline.monthly_threshold(household_size)
+    return FeeWaiverEvaluation(
+        household_size=household_size,
+        monthly_income=monthly_income,
+        monthly_expenses=monthly_expenses,
+        receives_public_benefits=receives_public_benefits,
+        guideline=guideline,
+        threshold_monthly=threshold,
+        below_threshold=monthly_income < threshold,
+    )
+
+
+def evaluate_application(fee_waiver, as_of: date | None = None) -> FeeWaiverEvaluation:
+    """
+    The fee waiver test for a FeeWaiverApplication, computed once per instance.
+
+    The guideline is the one for the session's district, in force when the
+    application was filed (else today, unless ``as_of`` is given). The
+    result is cached on the instance and recomputed only if the inputs change.
+    """
+    if as_of is None and fee_waiver.filed_at is not None:
+        as_of = timezone.localdate(fee_waiver.filed_at)
+    guideline = guideline_for(fee_waiver.session.district.state, as_of)
+    income = Decimal(str(fee_waiver.monthly_income or 0))
+    expenses = Decimal(str(fee_waiver.monthly_expenses or 0))
+    key = (
+        guideline,
+        fee_waiver.household_size,
+        income,
+        expenses,
+        fee_waiver.receives_public_benefits,
+    )
+    cached = getattr(fee_waiver, "_fee_waiver_evaluation", None)
+    if cached is None or cached[0] != key:
+        cached = (key, fee_waiver_test(*key))
+        fee_waiver._fee_waiver_evaluation = cached
+    return cached[1]
@@ -0,0 +1,32 @@
+"""
+The latest means test outcome on the session summary (``apps.intake.summaries``).
+"""
+
+from apps.intake import summaries
+
+from ..models import MeansTest
+
+
+def summarize(session_id: int) -> dict:
+    passes, fee_waiver = MeansTest.objects.filter(session_id=session_id).values_list(
+        "passes_means_test", "qualifies_for_fee_waiver"
+    ).first() or (None, None)
+    return {"means_test_passes": passes, "means_test_fee_waiver": fee_waiver}
+
+
+def _on_means_test_save(sender, instance, **kwargs):
+    summaries.update(
+        instance.session_id,
+        means_test_passes=instance.passes_means_test,
+        means_test_fee_waiver=instance.qualifies_for_fee_waiver,
+    )
+
+
+def _on_means_test_delete(sender, instance, **kwargs):
+    summaries.update(instance.session_id, means_test_passes=None, means_test_fee_waiver=None)
+
+
+def connect_signals() -> None:
+    """Attach the receivers; called from EligibilityConfig.ready."""
+    summaries.register(summarize)
+    summaries.connect(MeansTest, _on_means_test_save, _on_means_test_delete)
@@ -0,0 +1,382 @@
+"""
+Effective-dated means-test tables: IRS standards and Census median incomes.
+
+Every calculation used to query ``district.median_incomes.latest(...)`` and
+read the hardcoded 2024 IRS tables regardless of when the case is filed.
+``get_catalog()`` instead returns a process-wide ``StandardsCatalog`` holding
+every table release as immutable tuples:
+
+- IRS National/Local Standards: the built-in 2024 release from
+  ``irs_standards`` plus every ``IRSStandardsRelease`` imported with
+  ``import_irs_standards`` (an imported release wins on the same date).
+- Census median incomes: every ``MedianIncome`` row, per district.
+- IRS Local Standards for every district and county: the releases' local
+  tables plus every ``LocalStandard`` row, in a ``LocalStandardsStore``.
+
+``catalog.irs(as_of)`` and ``catalog.median_table(district, as_of)`` pick
+the release in force on ``as_of`` (the latest effective on or before it) with
+a bisect over a handful of dates; nothing touches the database.
+
+The catalog is rebuilt when ``StandardsVersion`` changes. Saving or deleting
+a MedianIncome, IRSStandardsRelease or LocalStandard bumps the version (see
+``connect_signals``), which drops this process's catalog at once; other
+workers notice on their next version check, at most every
+STANDARDS_RELOAD_CHECK_SECONDS (one primary-key lookup). A MedianIncome
+change is cheaper still in the process that made it: once it commits,
+``refresh_medians`` rereads just that district's rows and swaps them into
+the catalog, instead of rereading every table (LocalStandard alone can be
+tens of thousands of rows).
+
+Gunicorn workers call ``warm()`` once they start (see gunicorn.conf.py), so
+the first means test a worker serves does not pay for the load.
+"""
+
+import copy
+import logging
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from types import MappingProxyType
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+
+from . import irs_standards
+from .local_standards import LocalStandardsStore
+
+_NATIONAL_SIZES = 5  # IRS tables stop at a household of 5
+_MEDIAN_SIZES = 8  # MedianIncome.family_size_1..8
+_DEFAULT_ADDITIONAL = Decimal("9900.00")
+_MEDIAN_FIELDS = (
+    "effective_date",
+    "family_size_additional",
+    *(f"family_size_{size}" for size in range(1, _MEDIAN_SIZES + 1)),
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _row(amounts: Mapping) -> tuple[Decimal, ...]:
+    """``{1: "713", "2": 904, ...}`` -> ``(Decimal("713"), Decimal("904"), ...)``."""
+    by_size = {int(size): Decimal(str(amount)) for size, amount in amounts.items()}
+    return tuple(by_size[size] for size in range(1, len(by_size) + 1))
+
+
+def _pick(row: tuple[Decimal, ...], family_size: int) -> Decimal | None:
+    index = min(family_size, _NATIONAL_SIZES) - 1
+    return row[index] if 0 <= index < len(row) else None
+
+
+@dataclass(frozen=True, slots=True)
+class IRSStandards:
+    """One release of the IRS National and Local Standards."""
+
+    effective_date: date
+    national: Mapping[str, tuple[Decimal, ...]]
+    local: Mapping[str, Mapping[str, tuple[Decimal, ...] | Decimal]]
+
+    @classmethod
+    def from_tables(cls, effective_date: date, national: Mapping, local: Mapping) -> "IRSStandards":
+        return cls(
+            effective_date=effective_date,
+            national=MappingProxyType({key: _row(row) for key, row in national.items()}),
+            local=MappingProxyType(
+                {
+                    code.upper(): MappingProxyType(
+                        {
+                            category: (
+                                _row(value) if isinstance(value, Mapping) else Decimal(str(value))
+                            )
+                            for category, value in categories.items()
+                        }
+                    )
+                    for code, categories in local.items()
+                }
+            ),
+        )
+
+    def national_standard(
+        self, category: str, family_size: int, age_under_65: bool = True
+    ) -> Decimal:
+        key = category
+        if category == "health_care":
+            key = "health_care_under_65" if age_under_65 else "health_care_65_plus"
+        return _pick(self.national[key], family_size)
+
+    def local_standard(
+        self, district_code: str, category: str, family_size: int = 1
+    ) -> Decimal | None:
+        """None when the release has no entry for the district or category."""
+        district = self.local.get(district_code.upper())
+        if not district:
+            return None
+        value = district.get(category)
+        if isinstance(value, tuple):
+            return _pick(value, family_size)
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class MedianIncomeTable:
+    """One district's Census median family incomes for one effective date."""
+
+    effective_date: date
+    sizes: tuple[Decimal, ...]  # family sizes 1..8
+    additional: Decimal  # per person above 8
+
+    @classmethod
+    def from_row(
+        cls, effective_date: date, additional: Decimal | None, *sizes: Decimal
+    ) -> "MedianIncomeTable":
+        """From a MedianIncome ``values_list(*_MEDIAN_FIELDS)`` row."""
+        return cls(
+            effective_date=effective_date,
+            sizes=sizes,
+            additional=additional if additional is not None else _DEFAULT_ADDITIONAL,
+        )
+
+    def median(self, family_size: int) -> Decimal:
+        """Median for ``family_size``; sizes above 8 add ``additional`` per person."""
+        if family_size < 1:
+            raise ValueError("Family size must be at least 1.")
+        if family_size <= _MEDIAN_SIZES:
+            return self.sizes[family_size - 1]
+        return self.sizes[-1] + Decimal(family_size - _MEDIAN_SIZES) * self.additional
+
+
+def _in_force(dates: list[date], items: list, as_of: date):
+    """The item effective on ``as_of``; the earliest one if ``as_of`` predates them all."""
+    if not items:
+        return None
+    return items[max(bisect_right(dates, as_of) - 1, 0)]
+
+
+class StandardsCatalog:
+    """Immutable snapshot of every table release, indexed by effective date."""
+
+    __slots__ = ("version", "_irs_dates", "_irs", "_medians", "local")
+
+    def __init__(
+        self,
+        version: int,
+        irs: Iterable[IRSStandards],
+        medians: Mapping[str, Iterable[MedianIncomeTable]],
+        local: LocalStandardsStore | None = None,
+    ):
+        self.version = version
+        self.local = local if local is not None else LocalStandardsStore()
+        self._irs = sorted(irs, key=lambda table: table.effective_date)
+        self._irs_dates = [table.effective_date for table in self._irs]
+        self._medians = {code.upper(): _by_date(tables) for code, tables in medians.items()}
+
+    def irs(self, as_of: date | None = None) -> IRSStandards:
+        return _in_force(self._irs_dates, self._irs, as_of or timezone.localdate())
+
+    def local_standard(
+        self,
+        district_code: str,
+        category: str,
+        family_size: int = 1,
+        as_of: date | None = None,
+        county: str | None = None,
+    ) -> Decimal | None:
+        """Local Standards amount in force on ``as_of``; None if the district has none."""
+        return self.local.lookup(
+            district_code, category, family_size, as_of or timezone.localdate(), county
+        )
+
+    def median_table(
+        self, district_code: str, as_of: date | None = None
+    ) -> MedianIncomeTable | None:
+        dates, tables = self._medians.get(district_code.upper(), ([], []))
+        return _in_force(dates, tables, as_of or timezone.localdate())
+
+    def median_income(
+        self, district_code: str, family_size: int, as_of: date | None = None
+    ) -> Decimal | None:
+        table = self.median_table(district_code, as_of)
+        return table.median(family_size) if table is not None else None
+
+    def median_table_count(self) -> int:
+        return sum(len(tables) for _, tables in self._medians.values())
+
+    def with_medians(
+        self, version: int, district_code: str, tables: Iterable[MedianIncomeTable]
+    ) -> "StandardsCatalog":
+        """A copy at ``version`` with one district's median tables replaced."""
+        medians = dict(self._medians)
+        dates, ordered = _by_date(tables)
+        if ordered:
+            medians[district_code.upper()] = (dates, ordered)
+        else:
+            medians.pop(district_code.upper(), None)
+        catalog = copy.copy(self)
+        catalog.version = version
+        catalog._medians = medians
+        return catalog
+
+
+def _by_date(tables: Iterable[MedianIncomeTable]) -> tuple[list[date], list[MedianIncomeTable]]:
+    ordered = sorted(tables, key=lambda table: table.effective_date)
+    return [table.effective_date for table in ordered], ordered
+
+
+BUILTIN_IRS_STANDARDS = IRSStandards.from_tables(
+    irs_standards.BUILTIN_EFFECTIVE_DATE,
+    irs_standards.NATIONAL_STANDARDS,
+    irs_standards.LOCAL_STANDARDS,
+)
+
+
+def _release_local_rows(release: IRSStandards):
+    for code, categories in release.local.items():
+        for category, value in categories.items():
+            if isinstance(value, tuple):
+                for size, amount in enumerate(value, start=1):
+                    yield code, "", category, size, release.effective_date, amount
+            else:
+                yield code, "", category, 0, release.effective_date, value
+
+
+def load_catalog(version: int) -> StandardsCatalog:
+    """Read every release from the database (four queries)."""
+    from apps.districts.models import MedianIncome
+    from apps.eligibility.models import IRSStandardsRelease, LocalStandard
+
+    irs = {BUILTIN_IRS_STANDARDS.effective_date: BUILTIN_IRS_STANDARDS}
+    for release in IRSStandardsRelease.objects.all():
+        irs[release.effective_date] = IRSStandards.from_tables(
+            release.effective_date, release.national, release.local
+        )
+
+    medians: dict[str, list[MedianIncomeTable]] = {}
+    for code, *row in MedianIncome.objects.values_list("district__code", *_MEDIAN_FIELDS):
+        medians.setdefault(code, []).append(MedianIncomeTable.from_row(*row))
+
+    # LocalStandard rows come after the releases' tables, so they win on the same key.
+    local_rows = [row for release in irs.values() for row in _release_local_rows(release)]
+    local_rows.extend(
+        LocalStandard.objects.values_list(
+            "district__code", "county", "category", "family_size", "effective_date", "amount"
+        ).iterator(chunk_size=10_000)
+    )
+    return StandardsCatalog(version, irs.values(), medians, LocalStandardsStore(local_rows))
+
+
+def current_version() -> int:
+    from apps.eligibility.models import StandardsVersion
+
+    return StandardsVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+_lock = threading.Lock()
+_catalog: StandardsCatalog | None = None
+_checked_at = 0.0
+
+
+def get_catalog() -> StandardsCatalog:
+    """This process's catalog, rebuilt if the stored version has moved on."""
+    global _catalog, _checked_at
+    catalog = _catalog
+    if (
+        catalog is not None
+        and time.monotonic() - _checked_at < settings.STANDARDS_RELOAD_CHECK_SECONDS
+    ):
+        return catalog
+    with _lock:
+        version = current_version()
+        if _catalog is None or _catalog.version != version:
+            _catalog = load_catalog(version)
+        _checked_at = time.monotonic()
+        return _catalog
+
+
+def warm() -> StandardsCatalog:
+    """Load every district's tables now, rather than on the first request."""
+    catalog = get_catalog()
+    logger.info(
+        "Standards catalog v%s loaded with %d median income tables",
+        catalog.version,
+        catalog.median_table_count(),
+    )
+    return catalog
+
+
+def invalidate() -> None:
+    """Drop this process's catalog; the next ``get_catalog`` rebuilds it."""
+    global _catalog
+    _catalog = None
+
+
+def _bump_stored_version() -> None:
+    from apps.eligibility.models import StandardsVersion
+
+    if not StandardsVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        StandardsVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+
+
+def bump_version() -> None:
+    """Tell every worker the tables changed."""
+    _bump_stored_version()
+    invalidate()
+    transaction.on_commit(invalidate)
+
+
+def refresh_medians(district_id: int, version: int) -> None:
+    """
+    Reread one district's MedianIncome rows into this process's catalog.
+
+    Patching is only safe on top of the catalog for ``version - 1`` (the
+    change being applied is then the only one it is missing); any other
+    catalog is dropped and rebuilt in full on next use.
+    """
+    global _catalog
+    from apps.districts.models import District, MedianIncome
+
+    with _lock:
+        catalog = _catalog
+        if catalog is None:
+            return
+        code = None
+        if catalog.version == version - 1:
+            code = District.objects.filter(pk=district_id).values_list("code", flat=True).first()
+        if code is None:
+            _catalog = None
+            return
+        rows = MedianIncome.objects.filter(district_id=district_id).values_list(*_MEDIAN_FIELDS)
+        _catalog = catalog.with_medians(
+            version, code, [MedianIncomeTable.from_row(*row) for row in rows]
+        )
+
+
+def _on_table_change(sender, **kwargs) -> None:
+    bump_version()
+
+
+def _on_median_change(sender, instance, **kwargs) -> None:
+    _bump_stored_version()
+    # Patch once the change is committed, as bump_version does: a rolled-back
+    # save must not leave its medians in this process's catalog.
+    district_id, version = instance.district_id, current_version()
+    transaction.on_commit(lambda: refresh_medians(district_id, version))
+
+
+def connect_signals() -> None:
+    for model, handler in (
+        ("districts.MedianIncome", _on_median_change),
+        ("eligibility.IRSStandardsRelease", _on_table_change),
+        ("eligibility.LocalStandard", _on_table_change),
+    ):
+        for signal in (post_save, post_delete):
+            signal.connect(
+                handler,
+                sender=model,
+                dispatch_uid=f"standards_version:{signal is post_save}:{model}",
+            )
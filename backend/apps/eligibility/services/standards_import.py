@@ -0,0 +1,366 @@
+"""
+Import IRS standards and Census median income releases from CSV or XLSX.
+
+The IRS and the U.S. Trustee Program publish each table in its own layout, so
+releases are first normalised into one of two sheets (the header row is
+required; column order is not):
+
+IRS National/Local Standards, one amount per row::
+
+    table,district,family_size,amount
+    food,,1,713
+    health_care_65_plus,,1,164
+    housing,ILND,1,1730
+    transport_operating,ILND,,283
+
+``district`` is blank for National Standards rows, which need family sizes
+1 to 5; ``family_size`` is blank for flat amounts such as
+``transport_operating``.
+
+Census median family incomes, one row per district::
+
+    district,family_size_1,...,family_size_8,family_size_additional
+    ILND,71304,88472,...,9900
+
+IRS Local Standards for any number of districts, in the published wide
+layout (one row per county or region, one column per household size or
+number of vehicles; ``amount`` for flat operating costs)::
+
+    district,county,table,1 person,2 persons,3 persons,4 persons,5 persons,amount
+    ILND,Cook,housing,1730,1997,2049,2281,2302,
+    ILND,,transport_operating,,,,,,283
+
+``district`` and ``table`` may instead be given once for the whole file
+(the IRS publishes one table per state file); a blank county is the
+district-wide amount. Intake collects no county, so every means test reads
+the district-wide amount: where a file gives a table only per county, the
+importer derives it as the lowest county amount (see
+``district_wide_amounts``).
+
+``ExemptionSchedule`` rows::
+
+    district,exemption_type,amount,statute_citation,description
+
+Every importer replaces what it loads in one transaction. Saving the
+catalog's rows bumps the standards version, so running workers reload it
+(see ``standards.connect_signals``); the bulk loaders bump it explicitly
+because ``bulk_create`` sends no signals. Exemption schedules are not part
+of the catalog and are read from the database.
+"""
+
+import csv
+import logging
+import re
+from collections.abc import Iterable
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.db import transaction
+from openpyxl import load_workbook
+
+from . import irs_standards
+from .local_standards import MAX_FAMILY_SIZE
+from .standards import bump_version
+
+logger = logging.getLogger(__name__)
+
+NATIONAL_TABLES = frozenset(irs_standards.NATIONAL_STANDARDS)
+LOCAL_TABLES = frozenset({"housing", "transport_owned", "transport_operating"})
+NATIONAL_FAMILY_SIZES = 5
+IRS_COLUMNS = ("table", "district", "family_size", "amount")
+LOCAL_KEY_COLUMNS = frozenset({"district", "county", "table", "amount"})
+EXEMPTION_COLUMNS = ("district", "exemption_type", "amount", "statute_citation")
+_SIZE_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
+MEDIAN_COLUMNS = (
+    "district",
+    *(f"family_size_{size}" for size in range(1, 9)),
+    "family_size_additional",
+)
+
+
+class StandardsImportError(ValueError):
+    """The file does not match the normalised release layout."""
+
+
+def read_table(path: str | Path) -> list[dict[str, str]]:
+    """Rows of a CSV or XLSX file as dicts keyed by lower-cased header."""
+    path = Path(path)
+    if path.suffix.lower() in (".xlsx", ".xlsm"):
+        rows = _read_xlsx(path)
+    else:
+        with path.open(newline="", encoding="utf-8-sig") as handle:
+            rows = list(csv.reader(handle))
+    rows = [row for row in rows if any(cell.strip() for cell in row)]
+    if not rows:
+        raise StandardsImportError(f"{path.name} is empty")
+    header = [cell.strip().lower() for cell in rows[0]]
+    return [dict(zip(header, (cell.strip() for cell in row), strict=False)) for row in rows[1:]]
+
+
+def _read_xlsx(path: Path) -> list[list[str]]:
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        return [
+            ["" if cell is None else str(cell) for cell in row]
+            for row in sheet.iter_rows(values_only=True)
+        ]
+    finally:
+        workbook.close()
+
+
+def _require(rows: list[dict[str, str]], columns: Iterable[str], source: str) -> None:
+    missing = [column for column in columns if rows and column not in rows[0]]
+    if missing or not rows:
+        raise StandardsImportError(f"{source}: missing columns {', '.join(missing) or 'rows'}")
+
+
+def _amount(value: str, where: str) -> str:
+    try:
+        amount = Decimal(value.replace(",", "").replace("$", ""))
+    except InvalidOperation as exc:
+        raise StandardsImportError(f"{where}: {value!r} is not an amount") from exc
+    if amount < 0:
+        raise StandardsImportError(f"{where}: amount cannot be negative")
+    return str(amount)
+
+
+def parse_irs_release(rows: list[dict[str, str]], source: str = "") -> tuple[dict, dict]:
+    """Long-format rows -> ``(national, local)`` in the IRSStandardsRelease JSON shape."""
+    _require(rows, IRS_COLUMNS, source)
+    national: dict[str, dict[str, str]] = {}
+    local: dict[str, dict[str, dict[str, str] | str]] = {}
+    for line, row in enumerate(rows, start=2):
+        where = f"{source} line {line}"
+        table, district, size = row["table"].lower(), row["district"].upper(), row["family_size"]
+        amount = _amount(row["amount"], where)
+        if table in NATIONAL_TABLES:
+            if not size:
+                raise StandardsImportError(f"{where}: {table} needs a family_size")
+            national.setdefault(table, {})[str(int(size))] = amount
+        elif table in LOCAL_TABLES:
+            if not district:
+                raise StandardsImportError(f"{where}: {table} needs a district")
+            categories = local.setdefault(district, {})
+            if size:
+                categories.setdefault(table, {})[str(int(size))] = amount
+            else:
+                categories[table] = amount
+        else:
+            raise StandardsImportError(f"{where}: unknown table {row['table']!r}")
+
+    missing = NATIONAL_TABLES - national.keys()
+    if missing:
+        raise StandardsImportError(f"{source}: no rows for {', '.join(sorted(missing))}")
+    sizes = sorted(str(size) for size in range(1, NATIONAL_FAMILY_SIZES + 1))
+    for table, amounts in national.items():
+        if sorted(amounts) != sizes:
+            raise StandardsImportError(
+                f"{source}: {table} needs family sizes 1..{NATIONAL_FAMILY_SIZES}"
+            )
+    return national, local
+
+
+def import_irs_release(path: str | Path, effective_date: date):
+    """Create or replace the IRSStandardsRelease for ``effective_date``."""
+    from apps.eligibility.models import IRSStandardsRelease
+
+    path = Path(path)
+    national, local = parse_irs_release(read_table(path), path.name)
+    with transaction.atomic():
+        release, _ = IRSStandardsRelease.objects.update_or_create(
+            effective_date=effective_date,
+            defaults={"source": path.name, "national": national, "local": local},
+        )
+    return release
+
+
+def import_median_incomes(path: str | Path, effective_date: date) -> int:
+    """Create or replace each listed district's MedianIncome for ``effective_date``."""
+    from apps.districts.models import District, MedianIncome
+
+    path = Path(path)
+    rows = read_table(path)
+    _require(rows, MEDIAN_COLUMNS[:-1], path.name)
+    districts = {district.code.upper(): district for district in District.objects.all()}
+
+    with transaction.atomic():
+        for line, row in enumerate(rows, start=2):
+            where = f"{path.name} line {line}"
+            district = districts.get(row["district"].upper())
+            if district is None:
+                raise StandardsImportError(f"{where}: unknown district {row['district']!r}")
+            values = {
+                column: Decimal(_amount(row[column], where))
+                for column in MEDIAN_COLUMNS[1:]
+                if row.get(column)
+            }
+            MedianIncome.objects.update_or_create(
+                district=district, effective_date=effective_date, defaults=values
+            )
+    return len(rows)
+
+
+def _size_column(header: str) -> int | None:
+    """``"3 persons"``, ``"family_size_3"`` or ``"Three Cars"`` -> 3."""
+    match = re.search(r"\d+", header)
+    if match:
+        return int(match.group())
+    return next((size for word, size in _SIZE_WORDS.items() if word in header.split()), None)
+
+
+def parse_local_standards(
+    rows: list[dict[str, str]],
+    source: str = "",
+    district: str | None = None,
+    table: str | None = None,
+) -> list[tuple[str, str, str, int, Decimal]]:
+    """Wide rows -> ``(district, county, category, family_size, amount)`` tuples."""
+    if not rows:
+        raise StandardsImportError(f"{source}: missing columns rows")
+    sizes = {
+        column: size
+        for column in rows[0]
+        if column not in LOCAL_KEY_COLUMNS and (size := _size_column(column)) is not None
+    }
+    missing = [
+        column
+        for column, default in (("district", district), ("table", table))
+        if column not in rows[0] and not default
+    ]
+    if missing:
+        raise StandardsImportError(f"{source}: missing columns {', '.join(missing)}")
+
+    parsed = []
+    for line, row in enumerate(rows, start=2):
+        where = f"{source} line {line}"
+        code = (row.get("district") or district or "").upper()
+        category = (row.get("table") or table or "").lower()
+        if not code:
+            raise StandardsImportError(f"{where}: no district")
+        if category not in LOCAL_TABLES:
+            raise StandardsImportError(f"{where}: unknown table {category!r}")
+        county = " ".join(row.get("county", "").split())
+        if row.get("amount"):
+            parsed.append((code, county, category, 0, Decimal(_amount(row["amount"], where))))
+        for column, size in sizes.items():
+            if size > MAX_FAMILY_SIZE:
+                raise StandardsImportError(f"{source}: no family size {size} in column {column!r}")
+            if row.get(column):
+                parsed.append((code, county, category, size, Decimal(_amount(row[column], where))))
+    return parsed
+
+
+def district_wide_amounts(
+    parsed: list[tuple[str, str, str, int, Decimal]],
+) -> list[tuple[str, str, str, int, Decimal]]:
+    """
+    District-wide rows for the tables ``parsed`` gives only per county.
+
+    For each district, table and household size with county rows but no
+    blank-county row, the lowest county amount stands in: the smallest
+    allowance in force anywhere in the district, so a debtor whose county is
+    unknown is never allowed more than their county's standard.
+    """
+    covered = {(code, category, size) for code, county, category, size, _ in parsed if not county}
+    lowest: dict[tuple[str, str, int], Decimal] = {}
+    for code, _, category, size, amount in parsed:
+        key = (code, category, size)
+        if key not in covered and (key not in lowest or amount < lowest[key]):
+            lowest[key] = amount
+    return [(code, "", category, size, amount) for (code, category, size), amount in lowest.items()]
+
+
+def _districts_by_code(codes: Iterable[str], source: str) -> dict:
+    from apps.districts.models import District
+
+    districts = {d.code.upper(): d for d in District.objects.all()}
+    unknown = sorted(set(codes) - districts.keys())
+    if unknown:
+        raise StandardsImportError(f"{source}: unknown district(s) {', '.join(unknown)}")
+    return districts
+
+
+def import_local_standards(
+    path: str | Path,
+    effective_date: date,
+    district: str | None = None,
+    table: str | None = None,
+    batch_size: int = 2000,
+) -> tuple[int, int]:
+    """
+    Bulk create or replace LocalStandard rows for ``effective_date``.
+
+    Returns the number of rows saved and how many of them are district-wide
+    amounts derived from county rows (see ``district_wide_amounts``).
+    """
+    from apps.eligibility.models import LocalStandard
+
+    path = Path(path)
+    parsed = parse_local_standards(read_table(path), path.name, district, table)
+    districts = _districts_by_code({row[0] for row in parsed}, path.name)
+    derived = district_wide_amounts(parsed)
+    if derived:
+        logger.warning(
+            "%s: derived %d district-wide local standard amount(s) from county rows",
+            path.name,
+            len(derived),
+        )
+    parsed += derived
+    objects = [
+        LocalStandard(
+            district=districts[code],
+            county=county,
+            category=category,
+            family_size=size,
+            effective_date=effective_date,
+            amount=amount,
+        )
+        for code, county, category, size, amount in parsed
+    ]
+    with transaction.atomic():
+        LocalStandard.objects.bulk_create(
+            objects,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["district", "county", "category", "family_size", "effective_date"],
+            update_fields=["amount"],
+        )
+        bump_version()
+    return len(objects), len(derived)
+
+
+def import_exemption_schedules(path: str | Path, batch_size: int = 2000) -> int:
+    """Bulk create or replace ExemptionSchedule rows."""
+    from apps.districts.models import ExemptionSchedule
+
+    path = Path(path)
+    rows = read_table(path)
+    _require(rows, EXEMPTION_COLUMNS, path.name)
+    districts = _districts_by_code({row["district"].upper() for row in rows}, path.name)
+    types = {choice for choice, _ in ExemptionSchedule.EXEMPTION_TYPE_CHOICES}
+
+    objects = []
+    for line, row in enumerate(rows, start=2):
+        where = f"{path.name} line {line}"
+        if row["exemption_type"] not in types:
+            raise StandardsImportError(f"{where}: unknown exemption type {row['exemption_type']!r}")
+        objects.append(
+            ExemptionSchedule(
+                district=districts[row["district"].upper()],
+                exemption_type=row["exemption_type"],
+                amount=Decimal(_amount(row["amount"], where)),
+                statute_citation=row["statute_citation"],
+                description=row.get("description", ""),
+            )
+        )
+    with transaction.atomic():
+        ExemptionSchedule.objects.bulk_create(
+            objects,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["district", "exemption_type", "statute_citation"],
+            update_fields=["amount", "description"],
+        )
+    return len(objects)
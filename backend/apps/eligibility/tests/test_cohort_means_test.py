@@ -0,0 +1,201 @@
+"""Tests for the vectorized cohort means test."""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+from apps.districts.models import District, MedianIncome
+from apps.eligibility.models import MeansTest
+from apps.eligibility.services import MeansTestCalculator
+from apps.eligibility.services.cohort_means_test import (
+    _round_div,
+    evaluate,
+    load_cohort,
+    rescreen,
+)
+from apps.eligibility.services.standards import get_catalog
+from apps.intake.models import DebtInfo, DebtorInfo, ExpenseInfo, IncomeInfo, IntakeSession
+
+User = get_user_model()
+
+# (monthly income, marital status, dependents, household size, expenses, priority payment)
+CASES = [
+    (Decimal("1500"), "single", 0, None, None, None),  # fee waiver
+    (Decimal("5000"), "single", 0, None, None, None),  # below median
+    (Decimal("5942"), "single", 0, None, None, None),  # exactly the median: fails
+    (Decimal("4000.10"), "married_joint", 2, None, None, None),
+    (Decimal("9000"), "single", 0, 3, None, None),  # household_size overrides
+    (Decimal("7000"), "single", 0, None, "high", Decimal("1200")),  # above median, passes
+    (Decimal("7000"), "single", 0, None, "low", None),  # above median, fails
+    (Decimal("16000.33"), "married_separate", 7, None, "high", Decimal("300")),  # size 9
+]
+
+
+@pytest.fixture
+def district(db):
+    district = District.objects.create(
+        code="ilnd",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court for the Northern District of Illinois",
+        filing_fee_chapter_7=Decimal("338.00"),
+    )
+    MedianIncome.objects.create(
+        district=district,
+        effective_date=date(2024, 11, 1),
+        family_size_1=Decimal("1.00"),
+        family_size_2=Decimal("1.00"),
+        family_size_3=Decimal("1.00"),
+        family_size_4=Decimal("1.00"),
+        family_size_5=Decimal("1.00"),
+        family_size_6=Decimal("1.00"),
+        family_size_7=Decimal("1.00"),
+        family_size_8=Decimal("1.00"),
+    )
+    MedianIncome.objects.create(
+        district=district,
+        effective_date=date(2025, 11, 1),
+        family_size_1=Decimal("71304.00"),
+        family_size_2=Decimal("91526.00"),
+        family_size_3=Decimal("110712.00"),
+        family_size_4=Decimal("134366.00"),
+        family_size_5=Decimal("145466.00"),
+        family_size_6=Decimal("156566.00"),
+        family_size_7=Decimal("167666.00"),
+        family_size_8=Decimal("178766.00"),
+        family_size_additional=Decimal("11100.00"),
+    )
+    return district
+
+
+def _make_session(district, index, income, marital, dependents, household, expenses, priority):
+    user = User.objects.create_user(username=f"cohort{index}", password="pass")
+    session = IntakeSession.objects.create(user=user, district=district)
+    IncomeInfo.objects.create(
+        session=session,
+        marital_status=marital,
+        number_of_dependents=dependents,
+        monthly_income=[str(income)] * 6,
+    )
+    if household is not None:
+        DebtorInfo.objects.create(
+            session=session,
+            first_name="Test",
+            last_name="Debtor",
+            ssn="123-45-6789",
+            date_of_birth=date(1950, 1, 1),
+            phone="5555555555",
+            email="t@example.com",
+            street_address="1 Main St",
+            city="Chicago",
+            state="IL",
+            zip_code="60601",
+            household_size=household,
+        )
+    if expenses is not None:
+        amount = Decimal("5000") if expenses == "high" else Decimal("50")
+        ExpenseInfo.objects.create(
+            session=session,
+            rent_or_mortgage=amount,
+            food_and_groceries=amount,
+            medical_expenses=amount,
+            vehicle_payment=amount,
+        )
+    if priority is not None:
+        DebtInfo.objects.create(
+            session=session,
+            creditor_name="IRS",
+            amount_owed=Decimal("10000"),
+            is_priority=True,
+            debt_type="taxes",
+            monthly_payment=priority,
+        )
+    return session
+
+
+@pytest.fixture
+def sessions(district):
+    return [_make_session(district, i, *case) for i, case in enumerate(CASES)]
+
+
+@pytest.mark.django_db
+def test_matches_means_test_calculator_for_every_case(sessions, django_assert_max_num_queries):
+    get_catalog()  # tables are cached per process; loading the cohort is two queries
+    with django_assert_max_num_queries(2):
+        inputs, standards = load_cohort()
+        result = evaluate(inputs, standards)
+
+    rows = {session_id: i for i, session_id in enumerate(result.session_ids.tolist())}
+    for session in sessions:
+        expected = MeansTestCalculator(session).calculate()
+        i = rows[session.pk]
+        assert bool(result.passes_means_test[i]) == expected["passes_means_test"], session.pk
+        assert bool(result.qualifies_for_fee_waiver[i]) == expected["qualifies_for_fee_waiver"]
+        assert bool(result.above_median_calculated[i]) == expected["above_median_calculated"]
+        assert bool(result.passes_above_median[i]) == expected["passes_above_median"]
+        assert int(result.median_cents[i]) == int(expected["median_income_threshold"] * 100)
+        assert abs(int(result.cmi_cents[i]) - expected["cmi"] * 100) <= Decimal("0.5")
+        assert abs(int(result.disposable_cents[i]) - expected["disposable_income"] * 100) <= 1
+
+
+@pytest.mark.django_db
+def test_exact_median_tie_fails(sessions):
+    inputs, standards = load_cohort(IntakeSession.objects.filter(pk=sessions[2].pk))
+    result = evaluate(inputs, standards)
+    assert int(inputs.income_cents[0]) * 2 == int(result.median_cents[0])
+    assert not result.below_median[0]
+
+
+@pytest.mark.django_db
+def test_invalid_income_and_missing_median_are_not_evaluated(district, sessions):
+    IncomeInfo.objects.filter(session=sessions[0]).update(monthly_income=[100, 200])
+    other = District.objects.create(
+        code="xxnd", name="Nowhere", state="XX", court_name="None", filing_fee_chapter_7=338
+    )
+    orphan = _make_session(other, 99, Decimal("100"), "single", 0, None, None, None)
+
+    inputs, standards = load_cohort()
+    result = evaluate(inputs, standards)
+    valid = dict(zip(result.session_ids.tolist(), result.valid.tolist(), strict=True))
+    assert valid[sessions[0].pk] is False
+    assert valid[orphan.pk] is False
+    assert result.summary()["evaluated"] == len(CASES) - 1
+
+
+@pytest.mark.django_db
+def test_rescreen_reports_changed_and_unscreened(sessions):
+    for session in sessions[:3]:
+        MeansTestCalculator(session).calculate()
+    MeansTest.objects.filter(session=sessions[1]).update(passes_means_test=False)
+
+    report = rescreen()
+    assert report.changed_session_ids == [sessions[1].pk]
+    assert sorted(report.unscreened_session_ids) == [s.pk for s in sessions[3:]]
+
+
+@pytest.mark.django_db
+def test_rescreen_command_recalculates_changed_sessions(sessions):
+    out = StringIO()
+    call_command("rescreen_means_tests", "--district", "ILND", "--recalculate", stdout=out)
+    assert f"unscreened={len(CASES)}" in out.getvalue()
+    assert MeansTest.objects.count() == len(CASES)
+
+    out = StringIO()
+    call_command("rescreen_means_tests", stdout=out)
+    assert "changed=0 unscreened=0" in out.getvalue()
+
+
+def test_round_div_is_half_even():
+    values = np.array([3, 9, 15, 21, -3, -9, 7], dtype=np.int64)
+    assert _round_div(values, 6).tolist() == [0, 2, 2, 4, 0, -2, 1]
+
+
+def test_benchmark_command_agrees_with_decimal_reference():
+    out = StringIO()
+    call_command("benchmark_means_test", "--sessions", "2000", "--reference", "2000", stdout=out)
+    assert "agrees on every sampled row" in out.getvalue()
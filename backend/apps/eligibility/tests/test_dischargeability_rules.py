@@ -0,0 +1,193 @@
+"""Tests for the compiled dischargeability rule table."""
+
+import json
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from hypothesis import given
+from hypothesis import strategies as st
+
+from apps.audit.models import AuditLog
+from apps.districts.models import District
+from apps.eligibility.services.dischargeability_rules import (
+    RuleTable,
+    RuleTableError,
+    load_rule_table,
+)
+from apps.eligibility.services.dischargeability_service import DischargeabilityService
+from apps.intake.models import AdversaryProceeding, DebtInfo, IntakeSession
+
+User = get_user_model()
+
+AS_OF = date(2026, 10, 1)
+
+# Overlapping choice, flag and range conditions, to exercise the tree.
+RICH_TABLE = {
+    "version": "test",
+    "rules": [
+        {
+            "id": "disputed_tax",
+            "when": {"debt_type": ["taxes"], "is_disputed": True},
+            "dischargeable": False,
+            "proceeding_needed": False,
+            "reason": "11 U.S.C. § 523(a)(1) — disputed tax debt",
+        },
+        {
+            "id": "old_priority",
+            "when": {"is_priority": True, "years_since_incurred": {"min": 3, "max": 10}},
+            "dischargeable": False,
+            "proceeding_needed": False,
+            "reason": "11 U.S.C. § 507(a)(8) — older priority claim",
+        },
+        {
+            "id": "recent",
+            "when": {"years_since_incurred": {"max": 1}, "data_source": ["credit_report"]},
+            "dischargeable": True,
+            "proceeding_needed": False,
+            "reason": "",
+        },
+        {
+            "id": "student_loan",
+            "when": {"debt_type": ["student_loan"]},
+            "dischargeable": False,
+            "proceeding_needed": True,
+            "reason": "11 U.S.C. § 523(a)(8) — requires adversary proceeding",
+        },
+        {
+            "id": "general",
+            "when": {},
+            "dischargeable": True,
+            "proceeding_needed": False,
+            "reason": "",
+        },
+    ],
+}
+
+rows = st.fixed_dictionaries(
+    {
+        "debt_type": st.sampled_from(["taxes", "student_loan", "medical", "alimony", None]),
+        "data_source": st.sampled_from(["manual", "credit_report", "uploaded_document"]),
+        "is_priority": st.booleans(),
+        "is_disputed": st.booleans(),
+        "is_secured": st.booleans(),
+        "date_incurred": st.one_of(
+            st.none(), st.dates(min_value=date(2000, 1, 1), max_value=AS_OF)
+        ),
+    }
+)
+
+
+@given(rows)
+def test_compiled_tree_matches_rule_order(row):
+    for table in (RuleTable.from_dict(RICH_TABLE), load_rule_table()):
+        assert table.match(row, AS_OF) is table.match_linear(row, AS_OF)
+
+
+@given(st.lists(rows, max_size=40))
+def test_evaluate_counts_every_row_once(batch):
+    table = RuleTable.from_dict(RICH_TABLE)
+    evaluation = table.evaluate(batch, AS_OF)
+    assert evaluation.matches == [table.match_linear(row, AS_OF) for row in batch]
+    assert sum(evaluation.hits.values()) == len(batch)
+
+
+def test_shipped_table_classifies_tax_age():
+    table = load_rule_table()
+    old = {"debt_type": "taxes", "date_incurred": date(2022, 4, 15)}
+    recent = {"debt_type": "taxes", "date_incurred": date(2025, 4, 15)}
+    assert table.match(old, AS_OF).id == "tax_over_three_years_523a1"
+    assert table.match(recent, AS_OF).id == "tax_523a1"
+    assert table.match({"debt_type": "taxes"}, AS_OF).id == "tax_523a1"
+    assert table.match({"debt_type": "medical"}, AS_OF).id == "general"
+    assert not table.match(old, AS_OF).dischargeable  # information only, conservative
+
+
+def _table_with(**changes):
+    rules = [dict(rule) for rule in RICH_TABLE["rules"]]
+    rules[0].update(changes)
+    return {"version": "test", "rules": rules}
+
+
+@pytest.mark.parametrize(
+    "raw, message",
+    [
+        (_table_with(when={"fraud": True}), "unknown fact"),
+        (_table_with(when={"debt_type": "taxes"}), "non-empty list"),
+        (_table_with(when={"years_since_incurred": {"over": 3}}), "numeric min"),
+        (_table_with(reason="You should file an adversary proceeding"), "gives advice"),
+        (_table_with(dischargeable=True, proceeding_needed=True), "only needed"),
+        (_table_with(reason=""), "need a reason"),
+        (_table_with(id="general"), "unique"),
+        ({"version": "test", "rules": RICH_TABLE["rules"][:-1]}, "catch-all"),
+        ({"rules": RICH_TABLE["rules"]}, "version"),
+    ],
+)
+def test_invalid_tables_are_rejected(raw, message):
+    with pytest.raises(RuleTableError, match=message):
+        RuleTable.from_dict(raw)
+
+
+@pytest.fixture
+def session(db):
+    return IntakeSession.objects.create(
+        user=User.objects.create_user(username="rules", password="pass"),
+        district=District.objects.create(
+            code="ILND",
+            name="Northern District of Illinois",
+            state="IL",
+            court_name="U.S. Bankruptcy Court",
+            filing_fee_chapter_7=Decimal("338"),
+        ),
+    )
+
+
+def test_five_hundred_debts_in_constant_queries(session, django_assert_max_num_queries):
+    types = ["student_loan", "taxes", "medical", "credit_card", "alimony"]
+    DebtInfo.objects.bulk_create(
+        DebtInfo(
+            session=session,
+            creditor_name=f"Creditor {i}",
+            amount_owed=Decimal("100") + i,
+            debt_type=types[i % len(types)],
+        )
+        for i in range(500)
+    )
+
+    # SQLite's variable limit splits the one bulk_create into two INSERTs.
+    with django_assert_max_num_queries(10):
+        results = DischargeabilityService(session).evaluate()
+
+    assert len(results) == 500
+    assert AdversaryProceeding.objects.filter(session=session).count() == 100
+    entry = AuditLog.objects.get(action="evaluated_dischargeability")
+    assert entry.upl_sensitive and entry.resource_id == session.pk
+    assert entry.details["rules_version"] == load_rule_table().version
+    assert entry.details["rule_hits"] == {
+        "student_loan_523a8": 100,
+        "tax_523a1": 100,
+        "domestic_support_523a5": 100,
+        "general": 200,
+    }
+    assert {r["rule"] for r in results} == set(entry.details["rule_hits"])
+
+
+def test_benchmark_command(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(RICH_TABLE))
+    out = StringIO()
+    call_command(
+        "benchmark_dischargeability",
+        "--debts",
+        "500",
+        "--sessions",
+        "3",
+        "--rules",
+        str(path),
+        stdout=out,
+    )
+    assert "sessions=3 debts=500" in out.getvalue()
+    assert "agrees on every debt" in out.getvalue()
@@ -4,6 +4,8 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.districts.models import District
 from apps.eligibility.services.dischargeability_service import DischargeabilityService
@@ -100,3 +102,68 @@ class TestDischargeabilityEndToEnd:
         ap = AdversaryProceeding.objects.get(session=session)
         assert ap.proceeding_type == "student_loan"
         assert ap.status == "identified"
+
+
+def _add_debts(session, count, debt_type="student_loan"):
+    DebtInfo.objects.bulk_create(
+        DebtInfo(
+            session=session,
+            creditor_name=f"Lender {i}",
+            amount_owed=Decimal("1000") + i,
+            is_secured=False,
+            is_priority=False,
+            debt_type=debt_type,
+        )
+        for i in range(count)
+    )
+
+
+def _evaluation_queries(session) -> int:
+    with CaptureQueriesContext(connection) as ctx:
+        DischargeabilityService(session).evaluate()
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestSetBasedEvaluation:
+    def test_query_count_does_not_grow_with_debts(
+        self, session_with_student_loan, django_assert_max_num_queries
+    ):
+        small = session_with_student_loan
+        large = IntakeSession.objects.create(user=small.user, district=small.district)
+        for session, count in ((small, 1), (large, 40)):
+            _add_debts(session, count)
+            _add_debts(session, count, debt_type="taxes")
+            _add_debts(session, count, debt_type="medical")
+
+        assert _evaluation_queries(large) == _evaluation_queries(small) <= 9
+        assert AdversaryProceeding.objects.filter(session=large).count() == 40
+        assert DebtInfo.objects.filter(session=large, is_dischargeable=False).count() == 80
+
+        # Nothing changed, so the second pass reads but writes nothing new.
+        with django_assert_max_num_queries(6):
+            DischargeabilityService(large).evaluate()
+
+    def test_proceeding_copies_lender_and_amount(self, session_with_student_loan):
+        DischargeabilityService(session_with_student_loan).evaluate()
+        proceeding = AdversaryProceeding.objects.get(session=session_with_student_loan)
+        assert proceeding.lender_name == "Navient"
+        assert proceeding.loan_amount == Decimal("28000")
+        assert proceeding.debt.creditor_name == "Navient"
+
+    def test_reclassified_debt_drops_untouched_proceeding(self, session_with_student_loan):
+        session = session_with_student_loan
+        _add_debts(session, 2)
+        DischargeabilityService(session).evaluate()
+        filed = AdversaryProceeding.objects.filter(debt__creditor_name="Lender 0").get()
+        filed.status = "filed"
+        filed.save()
+
+        DebtInfo.objects.filter(session=session, debt_type="student_loan").update(
+            debt_type="medical"
+        )
+        results = DischargeabilityService(session).evaluate()
+
+        assert all(r["dischargeable"] for r in results)
+        assert list(AdversaryProceeding.objects.filter(session=session)) == [filed]
+        assert not DebtInfo.objects.filter(session=session, adversary_proceeding_needed=True)
@@ -75,3 +75,29 @@ class TestExpenseDeductionCalculator:
         result = calc.calculate()
         assert result.allowable_expenses >= Decimal("0")
         assert result.disposable_income >= Decimal("0")
+
+    def test_other_districts_use_loaded_local_standards(self, session_with_expenses):
+        from datetime import date
+
+        from apps.eligibility.models import LocalStandard
+
+        district = District.objects.create(
+            code="nysd",
+            name="Southern District of New York",
+            state="NY",
+            court_name="U.S. Bankruptcy Court",
+            filing_fee_chapter_7=Decimal("338"),
+        )
+        session_with_expenses.district = district
+        session_with_expenses.save()
+        calc = ExpenseDeductionCalculator(session_with_expenses, as_of=date(2025, 6, 1))
+        assert calc.calculate().local_housing_allowance == Decimal("0")
+
+        LocalStandard.objects.create(
+            district=district,
+            category="housing",
+            family_size=1,
+            effective_date=date(2025, 4, 1),
+            amount=Decimal("1100"),
+        )
+        assert calc.calculate().local_housing_allowance == Decimal("1100")
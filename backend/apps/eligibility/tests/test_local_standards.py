@@ -0,0 +1,202 @@
+"""Tests for the resident Local Standards store and its bulk loaders."""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.districts.models import District, ExemptionSchedule
+from apps.eligibility.models import LocalStandard
+from apps.eligibility.services.local_standards import LocalStandardsStore
+from apps.eligibility.services.standards import get_catalog
+
+OLD, NEW = date(2024, 4, 1), date(2025, 4, 1)
+
+LOCAL_CSV = """district,county,table,1 Person,2 Persons,3 Persons,4 Persons,5 Persons,amount
+NYSD,,housing,2000,2300,2500,2700,2900,
+NYSD,New York,housing,3000,3300,3500,3700,3900,
+NYSD,,transport_operating,,,,,,320
+NYSD,,transport_owned,,,,,,
+"""
+
+OWNERSHIP_CSV = """County,One Car,Two Cars
+,629,1258
+"""
+
+EXEMPTION_CSV = """district,exemption_type,amount,statute_citation,description
+NYSD,homestead,170825,NY CPLR 5206,Equity in your home.
+NYSD,vehicle,4825,NY Debt. & Cred. Law 282,One motor vehicle.
+"""
+
+
+def _store():
+    return LocalStandardsStore(
+        [("ilnd", "", "housing", size, OLD, Decimal(1000 + size)) for size in range(1, 6)]
+        + [
+            ("ILND", "", "housing", 1, NEW, Decimal("1100.50")),
+            ("ILND", "Cook", "housing", 1, NEW, Decimal("1500")),
+            ("ILND", "", "transport_operating", 0, OLD, Decimal("283")),
+        ]
+    )
+
+
+def test_lookup_resolves_county_size_and_effective_date():
+    store = _store()
+
+    assert store.lookup("ilnd", "housing", 1, date(2024, 6, 1)) == Decimal("1001")
+    assert store.lookup("ilnd", "housing", 1, NEW) == Decimal("1100.50")
+    assert store.lookup("ilnd", "housing", 1, date(2020, 1, 1)) == Decimal("1001")  # earliest
+    assert store.lookup("ilnd", "housing", 9, NEW) == Decimal("1005")  # capped at 5
+    assert store.lookup("ilnd", "housing", 1, NEW, county="  cook ") == Decimal("1500")
+    assert store.lookup("ilnd", "housing", 1, date(2024, 6, 1), county="Cook") == Decimal("1500")
+    assert store.lookup("ilnd", "housing", 2, NEW, county="Cook") == Decimal("1002")
+    assert store.lookup("ilnd", "housing", 1, NEW, county="Lake") == Decimal("1100.50")
+    assert store.lookup("ilnd", "transport_operating", 4, NEW) == Decimal("283")
+    assert store.lookup("ilnd", "transport_owned", 1, NEW) is None
+    assert store.lookup("nysd", "housing", 1, NEW) is None
+
+
+def test_every_district_stays_resident_in_sixteen_bytes_per_row():
+    rows = [
+        (f"d{district:03d}", f"county {county}", category, size, effective_date, Decimal("1234.56"))
+        for district in range(94)
+        for county in range(40)
+        for category, sizes in (("housing", range(1, 6)), ("transport_operating", [0]))
+        for size in sizes
+        for effective_date in (OLD, NEW)
+    ]
+    store = LocalStandardsStore(rows)
+
+    assert len(store) == 94 * 40 * 6 * 2
+    assert store.nbytes == 16 * len(store)
+    assert store.nbytes < 1_000_000
+    assert len(store.districts()) == 94
+    assert store.lookup("D093", "housing", 5, NEW, county="County 39") == Decimal("1234.56")
+
+
+@pytest.fixture
+def districts(db):
+    return [
+        District.objects.create(
+            code=code,
+            name=name,
+            state=state,
+            court_name=f"U.S. Bankruptcy Court for the {name}",
+            filing_fee_chapter_7=Decimal("338.00"),
+        )
+        for code, name, state in (
+            ("ilnd", "Northern District of Illinois", "IL"),
+            ("nysd", "Southern District of New York", "NY"),
+        )
+    ]
+
+
+def test_catalog_serves_builtin_release_and_saved_rows(districts):
+    catalog = get_catalog()
+    assert catalog.local_standard("ilnd", "housing", 3) == Decimal("2049")
+    assert catalog.local_standard("ilnd", "transport_operating") == Decimal("283")
+    assert catalog.local_standard("nysd", "housing", 3) is None
+
+    LocalStandard.objects.create(
+        district=districts[1],
+        category="housing",
+        family_size=3,
+        effective_date=NEW,
+        amount=Decimal("2500"),
+    )
+    assert get_catalog().local_standard("nysd", "housing", 3, date(2025, 5, 1)) == Decimal("2500")
+
+
+def test_import_local_standards_command(districts, tmp_path):
+    path = tmp_path / "ny.csv"
+    path.write_text(LOCAL_CSV)
+    out = StringIO()
+    call_command("import_local_standards", str(path), "--effective-date", "2025-04-01", stdout=out)
+
+    assert "Imported 11 local standard amount(s)" in out.getvalue()
+    assert LocalStandard.objects.count() == 11
+    catalog = get_catalog()
+    assert catalog.local_standard("nysd", "housing", 2, NEW) == Decimal("2300")
+    assert catalog.local_standard("nysd", "housing", 2, NEW, county="new york") == Decimal("3300")
+    assert catalog.local_standard("nysd", "transport_operating", as_of=NEW) == Decimal("320")
+
+    ownership = tmp_path / "ownership.csv"
+    ownership.write_text(OWNERSHIP_CSV)
+    call_command(
+        "import_local_standards",
+        str(ownership),
+        "--effective-date",
+        "2025-04-01",
+        "--district",
+        "nysd",
+        "--table",
+        "transport_owned",
+        stdout=out,
+    )
+    assert get_catalog().local_standard("nysd", "transport_owned", 2, NEW) == Decimal("1258")
+
+    # Re-importing updates amounts in place.
+    path.write_text(LOCAL_CSV.replace("2000,2300", "2000,2350"))
+    call_command("import_local_standards", str(path), "--effective-date", "2025-04-01", stdout=out)
+    assert LocalStandard.objects.count() == 13
+    assert get_catalog().local_standard("nysd", "housing", 2, NEW) == Decimal("2350")
+
+
+def test_county_only_tables_get_the_lowest_county_amount_district_wide(districts, tmp_path):
+    path = tmp_path / "ny_counties.csv"
+    path.write_text(
+        "county,1 Person,2 Persons\n"
+        "New York,3000,3300\n"
+        "Bronx,2100,2600\n"
+        "Westchester,2400,2500\n"
+    )
+    args = ["--effective-date", "2025-04-01", "--district", "nysd", "--table", "housing"]
+    out = StringIO()
+    call_command("import_local_standards", str(path), *args, stdout=out)
+
+    assert "Imported 8 local standard amount(s)" in out.getvalue()
+    assert "Derived 2 district-wide amount(s)" in out.getvalue()
+    catalog = get_catalog()
+    assert catalog.local_standard("nysd", "housing", 1, NEW) == Decimal("2100")
+    assert catalog.local_standard("nysd", "housing", 2, NEW) == Decimal("2500")
+    assert catalog.local_standard("nysd", "housing", 1, NEW, county="new york") == Decimal("3000")
+
+    # A district-wide row in the file wins over the derived amount.
+    path.write_text(path.read_text() + ",2222,\n")
+    out = StringIO()
+    call_command("import_local_standards", str(path), *args, stdout=out)
+    assert "Derived 1 district-wide amount(s)" in out.getvalue()
+    assert get_catalog().local_standard("nysd", "housing", 1, NEW) == Decimal("2222")
+    assert get_catalog().local_standard("nysd", "housing", 2, NEW) == Decimal("2500")
+
+
+def test_import_local_standards_rejects_bad_rows(districts, tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text(LOCAL_CSV.replace("NYSD,New York", "TXND,Dallas"))
+    with pytest.raises(CommandError, match="unknown district"):
+        call_command("import_local_standards", str(path), "--effective-date", "2025-04-01")
+
+    path.write_text(OWNERSHIP_CSV)
+    with pytest.raises(CommandError, match="missing columns district, table"):
+        call_command("import_local_standards", str(path), "--effective-date", "2025-04-01")
+    assert not LocalStandard.objects.exists()
+
+
+def test_import_exemption_schedules_command(districts, tmp_path):
+    path = tmp_path / "exemptions.csv"
+    path.write_text(EXEMPTION_CSV)
+    out = StringIO()
+    call_command("import_exemption_schedules", str(path), stdout=out)
+    assert "Imported 2" in out.getvalue()
+    assert ExemptionSchedule.objects.get(exemption_type="homestead").amount == Decimal("170825")
+
+    path.write_text(EXEMPTION_CSV.replace("170825", "180000"))
+    call_command("import_exemption_schedules", str(path), stdout=out)
+    assert ExemptionSchedule.objects.count() == 2
+    assert ExemptionSchedule.objects.get(exemption_type="homestead").amount == Decimal("180000")
+
+    path.write_text(EXEMPTION_CSV.replace("homestead", "jewelry"))
+    with pytest.raises(CommandError, match="unknown exemption type"):
+        call_command("import_exemption_schedules", str(path))
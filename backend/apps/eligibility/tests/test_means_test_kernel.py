@@ -0,0 +1,355 @@
+"""
+Tests for the pure means-test kernel.
+
+The property-based tests check the kernel against the per-session Decimal
+rules it replaced (transcribed below as ``_legacy`` and kept as they were)
+and against the vectorized cohort engine, over generated households. The
+one rule changed since, fee waiver screening, is checked against
+``_poverty_fee_waiver`` instead.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from django.contrib.auth import get_user_model
+from hypothesis import given
+from hypothesis import strategies as st
+
+from apps.districts.models import District, MedianIncome
+from apps.eligibility.management.commands.benchmark_means_test import (
+    kernel_standards,
+    synthetic_inputs,
+)
+from apps.eligibility.models import MeansTest
+from apps.eligibility.services.cohort_means_test import CohortInputs, evaluate
+from apps.eligibility.services.local_standards import LocalStandardsStore
+from apps.eligibility.services.means_test_kernel import (
+    DeductionStandards,
+    MeansTestInputs,
+    _build,
+    expense_deductions,
+    load_inputs,
+    load_inputs_many,
+    means_test,
+)
+from apps.eligibility.services.standards import (
+    BUILTIN_IRS_STANDARDS,
+    MedianIncomeTable,
+    StandardsCatalog,
+    _release_local_rows,
+)
+from apps.intake.models import DebtInfo, DebtorInfo, ExpenseInfo, IncomeInfo, IntakeSession
+
+User = get_user_model()
+
+AS_OF = date(2025, 6, 1)
+ZERO = Decimal("0")
+MEDIANS = MedianIncomeTable(
+    date(2024, 11, 1),
+    tuple(Decimal(v) for v in (71304, 91526, 110712, 129374, 138500, 147600, 156700, 165800)),
+    Decimal("9900"),
+)
+CATALOG = StandardsCatalog(
+    1,
+    [BUILTIN_IRS_STANDARDS],
+    {"ilnd": [MEDIANS]},
+    local=LocalStandardsStore(_release_local_rows(BUILTIN_IRS_STANDARDS)),
+)
+STANDARDS = DeductionStandards.resolve(CATALOG, "ilnd", AS_OF)
+
+money = st.decimals(min_value=0, max_value=30_000, places=2, allow_nan=False)
+households = st.fixed_dictionaries(
+    {
+        "months": st.lists(money, min_size=6, max_size=6),
+        "marital_status": st.sampled_from(["single", "married_joint", "married_separate"]),
+        "dependents": st.integers(0, 9),
+        "household_size": st.one_of(st.none(), st.integers(0, 12)),
+        "age": st.one_of(st.none(), st.integers(18, 95)),
+        "expenses": st.one_of(st.none(), st.lists(money, min_size=4, max_size=4)),
+        "priority": money,
+    }
+)
+
+
+def _legacy(h: dict) -> dict:
+    """MeansTest.calculate and ExpenseDeductionCalculator as they read before the kernel."""
+    total = sum(Decimal(str(amount)) for amount in h["months"])
+    cmi = total / Decimal("6")
+    if (h["household_size"] or 0) >= 1:
+        family_size = h["household_size"]
+    else:
+        family_size = h["dependents"] + 1
+        if h["marital_status"] in ["married_joint", "married_separate"]:
+            family_size += 1
+    median = MEDIANS.median(family_size)
+    annualized = cmi * Decimal("12")
+    passes = annualized < median
+    result = {"passes": passes, "median": median, "deductions": None}
+
+    if not passes:
+        under_65 = h["age"] is None or h["age"] < 65
+        irs = CATALOG.irs(AS_OF)
+        food, health, housing, transport = h["expenses"] or (ZERO,) * 4
+        allowable = (
+            min(food, irs.national_standard("food", family_size))
+            + min(health, irs.national_standard("health_care", family_size, under_65))
+            + min(housing, CATALOG.local_standard("ilnd", "housing", family_size, AS_OF) or ZERO)
+            + min(
+                transport,
+                CATALOG.local_standard("ilnd", "transport_operating", as_of=AS_OF) or ZERO,
+            )
+        )
+        disposable = (total / Decimal("6") if total else ZERO) - allowable - h["priority"]
+        result["deductions"] = (allowable, disposable)
+        result["passes"] = disposable < Decimal("756.25")
+
+    result["fee_waiver"] = annualized < median * Decimal("0.60")
+    result["cmi"] = cmi
+    return result
+
+
+def _poverty_fee_waiver(h: dict) -> bool:
+    """
+    The fee waiver rule that replaced the legacy 60%-of-median screen: CMI
+    below 150% of the 2025 HHS poverty line (48 states) for the household.
+    """
+    cmi = sum(Decimal(str(amount)) for amount in h["months"]) / Decimal("6")
+    if (h["household_size"] or 0) >= 1:
+        family_size = h["household_size"]
+    else:
+        family_size = h["dependents"] + 1
+        if h["marital_status"] in ["married_joint", "married_separate"]:
+            family_size += 1
+    poverty_line = Decimal("15650") + Decimal("5500") * (family_size - 1)
+    return cmi < poverty_line * Decimal("1.5") / Decimal("12")
+
+
+def _kernel_inputs(h: dict):
+    """Build inputs through the loader's ``_build`` from unsaved stand-in rows."""
+    expense_info = None
+    if h["expenses"] is not None:
+        food, health, housing, transport = h["expenses"]
+        expense_info = SimpleNamespace(
+            food_and_groceries=food,
+            medical_expenses=health,
+            rent_or_mortgage=housing,
+            vehicle_payment=transport,
+            calculate_total_monthly_expenses=lambda: float(sum(h["expenses"])),
+        )
+    date_of_birth = None if h["age"] is None else AS_OF - timedelta(days=365 * h["age"] + 1)
+    session = SimpleNamespace(
+        district=SimpleNamespace(code="ilnd", state="IL"),
+        debtor_info=SimpleNamespace(
+            household_size=h["household_size"], date_of_birth=date_of_birth
+        ),
+        expense_info=expense_info,
+    )
+    income_info = SimpleNamespace(
+        monthly_income=[str(amount) for amount in h["months"]],
+        marital_status=h["marital_status"],
+        number_of_dependents=h["dependents"],
+    )
+    return _build(session, income_info, h["priority"], STANDARDS, MEDIANS, AS_OF, strict=True)
+
+
+@given(households)
+def test_kernel_matches_legacy_rules(household):
+    expected = _legacy(household)
+    outcome = means_test(_kernel_inputs(household))
+
+    assert outcome.passes_means_test == expected["passes"]
+    # Fee waivers deliberately moved off the legacy rule to the poverty line.
+    assert outcome.qualifies_for_fee_waiver == _poverty_fee_waiver(household)
+    assert outcome.median_income_threshold == expected["median"]
+    assert outcome.cmi == expected["cmi"]
+    if expected["deductions"] is None:
+        assert outcome.deductions is None
+    else:
+        allowable, disposable = expected["deductions"]
+        assert outcome.deductions.allowable_expenses == allowable
+        assert outcome.deductions.disposable_income == disposable
+
+
+@given(households)
+def test_expense_deductions_are_capped_by_the_standards(household):
+    inputs = _kernel_inputs(household)
+    result = expense_deductions(inputs)
+
+    assert (
+        ZERO
+        <= result.allowable_expenses
+        <= inputs.food + inputs.health + inputs.housing + (inputs.transport)
+    )
+    assert result.local_transport_allowance <= STANDARDS.transport_operating
+    assert result.disposable_income == (
+        sum(inputs.monthly_income, ZERO) / 6
+        - result.allowable_expenses
+        - inputs.priority_debts_monthly
+    )
+
+
+cents = st.integers(0, 3_000_000)
+
+
+@given(
+    st.lists(
+        st.tuples(
+            st.integers(0, 6 * 2_000_000),  # six-month income
+            st.integers(1, 12),
+            st.booleans(),
+            cents,
+            cents,
+            cents,
+            cents,
+            cents,
+            st.integers(0, 2),  # poverty guideline region
+        ),
+        min_size=1,
+        max_size=50,
+    )
+)
+def test_kernel_matches_cohort_engine(rows):
+    _, table = synthetic_inputs(1, seed=0)
+    deduction, median, poverty = kernel_standards(table)
+    columns = list(zip(*rows, strict=True))
+    cohort = CohortInputs(
+        session_ids=np.arange(len(rows), dtype=np.int64),
+        valid=np.ones(len(rows), dtype=bool),
+        income_cents=np.array(columns[0], dtype=np.int64),
+        family_size=np.array(columns[1], dtype=np.int64),
+        district=np.zeros(len(rows), dtype=np.int64),
+        region=np.array(columns[8], dtype=np.int64),
+        under_65=np.array(columns[2], dtype=bool),
+        food_cents=np.array(columns[3], dtype=np.int64),
+        health_cents=np.array(columns[4], dtype=np.int64),
+        housing_cents=np.array(columns[5], dtype=np.int64),
+        transport_cents=np.array(columns[6], dtype=np.int64),
+        priority_cents=np.array(columns[7], dtype=np.int64),
+    )
+    result = evaluate(cohort, table)
+
+    def dollars(amount: int) -> Decimal:
+        return Decimal(amount).scaleb(-2)
+
+    for i, row in enumerate(rows):
+        income, size, under_65, food, health, housing, transport, priority, region = row
+        inputs = MeansTestInputs(
+            monthly_income=(dollars(income), ZERO, ZERO, ZERO, ZERO, ZERO),
+            family_size=size,
+            under_65=under_65,
+            food=dollars(food),
+            health=dollars(health),
+            housing=dollars(housing),
+            transport=dollars(transport),
+            total_expenses=ZERO,
+            priority_debts_monthly=dollars(priority),
+            standards=deduction,
+            median=median,
+            poverty=poverty[region],
+        )
+        outcome = means_test(inputs)
+        assert outcome.passes_means_test == bool(result.passes_means_test[i])
+        assert outcome.qualifies_for_fee_waiver == bool(result.qualifies_for_fee_waiver[i])
+        assert outcome.above_median_calculated == bool(result.above_median_calculated[i])
+        if outcome.deductions is not None:
+            allowable = outcome.deductions.allowable_expenses
+            assert allowable == dollars(int(result.allowable_cents[i]))
+
+
+@pytest.fixture
+def district(db):
+    district = District.objects.create(
+        code="ilnd",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court for the Northern District of Illinois",
+        filing_fee_chapter_7=Decimal("338.00"),
+    )
+    MedianIncome.objects.create(
+        district=district,
+        effective_date=MEDIANS.effective_date,
+        **{f"family_size_{size}": amount for size, amount in enumerate(MEDIANS.sizes, start=1)},
+        family_size_additional=MEDIANS.additional,
+    )
+    return district
+
+
+def _session(district, name, months=None, household_size=None, expenses=True):
+    session = IntakeSession.objects.create(
+        user=User.objects.create_user(username=name, password="pass"), district=district
+    )
+    if months is not None:
+        IncomeInfo.objects.create(
+            session=session, marital_status="single", number_of_dependents=1, monthly_income=months
+        )
+    if household_size is not None:
+        DebtorInfo.objects.create(
+            session=session,
+            first_name="Pat",
+            last_name="Doe",
+            ssn="123-45-6789",
+            date_of_birth=date(1950, 1, 1),
+            street_address="1 Main St",
+            city="Chicago",
+            state="IL",
+            zip_code="60601",
+            household_size=household_size,
+        )
+    if expenses:
+        ExpenseInfo.objects.create(
+            session=session,
+            rent_or_mortgage=Decimal("2500"),
+            food_and_groceries=Decimal("400"),
+            medical_expenses=Decimal("900"),
+            vehicle_payment=Decimal("100"),
+        )
+    DebtInfo.objects.create(
+        session=session,
+        creditor_name="IRS",
+        amount_owed=Decimal("8000"),
+        is_secured=False,
+        is_priority=True,
+        debt_type="taxes",
+        monthly_payment=Decimal("150.50"),
+    )
+    return session
+
+
+def test_load_inputs_many_matches_load_inputs(district, django_assert_num_queries):
+    sessions = [
+        _session(district, "high", [9000] * 6, household_size=3),
+        _session(district, "low", [1200] * 6, expenses=False),
+        _session(district, "short", [1200] * 5),
+        _session(district, "none"),
+    ]
+    load_inputs(sessions[0], AS_OF)  # warms the standards catalog
+
+    with django_assert_num_queries(2):
+        loaded = load_inputs_many(IntakeSession.objects.all(), AS_OF)
+
+    for session in sessions[:2]:
+        assert loaded[session.pk] == load_inputs(session, AS_OF)
+    assert loaded[sessions[0].pk].under_65 is False
+    assert loaded[sessions[0].pk].priority_debts_monthly == Decimal("150.50")
+    for session in sessions[2:]:
+        with pytest.raises(ValueError) as expected:
+            load_inputs(session, AS_OF)
+        assert str(loaded[session.pk]) == str(expected.value)
+
+
+def test_means_test_model_stores_kernel_outcome(district):
+    session = _session(district, "model", [9000] * 6, household_size=3)
+    means = MeansTest(session=session, district=district)
+    means.calculate(as_of=AS_OF)
+
+    outcome = means_test(load_inputs(session, AS_OF))
+    assert means.passes_means_test == outcome.passes_means_test
+    assert means.calculated_cmi == outcome.cmi
+    assert means.median_income_threshold == MEDIANS.median(3)
+    assert means.above_median_calculated is False  # $108,000 < $110,712
+    details = means.get_calculation_details()
+    assert details["family_size"] == 3
+    assert details["median_income_effective_date"] == "2024-11-01"
@@ -0,0 +1,110 @@
+"""Tests for the HHS poverty guideline table and the fee waiver income test."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from apps.eligibility.services import poverty_guidelines
+from apps.eligibility.services.poverty_guidelines import (
+    BASIS_BENEFITS,
+    BASIS_INCOME,
+    BASIS_NONE,
+    GUIDELINE_TABLE,
+    GUIDELINES,
+    REGION_ALASKA,
+    REGION_CONTIGUOUS,
+    REGION_HAWAII,
+    fee_waiver_test,
+    guideline_for,
+    guideline_year,
+    guidelines_outdated,
+    region_for_state,
+)
+
+
+@pytest.mark.parametrize(("effective", "regions"), GUIDELINES.items())
+def test_precomputed_thresholds_match_the_published_formula(effective, regions):
+    for region, (base, increment) in regions.items():
+        guideline = GUIDELINE_TABLE[(effective.year, region)]
+        for size in range(1, 13):
+            annual = Decimal(base) + Decimal(increment) * (size - 1)
+            assert guideline.poverty_line(size) == annual
+            assert guideline.monthly_threshold(size) == annual * Decimal("1.5") / 12
+
+
+def test_2024_thresholds():
+    assert GUIDELINE_TABLE[(2024, REGION_CONTIGUOUS)].monthly_threshold(1) == Decimal("1882.50")
+    assert GUIDELINE_TABLE[(2024, REGION_CONTIGUOUS)].monthly_threshold(4) == Decimal("3900.00")
+    assert GUIDELINE_TABLE[(2024, REGION_ALASKA)].monthly_threshold(1) == Decimal("2351.25")
+    assert GUIDELINE_TABLE[(2024, REGION_HAWAII)].monthly_threshold(1) == Decimal("2163.75")
+
+
+@pytest.mark.parametrize(
+    ("state", "region"),
+    [
+        ("AK", REGION_ALASKA),
+        ("hi", REGION_HAWAII),
+        ("IL", REGION_CONTIGUOUS),
+        ("DC", REGION_CONTIGUOUS),
+        (None, REGION_CONTIGUOUS),
+    ],
+)
+def test_region_for_state(state, region):
+    assert region_for_state(state) == region
+
+
+@pytest.mark.parametrize(
+    ("as_of", "year"),
+    [
+        (date(2020, 6, 1), 2023),  # before the table: earliest release
+        (date(2024, 1, 16), 2023),  # published mid-January
+        (date(2024, 1, 17), 2024),
+        (date(2025, 12, 31), 2025),
+        (date(2026, 1, 15), 2026),
+        (date(2030, 1, 1), max(GUIDELINES).year),  # latest release stays in force
+    ],
+)
+def test_guideline_year(as_of, year):
+    assert guideline_year(as_of) == year
+    assert guideline_for("IL", as_of).year == year
+
+
+def test_2026_thresholds():
+    assert GUIDELINE_TABLE[(2026, REGION_CONTIGUOUS)].poverty_line(4) == Decimal("33000")
+    assert GUIDELINE_TABLE[(2026, REGION_ALASKA)].poverty_line(4) == Decimal("41250")
+    assert GUIDELINE_TABLE[(2026, REGION_HAWAII)].poverty_line(4) == Decimal("37950")
+
+
+def test_date_more_than_a_year_past_the_table_is_flagged(caplog):
+    latest = max(GUIDELINES)
+    poverty_guidelines._warn_outdated.cache_clear()
+    assert not guidelines_outdated(latest.replace(year=latest.year + 1))
+
+    past = date(latest.year + 1, 12, 1)
+    with caplog.at_level("WARNING", logger=poverty_guidelines.__name__):
+        guideline_for("IL", past)
+        guideline_for("IL", past)  # once per year, not per lookup
+
+    assert guidelines_outdated(past)
+    assert [r.getMessage() for r in caplog.records] == [
+        f"No HHS poverty guidelines newer than {latest.isoformat()} for {past.year}; "
+        "add the current release to GUIDELINES"
+    ]
+
+
+def test_fee_waiver_test_is_strict_and_benefits_win():
+    guideline = guideline_for("IL", date(2024, 6, 1))
+
+    assert fee_waiver_test(guideline, 1, Decimal("1882.49")).basis == BASIS_INCOME
+    assert fee_waiver_test(guideline, 1, Decimal("1882.50")).basis == BASIS_NONE
+    assert not fee_waiver_test(guideline, 1, Decimal("1882.50")).qualifies
+    benefits = fee_waiver_test(guideline, 1, Decimal("9000"), receives_public_benefits=True)
+    assert benefits.basis == BASIS_BENEFITS and benefits.qualifies
+
+
+def test_household_size_below_one_counts_as_one():
+    guideline = guideline_for("IL", date(2024, 6, 1))
+    evaluation = fee_waiver_test(guideline, 0, Decimal("0"))
+    assert evaluation.household_size == 1
+    assert evaluation.threshold_monthly == Decimal("1882.50")
@@ -0,0 +1,328 @@
+"""Tests for the effective-dated standards catalog and its importers."""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import openpyxl
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from apps.districts.models import District, MedianIncome
+from apps.eligibility.models import IRSStandardsRelease, StandardsVersion
+from apps.eligibility.services.irs_standards import get_local_standard, get_national_standard
+from apps.eligibility.services.standards import (
+    BUILTIN_IRS_STANDARDS,
+    current_version,
+    get_catalog,
+    warm,
+)
+from apps.eligibility.services.standards_import import StandardsImportError, parse_irs_release
+
+IRS_CSV = (
+    "table,district,family_size,amount\n"
+    + "".join(
+        f"{table},,{size},{base + 10 * size}\n"
+        for table, base in (
+            ("food", 740),
+            ("health_care_under_65", 70),
+            ("health_care_65_plus", 160),
+        )
+        for size in range(1, 6)
+    )
+    + """housing,ilnd,1,1800
+housing,ilnd,2,2100
+transport_operating,ILND,,300
+"""
+)
+
+MEDIAN_CSV = """district,family_size_1,family_size_2,family_size_3,family_size_4,\
+family_size_5,family_size_6,family_size_7,family_size_8,family_size_additional
+ILND,"80,000",95000,110000,130000,140000,150000,160000,170000,12000
+"""
+
+
+def _medians(district, effective_date, base):
+    return MedianIncome.objects.create(
+        district=district,
+        effective_date=effective_date,
+        **{f"family_size_{size}": Decimal(base + size) for size in range(1, 9)},
+    )
+
+
+@pytest.fixture
+def district(db):
+    return District.objects.create(
+        code="ilnd",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court for the Northern District of Illinois",
+        filing_fee_chapter_7=Decimal("338.00"),
+    )
+
+
+def test_builtin_release_matches_hardcoded_tables():
+    for size in range(1, 7):
+        assert BUILTIN_IRS_STANDARDS.national_standard("food", size) == get_national_standard(
+            "food", size
+        )
+        assert BUILTIN_IRS_STANDARDS.local_standard("ilnd", "housing", size) == get_local_standard(
+            "ILND", "housing", size
+        )
+    assert BUILTIN_IRS_STANDARDS.national_standard("health_care", 1, age_under_65=False) == Decimal(
+        "164"
+    )
+    assert BUILTIN_IRS_STANDARDS.local_standard("ILND", "transport_owned", 3) is None
+    assert BUILTIN_IRS_STANDARDS.local_standard("NYSD", "housing", 1) is None
+
+
+def test_median_table_resolves_by_effective_date(district):
+    _medians(district, date(2024, 4, 1), 1000)
+    _medians(district, date(2025, 4, 1), 2000)
+    catalog = get_catalog()
+
+    assert catalog.median_income("ilnd", 1, date(2024, 1, 1)) == Decimal("1001")  # earliest
+    assert catalog.median_income("ILND", 1, date(2025, 3, 31)) == Decimal("1001")
+    assert catalog.median_income("ilnd", 1, date(2025, 4, 1)) == Decimal("2001")
+    assert catalog.median_income("ilnd", 10, date(2025, 4, 1)) == Decimal("2008") + 2 * Decimal(
+        "9900"
+    )
+    assert catalog.median_table("nysd") is None
+
+
+def test_warm_catalog_answers_without_queries(district):
+    _medians(district, date(2024, 4, 1), 1000)
+    get_catalog()
+    with CaptureQueriesContext(connection) as ctx:
+        for size in range(1, 12):
+            get_catalog().median_income("ilnd", size)
+            get_catalog().irs().national_standard("food", size)
+    assert len(ctx.captured_queries) == 0
+
+
+@override_settings(STANDARDS_RELOAD_CHECK_SECONDS=3600)
+def test_table_change_bumps_version_and_reloads(district, django_capture_on_commit_callbacks):
+    _medians(district, date(2024, 4, 1), 1000)
+    before = get_catalog()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _medians(district, date(2025, 4, 1), 2000)
+
+    after = get_catalog()
+    assert after is not before
+    assert after.version > before.version
+    assert after.median_income("ilnd", 1, date(2025, 5, 1)) == Decimal("2001")
+
+
+@override_settings(STANDARDS_RELOAD_CHECK_SECONDS=3600)
+def test_median_change_patches_only_that_district(district, django_capture_on_commit_callbacks):
+    other = District.objects.create(
+        code="nysd",
+        name="Southern District of New York",
+        state="NY",
+        court_name="SDNY",
+        filing_fee_chapter_7=Decimal("338.00"),
+    )
+    _medians(district, date(2024, 4, 1), 1000)
+    _medians(other, date(2024, 4, 1), 5000)
+    before = warm()
+
+    with (
+        CaptureQueriesContext(connection) as ctx,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        row = _medians(district, date(2025, 4, 1), 2000)
+    # Insert, version bump and read, then the district's code and rows: no full reload.
+    assert not any("irs_local_standards" in q["sql"] for q in ctx.captured_queries)
+
+    with CaptureQueriesContext(connection) as ctx:
+        after = get_catalog()
+    assert len(ctx.captured_queries) == 0
+    assert after.version == before.version + 1
+    assert after.local is before.local and after.irs() is before.irs()
+    assert after.median_income("ilnd", 1, date(2025, 5, 1)) == Decimal("2001")
+    assert after.median_income("ilnd", 1, date(2024, 5, 1)) == Decimal("1001")  # history kept
+    assert after.median_income("nysd", 1) == Decimal("5001")
+    assert before.median_income("ilnd", 1, date(2025, 5, 1)) == Decimal("1001")  # immutable
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row.delete()
+        MedianIncome.objects.filter(district=district).delete()
+    assert get_catalog().median_table("ilnd") is None
+    assert get_catalog().median_income("nysd", 1) == Decimal("5001")
+
+
+@override_settings(STANDARDS_RELOAD_CHECK_SECONDS=3600)
+def test_median_change_drops_a_catalog_that_missed_other_changes(
+    district, django_capture_on_commit_callbacks
+):
+    _medians(district, date(2024, 4, 1), 1000)
+    stale = get_catalog()
+    # Another worker changed some table; this process has not noticed yet.
+    StandardsVersion.objects.filter(pk=1).update(version=stale.version + 5)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _medians(district, date(2025, 4, 1), 2000)
+
+    fresh = get_catalog()
+    assert fresh is not stale
+    assert fresh.version == stale.version + 6
+    assert fresh.median_income("ilnd", 1, date(2025, 5, 1)) == Decimal("2001")
+
+
+@override_settings(STANDARDS_RELOAD_CHECK_SECONDS=3600)
+def test_rolled_back_median_change_leaves_the_catalog_alone(
+    district, django_capture_on_commit_callbacks
+):
+    _medians(district, date(2024, 4, 1), 1000)
+    before = warm()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with pytest.raises(RuntimeError), transaction.atomic():
+            _medians(district, date(2025, 4, 1), 2000)
+            raise RuntimeError("rolled back")
+
+    assert callbacks == []
+    after = get_catalog()
+    assert after is before
+    assert after.version == current_version()
+    assert after.median_income("ilnd", 1, date(2025, 5, 1)) == Decimal("1001")
+
+
+def test_model_median_matches_catalog(district):
+    row = _medians(district, date(2024, 4, 1), 1000)
+    catalog = get_catalog()
+    for size in range(1, 12):
+        assert row.get_median_income(size) == catalog.median_income("ilnd", size)
+    with pytest.raises(ValueError):
+        row.get_median_income(0)
+
+
+def test_other_worker_reloads_after_check_interval(district):
+    _medians(district, date(2024, 4, 1), 1000)
+    with override_settings(STANDARDS_RELOAD_CHECK_SECONDS=3600):
+        stale = get_catalog()
+        # Another worker bumps the version: this process keeps its catalog...
+        StandardsVersion.objects.update_or_create(pk=1, defaults={"version": stale.version + 1})
+        assert get_catalog() is stale
+    # ...until its next version check.
+    with override_settings(STANDARDS_RELOAD_CHECK_SECONDS=0):
+        assert get_catalog().version == stale.version + 1
+
+
+def test_imported_release_applies_from_its_effective_date(district, tmp_path):
+    path = tmp_path / "irs_2025.csv"
+    path.write_text(IRS_CSV)
+    out = StringIO()
+    call_command("import_irs_standards", str(path), "--effective-date", "2025-04-01", stdout=out)
+    assert "1 districts" in out.getvalue()
+
+    release = IRSStandardsRelease.objects.get()
+    assert release.source == "irs_2025.csv"
+    catalog = get_catalog()
+    old, new = catalog.irs(date(2025, 3, 31)), catalog.irs(date(2025, 4, 1))
+    assert old is not new
+    assert old.national_standard("food", 1) == Decimal("713")
+    assert new.national_standard("food", 1) == Decimal("750")
+    assert new.national_standard("food", 7) == Decimal("790")
+    assert new.national_standard("health_care", 1, age_under_65=False) == Decimal("170")
+    assert new.local_standard("ilnd", "housing", 2) == Decimal("2100")
+    assert new.local_standard("ilnd", "transport_operating") == Decimal("300")
+
+    # Re-importing the same date replaces the release.
+    path.write_text(IRS_CSV.replace("food,,1,750", "food,,1,760"))
+    call_command("import_irs_standards", str(path), "--effective-date", "2025-04-01", stdout=out)
+    assert IRSStandardsRelease.objects.count() == 1
+    assert get_catalog().irs(date(2025, 4, 1)).national_standard("food", 1) == Decimal("760")
+
+
+def test_import_median_incomes_command(district, tmp_path):
+    _medians(district, date(2024, 4, 1), 1000)
+    path = tmp_path / "medians.csv"
+    path.write_text(MEDIAN_CSV)
+    out = StringIO()
+    call_command("import_median_incomes", str(path), "--effective-date", "2025-04-01", stdout=out)
+
+    assert "1 district(s)" in out.getvalue()
+    assert MedianIncome.objects.filter(district=district).count() == 2
+    catalog = get_catalog()
+    assert catalog.median_income("ilnd", 1, date(2025, 4, 2)) == Decimal("80000")
+    assert catalog.median_income("ilnd", 9, date(2025, 4, 2)) == Decimal("182000")
+    assert catalog.median_income("ilnd", 1, date(2024, 6, 1)) == Decimal("1001")
+
+
+def test_import_xlsx(district, tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for line in MEDIAN_CSV.replace('"80,000"', "80000").strip().splitlines():
+        sheet.append(line.split(","))
+    path = tmp_path / "medians.xlsx"
+    workbook.save(path)
+
+    call_command(
+        "import_median_incomes", str(path), "--effective-date", "2025-04-01", stdout=StringIO()
+    )
+    assert get_catalog().median_income("ilnd", 2, date(2025, 4, 2)) == Decimal("95000")
+
+
+def test_import_rejects_malformed_files(district, tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("table,district,family_size,amount\nfuel,,1,10\n")
+    with pytest.raises(CommandError, match="unknown table"):
+        call_command("import_irs_standards", str(path), "--effective-date", "2025-04-01")
+
+    path.write_text(MEDIAN_CSV.replace("ILND", "NYSD"))
+    with pytest.raises(CommandError, match="unknown district"):
+        call_command("import_median_incomes", str(path), "--effective-date", "2025-04-01")
+    assert not IRSStandardsRelease.objects.exists()
+    assert not MedianIncome.objects.exists()
+
+    with pytest.raises(StandardsImportError, match="family sizes 1..5"):
+        parse_irs_release(
+            [
+                {"table": table, "district": "", "family_size": "1", "amount": "1"}
+                for table in ("food", "health_care_under_65", "health_care_65_plus")
+            ]
+        )
+    with pytest.raises(StandardsImportError, match="no rows for"):
+        parse_irs_release([{"table": "food", "district": "", "family_size": "1", "amount": "1"}])
+    with pytest.raises(StandardsImportError, match="not an amount"):
+        parse_irs_release([{"table": "food", "district": "", "family_size": "1", "amount": "n/a"}])
+
+
+def test_means_test_uses_table_in_force_on_as_of(district):
+    from django.contrib.auth import get_user_model
+
+    from apps.eligibility.services import MeansTestCalculator
+    from apps.intake.models import DebtorInfo, IncomeInfo, IntakeSession
+
+    _medians(district, date(2024, 4, 1), 100000)
+    _medians(district, date(2025, 4, 1), 10000)
+    user = get_user_model().objects.create_user(username="asof", password="pass")
+    session = IntakeSession.objects.create(user=user, district=district)
+    DebtorInfo.objects.create(
+        session=session,
+        first_name="A",
+        last_name="B",
+        ssn="123-45-6789",
+        date_of_birth=date(1980, 1, 1),
+        phone="555-555-5555",
+        email="a@example.com",
+        street_address="1 Main St",
+        city="Chicago",
+        state="IL",
+        zip_code="60601",
+    )
+    IncomeInfo.objects.create(
+        session=session, marital_status="single", number_of_dependents=0, monthly_income=[5000] * 6
+    )
+
+    early = MeansTestCalculator(session, as_of=date(2024, 6, 1)).calculate()
+    assert early["passes_means_test"]
+    assert early["median_income_threshold"] == Decimal("100001")
+    late = MeansTestCalculator(session, as_of=date(2025, 6, 1)).calculate()
+    assert not late["passes_means_test"]
+    assert late["median_income_threshold"] == Decimal("10001")
+    assert late["details"]["median_income_effective_date"] == "2025-04-01"
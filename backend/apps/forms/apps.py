@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class FormsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.forms"
+
+    def ready(self):
+        from .services import session_summary
+
+        session_summary.connect_signals()
@@ -14,6 +14,8 @@ from datetime import date
 from decimal import Decimal
 from functools import reduce
 
+from django.db.models import prefetch_related_objects
+
 from apps.intake.models import IntakeSession
 
 _ZERO = Decimal("0.00")
@@ -65,8 +67,39 @@ def _fmt(d: Decimal) -> str:
     return str(d.quantize(_TWO_PLACES))
 
 
-def _sum_encrypted(queryset, field_name: str) -> Decimal:
-    return reduce(lambda acc, obj: acc + (getattr(obj, field_name) or _ZERO), queryset, _ZERO)
+def _sum_encrypted(rows, field_name: str) -> Decimal:
+    return reduce(lambda acc, obj: acc + (getattr(obj, field_name) or _ZERO), rows, _ZERO)
+
+
+def _session_rows(session: IntakeSession, related_name: str) -> list:
+    """
+    The session's ``assets`` or ``debts``, loaded once per session instance.
+
+    The totals below filter these in Python, so a form with a dozen totals
+    (and every generator handed the same session) shares one query per
+    collection instead of issuing one per total.
+    """
+    prefetch_related_objects([session], related_name)
+    return list(getattr(session, related_name).all())
+
+
+def _asset_total(session: IntakeSession, include=None, exclude=None) -> str:
+    rows = [
+        asset
+        for asset in _session_rows(session, "assets")
+        if (include is None or asset.asset_type == include)
+        and (exclude is None or asset.asset_type != exclude)
+    ]
+    return _fmt(_sum_encrypted(rows, "current_value"))
+
+
+def _debt_total(session: IntakeSession, **flags: bool) -> str:
+    rows = [
+        debt
+        for debt in _session_rows(session, "debts")
+        if all(getattr(debt, flag) == value for flag, value in flags.items())
+    ]
+    return _fmt(_sum_encrypted(rows, "amount_owed"))
 
 
 # ---------------------------------------------------------------------------
@@ -75,80 +108,47 @@ def _sum_encrypted(queryset, field_name: str) -> Decimal:
 
 
 def _total_real_property(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session, asset_type="real_property")
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session, include="real_property")
 
 
 def _total_personal_property(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session).exclude(asset_type="real_property")
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session, exclude="real_property")
 
 
 def _total_assets(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session)
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session)
 
 
 def _total_secured_debts(session: IntakeSession) -> str:
-    from apps.intake.models import DebtInfo
-
-    qs = DebtInfo.objects.filter(session=session, is_secured=True)
-    return _fmt(_sum_encrypted(qs, "amount_owed"))
+    return _debt_total(session, is_secured=True)
 
 
 def _total_priority_unsecured(session: IntakeSession) -> str:
-    from apps.intake.models import DebtInfo
-
-    qs = DebtInfo.objects.filter(session=session, is_secured=False, is_priority=True)
-    return _fmt(_sum_encrypted(qs, "amount_owed"))
+    return _debt_total(session, is_secured=False, is_priority=True)
 
 
 def _total_nonpriority_unsecured(session: IntakeSession) -> str:
-    from apps.intake.models import DebtInfo
-
-    qs = DebtInfo.objects.filter(session=session, is_secured=False, is_priority=False)
-    return _fmt(_sum_encrypted(qs, "amount_owed"))
+    return _debt_total(session, is_secured=False, is_priority=False)
 
 
 def _total_unsecured_debts(session: IntakeSession) -> str:
-    from apps.intake.models import DebtInfo
-
-    qs = DebtInfo.objects.filter(session=session, is_secured=False)
-    return _fmt(_sum_encrypted(qs, "amount_owed"))
+    return _debt_total(session, is_secured=False)
 
 
 def _total_debts(session: IntakeSession) -> str:
-    from apps.intake.models import DebtInfo
-
-    qs = DebtInfo.objects.filter(session=session)
-    return _fmt(_sum_encrypted(qs, "amount_owed"))
+    return _debt_total(session)
 
 
 def _total_bank_accounts(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session, asset_type="bank_account")
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session, include="bank_account")
 
 
 def _total_retirement_accounts(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session, asset_type="retirement_account")
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session, include="retirement_account")
 
 
 def _total_other_assets(session: IntakeSession) -> str:
-    from apps.intake.models import AssetInfo
-
-    qs = AssetInfo.objects.filter(session=session, asset_type="other")
-    return _fmt(_sum_encrypted(qs, "current_value"))
+    return _asset_total(session, include="other")
 
 
 def _cmi(session: IntakeSession) -> str:
@@ -271,21 +271,23 @@ def _line12b_annualized_cmi(session: IntakeSession) -> str:
 
 
 def _line13a_median_income(session: IntakeSession) -> str:
-    from apps.districts.models import MedianIncome
+    from apps.eligibility.services.means_test_kernel import derive_family_size
+    from apps.eligibility.services.standards import get_catalog
 
     try:
         income_info = session.income_info
-        size = 1 + income_info.number_of_dependents
-        if income_info.marital_status in ("married_joint", "married_separate"):
-            size += 1
+        debtor_info = getattr(session, "debtor_info", None)
+        size = derive_family_size(
+            income_info.number_of_dependents,
+            income_info.marital_status,
+            debtor_info.household_size if debtor_info else None,
+        )
     except Exception:
         size = 1
-    median = (
-        MedianIncome.objects.filter(district=session.district).order_by("-effective_date").first()
-    )
+    median = get_catalog().median_income(session.district.code, size)
     if median is None:
         return "0.00"
-    return _fmt(median.get_median_income(size))
+    return _fmt(median)
 
 
 def _line13b_annualized_income(session: IntakeSession) -> str:
@@ -303,31 +305,27 @@ def _line13c_difference(session: IntakeSession) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _fee_waiver_household_size(session: IntakeSession) -> str:
-
+def _fee_waiver_evaluation(session: IntakeSession):
+    """The application's cached FeeWaiverEvaluation, or None without one."""
     try:
-        fw = session.fee_waiver
-        return str(fw.household_size)
+        return session.fee_waiver.evaluate()
     except Exception:
-        return "1"
+        return None
 
 
-def _fee_waiver_monthly_income(session: IntakeSession) -> str:
+def _fee_waiver_household_size(session: IntakeSession) -> str:
+    evaluation = _fee_waiver_evaluation(session)
+    return str(evaluation.household_size) if evaluation else "1"
 
-    try:
-        fw = session.fee_waiver
-        return _fmt(Decimal(str(fw.monthly_income)))
-    except Exception:
-        return "0.00"
 
+def _fee_waiver_monthly_income(session: IntakeSession) -> str:
+    evaluation = _fee_waiver_evaluation(session)
+    return _fmt(evaluation.monthly_income) if evaluation else "0.00"
 
-def _fee_waiver_monthly_expenses(session: IntakeSession) -> str:
 
-    try:
-        fw = session.fee_waiver
-        return _fmt(Decimal(str(fw.monthly_expenses)))
-    except Exception:
-        return "0.00"
+def _fee_waiver_monthly_expenses(session: IntakeSession) -> str:
+    evaluation = _fee_waiver_evaluation(session)
+    return _fmt(evaluation.monthly_expenses) if evaluation else "0.00"
 
 
 # ---------------------------------------------------------------------------
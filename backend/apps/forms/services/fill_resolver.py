@@ -8,6 +8,8 @@ ingested/signature). This module resolves ``binding`` references; resolve()
 
 from __future__ import annotations
 
+from django.db.models import prefetch_related_objects
+
 from apps.forms.schema import FieldSpec, FormSchema
 from apps.forms.services.derivations import DERIVATIONS, PREDICATES
 from apps.intake.models import FormAnswer, IntakeSession
@@ -27,18 +29,25 @@ class RepeatOverflow(Exception):
         )
 
 
-def resolve_binding(binding: str, session: IntakeSession) -> str | list[str]:
+def resolve_binding(
+    binding: str, session: IntakeSession, answers: dict[tuple[str, str], str] | None = None
+) -> str | list[str]:
     """
     Resolve a schema ``binding``:
 
       - "answer:<form_type>.<key>" → the FormAnswer value, or "" if absent
       - "sofa.<collection>[].<attr>" → list of str over the collection
       - "sofa.<attr>" → scalar str on the SOFAReport
+
+    ``answers`` maps (form_type, field_key) to value for every FormAnswer of
+    the session; ``resolve`` loads it once so answer bindings cost no query.
     """
     binding = binding.strip()
 
     if binding.startswith("answer:"):
         form_type, _, key = binding[len("answer:") :].partition(".")
+        if answers is not None:
+            return answers.get((form_type, key), "")
         ans = FormAnswer.objects.filter(session=session, form_type=form_type, field_key=key).first()
         return ans.value if ans else ""
 
@@ -67,7 +76,10 @@ def _section_applies(
 
 
 def _scalar_value(
-    field: FieldSpec, session: IntakeSession, ingested_cache: dict | None = None
+    field: FieldSpec,
+    session: IntakeSession,
+    ingested_cache: dict | None = None,
+    answers: dict[tuple[str, str], str] | None = None,
 ) -> str | None:
     if field.source == "constant":
         return field.value
@@ -79,7 +91,7 @@ def _scalar_value(
     if field.source == "asked":
         if not field.binding:
             raise RuntimeError(f"Field {field.pdf_field} has source='asked' but no binding")
-        val = resolve_binding(field.binding, session)
+        val = resolve_binding(field.binding, session, answers)
         return val if isinstance(val, str) else None
     if field.source in ("ingested", "db_aggregate"):
         if not field.ingest_key:
@@ -117,14 +129,16 @@ def resolve(schema: FormSchema, session: IntakeSession) -> dict[str, str]:
         agg.ingest_key: agg.value for agg in IngestedAggregate.objects.filter(session=session)
     }
 
-    # Prefetch SOFAReport collections to avoid N+1 in repeat group resolution
+    # Prefetch SOFAReport collections so each repeat column reads the cache
     report = getattr(session, "sofa_report", None)
     if report is not None:
-        _ = list(report.prior_income.all())
-        _ = list(report.creditor_payments.all())
+        prefetch_related_objects([report], "prior_income", "creditor_payments")
 
-    # Batch-fetch all FormAnswer rows for this session once (avoids per-predicate DB hits)
-    _form_answers = {(fa.field_key): fa for fa in FormAnswer.objects.filter(session=session)}
+    # Batch-fetch all FormAnswer rows for this session once (avoids per-predicate
+    # and per-binding DB hits)
+    _all_answers = list(FormAnswer.objects.filter(session=session))
+    _form_answers = {fa.field_key: fa for fa in _all_answers}
+    _answers = {(fa.form_type, fa.field_key): fa.value for fa in _all_answers}
 
     # Non-repeat fields
     for f in schema.fields:
@@ -135,7 +149,9 @@ def resolve(schema: FormSchema, session: IntakeSession) -> dict[str, str]:
         # UPL guard: legal_review fields fill only from an explicit asked answer
         if f.legal_review and f.source != "asked":
             continue
-        emitted = _emit(f, _scalar_value(f, session, ingested_cache=_ingested_cache))
+        emitted = _emit(
+            f, _scalar_value(f, session, ingested_cache=_ingested_cache, answers=_answers)
+        )
         if emitted is not None:
             out[f.pdf_field] = emitted
 
@@ -148,7 +164,7 @@ def resolve(schema: FormSchema, session: IntakeSession) -> dict[str, str]:
     for group_name, fields in groups.items():
         capacity = fields[0].repeat_capacity or 0
         resolved_cols = {
-            f.pdf_field: resolve_binding(f.binding, session) for f in fields if f.binding
+            f.pdf_field: resolve_binding(f.binding, session, _answers) for f in fields if f.binding
         }
         actual = max(
             (len(v) for v in resolved_cols.values() if isinstance(v, list)),
@@ -166,7 +182,9 @@ def resolve(schema: FormSchema, session: IntakeSession) -> dict[str, str]:
                     if emitted is not None:
                         out[f.pdf_field] = emitted
             else:
-                emitted = _emit(f, _scalar_value(f, session, ingested_cache=_ingested_cache))
+                emitted = _emit(
+                    f, _scalar_value(f, session, ingested_cache=_ingested_cache, answers=_answers)
+                )
                 if emitted is not None:
                     out[f.pdf_field] = emitted
 
@@ -10,6 +10,10 @@ Qualification paths:
   2. Receives means-tested public benefits (SSI, SNAP, TANF) → qualifies
   3. Cannot pay in full or installments → may qualify (court discretion)
 
+Paths 1 and 2 come from ``FeeWaiverApplication.evaluate()`` (see
+``apps.eligibility.services.poverty_guidelines``), the same cached
+evaluation the ``fee_waiver_*`` PDF derivations read.
+
 Official form: form_b103b.pdf
 """
 
@@ -18,6 +22,7 @@ from decimal import ROUND_HALF_UP, Decimal
 from functools import reduce
 from typing import Any
 
+from apps.eligibility.services.poverty_guidelines import BASIS_BENEFITS, BASIS_INCOME
 from apps.intake.models import (
     AssetInfo,
     DebtInfo,
@@ -32,11 +37,6 @@ _ZERO = Decimal("0.00")
 _TWO_PLACES = Decimal("0.01")
 BANK_ACCOUNT_TYPE = "bank_account"
 
-# Qualification basis identifiers
-BASIS_INCOME = "income"
-BASIS_BENEFITS = "benefits"
-BASIS_NONE = "none"
-
 # UPL-compliant result messages (information, never advice)
 MSG_QUALIFIES_INCOME = (
     "Based on the information provided, your monthly income is below "
@@ -91,30 +91,13 @@ def _compute_total_debt(debts: list[DebtInfo]) -> Decimal:
     ).quantize(_TWO_PLACES, rounding=ROUND_HALF_UP)
 
 
-def _determine_qualification_basis(fee_waiver: FeeWaiverApplication) -> str:
-    """
-    Determine which path qualifies the applicant for a fee waiver.
-
-    Returns BASIS_BENEFITS if public benefits, BASIS_INCOME if income
-    is below 150% poverty line, or BASIS_NONE if neither applies.
-    Benefits check takes precedence (strongest qualification path).
-    """
-    if fee_waiver.receives_public_benefits:
-        return BASIS_BENEFITS
-    if fee_waiver.monthly_income < fee_waiver.get_poverty_threshold():
-        return BASIS_INCOME
-    return BASIS_NONE
-
-
 def _get_result_message(basis: str, filing_fee: Decimal) -> str:
     """Return UPL-compliant result message based on qualification basis."""
-    match basis:
-        case "income":
-            return MSG_QUALIFIES_INCOME
-        case "benefits":
-            return MSG_QUALIFIES_BENEFITS
-        case _:
-            return MSG_DOES_NOT_QUALIFY.replace("${fee}", str(filing_fee.quantize(_TWO_PLACES)))
+    if basis == BASIS_INCOME:
+        return MSG_QUALIFIES_INCOME
+    if basis == BASIS_BENEFITS:
+        return MSG_QUALIFIES_BENEFITS
+    return MSG_DOES_NOT_QUALIFY.replace("${fee}", str(filing_fee.quantize(_TWO_PLACES)))
 
 
 def _build_form_103b_data(
@@ -242,13 +225,14 @@ class Form103BGenerator:
         debtor_name = self._get_debtor_name()
         filing_fee = self._get_filing_fee()
 
-        qualification_basis = _determine_qualification_basis(fee_waiver)
+        evaluation = fee_waiver.evaluate()
+        qualification_basis = evaluation.basis
 
         return _build_form_103b_data(
             debtor_name=debtor_name,
-            household_size=fee_waiver.household_size,
-            monthly_income=fee_waiver.monthly_income,
-            monthly_expenses=fee_waiver.monthly_expenses,
+            household_size=evaluation.household_size,
+            monthly_income=evaluation.monthly_income,
+            monthly_expenses=evaluation.monthly_expenses,
             cash_and_bank_balances=_compute_cash_and_bank_balances(assets),
             total_property_value=_compute_total_property_value(assets),
             total_debt=_compute_total_debt(debts),
@@ -256,9 +240,9 @@ class Form103BGenerator:
             receives_benefits_or_disability=fee_waiver.receives_public_benefits,
             receives_public_benefits=fee_waiver.receives_public_benefits,
             benefit_types=fee_waiver.benefit_types,
-            qualifies_for_waiver=fee_waiver.qualifies_for_waiver(),
+            qualifies_for_waiver=evaluation.qualifies,
             qualification_basis=qualification_basis,
-            poverty_threshold_monthly=fee_waiver.get_poverty_threshold(),
+            poverty_threshold_monthly=evaluation.threshold_monthly,
             filing_fee=filing_fee,
             result_message=_get_result_message(qualification_basis, filing_fee),
             signature_date=date.today().isoformat(),
@@ -18,7 +18,8 @@ from decimal import ROUND_HALF_UP, Decimal
 from functools import reduce
 from typing import Any
 
-from apps.districts.models import MedianIncome
+from apps.eligibility.services.means_test_kernel import derive_family_size
+from apps.eligibility.services.standards import get_catalog
 from apps.intake.models import DebtInfo, IncomeInfo, IntakeSession
 
 # -- Constants --
@@ -105,32 +106,30 @@ def _compute_debt_classification(debts: list[DebtInfo]) -> dict[str, Decimal]:
 
 def _determine_household_size(session: IntakeSession) -> int:
     """
-    Derive household size from IncomeInfo: 1 (debtor) + spouse if married + dependents.
+    Household size exactly as the means test counts it (``derive_family_size``).
 
     Falls back to 1 if IncomeInfo is missing.
     """
     try:
         income_info: IncomeInfo = session.income_info
-        size = 1 + income_info.number_of_dependents
-        if income_info.marital_status in ("married_joint", "married_separate"):
-            size += 1
-        return size
     except IncomeInfo.DoesNotExist:
         return 1
+    debtor_info = getattr(session, "debtor_info", None)
+    return derive_family_size(
+        income_info.number_of_dependents,
+        income_info.marital_status,
+        debtor_info.household_size if debtor_info else None,
+    )
 
 
 def _get_median_income(session: IntakeSession, household_size: int) -> Decimal:
     """
-    Retrieve the most recent median income for the session's district and household size.
+    Retrieve the median income in force today for the session's district and household size.
 
     Returns ZERO if no MedianIncome record exists (graceful degradation).
     """
-    median = (
-        MedianIncome.objects.filter(district=session.district).order_by("-effective_date").first()
-    )
-    if median is None:
-        return ZERO
-    return median.get_median_income(household_size)
+    median = get_catalog().median_income(session.district.code, household_size)
+    return ZERO if median is None else median
 
 
 def _build_form_122a1_data(
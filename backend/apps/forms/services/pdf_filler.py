@@ -15,6 +15,9 @@ from pathlib import Path
 import pypdf
 from django.conf import settings
 
+from config.metrics import PDF_RENDER_SECONDS
+from config.perf import timed
+
 # Maps form_type key → filename under PDF_FORMS_DIRECTORY
 FORM_TEMPLATES: dict[str, str] = {
     "form_101": "form_b_101_0624_fillable_clean.pdf",
@@ -41,6 +44,7 @@ FORM_TEMPLATES: dict[str, str] = {
 class PDFFormFiller:
     """Fill AO court PDF templates with field values and return bytes."""
 
+    @timed("pdf_fill")
     def fill(self, form_type: str, field_map: dict[str, str]) -> bytes:
         """
         Load template for form_type, write field_map into every page, return PDF bytes.
@@ -57,15 +61,16 @@ class PDFFormFiller:
         filename = FORM_TEMPLATES[form_type]  # KeyError if unknown
         template_path = Path(settings.PDF_FORMS_DIRECTORY) / filename
 
-        reader = pypdf.PdfReader(str(template_path))
-        writer = pypdf.PdfWriter()
-        writer.append(reader)
+        with PDF_RENDER_SECONDS.labels(form_type).time():
+            reader = pypdf.PdfReader(str(template_path))
+            writer = pypdf.PdfWriter()
+            writer.append(reader)
 
-        # update_page_form_field_values fills matching fields on one page at a time.
-        # auto_regenerate=False keeps visual appearance stable across viewers.
-        for page in writer.pages:
-            writer.update_page_form_field_values(page, field_map, auto_regenerate=False)
+            # update_page_form_field_values fills matching fields on one page at a time.
+            # auto_regenerate=False keeps visual appearance stable across viewers.
+            for page in writer.pages:
+                writer.update_page_form_field_values(page, field_map, auto_regenerate=False)
 
-        buf = BytesIO()
-        writer.write(buf)
+            buf = BytesIO()
+            writer.write(buf)
         return buf.getvalue()
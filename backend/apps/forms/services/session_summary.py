@@ -0,0 +1,61 @@
+"""
+Generated forms on the session summary (``apps.intake.summaries``).
+
+The summary keeps ``[form id, form type, status]`` per form, newest first.
+"""
+
+from apps.intake import summaries
+
+from ..models import GeneratedForm
+
+
+def summarize(session_id: int) -> dict:
+    forms = (
+        GeneratedForm.objects.filter(session_id=session_id)
+        .order_by("-generated_at", "-id")
+        .values_list("id", "form_type", "status")
+    )
+    return {"forms": [list(form) for form in forms]}
+
+
+def _remember_form(sender, instance, **kwargs):
+    instance._summarized = [
+        instance.pk,
+        instance.__dict__.get("form_type"),
+        instance.__dict__.get("status"),
+    ]
+
+
+def _on_form_save(sender, instance, created, **kwargs):
+    entry = [instance.pk, instance.form_type, instance.status]
+    if not created and getattr(instance, "_summarized", None) == entry:
+        return  # regenerated or downloaded without a type or status change
+    instance._summarized = entry
+
+    def change(summary):
+        for i, form in enumerate(summary.forms):
+            if form[0] == instance.pk:
+                if form == entry:
+                    return False
+                summary.forms[i] = entry
+                return True
+        summary.forms.insert(0, entry)  # newest first
+        return True
+
+    summaries.edit(instance.session_id, ("forms",), change)
+
+
+def _on_form_delete(sender, instance, **kwargs):
+    def change(summary):
+        forms = [form for form in summary.forms if form[0] != instance.pk]
+        changed = len(forms) != len(summary.forms)
+        summary.forms = forms
+        return changed
+
+    summaries.edit(instance.session_id, ("forms",), change)
+
+
+def connect_signals() -> None:
+    """Attach the receivers; called from FormsConfig.ready."""
+    summaries.register(summarize)
+    summaries.connect(GeneratedForm, _on_form_save, _on_form_delete, _remember_form)
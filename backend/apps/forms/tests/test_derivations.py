@@ -99,3 +99,31 @@ def test_has_attorney_predicate():
         session=session, form_type="form_107", field_key="attorney_gate", value="yes"
     )
     assert PREDICATES["has_attorney"](session) is True
+
+
+@pytest.mark.django_db
+def test_totals_share_one_query_per_collection(session, django_assert_num_queries):
+    from apps.intake.models import AssetInfo, DebtInfo
+
+    for asset_type in ("real_property", "bank_account", "other"):
+        AssetInfo.objects.create(
+            session=session, asset_type=asset_type, description=asset_type, current_value=100
+        )
+    DebtInfo.objects.create(
+        session=session, creditor_name="Bank", debt_type="mortgage", amount_owed=50, is_secured=True
+    )
+    DebtInfo.objects.create(
+        session=session, creditor_name="Card", debt_type="credit_card", amount_owed=25
+    )
+    session = IntakeSession.objects.get(pk=session.pk)
+    totals = [name for name in DERIVATIONS if name.startswith("total_")]
+
+    with django_assert_num_queries(3):  # assets, debts and the expense row
+        values = {name: DERIVATIONS[name](session) for name in totals}
+
+    assert values["total_assets"] == "300.00"
+    assert values["total_real_property"] == "100.00"
+    assert values["total_personal_property"] == "200.00"
+    assert values["total_secured_debts"] == "50.00"
+    assert values["total_nonpriority_unsecured"] == "25.00"
+    assert values["total_debts"] == "75.00"
@@ -42,6 +42,13 @@ def test_resolve_answer_binding_missing_returns_empty(session):
     assert resolve_binding("answer:form_107.q9", session) == ""
 
 
+def test_resolve_answer_binding_reads_preloaded_answers(session, django_assert_num_queries):
+    answers = {("form_107", "q9"): "Yes"}
+    with django_assert_num_queries(0):
+        assert resolve_binding("answer:form_107.q9", session, answers) == "Yes"
+        assert resolve_binding("answer:form_107.q10", session, answers) == ""
+
+
 def test_resolve_collection_binding_returns_list(session):
     report = SOFAReport.objects.create(session=session, has_creditor_payments=True)
     SOFACreditorPayment.objects.create(
@@ -1,17 +1,22 @@
 """Tests for Form 103B (Application to Have the Chapter 7 Filing Fee Waived) generator."""
 
 from dataclasses import dataclass
-from datetime import date
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
 
 from apps.districts.models import District
-from apps.forms.services.form_103b_generator import (
+from apps.eligibility.services.poverty_guidelines import (
     BASIS_BENEFITS,
     BASIS_INCOME,
     BASIS_NONE,
+    GUIDELINE_TABLE,
+    REGION_CONTIGUOUS,
+    fee_waiver_test,
+)
+from apps.forms.services.form_103b_generator import (
     MSG_QUALIFIES_BENEFITS,
     MSG_QUALIFIES_INCOME,
     Form103BGenerationError,
@@ -21,7 +26,6 @@ from apps.forms.services.form_103b_generator import (
     _compute_cash_and_bank_balances,
     _compute_total_debt,
     _compute_total_property_value,
-    _determine_qualification_basis,
     _get_result_message,
 )
 from apps.intake.models import (
@@ -56,23 +60,9 @@ class _StubDebt:
     amount_owed: Decimal
 
 
-@dataclass(frozen=True)
-class _StubFeeWaiver:
-    """Minimal stub matching FeeWaiverApplication interface for pure tests."""
-
-    monthly_income: Decimal
-    receives_public_benefits: bool
-    household_size: int = 1
-
-    # HHS poverty guidelines constants (mirrored from model)
-    POVERTY_BASE_2024 = Decimal("15060")
-    POVERTY_INCREMENT = Decimal("5380")
-    POVERTY_MULTIPLIER = Decimal("1.5")
-    MONTHS_PER_YEAR = Decimal("12")
-
-    def get_poverty_threshold(self) -> Decimal:
-        annual = self.POVERTY_BASE_2024 + (self.POVERTY_INCREMENT * (self.household_size - 1))
-        return (annual * self.POVERTY_MULTIPLIER) / self.MONTHS_PER_YEAR
+# 2024 HHS guideline, 48 states: 150% of $15,060 / 12 = $1,882.50 for one person
+GUIDELINE_2024 = GUIDELINE_TABLE[(2024, REGION_CONTIGUOUS)]
+FILED_IN_2024 = datetime(2024, 6, 3, 15, 0, tzinfo=UTC)
 
 
 # -- DB fixture helpers --
@@ -123,9 +113,11 @@ def _create_fee_waiver(
     household_size: int = 1,
     receives_public_benefits: bool = False,
     benefit_types: list[str] | None = None,
+    filed_at: datetime | None = FILED_IN_2024,
 ) -> FeeWaiverApplication:
     return FeeWaiverApplication.objects.create(
         session=session,
+        filed_at=filed_at,
         household_size=household_size,
         monthly_income=monthly_income,
         monthly_expenses=monthly_expenses,
@@ -241,48 +233,34 @@ class TestComputeTotalDebt:
 
 
 class TestDetermineQualificationBasis:
-    """Unit tests for _determine_qualification_basis."""
+    """Unit tests for the qualification basis of the fee waiver evaluator."""
+
+    @staticmethod
+    def _basis(monthly_income: Decimal, receives_public_benefits: bool = False) -> str:
+        return fee_waiver_test(
+            GUIDELINE_2024, 1, monthly_income, receives_public_benefits=receives_public_benefits
+        ).basis
 
     def test_benefits_path(self):
         """Public benefits qualification takes precedence."""
-        stub = _StubFeeWaiver(
-            monthly_income=Decimal("5000.00"),  # Above poverty line
-            receives_public_benefits=True,
-        )
-        assert _determine_qualification_basis(stub) == BASIS_BENEFITS
+        assert self._basis(Decimal("5000.00"), receives_public_benefits=True) == BASIS_BENEFITS
 
     def test_income_path_zero_income(self):
         """$0 income is well below 150% poverty line."""
-        stub = _StubFeeWaiver(
-            monthly_income=Decimal("0.00"),
-            receives_public_benefits=False,
-        )
-        assert _determine_qualification_basis(stub) == BASIS_INCOME
+        assert self._basis(Decimal("0.00")) == BASIS_INCOME
 
     def test_income_path_below_threshold(self):
         """Income just below threshold qualifies."""
-        stub = _StubFeeWaiver(
-            monthly_income=Decimal("1882.00"),  # Just under $1882.50
-            receives_public_benefits=False,
-        )
-        assert _determine_qualification_basis(stub) == BASIS_INCOME
+        assert self._basis(Decimal("1882.00")) == BASIS_INCOME  # Just under $1882.50
 
     def test_none_path_above_threshold(self):
         """Income above 150% poverty line, no benefits → does not qualify."""
-        stub = _StubFeeWaiver(
-            monthly_income=Decimal("3000.00"),
-            receives_public_benefits=False,
-        )
-        assert _determine_qualification_basis(stub) == BASIS_NONE
+        assert self._basis(Decimal("3000.00")) == BASIS_NONE
 
     def test_income_at_exact_threshold_does_not_qualify(self):
         """Income AT exactly 150% poverty line does NOT qualify (must be below)."""
         # 150% of $15,060 / 12 = $1,882.50 for household of 1
-        stub = _StubFeeWaiver(
-            monthly_income=Decimal("1882.50"),
-            receives_public_benefits=False,
-        )
-        assert _determine_qualification_basis(stub) == BASIS_NONE
+        assert self._basis(Decimal("1882.50")) == BASIS_NONE
 
 
 class TestGetResultMessage:
@@ -520,6 +498,57 @@ class TestForm103BGeneratorIntegration:
         assert result["poverty_threshold_monthly"] == Decimal("3900.00")
         assert result["qualifies_for_waiver"] is True
 
+    def test_threshold_follows_filing_year(self):
+        """An application filed in 2025 is tested against the 2025 guidelines."""
+        user = User.objects.create_user(username="test_2025", password="test")
+        session = _create_session(user, _create_ilnd_district())
+        _create_fee_waiver(
+            session,
+            monthly_income=Decimal("1900.00"),
+            filed_at=datetime(2025, 3, 3, 15, 0, tzinfo=UTC),
+        )
+
+        result = Form103BGenerator(session).generate()
+
+        # 150% of $15,650 / 12 = $1,956.25
+        assert result["poverty_threshold_monthly"] == Decimal("1956.25")
+        assert result["qualifies_for_waiver"] is True
+
+    def test_alaska_district_uses_alaska_guideline(self):
+        """Alaska and Hawaii have their own, higher poverty guidelines."""
+        user = User.objects.create_user(username="test_ak", password="test")
+        district = District.objects.create(
+            code="akb",
+            name="District of Alaska",
+            state="AK",
+            court_name="U.S. Bankruptcy Court, District of Alaska",
+            filing_fee_chapter_7=Decimal("338.00"),
+        )
+        session = _create_session(user, district)
+        _create_fee_waiver(session, monthly_income=Decimal("2000.00"))
+
+        result = Form103BGenerator(session).generate()
+
+        # 150% of $18,810 / 12 = $2,351.25
+        assert result["poverty_threshold_monthly"] == Decimal("2351.25")
+        assert result["qualification_basis"] == BASIS_INCOME
+
+    def test_generator_and_derivations_share_one_evaluation(self):
+        """The PDF derivations read the evaluation the generator used."""
+        from apps.forms.services.derivations import DERIVATIONS
+
+        user = User.objects.create_user(username="test_shared", password="test")
+        session = _create_session(user, _create_ilnd_district())
+        _create_fee_waiver(session, household_size=3, monthly_income=Decimal("1234.5"))
+
+        Form103BGenerator(session).generate()
+        evaluation = session.fee_waiver.evaluate()
+
+        assert session.fee_waiver.evaluate() is evaluation
+        assert DERIVATIONS["fee_waiver_household_size"](session) == "3"
+        assert DERIVATIONS["fee_waiver_monthly_income"](session) == "1234.50"
+        assert session.fee_waiver.evaluate() is evaluation
+
     def test_assets_aggregated_correctly(self):
         """Bank balances, total property, and debt computed from related models."""
         user = User.objects.create_user(username="test_assets", password="test")
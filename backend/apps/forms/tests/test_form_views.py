@@ -17,16 +17,20 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from apps.districts.models import District
 from apps.forms.models import GeneratedForm
 from apps.forms.registry import get_all_form_types
+from apps.intake import counters
 from apps.intake.models import (
     DebtorInfo,
     IncomeInfo,
     IntakeSession,
+    SessionSummary,
 )
 
 User = get_user_model()
@@ -254,6 +258,32 @@ class TestGenerateAllEndpoint:
         total = resp.data["total_generated"] + resp.data["total_errors"]
         assert total == len(get_all_form_types())
 
+    def test_counters_and_summary_are_written_once_for_the_batch(
+        self, api_client, session_with_income
+    ):
+        GeneratedForm.objects.create(
+            session=session_with_income, form_type="form_101", status="downloaded", form_data={}
+        )
+        with CaptureQueriesContext(connection) as queries:
+            resp = api_client.post(self.URL, {"session_id": session_with_income.id}, format="json")
+
+        counter_writes = [
+            q for q in queries if "INSERT INTO" in q["sql"] and "status_counter" in q["sql"]
+        ]
+        assert len(counter_writes) == 1
+        generated = resp.data["total_generated"]
+        assert counters.read(counters.FORM_STATUS)[counters.FORM_STATUS] == {
+            "downloaded": 0,
+            "generated": generated,
+        }
+        forms = SessionSummary.objects.get(session=session_with_income).forms
+        assert sorted(form[1] for form in forms) == sorted(
+            GeneratedForm.objects.filter(session=session_with_income).values_list(
+                "form_type", flat=True
+            )
+        )
+        assert {form[2] for form in forms} == {"generated"}
+
     def test_missing_session_id(self, api_client):
         resp = api_client.post(self.URL, {}, format="json")
         assert resp.status_code == status.HTTP_400_BAD_REQUEST
@@ -6,6 +6,7 @@ types. DB persistence lives here; generators stay pure (data in → data out).
 """
 
 import json
+from contextlib import contextmanager
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
@@ -17,7 +18,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from apps.intake import counters, summaries
 from apps.intake.models import IntakeSession
+from config.metrics import GENERATOR_SECONDS
+from config.pagination import NewestIdCursorPagination
+from config.perf import span
+from config.query_budget import query_budget
 
 from .models import GeneratedForm
 from .registry import FORM_REGISTRY, get_all_form_types, get_generator
@@ -33,6 +39,14 @@ _UPL_DISCLAIMER = (
     "You are responsible for reviewing all information for accuracy before filing."
 )
 
+# Query budgets (config.query_budget). A download loads the session, its
+# answers and each repeating collection once, whatever the form. generate_all
+# reads the session's forms once and writes each with one INSERT or UPDATE;
+# the status counters and the session summary are then updated once for the
+# whole batch. The budget is absolute so that a new form type has to fit it.
+_DOWNLOAD_QUERY_BUDGET = 25
+_GENERATE_ALL_QUERY_BUDGET = 60
+
 
 def _resolve_session(request) -> tuple[IntakeSession | None, Response | None]:
     """
@@ -85,24 +99,46 @@ def _json_safe(data: dict) -> dict:
     return json.loads(json.dumps(data, cls=DjangoJSONEncoder))
 
 
+@contextmanager
+def _timed_generator(form_type: str, operation: str):
+    """Request span plus the per-form_type generator histogram."""
+    with span("generator"), GENERATOR_SECONDS.labels(form_type, operation).time():
+        yield
+
+
 def _generate_and_persist(
     session: IntakeSession,
     form_type: str,
     user,
+    existing: dict[str, GeneratedForm] | None = None,
 ) -> GeneratedForm:
-    """Run generator and persist result to DB. Returns the GeneratedForm."""
+    """
+    Run generator and persist result to DB. Returns the GeneratedForm.
+
+    ``existing`` maps form_type to the session's forms already loaded by the
+    caller, so the row is written with a single INSERT or UPDATE.
+    """
     generator = get_generator(form_type, session)
-    form_data = _json_safe(generator.generate())
-
-    generated_form, _ = GeneratedForm.objects.update_or_create(
-        session=session,
-        form_type=form_type,
-        defaults={
-            "form_data": form_data,
-            "status": "generated",
-            "generated_by": user,
-        },
-    )
+    with _timed_generator(form_type, "generate"):
+        form_data = _json_safe(generator.generate())
+
+    if existing is None:
+        generated_form, _ = GeneratedForm.objects.update_or_create(
+            session=session,
+            form_type=form_type,
+            defaults={
+                "form_data": form_data,
+                "status": "generated",
+                "generated_by": user,
+            },
+        )
+        return generated_form
+
+    generated_form = existing.get(form_type) or GeneratedForm(session=session, form_type=form_type)
+    generated_form.form_data = form_data
+    generated_form.status = "generated"
+    generated_form.generated_by = user
+    generated_form.save()
     return generated_form
 
 
@@ -121,6 +157,7 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
 
     serializer_class = GeneratedFormSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = NewestIdCursorPagination
 
     def get_queryset(self):
         """Return only forms for the authenticated user's sessions."""
@@ -172,6 +209,7 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
     # ------------------------------------------------------------------
 
     @action(detail=False, methods=["post"], url_path="generate_all")
+    @query_budget(_GENERATE_ALL_QUERY_BUDGET, "forms.generate_all")
     def generate_all(self, request):
         """
         Generate all 14 bankruptcy forms for a session in one request.
@@ -189,10 +227,17 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
         results = []
         errors = []
 
-        with transaction.atomic():
+        # Counters and the session summary are written once for the batch.
+        with transaction.atomic(), counters.deferred(), summaries.deferred():
+            existing = {
+                form.form_type: form
+                for form in GeneratedForm.objects.filter(session=session).defer("form_data")
+            }
             for form_type in get_all_form_types():
                 try:
-                    generated_form = _generate_and_persist(session, form_type, request.user)
+                    generated_form = _generate_and_persist(
+                        session, form_type, request.user, existing
+                    )
                     results.append(self.get_serializer(generated_form).data)
                 except Exception as e:
                     errors.append({"form_type": form_type, "error": str(e)})
@@ -211,6 +256,7 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
     # ------------------------------------------------------------------
 
     @action(detail=False, methods=["post"])
+    @query_budget(10, "forms.preview")
     def preview(self, request):
         """
         Preview form data without persisting to DB.
@@ -229,7 +275,8 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
 
         try:
             generator = get_generator(form_type, session)
-            preview_data = _json_safe(generator.preview())
+            with _timed_generator(form_type, "preview"):
+                preview_data = _json_safe(generator.preview())
             return Response(
                 {
                     "form_type": form_type,
@@ -259,7 +306,8 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
 
         try:
             generator = get_generator(generated_form.form_type, generated_form.session)
-            form_data = _json_safe(generator.generate())
+            with _timed_generator(generated_form.form_type, "generate"):
+                form_data = _json_safe(generator.generate())
 
             generated_form.form_data = form_data
             generated_form.status = "generated"
@@ -320,10 +368,15 @@ class GeneratedFormViewSet(viewsets.ReadOnlyModelViewSet):
     def download(self, request, pk=None):
         """Fill the official AO PDF template with session data and stream it."""
         generated_form = self.get_object()
+        form_type = generated_form.form_type
+        with query_budget(_DOWNLOAD_QUERY_BUDGET, f"forms.download.{form_type}"):
+            return self._download(generated_form)
 
+    def _download(self, generated_form: GeneratedForm):
         generator = get_generator(generated_form.form_type, generated_form.session)
         try:
-            field_map = generator.pdf_field_map()
+            with _timed_generator(generated_form.form_type, "pdf_field_map"):
+                field_map = generator.pdf_field_map()
         except NotImplementedError:
             return Response(
                 {"error": "PDF download is not yet available for this form."},
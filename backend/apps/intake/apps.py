@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class IntakeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.intake"
+
+    def ready(self):
+        from . import counters, summaries
+
+        counters.connect_signals()
+        summaries.connect_signals()
@@ -0,0 +1,218 @@
+"""
+Signal-maintained status counters (StatusCounter rows).
+
+The metrics views and the Prometheus gauges used to GROUP BY over every
+IntakeSession, GeneratedForm and OCRResult row on each call. Instead,
+``post_save``/``post_delete`` receivers adjust one counter row per tracked
+value whenever a row is created, deleted or changes value, so readers fetch
+a handful of rows regardless of table size:
+
+    session_status    IntakeSession.status      started / in_progress / ...
+    form_status       GeneratedForm.status      generated / downloaded / filed
+    form_type         GeneratedForm.form_type   form_101 / schedule_a_b / ...
+    form_type_status  GeneratedForm.form_type   form_101:generated / ...
+                      and .status
+    ocr_status        OCRResult.status          pending / completed / ...
+
+A scope over several fields keys its counters by the values joined with
+``KEY_SEPARATOR``.
+
+The previous value is remembered on ``post_init`` (no extra query). Writes
+that bypass signals (``QuerySet.update``, ``bulk_create``, raw SQL) cause
+drift, which ``reconcile`` corrects; ``reconcile_status_counters`` runs it
+from the scheduler.
+
+Code that saves many tracked rows at once wraps the writes in ``deferred()``:
+the receivers then only total their changes, and each counter is adjusted
+once, in a single upsert, when the block exits.
+"""
+
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import partial
+
+from django.apps import apps
+from django.db import connections, router, transaction
+from django.db.models import Count
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils import timezone
+
+from .models import StatusCounter
+
+logger = logging.getLogger(__name__)
+
+SESSION_STATUS = "session_status"
+FORM_STATUS = "form_status"
+FORM_TYPE = "form_type"
+FORM_TYPE_STATUS = "form_type_status"
+OCR_STATUS = "ocr_status"
+
+KEY_SEPARATOR = ":"
+
+# scope -> (model label, fields)
+TRACKED: dict[str, tuple[str, tuple[str, ...]]] = {
+    SESSION_STATUS: ("intake.IntakeSession", ("status",)),
+    FORM_STATUS: ("forms.GeneratedForm", ("status",)),
+    FORM_TYPE: ("forms.GeneratedForm", ("form_type",)),
+    FORM_TYPE_STATUS: ("forms.GeneratedForm", ("form_type", "status")),
+    OCR_STATUS: ("documents.OCRResult", ("status",)),
+}
+
+
+def counter_key(values) -> str | None:
+    """The counter key for a row's tracked values; None while any is unknown."""
+    if any(value is None for value in values):
+        return None
+    return KEY_SEPARATOR.join(str(value) for value in values)
+
+
+_deferred = threading.local()
+
+
+def bump(scope: str, key: str, delta: int) -> None:
+    """Add ``delta`` to one counter, creating the row on first use."""
+    pending = getattr(_deferred, "deltas", None)
+    if pending is not None:
+        pending[scope, key] += delta
+        return
+    bump_many({(scope, key): delta})
+
+
+def bump_many(deltas) -> None:
+    """
+    Apply ``{(scope, key): delta}`` in one query.
+
+    A single multi-row INSERT ... ON CONFLICT DO UPDATE (PostgreSQL and
+    SQLite), whether or not the rows exist yet.
+    """
+    rows = [(scope, key, delta) for (scope, key), delta in deltas.items() if delta]
+    if not rows:
+        return
+    connection = connections[router.db_for_write(StatusCounter)]
+    qn = connection.ops.quote_name
+    table = qn(StatusCounter._meta.db_table)
+    now = timezone.now()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({qn('scope')}, {qn('key')}, {qn('count')}, {qn('updated_at')})"
+            f" VALUES {', '.join(['(%s, %s, %s, %s)'] * len(rows))}"
+            f" ON CONFLICT ({qn('scope')}, {qn('key')}) DO UPDATE"
+            f" SET {qn('count')} = {table}.{qn('count')} + EXCLUDED.{qn('count')},"
+            f" {qn('updated_at')} = EXCLUDED.{qn('updated_at')}",
+            [value for row in rows for value in (*row, now)],
+        )
+
+
+@contextmanager
+def deferred():
+    """
+    Total the bumps made inside the block and apply them once on exit.
+
+    If the block raises, the totals are dropped along with the transaction
+    the caller is expected to be rolling back. Nested blocks join the
+    outermost one.
+    """
+    if getattr(_deferred, "deltas", None) is not None:
+        yield
+        return
+    _deferred.deltas = Counter()
+    try:
+        yield
+        deltas = _deferred.deltas
+    finally:
+        _deferred.deltas = None
+    bump_many(deltas)
+
+
+def read(*scopes: str) -> dict[str, dict[str, int]]:
+    """``{scope: {key: count}}`` for the given scopes, in one query."""
+    result: dict[str, dict[str, int]] = {scope: {} for scope in scopes}
+    rows = StatusCounter.objects.filter(scope__in=scopes).values_list("scope", "key", "count")
+    for scope, key, count in rows:
+        result[scope][key] = count
+    return result
+
+
+def actual_counts(scope: str) -> dict[str, int]:
+    """The true per-key counts for ``scope`` (a GROUP BY over the model)."""
+    label, fields = TRACKED[scope]
+    rows = apps.get_model(label).objects.order_by().values_list(*fields).annotate(n=Count("pk"))
+    return {counter_key(values): n for *values, n in rows}
+
+
+def reconcile() -> dict[str, dict[str, tuple[int, int]]]:
+    """
+    Overwrite every counter with the true count.
+
+    Returns ``{scope: {key: (stored, actual)}}`` for the counters that had
+    drifted. Counter rows are locked before counting, so a concurrent bump
+    waits and then applies on top of the corrected value.
+    """
+    drift: dict[str, dict[str, tuple[int, int]]] = {}
+    with transaction.atomic():
+        for scope in TRACKED:
+            stored = dict(
+                StatusCounter.objects.select_for_update()
+                .filter(scope=scope)
+                .values_list("key", "count")
+            )
+            actual = actual_counts(scope)
+            for key in stored.keys() | actual.keys():
+                before, after = stored.get(key, 0), actual.get(key, 0)
+                if before == after and key in stored:
+                    continue
+                StatusCounter.objects.update_or_create(
+                    scope=scope, key=key, defaults={"count": after}
+                )
+                if before != after:
+                    drift.setdefault(scope, {})[key] = (before, after)
+    if drift:
+        logger.warning("Status counters drifted and were corrected: %s", drift)
+    return drift
+
+
+def _remember(fields, sender, instance, **kwargs):
+    # Deferred fields are absent from __dict__; reading them would query.
+    instance._counted_values = {name: instance.__dict__.get(name) for name in fields}
+
+
+def _on_save(tracked, sender, instance, created, **kwargs):
+    previous = getattr(instance, "_counted_values", {})
+    for scope, fields in tracked:
+        new = counter_key([getattr(instance, field) for field in fields])
+        old = None if created else counter_key([previous.get(field) for field in fields])
+        if created:
+            bump(scope, new, 1)
+        elif old is not None and old != new:
+            bump(scope, old, -1)
+            bump(scope, new, 1)
+    instance._counted_values = {
+        field: getattr(instance, field) for _, fields in tracked for field in fields
+    }
+
+
+def _on_delete(tracked, sender, instance, **kwargs):
+    previous = getattr(instance, "_counted_values", {})
+    for scope, fields in tracked:
+        key = counter_key([previous.get(field) or instance.__dict__.get(field) for field in fields])
+        if key is not None:
+            bump(scope, key, -1)
+
+
+def connect_signals() -> None:
+    """Attach the receivers; called from IntakeConfig.ready."""
+    by_model: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+    for scope, (label, fields) in TRACKED.items():
+        by_model.setdefault(label, []).append((scope, fields))
+
+    for label, tracked in by_model.items():
+        model = apps.get_model(label)
+        fields = list(dict.fromkeys(field for _, fields in tracked for field in fields))
+        uid = f"status_counters:{label}"
+        post_init.connect(partial(_remember, fields), sender=model, weak=False, dispatch_uid=uid)
+        post_save.connect(partial(_on_save, tracked), sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(
+            partial(_on_delete, tracked), sender=model, weak=False, dispatch_uid=uid
+        )
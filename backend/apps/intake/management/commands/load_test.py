@@ -0,0 +1,296 @@
+"""
+load_test - Replay the demo persona flows over HTTP and report latency.
+
+Each virtual user logs in as one of the ``seed_demo_data`` personas (round
+robin) and repeats the filing flow against a running server:
+
+  session list/detail -> update_step 1..6 -> bulk answers -> means test ->
+  summary -> Form 101 preview -> generate_all -> PDF downloads -> document
+  upload -> complete
+
+Only HTTP is used (stdlib urllib), so the target can be runserver, gunicorn
+or a container. Start the server with OCR_PROVIDER=stub (and optionally
+OCR_STUB_LATENCY_SECONDS) so uploads never leave the machine, and seed the
+personas first (or pass --seed when the command shares the server's
+database). Note that the flow writes to the personas' sessions.
+
+  OCR_PROVIDER=stub python manage.py runserver --noreload
+  python manage.py load_test --users 10 --duration 60
+  python manage.py load_test --base-url http://localhost:8000 --iterations 3 --seed
+"""
+
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.documents.management.commands.benchmark_ocr import build_sample_pdf, percentile
+from apps.intake.management.commands.seed_demo_data import DEMO_PASSWORD, PERSONAS
+
+# PDF downloads return 501 for forms without an AO template mapping yet.
+_DOWNLOAD_OK = frozenset({200, 501})
+
+
+class Recorder:
+    """Thread-safe latency samples and error counts per endpoint label."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def add(self, label: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self.samples[label].append(seconds)
+            if not ok:
+                self.errors[label] += 1
+
+
+class FlowError(Exception):
+    """A step the rest of the flow depends on did not succeed."""
+
+
+class Client:
+    """Minimal JSON/multipart HTTP client that times every call."""
+
+    def __init__(self, base_url: str, recorder: Recorder, timeout: float):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.timeout = timeout
+        self.token: str | None = None
+
+    def call(
+        self,
+        method: str,
+        path: str,
+        label: str,
+        *,
+        payload: dict | None = None,
+        files: dict[str, tuple[str, bytes, str]] | None = None,
+        ok: frozenset[int] = frozenset({200}),
+    ) -> tuple[int, bytes]:
+        headers = {"Accept": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        body = None
+        if files is not None:
+            body, headers["Content-Type"] = _multipart(payload or {}, files)
+        elif payload is not None:
+            body = json.dumps(payload).encode()
+            headers["Content-Type"] = "application/json"
+
+        request = urllib.request.Request(
+            self.base_url + path, data=body, headers=headers, method=method
+        )
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, content = response.status, response.read()
+        except urllib.error.HTTPError as exc:
+            status, content = exc.code, exc.read()
+        except OSError:
+            status, content = 0, b""
+        self.recorder.add(f"{method} {label}", time.perf_counter() - started, status in ok)
+        return status, content
+
+    def json(self, method: str, path: str, label: str, **kwargs) -> dict:
+        ok = kwargs.get("ok", frozenset({200}))
+        status, content = self.call(method, path, label, **kwargs)
+        if status not in ok:
+            raise FlowError(f"{method} {label} returned {status}")
+        return json.loads(content) if content else {}
+
+
+def _multipart(fields: dict, files: dict[str, tuple[str, bytes, str]]) -> tuple[bytes, str]:
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+        )
+    for name, (filename, content, content_type) in files.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+            f'filename="{filename}"\r\nContent-Type: {content_type}\r\n\r\n'.encode()
+            + content
+            + b"\r\n"
+        )
+    parts.append(f"--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+def login(client: Client, persona: str) -> None:
+    data = client.json(
+        "POST",
+        "/api/token/obtain/",
+        "/api/token/obtain/",
+        payload={"username": f"demo_{persona}", "password": DEMO_PASSWORD},
+    )
+    client.token = data["access"]
+
+
+def run_flow(client: Client, sample_pdf: bytes) -> None:
+    """One pass through the filing flow for the logged-in persona."""
+    sessions = client.json("GET", "/api/intake/sessions/", "/api/intake/sessions/")
+    results = sessions.get("results", sessions) if isinstance(sessions, dict) else sessions
+    if not results:
+        raise FlowError("persona has no intake session")
+    session_id = results[0]["id"]
+    base = f"/api/intake/sessions/{session_id}"
+    label = "/api/intake/sessions/{id}"
+
+    client.json("GET", f"{base}/", f"{label}/")
+    for step in range(1, 7):
+        client.json(
+            "POST", f"{base}/update_step/", f"{label}/update_step/", payload={"current_step": step}
+        )
+    answers = [
+        {"form_type": "form_107", "binding": f"answer:form_107.load_test_{i}", "value": str(i)}
+        for i in range(10)
+    ]
+    client.json(
+        "POST", f"{base}/answers/bulk/", f"{label}/answers/bulk/", payload={"answers": answers}
+    )
+    client.json("POST", f"{base}/calculate_means_test/", f"{label}/calculate_means_test/")
+    client.json("GET", f"{base}/summary/", f"{label}/summary/")
+    client.json(
+        "POST",
+        "/api/forms/preview/",
+        "/api/forms/preview/",
+        payload={"session_id": session_id, "form_type": "form_101"},
+    )
+    generated = client.json(
+        "POST",
+        "/api/forms/generate_all/",
+        "/api/forms/generate_all/",
+        payload={"session_id": session_id},
+    )
+    for form in generated.get("generated", []):
+        client.call(
+            "GET",
+            f"/api/forms/{form['id']}/download/",
+            "/api/forms/{id}/download/",
+            ok=_DOWNLOAD_OK,
+        )
+    client.call(
+        "POST",
+        "/api/documents/upload/",
+        "/api/documents/upload/",
+        payload={"document_type": "pay_stub", "session_id": session_id},
+        files={"file": ("paystub.pdf", sample_pdf, "application/pdf")},
+        ok=frozenset({202}),
+    )
+    client.json("POST", f"{base}/complete/", f"{label}/complete/")
+
+
+class Command(BaseCommand):
+    help = "Replay the demo persona flows over HTTP and report per-endpoint latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server to load")
+        parser.add_argument("--users", type=int, default=5, help="Concurrent virtual users")
+        parser.add_argument(
+            "--iterations", type=int, default=1, help="Flows per user (ignored with --duration)"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=0, help="Run for this many seconds instead"
+        )
+        parser.add_argument(
+            "--persona",
+            action="append",
+            choices=list(PERSONAS.keys()),
+            help="Restrict to these personas (repeatable; default all 5)",
+        )
+        parser.add_argument("--timeout", type=float, default=120, help="Per-request timeout")
+        parser.add_argument(
+            "--seed", action="store_true", help="Run seed_demo_data against this database first"
+        )
+        parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1:
+            raise CommandError("--users must be at least 1")
+        if options["seed"]:
+            call_command("seed_demo_data", stdout=self.stderr)
+
+        personas = options["persona"] or list(PERSONAS.keys())
+        sample_pdf = build_sample_pdf()
+        recorder = Recorder()
+        failures: list[str] = []
+        deadline = time.monotonic() + options["duration"] if options["duration"] else None
+
+        def virtual_user(index: int) -> int:
+            client = Client(options["base_url"], recorder, options["timeout"])
+            flows = 0
+            try:
+                login(client, personas[index % len(personas)])
+                while (deadline is None and flows < options["iterations"]) or (
+                    deadline is not None and time.monotonic() < deadline
+                ):
+                    run_flow(client, sample_pdf)
+                    flows += 1
+            except FlowError as exc:
+                failures.append(f"user {index}: {exc}")
+            return flows
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["users"]) as pool:
+            flows = sum(pool.map(virtual_user, range(options["users"])))
+        elapsed = time.perf_counter() - started
+
+        report = self._report(recorder, elapsed, flows, failures)
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self._print(report)
+
+    @staticmethod
+    def _report(recorder: Recorder, elapsed: float, flows: int, failures: list[str]) -> dict:
+        endpoints = {}
+        for label in sorted(recorder.samples):
+            samples = sorted(recorder.samples[label])
+            endpoints[label] = {
+                "requests": len(samples),
+                "errors": recorder.errors.get(label, 0),
+                "rps": round(len(samples) / elapsed, 2) if elapsed else 0,
+                "p50_ms": round(percentile(samples, 50) * 1000, 1),
+                "p95_ms": round(percentile(samples, 95) * 1000, 1),
+                "p99_ms": round(percentile(samples, 99) * 1000, 1),
+                "max_ms": round(samples[-1] * 1000, 1),
+            }
+        total = sum(e["requests"] for e in endpoints.values())
+        return {
+            "elapsed_s": round(elapsed, 3),
+            "flows": flows,
+            "requests": total,
+            "errors": sum(e["errors"] for e in endpoints.values()),
+            "rps": round(total / elapsed, 2) if elapsed else 0,
+            "failures": failures,
+            "endpoints": endpoints,
+        }
+
+    def _print(self, report: dict) -> None:
+        width = max([len(label) for label in report["endpoints"]] + [8])
+        self.stdout.write(
+            f"{'endpoint':<{width}}  {'reqs':>5}  {'errs':>4}  {'rps':>7}  "
+            f"{'p50ms':>8}  {'p95ms':>8}  {'p99ms':>8}  {'maxms':>8}"
+        )
+        for label, e in report["endpoints"].items():
+            self.stdout.write(
+                f"{label:<{width}}  {e['requests']:>5}  {e['errors']:>4}  {e['rps']:>7.2f}  "
+                f"{e['p50_ms']:>8.1f}  {e['p95_ms']:>8.1f}  {e['p99_ms']:>8.1f}  {e['max_ms']:>8.1f}"
+            )
+        self.stdout.write(
+            f"flows={report['flows']} requests={report['requests']} errors={report['errors']} "
+            f"elapsed={report['elapsed_s']:.1f}s throughput={report['rps']:.2f} req/s"
+        )
+        for failure in report["failures"]:
+            self.stdout.write(self.style.WARNING(f"  {failure}"))
@@ -0,0 +1,27 @@
+"""
+rebuild_session_summaries - Recompute the per-session summary rows.
+
+SessionSummary rows are maintained by signals, which bulk updates and raw SQL
+bypass. Run this once to backfill sessions created before summaries existed
+(the summary endpoint also builds a missing row on first read), then
+periodically (e.g. nightly from the scheduler) to correct drift; rebuilt
+sessions are reported.
+
+  python manage.py rebuild_session_summaries
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.intake.summaries import rebuild
+
+
+class Command(BaseCommand):
+    help = "Recompute SessionSummary rows from intake, eligibility, forms and documents data."
+
+    def handle(self, *args, **options):
+        drifted = rebuild()
+        for session_id in drifted:
+            self.stdout.write(f"session {session_id} rebuilt")
+        self.stdout.write(
+            self.style.SUCCESS(f"Session summaries rebuilt ({len(drifted)} corrected)")
+        )
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.14 on 2026-10-19 14:30
+
+from django.db import migrations, models
+from django.db.models import Count
+
+# scope -> (app label, model, field); mirrors apps.intake.counters.TRACKED.
+TRACKED = {
+    "session_status": ("intake", "IntakeSession", "status"),
+    "form_status": ("forms", "GeneratedForm", "status"),
+    "form_type": ("forms", "GeneratedForm", "form_type"),
+}
+
+
+def seed_counters(apps, schema_editor):
+    StatusCounter = apps.get_model("intake", "StatusCounter")
+    db = schema_editor.connection.alias
+    counters = []
+    for scope, (app_label, model_name, field) in TRACKED.items():
+        model = apps.get_model(app_label, model_name)
+        rows = model.objects.using(db).order_by().values_list(field).annotate(n=Count("pk"))
+        counters.extend(StatusCounter(scope=scope, key=key, count=n) for key, n in rows)
+    StatusCounter.objects.using(db).bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0010_add_adversary_proceedings"),
+        ("forms", "0004_add_five_form_types"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatusCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("scope", models.CharField(max_length=30)),
+                ("key", models.CharField(max_length=50)),
+                ("count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "status_counters",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="statuscounter",
+            constraint=models.UniqueConstraint(
+                fields=("scope", "key"), name="status_counter_scope_key_uniq"
+            ),
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
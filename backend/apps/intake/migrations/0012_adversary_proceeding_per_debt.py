@@ -0,0 +1,30 @@
+# Generated by Django 5.0.14 on 2026-10-19 15:09
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicate_proceedings(apps, schema_editor):
+    """get_or_create could race; keep the oldest proceeding per (session, debt)."""
+    AdversaryProceeding = apps.get_model("intake", "AdversaryProceeding")
+    db = schema_editor.connection.alias
+    proceedings = AdversaryProceeding.objects.using(db).filter(debt__isnull=False)
+    keep = proceedings.order_by().values("session", "debt").annotate(first=Min("pk"))
+    proceedings.exclude(pk__in=keep.values("first")).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0011_status_counters"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_proceedings, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="adversaryproceeding",
+            constraint=models.UniqueConstraint(
+                fields=("session", "debt"), name="unique_adversary_proceeding_per_debt"
+            ),
+        ),
+    ]
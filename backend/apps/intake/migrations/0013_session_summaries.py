@@ -0,0 +1,67 @@
+# Generated by Django 5.0.14 on 2026-10-19 15:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import apps.intake.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0012_adversary_proceeding_per_debt"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SessionSummary",
+            fields=[
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="intake.intakesession",
+                    ),
+                ),
+                ("has_debtor_info", models.BooleanField(default=False)),
+                ("has_income_info", models.BooleanField(default=False)),
+                ("has_expense_info", models.BooleanField(default=False)),
+                ("asset_count", models.IntegerField(default=0)),
+                ("debt_count", models.IntegerField(default=0)),
+                (
+                    "total_asset_value",
+                    apps.intake.fields.EncryptedDecimalField(
+                        decimal_places=2, default=0, max_digits=14
+                    ),
+                ),
+                (
+                    "total_debt_amount",
+                    apps.intake.fields.EncryptedDecimalField(
+                        decimal_places=2, default=0, max_digits=14
+                    ),
+                ),
+                ("means_test_passes", models.BooleanField(null=True)),
+                ("means_test_fee_waiver", models.BooleanField(null=True)),
+                (
+                    "forms",
+                    models.JSONField(
+                        default=list,
+                        help_text="[form id, form type, status] per generated form, newest first",
+                    ),
+                ),
+                (
+                    "ocr_pending_count",
+                    models.IntegerField(
+                        default=0, help_text="Uploaded documents whose OCR is pending or processing"
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "session_summaries",
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+from django.db.models import Count
+
+# scope -> (app label, model, fields); mirrors the scopes added to
+# apps.intake.counters.TRACKED for the Prometheus count gauges.
+TRACKED = {
+    "form_type_status": ("forms", "GeneratedForm", ("form_type", "status")),
+    "ocr_status": ("documents", "OCRResult", ("status",)),
+}
+
+
+def seed_counters(apps, schema_editor):
+    StatusCounter = apps.get_model("intake", "StatusCounter")
+    db = schema_editor.connection.alias
+    counters = []
+    for scope, (app_label, model_name, fields) in TRACKED.items():
+        model = apps.get_model(app_label, model_name)
+        rows = model.objects.using(db).order_by().values_list(*fields).annotate(n=Count("pk"))
+        counters.extend(
+            StatusCounter(scope=scope, key=":".join(values), count=n) for *values, n in rows
+        )
+    StatusCounter.objects.using(db).bulk_create(counters)
+
+
+def drop_counters(apps, schema_editor):
+    StatusCounter = apps.get_model("intake", "StatusCounter")
+    StatusCounter.objects.using(schema_editor.connection.alias).filter(
+        scope__in=list(TRACKED)
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intake", "0013_session_summaries"),
+        ("forms", "0004_add_five_form_types"),
+        ("documents", "0008_cached_extraction_source_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_counters, drop_counters),
+    ]
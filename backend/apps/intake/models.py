@@ -431,19 +431,15 @@ class FeeWaiverApplication(models.Model):
     Chapter 7 fee waiver application (Form 103B).
 
     Qualifies if:
-    1. Income < 150% federal poverty line ($1,882.50/month for 1 person as of 2024)
+    1. Income < 150% of the HHS poverty guideline for the household size,
+       year and region (48 states, Alaska or Hawaii) of the filing
     2. OR receives means-tested public benefits (SSI, SNAP, TANF, etc.)
     3. AND cannot pay filing fee ($338) in full or installments
 
-    Per 28 U.S.C. § 1930(f)
+    Per 28 U.S.C. § 1930(f). The test itself lives in
+    ``apps.eligibility.services.poverty_guidelines``.
     """
 
-    # HHS poverty guidelines constants (2024)
-    POVERTY_BASE_2024: ClassVar[Decimal] = Decimal("15060")  # HHS poverty line base (2024)
-    POVERTY_INCREMENT: ClassVar[Decimal] = Decimal("5380")  # Per-person increment
-    POVERTY_MULTIPLIER: ClassVar[Decimal] = Decimal("1.5")  # 150% per 28 U.S.C. § 1930(f)
-    MONTHS_PER_YEAR: ClassVar[Decimal] = Decimal("12")
-
     # Relations
     session = models.OneToOneField(
         IntakeSession, on_delete=models.CASCADE, related_name="fee_waiver"
@@ -513,24 +509,17 @@ class FeeWaiverApplication(models.Model):
         Returns:
             bool: True if qualifies via income test OR public benefits
         """
-        # Automatic qualification: Receives public benefits
-        # 28 U.S.C. § 1930(f) allows waiver for means-tested benefits
-        if self.receives_public_benefits:
-            return True
+        return self.evaluate().qualifies
 
-        # Income test: < 150% federal poverty line
-        poverty_threshold_150_monthly = self.get_poverty_threshold()
-        if self.monthly_income < poverty_threshold_150_monthly:
-            return True
+    def get_poverty_threshold(self) -> Decimal:
+        """150% poverty threshold (monthly) for the household size."""
+        return self.evaluate().threshold_monthly
 
-        return False
+    def evaluate(self):
+        """Fee waiver test result (``FeeWaiverEvaluation``), cached on this instance."""
+        from apps.eligibility.services.poverty_guidelines import evaluate_application
 
-    def get_poverty_threshold(self) -> Decimal:
-        """Calculate 150% poverty threshold for household size."""
-        poverty_threshold_annual = self.POVERTY_BASE_2024 + (
-            self.POVERTY_INCREMENT * (self.household_size - 1)
-        )
-        return (poverty_threshold_annual * self.POVERTY_MULTIPLIER) / self.MONTHS_PER_YEAR
+        return evaluate_application(self)
 
 
 class SOFAReport(models.Model):
@@ -672,3 +661,90 @@ class AdversaryProceeding(models.Model):
 
     class Meta:
         db_table = "adversary_proceedings"
+        constraints = [
+            # One proceeding per debt, so evaluation can insert with ignore_conflicts.
+            models.UniqueConstraint(
+                fields=["session", "debt"], name="unique_adversary_proceeding_per_debt"
+            ),
+        ]
+
+
+class StatusCounter(models.Model):
+    """
+    Running row counts per status for the metrics endpoints and gauges.
+
+    Kept current by signal receivers in ``apps.intake.counters`` as intake
+    sessions, generated forms and OCR results are created, change status or
+    are deleted, and corrected by ``reconcile_status_counters``.
+    """
+
+    scope = models.CharField(max_length=30)
+    key = models.CharField(max_length=50)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "status_counters"
+        constraints: ClassVar[list] = [
+            models.UniqueConstraint(fields=["scope", "key"], name="status_counter_scope_key_uniq")
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.scope}:{self.key}={self.count}"
+
+
+class SessionSummary(models.Model):
+    """
+    Progress, totals and outcomes of one intake session, for the summary endpoint.
+
+    Kept current by signal receivers in ``apps.intake.summaries`` as the rows
+    it describes change, and recomputed by ``rebuild_session_summaries``.
+    """
+
+    COMPLETION_SECTIONS = 5  # debtor, income, expenses, assets, debts
+
+    session = models.OneToOneField(
+        IntakeSession, on_delete=models.CASCADE, primary_key=True, related_name="summary"
+    )
+
+    # Completion
+    has_debtor_info = models.BooleanField(default=False)
+    has_income_info = models.BooleanField(default=False)
+    has_expense_info = models.BooleanField(default=False)
+
+    # Counts and totals
+    asset_count = models.IntegerField(default=0)
+    debt_count = models.IntegerField(default=0)
+    total_asset_value = EncryptedDecimalField(max_digits=14, decimal_places=2, default=0)
+    total_debt_amount = EncryptedDecimalField(max_digits=14, decimal_places=2, default=0)
+
+    # Latest means test outcome (null until one is calculated)
+    means_test_passes = models.BooleanField(null=True)
+    means_test_fee_waiver = models.BooleanField(null=True)
+
+    forms = models.JSONField(
+        default=list, help_text="[form id, form type, status] per generated form, newest first"
+    )
+    ocr_pending_count = models.IntegerField(
+        default=0, help_text="Uploaded documents whose OCR is pending or processing"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "session_summaries"
+
+    def __str__(self) -> str:
+        return f"Summary for session {self.session_id}"
+
+    @property
+    def completion_percentage(self) -> int:
+        completed = sum(
+            (
+                self.has_debtor_info,
+                self.has_income_info,
+                self.has_expense_info,
+                self.asset_count > 0,
+                self.debt_count > 0,
+            )
+        )
+        return int((completed / self.COMPLETION_SECTIONS) * 100)
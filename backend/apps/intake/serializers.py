@@ -11,6 +11,9 @@ from django.contrib.auth import get_user_model
 from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
 
+from apps.eligibility.services.means_test_simulator import FIELDS as SIMULATION_FIELDS
+from apps.eligibility.services.means_test_simulator import MAX_SCENARIOS, Change, Scenario
+
 from .models import (
     AssetInfo,
     Codebtor,
@@ -504,6 +507,41 @@ class BulkAnswerPayloadSerializer(serializers.Serializer):
     answers = BulkAnswerItemSerializer(many=True)
 
 
+class ScenarioChangeSerializer(serializers.Serializer):
+    """One what-if change: add ``delta`` to a field or replace it with ``value``."""
+
+    field = serializers.ChoiceField(choices=list(SIMULATION_FIELDS))
+    delta = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    value = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+
+    def validate(self, data):
+        if ("delta" in data) == ("value" in data):
+            raise serializers.ValidationError("Give either a delta or a value for each change.")
+        amount = data.get("delta", data.get("value"))
+        if data["field"] == "household" and amount != amount.to_integral_value():
+            raise serializers.ValidationError({"field": "Household changes are whole people."})
+        return data
+
+
+class ScenarioSerializer(serializers.Serializer):
+    label = serializers.CharField(max_length=100)
+    changes = ScenarioChangeSerializer(many=True, max_length=20)
+
+
+class MeansTestSimulationSerializer(serializers.Serializer):
+    scenarios = ScenarioSerializer(many=True, min_length=1, max_length=MAX_SCENARIOS)
+    as_of = serializers.DateField(required=False)
+
+    def to_scenarios(self) -> list[Scenario]:
+        return [
+            Scenario(
+                label=scenario["label"],
+                changes=tuple(Change(**change) for change in scenario["changes"]),
+            )
+            for scenario in self.validated_data["scenarios"]
+        ]
+
+
 class ExecutoryContractSerializer(serializers.ModelSerializer):
     class Meta:
         model = ExecutoryContract
@@ -0,0 +1,292 @@
+"""
+Signal-maintained session summaries (SessionSummary rows).
+
+The summary endpoint, which the wizard polls, used to serialize the whole
+session with every asset and debt, probe the debtor, income and expense rows
+and list the generated forms on each call. Instead, ``post_save``/``post_delete``
+receivers keep one SessionSummary row per session current as the rows it
+describes change, so the endpoint reads a single row.
+
+This module owns the intake part: IntakeSession (creates the row);
+DebtorInfo, IncomeInfo, ExpenseInfo (completion flags); AssetInfo, DebtInfo
+(counts and totals). The other fields belong to the apps whose rows they
+describe, which keep them current from their own AppConfig.ready() and never
+need importing here:
+
+    eligibility  MeansTest (latest outcome)      services.session_summary
+    forms        GeneratedForm (type and status)  services.session_summary
+    documents    OCRResult (pending count)        services.session_summary
+
+Each of those modules ``register``s a function that computes its fields for
+``summarize`` and attaches receivers with ``connect``. The receivers write
+through ``update`` (a single UPDATE), ``edit`` (lock, read, write back) or
+``mark_stale`` (a full refresh).
+
+Flags, the means test outcome and the OCR count are single UPDATEs. Totals
+are encrypted, so they cannot be adjusted with F(); the row is locked, read
+and written back. Previous amounts and statuses are remembered on
+``post_init`` (no extra query).
+
+As with the status counters (``apps.intake.counters``), writes that bypass
+signals cause drift. Callers that bulk update refresh the session's row with
+``refresh``; ``rebuild_session_summaries`` recomputes every row. Code that
+saves many rows through the ORM wraps the writes in ``deferred()``, which
+refreshes each touched session once on exit instead of once per row.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.utils import timezone
+
+from .models import (
+    AssetInfo,
+    DebtInfo,
+    DebtorInfo,
+    ExpenseInfo,
+    IncomeInfo,
+    IntakeSession,
+    SessionSummary,
+)
+
+logger = logging.getLogger(__name__)
+
+# model -> completion flag set while the session has that row
+SECTIONS = {
+    DebtorInfo: "has_debtor_info",
+    IncomeInfo: "has_income_info",
+    ExpenseInfo: "has_expense_info",
+}
+
+# model -> (amount field, count field, total field)
+AMOUNTS = {
+    AssetInfo: ("current_value", "asset_count", "total_asset_value"),
+    DebtInfo: ("amount_owed", "debt_count", "total_debt_amount"),
+}
+
+# summarize(session_id) -> {field: value} for the fields other apps maintain
+_contributors = []
+
+_deferred = threading.local()
+
+
+def _decimal(value) -> Decimal:
+    # Unsaved instances may still hold the float or string they were built with.
+    return Decimal(str(value or 0))
+
+
+def register(contributor) -> None:
+    """Have ``summarize`` include the fields ``contributor(session_id)`` returns."""
+    if contributor not in _contributors:
+        _contributors.append(contributor)
+
+
+def summarize(session_id: int) -> dict:
+    """Summary field values for one session, read from the rows it describes."""
+    asset_values = AssetInfo.objects.filter(session_id=session_id).values_list(
+        "current_value", flat=True
+    )
+    debt_amounts = DebtInfo.objects.filter(session_id=session_id).values_list(
+        "amount_owed", flat=True
+    )
+    asset_values, debt_amounts = list(asset_values), list(debt_amounts)
+    values = {
+        "has_debtor_info": DebtorInfo.objects.filter(session_id=session_id).exists(),
+        "has_income_info": IncomeInfo.objects.filter(session_id=session_id).exists(),
+        "has_expense_info": ExpenseInfo.objects.filter(session_id=session_id).exists(),
+        "asset_count": len(asset_values),
+        "debt_count": len(debt_amounts),
+        "total_asset_value": sum(map(_decimal, asset_values), Decimal("0")),
+        "total_debt_amount": sum(map(_decimal, debt_amounts), Decimal("0")),
+    }
+    for contributor in _contributors:
+        values.update(contributor(session_id))
+    return values
+
+
+def refresh(session_id: int, create: bool = True) -> SessionSummary | None:
+    """
+    Recompute one session's summary from its rows.
+
+    With ``create=False`` only an existing row is updated; receivers that run
+    while a session is being deleted use it so they never recreate the row.
+    """
+    values = summarize(session_id)
+    if not create:
+        SessionSummary.objects.filter(session_id=session_id).update(
+            **values, updated_at=timezone.now()
+        )
+        return None
+    summary, _ = SessionSummary.objects.update_or_create(session_id=session_id, defaults=values)
+    return summary
+
+
+def rebuild() -> list[int]:
+    """
+    Recompute every session's summary.
+
+    Returns the ids of sessions whose row was missing or had drifted. Each
+    row is locked while it is compared, so a concurrent receiver waits and
+    then applies on top of the corrected values.
+    """
+    drifted = []
+    for session_id in IntakeSession.objects.order_by("pk").values_list("pk", flat=True).iterator():
+        with transaction.atomic():
+            summary = (
+                SessionSummary.objects.select_for_update().filter(session_id=session_id).first()
+            )
+            values = summarize(session_id)
+            if summary is not None and all(
+                getattr(summary, field) == value for field, value in values.items()
+            ):
+                continue
+            SessionSummary.objects.update_or_create(session_id=session_id, defaults=values)
+            drifted.append(session_id)
+    if drifted:
+        logger.warning("Session summaries drifted and were rebuilt: %s", drifted)
+    return drifted
+
+
+@contextmanager
+def deferred():
+    """
+    Hold the receivers' updates inside the block; refresh each touched session on exit.
+
+    If the block raises, nothing is refreshed (the caller's transaction is
+    expected to roll back). Nested blocks join the outermost one.
+    """
+    if getattr(_deferred, "sessions", None) is not None:
+        yield
+        return
+    _deferred.sessions = set()
+    try:
+        yield
+        sessions = _deferred.sessions
+    finally:
+        _deferred.sessions = None
+    for session_id in sorted(sessions):
+        refresh(session_id, create=False)
+
+
+def _defer(session_id: int) -> bool:
+    """Inside ``deferred()``, note the session for the refresh on exit and return True."""
+    sessions = getattr(_deferred, "sessions", None)
+    if sessions is None:
+        return False
+    sessions.add(session_id)
+    return True
+
+
+def mark_stale(session_id: int) -> None:
+    """Recompute the session's row (at the end of a ``deferred()`` block, if inside one)."""
+    if not _defer(session_id):
+        refresh(session_id, create=False)
+
+
+def update(session_id: int, **fields) -> None:
+    """Set ``fields`` on the session's row with one UPDATE (F() expressions allowed)."""
+    if _defer(session_id):
+        return
+    SessionSummary.objects.filter(session_id=session_id).update(**fields, updated_at=timezone.now())
+
+
+def edit(session_id: int, fields: tuple[str, ...], change) -> None:
+    """Lock the row; if ``change`` modifies ``fields`` in place (returns True), save them."""
+    if _defer(session_id):
+        return
+    with transaction.atomic(savepoint=False):
+        summary = (
+            SessionSummary.objects.select_for_update()
+            .filter(session_id=session_id)
+            .only("session_id", *fields)
+            .first()
+        )
+        if summary is None:  # deleted along with its session; rebuilt if ever read again
+            return
+        if change(summary):
+            summary.save(update_fields=[*fields, "updated_at"])
+
+
+def connect(model, on_save, on_delete=None, on_init=None) -> None:
+    """Attach summary receivers for ``model``; called from the owning app's ready()."""
+    uid = f"session_summaries:{model._meta.label}"
+    if on_init is not None:
+        post_init.connect(on_init, sender=model, weak=False, dispatch_uid=uid)
+    post_save.connect(on_save, sender=model, weak=False, dispatch_uid=uid)
+    if on_delete is not None:
+        post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=uid)
+
+
+# -- receivers ----------------------------------------------------------------
+
+
+def _on_session_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        SessionSummary.objects.create(session_id=instance.pk)
+
+
+def _on_section_save(flag, sender, instance, created, **kwargs):
+    if created:
+        update(instance.session_id, **{flag: True})
+
+
+def _on_section_delete(flag, sender, instance, **kwargs):
+    update(instance.session_id, **{flag: False})
+
+
+def _remember_amount(field, sender, instance, **kwargs):
+    # Deferred fields are absent from __dict__; reading them would query.
+    instance._summarized = (instance.__dict__.get("session_id"), instance.__dict__.get(field))
+
+
+def _adjust(spec, session_id: int, count_delta: int, total_delta: Decimal) -> None:
+    _, count_field, total_field = spec
+
+    def change(summary):
+        setattr(summary, count_field, getattr(summary, count_field) + count_delta)
+        setattr(summary, total_field, _decimal(getattr(summary, total_field)) + total_delta)
+        return True
+
+    edit(session_id, (count_field, total_field), change)
+
+
+def _on_amount_save(spec, sender, instance, created, **kwargs):
+    old_session, old_amount = getattr(instance, "_summarized", (None, None))
+    amount = _decimal(getattr(instance, spec[0]))
+    if created:
+        _adjust(spec, instance.session_id, 1, amount)
+    elif old_session is None or old_amount is None:
+        mark_stale(instance.session_id)  # loaded without the amount
+    elif old_session != instance.session_id:
+        _adjust(spec, old_session, -1, -_decimal(old_amount))
+        _adjust(spec, instance.session_id, 1, amount)
+    elif amount != _decimal(old_amount):
+        _adjust(spec, instance.session_id, 0, amount - _decimal(old_amount))
+    instance._summarized = (instance.session_id, amount)
+
+
+def _on_amount_delete(spec, sender, instance, **kwargs):
+    _, amount = getattr(instance, "_summarized", (None, None))
+    if amount is None:
+        mark_stale(instance.session_id)
+    else:
+        _adjust(spec, instance.session_id, -1, -_decimal(amount))
+
+
+def connect_signals() -> None:
+    """Attach the intake receivers; called from IntakeConfig.ready."""
+    connect(IntakeSession, _on_session_save)
+    for model, flag in SECTIONS.items():
+        connect(model, partial(_on_section_save, flag), partial(_on_section_delete, flag))
+    for model, spec in AMOUNTS.items():
+        connect(
+            model,
+            partial(_on_amount_save, spec),
+            partial(_on_amount_delete, spec),
+            partial(_remember_amount, spec[0]),
+        )
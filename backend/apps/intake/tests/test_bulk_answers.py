@@ -4,7 +4,8 @@ import pytest
 from rest_framework.test import APIClient
 
 from apps.districts.models import District
-from apps.intake.models import FormAnswer, IntakeSession
+from apps.intake import summaries
+from apps.intake.models import FormAnswer, IntakeSession, SessionSummary
 from apps.users.models import User
 
 
@@ -60,6 +61,22 @@ class TestBulkAnswerView:
         sofa = SOFAReport.objects.get(session=session)
         assert sofa.has_prior_income is True
 
+    def test_bulk_upsert_refreshes_the_session_summary(self, auth_client_with_session):
+        client, session = auth_client_with_session
+        before = SessionSummary.objects.get(session=session).updated_at
+        payload = {
+            "answers": [
+                {"form_type": "form_test", "binding": "answer:form_test.q1", "value": "yes"},
+            ]
+        }
+        response = client.post(
+            f"/api/intake/sessions/{session.pk}/answers/bulk/", payload, format="json"
+        )
+
+        assert response.status_code == 200
+        assert SessionSummary.objects.get(session=session).updated_at > before
+        assert summaries.rebuild() == []
+
     def test_bulk_upsert_handles_sofa_bindings(self, auth_client_with_session):
         client, session = auth_client_with_session
         from apps.intake.models import SOFAReport
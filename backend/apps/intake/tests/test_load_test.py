@@ -0,0 +1,40 @@
+"""load_test replays a persona flow against a live server."""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db(transaction=True)
+def test_load_test_reports_every_endpoint(live_server, settings, tmp_path):
+    settings.OCR_PROVIDER = "stub"
+    settings.MEDIA_ROOT = str(tmp_path)
+    call_command("loaddata", "ilnd_2025_data", verbosity=0)
+    call_command("seed_demo_data", persona="maria", stdout=StringIO())
+
+    out = StringIO()
+    call_command(
+        "load_test",
+        base_url=live_server.url,
+        users=1,
+        iterations=1,
+        persona=["maria"],
+        json=True,
+        stdout=out,
+    )
+    report = json.loads(out.getvalue())
+
+    assert report["failures"] == []
+    assert report["flows"] == 1
+    endpoints = report["endpoints"]
+    assert all(
+        e["errors"] == 0 for label, e in endpoints.items() if not label.endswith("/download/")
+    )
+    assert endpoints["POST /api/intake/sessions/{id}/update_step/"]["requests"] == 6
+    assert endpoints["POST /api/forms/generate_all/"]["requests"] == 1
+    assert endpoints["POST /api/documents/upload/"]["requests"] == 1
+    assert "GET /api/forms/{id}/download/" in endpoints
+    summary = endpoints["GET /api/intake/sessions/{id}/summary/"]
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"]
@@ -0,0 +1,281 @@
+"""Tests for signal-maintained session summaries and the summary endpoint."""
+
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.districts.models import District
+from apps.documents.models import DocumentType, OCRResult, OCRStatus, UploadedDocument
+from apps.eligibility.models import MeansTest
+from apps.forms.models import GeneratedForm
+from apps.intake.models import (
+    AssetInfo,
+    DebtInfo,
+    DebtorInfo,
+    ExpenseInfo,
+    IncomeInfo,
+    IntakeSession,
+    SessionSummary,
+)
+from apps.intake.summaries import rebuild, summarize
+from apps.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def district():
+    return District.objects.create(
+        code="ILND",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court",
+        filing_fee_chapter_7=Decimal("338"),
+    )
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username="summarized", password="pw")
+
+
+@pytest.fixture
+def session(user, district):
+    return IntakeSession.objects.create(user=user, district=district)
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _stored(session) -> dict:
+    summary = SessionSummary.objects.get(session=session)
+    return {field: getattr(summary, field) for field in summarize(session.pk)}
+
+
+def _asset(session, value, description="Car"):
+    return AssetInfo.objects.create(
+        session=session, asset_type="vehicle", description=description, current_value=value
+    )
+
+
+def _debt(session, amount, creditor="Card Co"):
+    return DebtInfo.objects.create(
+        session=session, creditor_name=creditor, debt_type="credit_card", amount_owed=amount
+    )
+
+
+def _fill_sections(session):
+    DebtorInfo.objects.create(
+        session=session,
+        first_name="Ada",
+        last_name="Lovelace",
+        ssn="123-45-6789",
+        date_of_birth=date(1985, 12, 10),
+        phone="5555550100",
+        email="ada@example.com",
+        street_address="1 Main St",
+        city="Chicago",
+        state="IL",
+        zip_code="60601",
+    )
+    IncomeInfo.objects.create(session=session, monthly_income=[3000] * 6)
+    ExpenseInfo.objects.create(session=session, rent_or_mortgage=Decimal("1200"))
+
+
+def _document(session, status=OCRStatus.PENDING):
+    doc = UploadedDocument.objects.create(
+        session=session,
+        uploaded_by=session.user,
+        document_type=DocumentType.CREDITOR_BILL,
+        user_declared_type=DocumentType.CREDITOR_BILL,
+        original_filename="bill.pdf",
+        file_size=1024,
+        mime_type="application/pdf",
+        file="documents/2026/05/bill.pdf",
+    )
+    ocr = OCRResult.objects.create(
+        document=doc,
+        status=status,
+        extracted_data="{}",
+        confidence_scores={},
+        overall_confidence=0,
+    )
+    return doc, ocr
+
+
+def test_new_session_gets_an_empty_summary(session):
+    summary = SessionSummary.objects.get(session=session)
+    assert summary.completion_percentage == 0
+    assert summary.forms == [] and summary.means_test_passes is None
+    assert summary.total_asset_value == 0
+
+
+def test_intake_rows_keep_flags_counts_and_totals(session):
+    _fill_sections(session)
+    car = _asset(session, 8000.50)
+    _asset(session, "1200", description="Savings")
+    card = _debt(session, 2500)
+    loan = _debt(session, Decimal("900.25"), creditor="Lender")
+
+    stored = _stored(session)
+    assert stored == summarize(session.pk)
+    assert stored["asset_count"] == 2 and stored["total_asset_value"] == Decimal("9200.50")
+    assert stored["debt_count"] == 2 and stored["total_debt_amount"] == Decimal("3400.25")
+    assert SessionSummary.objects.get(session=session).completion_percentage == 100
+
+    reloaded = AssetInfo.objects.get(pk=car.pk)
+    reloaded.current_value = Decimal("7000.50")
+    reloaded.save()
+    card.amount_owed = Decimal("2600")
+    card.save()
+    loan.delete()
+    IncomeInfo.objects.filter(session=session).get().delete()
+
+    stored = _stored(session)
+    assert stored == summarize(session.pk)
+    assert stored["total_asset_value"] == Decimal("8200.50")
+    assert stored["debt_count"] == 1 and stored["total_debt_amount"] == Decimal("2600")
+    assert stored["has_income_info"] is False
+
+
+def test_deferred_amount_falls_back_to_a_recount(session):
+    asset = _asset(session, 500)
+    deferred = AssetInfo.objects.only("id", "description").get(pk=asset.pk)
+    deferred.description = "Bike"
+    deferred.save()
+    AssetInfo.objects.filter(pk=asset.pk).update(current_value=Decimal("650"))
+    AssetInfo.objects.only("id", "session_id").get(pk=asset.pk).delete()
+
+    assert _stored(session) == summarize(session.pk)
+
+
+def test_means_test_forms_and_ocr(session, district):
+    means_test = MeansTest.objects.create(
+        session=session,
+        district=district,
+        median_income_threshold=Decimal("71304"),
+        calculated_cmi=Decimal("3000"),
+        passes_means_test=True,
+        qualifies_for_fee_waiver=False,
+    )
+    first = GeneratedForm.objects.create(
+        session=session, form_type="form_101", status="generated", form_data={}
+    )
+    second = GeneratedForm.objects.create(
+        session=session, form_type="schedule_a_b", status="generated", form_data={}
+    )
+    first.status = "downloaded"
+    first.save()
+    _, pending = _document(session)
+    _document(session, status=OCRStatus.COMPLETED)
+
+    summary = SessionSummary.objects.get(session=session)
+    assert summary.means_test_passes is True and summary.means_test_fee_waiver is False
+    assert summary.forms == [
+        [second.pk, "schedule_a_b", "generated"],
+        [first.pk, "form_101", "downloaded"],
+    ]
+    assert summary.ocr_pending_count == 1
+
+    pending.status = OCRStatus.PROCESSING
+    pending.save(update_fields=["status"])
+    assert SessionSummary.objects.get(session=session).ocr_pending_count == 1
+    pending.status = OCRStatus.COMPLETED
+    pending.save()
+    second.delete()
+    means_test.delete()
+
+    stored = _stored(session)
+    assert stored == summarize(session.pk)
+    assert stored["ocr_pending_count"] == 0
+    assert stored["forms"] == [[first.pk, "form_101", "downloaded"]]
+    assert stored["means_test_passes"] is None
+
+
+def test_deleting_a_session_leaves_no_summary(session):
+    _fill_sections(session)
+    _asset(session, 100)
+    _debt(session, 50)
+    _document(session)
+
+    session.delete()
+    assert not SessionSummary.objects.exists()
+
+
+def test_rebuild_corrects_drift(session, user, district):
+    _asset(session, 100)
+    _debt(session, 50)
+    AssetInfo.objects.filter(session=session).update(current_value=Decimal("300"))
+    legacy = IntakeSession.objects.create(user=user, district=district)
+    SessionSummary.objects.filter(session=legacy).delete()
+
+    out = StringIO()
+    call_command("rebuild_session_summaries", stdout=out)
+
+    assert f"session {session.pk} rebuilt" in out.getvalue()
+    assert "(2 corrected)" in out.getvalue()
+    assert _stored(session)["total_asset_value"] == Decimal("300")
+    assert _stored(legacy) == summarize(legacy.pk)
+    assert rebuild() == []
+
+
+def test_summary_endpoint_reads_the_summary_row(client, session, django_assert_num_queries):
+    _fill_sections(session)
+    _asset(session, 8000)
+    _debt(session, Decimal("2500.75"))
+    GeneratedForm.objects.create(
+        session=session, form_type="form_101", status="generated", form_data={}
+    )
+    _document(session)
+
+    # The session with its sections, its assets and debts, the summary row and
+    # the request's audit log entry; nothing scans forms, means tests or OCR.
+    with django_assert_num_queries(5):
+        response = client.get(f"/api/intake/sessions/{session.pk}/summary/")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["session"]["id"] == session.pk
+    assert data["session"]["district_name"] == "Northern District of Illinois"
+    assert len(data["session"]["assets"]) == len(data["session"]["debts"]) == 1
+    assert data["session"]["debtor_info"] is not None
+    assert data["progress"]["completion_percentage"] == 100
+    assert data["financial"] == {
+        "asset_count": 1,
+        "debt_count": 1,
+        "total_asset_value": "8000",
+        "total_debt_amount": "2500.75",
+    }
+    assert "means_test" not in data
+    assert data["forms"] == {
+        "generated_count": 1,
+        "forms": [{"form_type": "form_101", "status": "generated"}],
+    }
+    assert data["documents"] == {"ocr_pending": 1}
+
+
+def test_summary_endpoint_builds_a_missing_row(client, session):
+    _debt(session, 75)
+    SessionSummary.objects.filter(session=session).delete()
+
+    response = client.get(f"/api/intake/sessions/{session.pk}/summary/")
+
+    assert response.status_code == 200
+    assert response.json()["financial"]["debt_count"] == 1
+    assert SessionSummary.objects.filter(session=session).exists()
+
+
+def test_summary_endpoint_is_scoped_to_the_user(client, district):
+    other = User.objects.create_user(username="someone-else", password="pw")
+    theirs = IntakeSession.objects.create(user=other, district=district)
+
+    assert client.get(f"/api/intake/sessions/{theirs.pk}/summary/").status_code == 404
+    assert client.get("/api/intake/sessions/nope/summary/").status_code == 404
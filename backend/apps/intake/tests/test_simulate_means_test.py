@@ -0,0 +1,177 @@
+"""Tests for the side-effect-free means test simulator endpoint."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.districts.models import District, MedianIncome
+from apps.eligibility.models import MeansTest
+from apps.eligibility.services import MeansTestCalculator
+from apps.eligibility.services.means_test_simulator import MAX_SCENARIOS
+from apps.intake.models import DebtInfo, ExpenseInfo, IncomeInfo, IntakeSession
+
+User = get_user_model()
+
+
+@pytest.fixture
+def session(db):
+    district = District.objects.create(
+        code="ilnd",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court",
+        filing_fee_chapter_7=Decimal("338"),
+    )
+    MedianIncome.objects.create(
+        district=district,
+        effective_date=date(2024, 4, 1),
+        family_size_1=Decimal("71304.00"),
+        family_size_2=Decimal("91526.00"),
+        family_size_3=Decimal("110712.00"),
+        family_size_4=Decimal("134366.00"),
+        family_size_5=Decimal("145466.00"),
+        family_size_6=Decimal("156566.00"),
+        family_size_7=Decimal("167666.00"),
+        family_size_8=Decimal("178766.00"),
+    )
+    user = User.objects.create_user(username="simulate", password="pass")
+    session = IntakeSession.objects.create(user=user, district=district)
+    IncomeInfo.objects.create(
+        session=session, marital_status="single", number_of_dependents=0, monthly_income=[6200] * 6
+    )
+    ExpenseInfo.objects.create(
+        session=session,
+        rent_or_mortgage=Decimal("1500"),
+        food_and_groceries=Decimal("600"),
+        medical_expenses=Decimal("50"),
+        vehicle_payment=Decimal("250"),
+    )
+    DebtInfo.objects.create(
+        session=session,
+        creditor_name="IRS",
+        amount_owed=Decimal("5000"),
+        is_secured=False,
+        is_priority=True,
+        debt_type="taxes",
+        monthly_payment=Decimal("200"),
+    )
+    return session
+
+
+@pytest.fixture
+def client(session):
+    client = APIClient()
+    client.force_authenticate(user=session.user)
+    return client
+
+
+def _url(session):
+    return reverse("intake-session-simulate-means-test", kwargs={"pk": session.pk})
+
+
+def test_scenarios_are_evaluated_without_writes(client, session):
+    payload = {
+        "scenarios": [
+            {"label": "less overtime", "changes": [{"field": "income", "delta": "-300"}]},
+            {"label": "new baby", "changes": [{"field": "household", "delta": 1}]},
+            {
+                "label": "lower rent, more tax",
+                "changes": [
+                    {"field": "housing", "value": "900"},
+                    {"field": "priority", "delta": "400"},
+                ],
+            },
+            {"label": "lose job", "changes": [{"field": "income", "value": "0"}]},
+        ]
+    }
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.post(_url(session), payload, format="json")
+
+    assert response.status_code == 200, response.content
+    # The audit middleware records the request; the simulation itself writes nothing.
+    writes = [
+        q["sql"]
+        for q in ctx.captured_queries
+        if not q["sql"].lstrip().startswith("SELECT") and '"audit_logs"' not in q["sql"]
+    ]
+    assert writes == []
+    assert not MeansTest.objects.exists()
+
+    data = response.json()
+    baseline = data["baseline"]
+    assert baseline["label"] == "baseline"
+    assert baseline["passes_means_test"] is False  # $74,400 a year is above the median
+    assert Decimal(baseline["cmi"]) == Decimal("6200.00")
+    assert Decimal(baseline["median_income_threshold"]) == Decimal("71304.00")
+
+    less, baby, rent, jobless = data["scenarios"]
+    assert less["label"] == "less overtime"
+    assert Decimal(less["cmi"]) == Decimal("5900.00")
+    assert less["below_median"] and less["passes_means_test"]
+    assert baby["family_size"] == 2 and baby["below_median"]
+    assert Decimal(baby["median_income_threshold"]) == Decimal("91526.00")
+    assert not rent["below_median"]
+    assert Decimal(rent["total_allowable_expenses"]) < Decimal(baseline["total_allowable_expenses"])
+    assert jobless["qualifies_for_fee_waiver"] and Decimal(jobless["cmi"]) == 0
+
+
+def test_baseline_matches_calculator(client, session):
+    data = client.post(
+        _url(session),
+        {"scenarios": [{"label": "same", "changes": []}]},
+        format="json",
+    ).json()
+
+    stored = MeansTestCalculator(session).calculate()
+    for outcome in (data["baseline"], data["scenarios"][0]):
+        assert outcome["passes_means_test"] == stored["passes_means_test"]
+        assert outcome["qualifies_for_fee_waiver"] == stored["qualifies_for_fee_waiver"]
+        assert Decimal(outcome["cmi"]) == stored["cmi"].quantize(Decimal("0.01"))
+        assert Decimal(outcome["median_income_threshold"]) == stored["median_income_threshold"]
+        assert Decimal(outcome["total_allowable_expenses"]) == stored["total_allowable_expenses"]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"field": "income"},
+        {"field": "income", "delta": "1", "value": "2"},
+        {"field": "pets", "delta": "1"},
+        {"field": "household", "delta": "0.5"},
+    ],
+)
+def test_invalid_changes_are_rejected(client, session, change):
+    response = client.post(
+        _url(session), {"scenarios": [{"label": "x", "changes": [change]}]}, format="json"
+    )
+    assert response.status_code == 400
+
+
+def test_scenario_count_is_capped(client, session):
+    scenarios = [{"label": str(i), "changes": []} for i in range(MAX_SCENARIOS + 1)]
+    response = client.post(_url(session), {"scenarios": scenarios}, format="json")
+    assert response.status_code == 400
+
+
+def test_session_without_income_is_rejected(client, session):
+    session.income_info.delete()
+    response = client.post(
+        _url(session), {"scenarios": [{"label": "x", "changes": []}]}, format="json"
+    )
+    assert response.status_code == 400
+    assert "income" in response.json()["error"].lower()
+
+
+def test_other_users_session_is_not_found(session):
+    other = APIClient()
+    other.force_authenticate(user=User.objects.create_user(username="other", password="pass"))
+    response = other.post(
+        _url(session), {"scenarios": [{"label": "x", "changes": []}]}, format="json"
+    )
+    assert response.status_code == 404
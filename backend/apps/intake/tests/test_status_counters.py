@@ -0,0 +1,154 @@
+"""Tests for signal-maintained status counters and their reconciliation."""
+
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.districts.models import District
+from apps.documents.models import DocumentType, OCRResult, OCRStatus, UploadedDocument
+from apps.forms.models import GeneratedForm
+from apps.intake.counters import (
+    FORM_STATUS,
+    FORM_TYPE,
+    FORM_TYPE_STATUS,
+    OCR_STATUS,
+    SESSION_STATUS,
+    read,
+    reconcile,
+)
+from apps.intake.models import IntakeSession
+from apps.users.models import User
+from config.views import _collect_form_metrics, _collect_session_metrics
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def district():
+    return District.objects.create(
+        code="ILND",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court",
+        filing_fee_chapter_7=Decimal("338"),
+    )
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(username="counted", password="pw")
+
+
+def _sessions():
+    return {k: v for k, v in read(SESSION_STATUS)[SESSION_STATUS].items() if v}
+
+
+def _form(session, form_type="form_101", status="generated"):
+    return GeneratedForm.objects.create(
+        session=session, form_type=form_type, status=status, form_data={}
+    )
+
+
+def test_session_status_transitions(user, district):
+    first = IntakeSession.objects.create(user=user, district=district)
+    second = IntakeSession.objects.create(user=user, district=district)
+    assert _sessions() == {"started": 2}
+
+    first.status = "in_progress"
+    first.save()
+    first.save()  # unchanged status is not counted twice
+    assert _sessions() == {"started": 1, "in_progress": 1}
+
+    reloaded = IntakeSession.objects.get(pk=first.pk)
+    reloaded.status = "completed"
+    reloaded.save(update_fields=["status"])
+    second.delete()
+    assert _sessions() == {"completed": 1}
+
+
+def test_form_lifecycle_and_cascade(user, district):
+    session = IntakeSession.objects.create(user=user, district=district)
+    form = _form(session)
+    _form(session, form_type="schedule_d")
+
+    form.status = "downloaded"
+    form.save()
+    GeneratedForm.objects.update_or_create(
+        session=session, form_type="form_101", defaults={"status": "filed"}
+    )
+    counts = read(FORM_TYPE, FORM_STATUS)
+    assert counts[FORM_TYPE] == {"form_101": 1, "schedule_d": 1}
+    assert {k: v for k, v in counts[FORM_STATUS].items() if v} == {"generated": 1, "filed": 1}
+    assert {k: v for k, v in read(FORM_TYPE_STATUS)[FORM_TYPE_STATUS].items() if v} == {
+        "form_101:filed": 1,
+        "schedule_d:generated": 1,
+    }
+
+    session.delete()
+    counts = read(FORM_TYPE, FORM_STATUS, FORM_TYPE_STATUS)
+    assert set(counts[FORM_TYPE].values()) == {0}
+    assert set(counts[FORM_STATUS].values()) == {0}
+    assert set(counts[FORM_TYPE_STATUS].values()) == {0}
+
+
+def test_ocr_status_lifecycle(user, district):
+    session = IntakeSession.objects.create(user=user, district=district)
+    doc = UploadedDocument.objects.create(
+        session=session,
+        uploaded_by=user,
+        document_type=DocumentType.CREDITOR_BILL,
+        user_declared_type=DocumentType.CREDITOR_BILL,
+        original_filename="bill.pdf",
+        file_size=1024,
+        mime_type="application/pdf",
+        file="documents/2026/05/bill.pdf",
+    )
+    ocr = OCRResult.objects.create(
+        document=doc,
+        status=OCRStatus.PENDING,
+        extracted_data="{}",
+        confidence_scores={},
+        overall_confidence=0,
+    )
+    ocr.status = OCRStatus.COMPLETED
+    ocr.save(update_fields=["status"])
+    assert {k: v for k, v in read(OCR_STATUS)[OCR_STATUS].items() if v} == {"completed": 1}
+
+    OCRResult.objects.filter(pk=ocr.pk).update(status=OCRStatus.FAILED)  # no signal
+    assert reconcile()[OCR_STATUS] == {"completed": (1, 0), "failed": (0, 1)}
+
+    session.delete()
+    assert set(read(OCR_STATUS)[OCR_STATUS].values()) == {0}
+
+
+def test_reconcile_corrects_drift_from_bulk_updates(user, district):
+    session = IntakeSession.objects.create(user=user, district=district)
+    IntakeSession.objects.filter(pk=session.pk).update(status="abandoned")  # no signal
+    assert _sessions() == {"started": 1}
+
+    drift = reconcile()
+    assert drift[SESSION_STATUS] == {"started": (1, 0), "abandoned": (0, 1)}
+    assert _sessions() == {"abandoned": 1}
+    assert reconcile() == {}
+
+
+def test_reconcile_command_reports_corrections(user, district):
+    session = IntakeSession.objects.create(user=user, district=district)
+    IntakeSession.objects.filter(pk=session.pk).update(status="completed")
+    out = StringIO()
+    call_command("reconcile_status_counters", stdout=out)
+    assert "session_status:completed 0 -> 1" in out.getvalue()
+    assert "2 corrected" in out.getvalue()
+
+
+def test_metrics_read_counters_in_constant_queries(user, district, django_assert_num_queries):
+    for _ in range(3):
+        session = IntakeSession.objects.create(user=user, district=district)
+        _form(session)
+    with django_assert_num_queries(2):
+        sessions = _collect_session_metrics()
+        forms = _collect_form_metrics()
+    assert sessions == {"active": 3, "completed": 0, "abandoned": 0, "total": 3}
+    assert forms == {"by_type": {"form_101": 3}, "by_status": {"generated": 3}, "total": 3}
@@ -12,8 +12,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from apps.eligibility.services import MeansTestCalculator
+from apps.eligibility.services.means_test_simulator import simulate
 from apps.forms.services import Form101Generator
+from config.pagination import IdCursorPagination
+from config.query_budget import query_budget
 
+from . import summaries
 from .models import (
     AssetInfo,
     Codebtor,
@@ -22,6 +26,7 @@ from .models import (
     FeeWaiverApplication,
     FormAnswer,
     IntakeSession,
+    SessionSummary,
     SOFAReport,
 )
 from .serializers import (
@@ -32,6 +37,7 @@ from .serializers import (
     ExecutoryContractSerializer,
     FeeWaiverApplicationSerializer,
     IntakeSessionSerializer,
+    MeansTestSimulationSerializer,
     SOFAReportSerializer,
 )
 
@@ -49,6 +55,12 @@ def _assert_session_owned(session, user):
         raise PermissionDenied("You do not have access to this session.")
 
 
+def _answer_key(binding: str) -> tuple[str, str]:
+    """``"answer:<form_type>.<key>"`` -> (form_type, key)."""
+    form_type, _, key = binding[len("answer:") :].partition(".")
+    return form_type, key
+
+
 class IntakeSessionViewSet(viewsets.ModelViewSet):
     """
     ViewSet for intake session management.
@@ -235,6 +247,43 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    # Three queries, plus five the first time a worker loads the standards catalog.
+    @action(detail=True, methods=["post"])
+    @query_budget(10, "intake.simulate_means_test")
+    def simulate_means_test(self, request, pk=None):
+        """
+        Evaluate what-if changes to this session's means test without saving.
+
+        POST /api/intake/sessions/{id}/simulate_means_test/
+            {
+                "scenarios": [
+                    {"label": "less overtime", "changes": [{"field": "income", "delta": "-300"}]},
+                    {"label": "new baby", "changes": [{"field": "household", "delta": 1}]}
+                ],
+                "as_of": "2025-06-01"  (optional filing date)
+            }
+
+        Returns the baseline and one result per scenario, in order. Nothing
+        is written: the stored means test result stays as it was.
+        """
+        session = self.get_object()
+        serializer = MeansTestSimulationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            result = simulate(
+                session, serializer.to_scenarios(), as_of=serializer.validated_data.get("as_of")
+            )
+        except ValueError as e:
+            return Response(
+                {
+                    "error": str(e),
+                    "message": "Unable to estimate the means test. Please ensure all income information is provided.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"session_id": session.id, **result})
+
     @action(detail=True, methods=["get"])
     def preview_form_101(self, request, pk=None):
         """
@@ -267,7 +316,12 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    # The session with its nested intake data (as IntakeSessionSerializer
+    # returns it) plus one query for the SessionSummary row kept current by
+    # apps.intake.summaries; about fifteen more the first time a session from
+    # before summaries is read.
     @action(detail=True, methods=["get"])
+    @query_budget(25, "intake.summary")
     def summary(self, request, pk=None):
         """
         Get comprehensive session summary.
@@ -275,40 +329,57 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
         GET /api/intake/sessions/{id}/summary/
 
         Returns:
-            Complete session data including:
-            - Debtor information
-            - Financial overview
+            Complete session data, plus status and progress, including:
+            - Completion of each intake section
+            - Financial overview (asset and debt counts and totals)
             - Means test result (if calculated)
             - Form generation status
+            - Documents still waiting for OCR
         """
         session = self.get_object()
+        summary = SessionSummary.objects.filter(session=session).first()
+        if summary is None:
+            # Sessions from before summaries were kept get their row on first read.
+            summary = summaries.refresh(session.pk)
 
-        # Build summary
         summary_data = {
             "session": IntakeSessionSerializer(session).data,
             "progress": {
                 "current_step": session.current_step,
                 "status": session.status,
-                "completion_percentage": self._calculate_completion_percentage(session),
+                "completion_percentage": summary.completion_percentage,
+            },
+            "financial": {
+                "asset_count": summary.asset_count,
+                "debt_count": summary.debt_count,
+                "total_asset_value": str(summary.total_asset_value),
+                "total_debt_amount": str(summary.total_debt_amount),
             },
         }
 
         # Add means test if calculated
-        if hasattr(session, "means_test"):
+        if summary.means_test_passes is not None:
             summary_data["means_test"] = {
-                "passes": session.means_test.passes_means_test,
-                "qualifies_fee_waiver": session.means_test.qualifies_for_fee_waiver,
+                "passes": summary.means_test_passes,
+                "qualifies_fee_waiver": summary.means_test_fee_waiver,
             }
 
         # Add form generation status
         summary_data["forms"] = {
-            "generated_count": session.generated_forms.count(),
-            "forms": list(session.generated_forms.values("form_type", "status")),
+            "generated_count": len(summary.forms),
+            "forms": [
+                {"form_type": form_type, "status": form_status}
+                for _, form_type, form_status in summary.forms
+            ],
         }
+        summary_data["documents"] = {"ocr_pending": summary.ocr_pending_count}
 
         return Response(summary_data)
 
+    # One read of the existing answers and one upsert for any number of fields,
+    # a write per SOFA collection saved, and one summary refresh.
     @action(detail=True, methods=["post"], url_path="answers/bulk", url_name="bulk-answers")
+    @query_budget(25, "intake.bulk_answers")
     def bulk_answers(self, request, pk=None):
         session = self.get_object()
         serializer = BulkAnswerPayloadSerializer(data=request.data)
@@ -324,23 +395,35 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
         models_to_save = {}
         cached_collections = {}
 
+        # FormAnswer rows are upserted together after the loop: one query to
+        # find the keys that exist, one INSERT ... ON CONFLICT for all of them.
+        answer_values = {}
+        answer_field_keys = {
+            _answer_key(ans["binding"])[1]
+            for ans in answers_data
+            if ans["binding"].startswith("answer:")
+        }
+        known_keys = set()
+        if answer_field_keys:
+            known_keys = set(
+                FormAnswer.objects.filter(
+                    session=session, field_key__in=answer_field_keys
+                ).values_list("form_type", "field_key")
+            )
+
         with transaction.atomic():
             for ans in answers_data:
                 binding = ans["binding"]
                 val = ans["value"]
 
                 if binding.startswith("answer:"):
-                    form_type, _, key = binding[len("answer:") :].partition(".")
-                    obj, created = FormAnswer.objects.update_or_create(
-                        session=session,
-                        form_type=form_type,
-                        field_key=key,
-                        defaults={"value": val},
-                    )
-                    if created:
-                        created_count += 1
-                    else:
+                    form_type, key = _answer_key(binding)
+                    if (form_type, key) in known_keys:
                         updated_count += 1
+                    else:
+                        created_count += 1
+                        known_keys.add((form_type, key))
+                    answer_values[(form_type, key)] = val
 
                 elif binding.startswith("sofa."):
                     path = binding[len("sofa.") :]
@@ -377,6 +460,19 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
                             models_to_save[id(sofa_report)] = sofa_report
                             updated_count += 1
 
+            if answer_values:
+                FormAnswer.objects.bulk_create(
+                    [
+                        FormAnswer(session=session, form_type=form_type, field_key=key, value=val)
+                        for (form_type, key), val in answer_values.items()
+                    ],
+                    update_conflicts=True,
+                    unique_fields=["session", "form_type", "field_key"],
+                    update_fields=["value"],
+                )
+                # bulk_create sends no post_save, so refresh the summary directly.
+                summaries.refresh(session.pk, create=False)
+
             for model_obj in models_to_save.values():
                 model_obj.save()
 
@@ -436,7 +532,9 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
         except Codebtor.DoesNotExist:
             return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
 
+    # Set-based evaluation: the same queries however many debts the session has.
     @action(detail=True, methods=["post"], url_path="dischargeability", url_name="dischargeability")
+    @query_budget(14, "intake.dischargeability")
     def dischargeability(self, request, pk=None):
         session = self.get_object()
         from apps.eligibility.services.dischargeability_service import DischargeabilityService
@@ -445,24 +543,6 @@ class IntakeSessionViewSet(viewsets.ModelViewSet):
         results = svc.evaluate()
         return Response(results)
 
-    def _calculate_completion_percentage(self, session):
-        """Calculate how complete the intake session is."""
-        completed_sections = 0
-        total_sections = 5  # debtor, income, expenses, assets, debts
-
-        if hasattr(session, "debtor_info"):
-            completed_sections += 1
-        if hasattr(session, "income_info"):
-            completed_sections += 1
-        if hasattr(session, "expense_info"):
-            completed_sections += 1
-        if session.assets.exists():
-            completed_sections += 1
-        if session.debts.exists():
-            completed_sections += 1
-
-        return int((completed_sections / total_sections) * 100)
-
 
 class AssetViewSet(viewsets.ModelViewSet):
     """
@@ -473,6 +553,7 @@ class AssetViewSet(viewsets.ModelViewSet):
 
     serializer_class = AssetInfoSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
         """Return only assets for user's intake sessions."""
@@ -499,6 +580,7 @@ class DebtViewSet(viewsets.ModelViewSet):
 
     serializer_class = DebtInfoSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = IdCursorPagination
 
     def get_queryset(self):
         """Return only debts for user's intake sessions."""
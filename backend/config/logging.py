@@ -36,7 +36,15 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Include extra fields from record if present
-        for key in ("user_id", "ip_address", "path", "method", "status_code", "upl_sensitive"):
+        for key in (
+            "user_id",
+            "ip_address",
+            "path",
+            "method",
+            "status_code",
+            "upl_sensitive",
+            "perf",
+        ):
             value = getattr(record, key, None)
             if value is not None:
                 log_entry[key] = value
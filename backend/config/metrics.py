@@ -0,0 +1,233 @@
+"""
+Prometheus metrics for DigniFi.
+
+Series (all prefixed ``dignifi_``):
+
+- ``http_request_duration_seconds{method,route,status}``: request latency
+  histogram per URL name.
+- ``db_queries_per_request{route}``: database queries per request.
+- ``form_generator_duration_seconds{form_type,operation}``: generate, preview
+  and pdf_field_map runs.
+- ``pdf_render_duration_seconds{form_type}``: PDF template fills.
+- ``ocr_provider_duration_seconds{provider}``: one provider extraction call.
+- ``ocr_queue_wait_seconds``: upload to start of processing.
+- ``ocr_in_flight``: documents being processed right now.
+- ``audit_buffer_depth``: entries waiting in the audit write buffer.
+- ``intake_sessions{status}``, ``generated_forms{form_type,status}``,
+  ``ocr_documents{status}``: row counts, published on a timer
+  (METRICS_COUNT_REFRESH_SECONDS) from the signal-maintained StatusCounter
+  rows (``apps.intake.counters``); the GROUP BYs only run when
+  ``reconcile_status_counters`` corrects drift.
+
+Under gunicorn, ``gunicorn.conf.py`` points PROMETHEUS_MULTIPROC_DIR at a
+shared directory before any worker starts. prometheus_client then keeps each
+worker's values in mmap'd files there, and the ``/metrics/`` view merges them
+with MultiProcessCollector, so a scrape sees every worker. Without the
+variable (runserver, tests) the process's default registry is served.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import close_old_connections, connections
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+logger = logging.getLogger(__name__)
+
+_QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250, 500)
+_SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 40, 80, 160)
+
+REQUEST_SECONDS = Histogram(
+    "dignifi_http_request_duration_seconds",
+    "Request latency by URL name.",
+    ["method", "route", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "dignifi_db_queries_per_request",
+    "Database queries issued while serving one request.",
+    ["route"],
+    buckets=_QUERY_BUCKETS,
+)
+GENERATOR_SECONDS = Histogram(
+    "dignifi_form_generator_duration_seconds",
+    "Form generator run time.",
+    ["form_type", "operation"],
+)
+PDF_RENDER_SECONDS = Histogram(
+    "dignifi_pdf_render_duration_seconds",
+    "Time to fill an AO PDF template.",
+    ["form_type"],
+)
+OCR_PROVIDER_SECONDS = Histogram(
+    "dignifi_ocr_provider_duration_seconds",
+    "One OCR provider extraction call.",
+    ["provider"],
+    buckets=_SLOW_BUCKETS,
+)
+OCR_QUEUE_WAIT_SECONDS = Histogram(
+    "dignifi_ocr_queue_wait_seconds",
+    "Time from upload to the start of OCR processing.",
+    buckets=_SLOW_BUCKETS,
+)
+OCR_IN_FLIGHT = Gauge(
+    "dignifi_ocr_in_flight",
+    "Documents being processed.",
+    multiprocess_mode="livesum",
+)
+AUDIT_BUFFER_DEPTH = Gauge(
+    "dignifi_audit_buffer_depth",
+    "Audit entries waiting for the background writer.",
+    multiprocess_mode="livesum",
+)
+INTAKE_SESSIONS = Gauge(
+    "dignifi_intake_sessions",
+    "Intake sessions by status.",
+    ["status"],
+    multiprocess_mode="mostrecent",
+)
+GENERATED_FORMS = Gauge(
+    "dignifi_generated_forms",
+    "Generated forms by type and status.",
+    ["form_type", "status"],
+    multiprocess_mode="mostrecent",
+)
+OCR_DOCUMENTS = Gauge(
+    "dignifi_ocr_documents",
+    "Uploaded documents by OCR status.",
+    ["status"],
+    multiprocess_mode="mostrecent",
+)
+
+
+def _route(request: HttpRequest) -> str:
+    match = getattr(request, "resolver_match", None)
+    return match.view_name if match is not None and match.view_name else "unmatched"
+
+
+class MetricsMiddleware:
+    """Observes request latency and query count per route."""
+
+    def __init__(self, get_response):
+        if not settings.METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        queries = [0]
+
+        def count(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        with connections["default"].execute_wrapper(count):
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        route = _route(request)
+        REQUEST_SECONDS.labels(
+            method=request.method, route=route, status=f"{response.status_code // 100}xx"
+        ).observe(elapsed)
+        REQUEST_QUERIES.labels(route=route).observe(queries[0])
+        return response
+
+
+def refresh_counts() -> None:
+    """Publish the row-count gauges from the StatusCounter rows (one query)."""
+    from apps.intake.counters import (
+        FORM_TYPE_STATUS,
+        KEY_SEPARATOR,
+        OCR_STATUS,
+        SESSION_STATUS,
+        read,
+    )
+
+    counts = read(SESSION_STATUS, FORM_TYPE_STATUS, OCR_STATUS)
+    _publish(INTAKE_SESSIONS, {(key,): n for key, n in counts[SESSION_STATUS].items() if n})
+    _publish(
+        GENERATED_FORMS,
+        {tuple(key.split(KEY_SEPARATOR, 1)): n for key, n in counts[FORM_TYPE_STATUS].items() if n},
+    )
+    _publish(OCR_DOCUMENTS, {(key,): n for key, n in counts[OCR_STATUS].items() if n})
+
+
+_published: dict[str, set[tuple[str, ...]]] = {}
+
+
+def _publish(gauge: Gauge, counts: dict[tuple[str, ...], int]) -> None:
+    # Labels that vanished are set to 0 rather than removed: in multiprocess
+    # mode a removed child would keep its last value in the mmap'd file.
+    seen = _published.setdefault(gauge._name, set())
+    for labels in seen - counts.keys():
+        gauge.labels(*labels).set(0)
+    for labels, count in counts.items():
+        gauge.labels(*labels).set(count)
+    seen.update(counts)
+
+
+class CountRefresher:
+    """Daemon thread that calls ``refresh_counts`` every ``interval`` seconds."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._refresh()
+        self._thread = threading.Thread(target=self._run, name="metrics-counts", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            close_old_connections()
+            self._refresh()
+
+    def _refresh(self) -> None:
+        try:
+            refresh_counts()
+        except Exception:
+            logger.exception("Metrics count refresh failed")
+
+
+_refresher: CountRefresher | None = None
+_refresher_pid: int | None = None
+_refresher_lock = threading.Lock()
+
+
+def ensure_count_refresher() -> None:
+    """Start this process's refresher on first scrape (and again after a fork)."""
+    global _refresher, _refresher_pid
+    if _refresher is not None and _refresher_pid == os.getpid():
+        return
+    with _refresher_lock:
+        if _refresher is None or _refresher_pid != os.getpid():
+            refresher = CountRefresher(settings.METRICS_COUNT_REFRESH_SECONDS)
+            refresher.start()
+            _refresher, _refresher_pid = refresher, os.getpid()
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Exposition-format payload, merged across workers in multiprocess mode."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,78 @@
+"""
+Keyset (cursor) pagination for list endpoints.
+
+PageNumberPagination runs ``COUNT(*)`` and ``OFFSET n`` on every page, so a
+page's cost grows with its depth. These classes page by the position of the
+last row seen on an indexed ordering instead, and are chosen per viewset via
+``pagination_class``:
+
+    pagination_class = IdCursorPagination          # "id" ascending
+    pagination_class = NewestIdCursorPagination    # "-id"
+
+A client that needs a total sends ``?include_count=1`` and receives an
+``X-Estimated-Count`` header: the planner's row estimate on PostgreSQL (an
+exact count elsewhere), cached for ``count_cache_seconds``. No list request
+ever pays for an exact count on PostgreSQL.
+"""
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.pagination import CursorPagination
+
+ESTIMATED_COUNT_HEADER = "X-Estimated-Count"
+
+
+def estimated_count(queryset, timeout: int = 60) -> int:
+    """Approximate ``queryset.count()`` without scanning, cached by SQL."""
+    sql, params = queryset.query.sql_with_params()
+    key = "estimated-count:" + hashlib.sha256(f"{sql}|{params!r}".encode()).hexdigest()
+    value = cache.get(key)
+    if value is None:
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            value = int(plan[0]["Plan"]["Plan Rows"])
+        else:
+            value = queryset.count()
+        cache.set(key, value, timeout)
+    return value
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination with an opt-in estimated total. Subclasses set ``ordering``."""
+
+    page_size_query_param = "page_size"
+    max_page_size = 200
+    count_query_param = "include_count"
+    count_cache_seconds = 60
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.estimated_total = None
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            self.estimated_total = estimated_count(queryset, self.count_cache_seconds)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.estimated_total is not None:
+            response[ESTIMATED_COUNT_HEADER] = str(self.estimated_total)
+        return response
+
+
+class IdCursorPagination(KeysetPagination):
+    """Oldest first on the primary key (entry order)."""
+
+    ordering = "id"
+
+
+class NewestIdCursorPagination(KeysetPagination):
+    """Newest first on the primary key."""
+
+    ordering = "-id"
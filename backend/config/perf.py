@@ -0,0 +1,206 @@
+"""
+Request-level performance instrumentation.
+
+``PerformanceMiddleware`` records, for each request:
+
+- wall time
+- database query count and time (``connection.execute_wrapper``)
+- field encryption/decryption calls and time
+- named spans opened by application code, e.g. ``pdf_fill``, ``ocr_provider``
+  and ``generator``
+
+The numbers are logged on the ``dignifi.perf`` logger as a ``perf`` field of
+the JSON log line, which already carries the request ID. Requests slower than
+PERF_SLOW_REQUEST_MS are logged at WARNING with probability
+PERF_SLOW_SAMPLE_RATE; all other requests are logged at INFO with probability
+PERF_SAMPLE_RATE.
+
+Application code marks spans with ``span("name")`` or ``@timed("name")``.
+Both reduce to one context-variable lookup when no request is being measured,
+and the middleware removes itself at startup unless
+PERF_INSTRUMENTATION_ENABLED is set. A context variable (rather than the
+thread-local used for request IDs) lets spans opened in OCR coroutines and
+their ``asyncio.to_thread`` workers reach the request's stats.
+"""
+
+import functools
+import logging
+import random
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+logger = logging.getLogger("dignifi.perf")
+
+_current: ContextVar["RequestStats | None"] = ContextVar("perf_request_stats", default=None)
+
+
+@dataclass
+class RequestStats:
+    """Counters for one request; shared by every thread and task it spawns."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    crypto_calls: int = 0
+    crypto_seconds: float = 0.0
+    spans: dict[str, list[float]] = field(default_factory=dict)  # name -> [count, seconds]
+
+    def add_span(self, name: str, seconds: float) -> None:
+        entry = self.spans.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+    def as_dict(self, wall_seconds: float) -> dict[str, Any]:
+        return {
+            "wall_ms": _ms(wall_seconds),
+            "db_queries": self.db_queries,
+            "db_ms": _ms(self.db_seconds),
+            "crypto_calls": self.crypto_calls,
+            "crypto_ms": _ms(self.crypto_seconds),
+            "spans": {
+                name: {"count": int(count), "ms": _ms(seconds)}
+                for name, (count, seconds) in sorted(self.spans.items())
+            },
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+def current_stats() -> RequestStats | None:
+    """The stats of the request being measured, if any."""
+    return _current.get()
+
+
+@contextmanager
+def span(name: str):
+    """Time the enclosed block under ``name`` on the current request's stats."""
+    stats = _current.get()
+    if stats is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_span(name, time.perf_counter() - started)
+
+
+def timed(name: str):
+    """Decorator form of ``span``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = _current.get()
+            if stats is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.add_span(name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+def _timed_crypto(func):
+    @functools.wraps(func)
+    def wrapper(value):
+        stats = _current.get()
+        if stats is None:
+            return func(value)
+        started = time.perf_counter()
+        try:
+            return func(value)
+        finally:
+            stats.crypto_calls += 1
+            stats.crypto_seconds += time.perf_counter() - started
+
+    wrapper._perf_wrapped = True
+    return wrapper
+
+
+def install_crypto_timers() -> None:
+    """
+    Time django-encrypted-model-fields' encrypt/decrypt helpers.
+
+    Its field classes call the module-level ``encrypt_str``/``decrypt_str``
+    by name, so wrapping the module attributes covers every encrypted field.
+    """
+    from encrypted_model_fields import fields
+
+    for name in ("encrypt_str", "decrypt_str"):
+        func = getattr(fields, name)
+        if not getattr(func, "_perf_wrapped", False):
+            setattr(fields, name, _timed_crypto(func))
+
+
+class PerformanceMiddleware:
+    """
+    Measures each request and logs a sampled ``perf`` line.
+
+    Must sit after RequestIDMiddleware so the log line carries the request ID.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PERF_INSTRUMENTATION_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = settings.PERF_SLOW_REQUEST_MS / 1000
+        self.slow_sample_rate = settings.PERF_SLOW_SAMPLE_RATE
+        self.sample_rate = settings.PERF_SAMPLE_RATE
+        install_crypto_timers()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        stats = RequestStats()
+        token = _current.set(stats)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(stats.db_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._log(request, response, stats, time.perf_counter() - stats.started)
+        return response
+
+    def _log(self, request, response, stats: RequestStats, wall_seconds: float) -> None:
+        slow = wall_seconds >= self.slow_seconds
+        rate = self.slow_sample_rate if slow else self.sample_rate
+        if rate <= 0 or (rate < 1 and random.random() >= rate):
+            return
+        user = getattr(request, "user", None)
+        logger.log(
+            logging.WARNING if slow else logging.INFO,
+            "%s request %s %s",
+            "slow" if slow else "sampled",
+            request.method,
+            request.path,
+            extra={
+                "method": request.method,
+                "path": request.path,
+                "status_code": response.status_code,
+                "user_id": user.pk if user is not None and user.is_authenticated else None,
+                "perf": stats.as_dict(wall_seconds),
+            },
+        )
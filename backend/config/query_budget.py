@@ -0,0 +1,98 @@
+"""
+Per-request ORM query budgets.
+
+Hot endpoints declare how many queries one call may issue::
+
+    @query_budget(40, "forms.generate_all")
+    def generate_all(self, request): ...
+
+``query_budget`` works as a decorator or a ``with`` block and counts the
+queries issued on the default connection while it is open. What happens when
+the count passes the limit depends on QUERY_BUDGET_MODE:
+
+- ``"off"`` (production default): nothing is counted; the wrapper costs one
+  settings lookup.
+- ``"log"`` (staging): a WARNING on the ``dignifi.perf`` logger carrying the
+  budget name, query count and limit.
+- ``"raise"`` (tests): ``QueryBudgetExceeded``, so an N+1 regression fails the
+  test that exercised it.
+
+Whenever counting is on, every exit is recorded in ``observations`` so the
+pytest plugin in ``config.query_budget_plugin`` can report per-endpoint counts.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("dignifi.perf")
+
+MODES = ("off", "log", "raise")
+
+
+class QueryBudgetExceeded(Exception):
+    """Raised in ``raise`` mode when a block issues more queries than its budget."""
+
+    def __init__(self, name: str, queries: int, limit: int):
+        self.name = name
+        self.queries = queries
+        self.limit = limit
+        super().__init__(f"{name} issued {queries} queries (budget {limit})")
+
+
+@dataclass
+class Observation:
+    limit: int
+    counts: list[int] = field(default_factory=list)
+
+
+observations: dict[str, Observation] = {}
+_observations_lock = threading.Lock()
+
+
+def _record(name: str, queries: int, limit: int) -> None:
+    with _observations_lock:
+        entry = observations.setdefault(name, Observation(limit=limit))
+        entry.limit = limit
+        entry.counts.append(queries)
+
+
+def reset_observations() -> None:
+    with _observations_lock:
+        observations.clear()
+
+
+@contextmanager
+def query_budget(limit: int, name: str):
+    """Fail or warn when the enclosed block issues more than ``limit`` queries."""
+    mode = getattr(settings, "QUERY_BUDGET_MODE", "off")
+    if mode == "off":
+        yield
+        return
+
+    queries = 0
+
+    def count(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    with connections["default"].execute_wrapper(count):
+        yield
+
+    _record(name, queries, limit)
+    if queries <= limit:
+        return
+    if mode == "raise":
+        raise QueryBudgetExceeded(name, queries, limit)
+    logger.warning(
+        "query budget exceeded: %s issued %d queries (budget %d)",
+        name,
+        queries,
+        limit,
+        extra={"perf": {"budget": name, "db_queries": queries, "limit": limit}},
+    )
@@ -0,0 +1,27 @@
+"""
+Pytest plugin: per-endpoint query counts observed by ``config.query_budget``.
+
+Registered from ``backend/conftest.py``. After the run it prints, for every
+budget that was exercised, the number of calls, the smallest and largest query
+count seen and the declared limit, so budgets can be tightened (or an N+1
+spotted) without instrumenting views by hand.
+"""
+
+from config.query_budget import observations
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not observations:
+        return
+    terminalreporter.section("query budgets")
+    width = max(len(name) for name in observations)
+    terminalreporter.write_line(
+        f"{'endpoint':<{width}}  {'calls':>5}  {'min':>5}  {'max':>5}  {'budget':>6}"
+    )
+    for name in sorted(observations):
+        entry = observations[name]
+        flag = "  OVER" if max(entry.counts) > entry.limit else ""
+        terminalreporter.write_line(
+            f"{name:<{width}}  {len(entry.counts):>5}  {min(entry.counts):>5}  "
+            f"{max(entry.counts):>5}  {entry.limit:>6}{flag}"
+        )
@@ -76,6 +76,8 @@ MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",  # Static files (must follow SecurityMiddleware)
     "config.logging.RequestIDMiddleware",  # Request-ID correlation (must be early)
+    "config.perf.PerformanceMiddleware",  # Timing; no-op unless PERF_INSTRUMENTATION_ENABLED
+    "config.metrics.MetricsMiddleware",  # Prometheus request latency / query counts
     "corsheaders.middleware.CorsMiddleware",  # Must be before CommonMiddleware
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -183,6 +185,7 @@ SIMPLE_JWT = {
 # CORS Settings
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=["http://localhost:3000"])
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ["X-Estimated-Count"]  # config.pagination, opt-in list totals
 
 # Field Encryption (for PII: SSN, income data, etc.)
 FIELD_ENCRYPTION_KEY = env("FIELD_ENCRYPTION_KEY", default="")
@@ -217,6 +220,40 @@ UPL_PROHIBITED_PHRASES = [
     "based on your situation, file",
 ]
 
+# Audit log write buffer (apps.audit.buffer): middleware entries are
+# bulk-inserted off the request path; UPL-sensitive ones are journaled to the
+# spool directory first so a crash cannot lose them. AUDIT_SPOOL_FSYNC also
+# survives host (not just process) crashes, at one fsync per UPL request.
+AUDIT_BUFFER_ENABLED = env.bool("AUDIT_BUFFER_ENABLED", default=True)
+AUDIT_BUFFER_BATCH_SIZE = 200
+AUDIT_BUFFER_FLUSH_SECONDS = 1.0
+AUDIT_BUFFER_MAX_QUEUE = 10_000
+AUDIT_SPOOL_DIR = env("AUDIT_SPOOL_DIR", default=str(LOGS_DIR / "audit_spool"))
+AUDIT_SPOOL_FSYNC = env.bool("AUDIT_SPOOL_FSYNC", default=False)
+# Cold-storage segments written by export_audit_archive (apps.audit.archive).
+AUDIT_ARCHIVE_DIR = env("AUDIT_ARCHIVE_DIR", default=str(BASE_DIR / "audit_archive"))
+
+# Request performance instrumentation (config.perf). Slow requests are logged
+# at WARNING (sampled at PERF_SLOW_SAMPLE_RATE); PERF_SAMPLE_RATE samples the
+# rest at INFO.
+PERF_INSTRUMENTATION_ENABLED = env.bool("PERF_INSTRUMENTATION_ENABLED", default=False)
+PERF_SLOW_REQUEST_MS = env.int("PERF_SLOW_REQUEST_MS", default=1000)
+PERF_SLOW_SAMPLE_RATE = env.float("PERF_SLOW_SAMPLE_RATE", default=1.0)
+PERF_SAMPLE_RATE = env.float("PERF_SAMPLE_RATE", default=0.0)
+# Per-endpoint query budgets (config.query_budget): "off", "log" (staging) or
+# "raise" (tests).
+QUERY_BUDGET_MODE = env("QUERY_BUDGET_MODE", default="off")
+
+# Prometheus metrics (config.metrics). /metrics/ is open to staff sessions and
+# to scrapers sending "Authorization: Bearer <METRICS_TOKEN>".
+METRICS_ENABLED = env.bool("METRICS_ENABLED", default=True)
+METRICS_TOKEN = env("METRICS_TOKEN", default="")
+METRICS_COUNT_REFRESH_SECONDS = env.int("METRICS_COUNT_REFRESH_SECONDS", default=60)
+
+# Effective-dated means-test tables (apps.eligibility.services.standards). Each
+# worker checks the stored table version at most this often.
+STANDARDS_RELOAD_CHECK_SECONDS = env.int("STANDARDS_RELOAD_CHECK_SECONDS", default=30)
+
 # Plain Language Settings
 PLAIN_LANGUAGE_TARGET_GRADE_LEVEL = 7  # 6th-8th grade (Flesch-Kincaid)
 PLAIN_LANGUAGE_VALIDATION_ENABLED = DEBUG  # Enable in dev for warnings
@@ -234,6 +271,7 @@ TRAUMA_SENSITIVE_TERMS = {
 PDF_GENERATION_BACKEND = "PyPDF2"  # Alternative: 'pdfrw'
 PDF_FORMS_DIRECTORY = BASE_DIR.parent / "data" / "forms" / "pdfs"
 FORM_SCHEMAS_DIRECTORY = BASE_DIR.parent / "data" / "forms" / "schemas"
+DISCHARGEABILITY_RULES_PATH = BASE_DIR.parent / "data" / "dischargeability" / "rules.json"
 PDF_OUTPUT_DIRECTORY = MEDIA_ROOT / "generated_forms"
 
 # ============================================
@@ -256,6 +294,10 @@ DOCUMENT_RETENTION_DAYS = 22
 DOCUMENT_DELETION_WARNING_DAYS = 7
 
 # OCR Processing
+# "gemini" in every real environment; "stub" answers from canned schema examples
+# with no network (benchmarks, load tests, offline development).
+OCR_PROVIDER = env("OCR_PROVIDER", default="gemini")
+OCR_STUB_LATENCY_SECONDS = env.float("OCR_STUB_LATENCY_SECONDS", default=0.0)
 OCR_TIMEOUT_SECONDS = 30  # Synchronous request timeout
 OCR_MAX_RETRIES = 3
 OCR_CONFIDENCE_THRESHOLD_HIGH = 90
@@ -320,6 +362,11 @@ LOGGING = {
             "level": "WARNING",
             "propagate": False,
         },
+        "dignifi.perf": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
 
@@ -4,3 +4,9 @@ from .base import *
 DEBUG = False
 PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 DATABASES["default"] = {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+
+# Tests assert on AuditLog rows inside the request's transaction.
+AUDIT_BUFFER_ENABLED = False
+
+# Endpoints that exceed their declared query budget fail the test.
+QUERY_BUDGET_MODE = "raise"
@@ -0,0 +1,114 @@
+"""Tests for the Prometheus metrics surface."""
+
+from decimal import Decimal
+
+import pytest
+from django.test import Client, override_settings
+from prometheus_client import REGISTRY
+
+from apps.districts.models import District
+from apps.forms.models import GeneratedForm
+from apps.intake.counters import reconcile
+from apps.intake.models import IntakeSession
+from apps.users.models import User
+from config import metrics
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def no_refresher(monkeypatch):
+    # The view starts a per-process refresher thread; keep tests from sharing one.
+    monkeypatch.setattr(metrics, "_refresher", None)
+    monkeypatch.setattr(metrics, "_refresher_pid", None)
+    with override_settings(METRICS_COUNT_REFRESH_SECONDS=3600):
+        yield
+    if metrics._refresher is not None:
+        metrics._refresher.stop()
+
+
+@pytest.fixture
+def session(db):
+    district = District.objects.create(
+        code="ILND",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court",
+        filing_fee_chapter_7=Decimal("338"),
+    )
+    user = User.objects.create_user(username="metrics", password="pw")
+    return IntakeSession.objects.create(user=user, district=district)
+
+
+@pytest.mark.django_db
+def test_metrics_requires_staff_or_token(no_refresher):
+    assert Client().get("/metrics/").status_code == 403
+    with override_settings(METRICS_TOKEN="s3cret"):
+        assert Client().get("/metrics/", HTTP_AUTHORIZATION="Bearer nope").status_code == 403
+        response = Client().get("/metrics/", HTTP_AUTHORIZATION="Bearer s3cret")
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "dignifi_http_request_duration_seconds" in body
+    assert "dignifi_audit_buffer_depth" in body
+
+
+@pytest.mark.django_db
+def test_staff_session_can_scrape(no_refresher):
+    staff = User.objects.create_user(username="ops", password="pw", is_staff=True)
+    client = Client()
+    client.force_login(staff)
+    assert client.get("/metrics/").status_code == 200
+    assert client.get("/metrics/json/").json()["sessions"]["total"] == 0
+
+
+@pytest.mark.django_db
+def test_middleware_observes_latency_and_queries_per_route():
+    labels = {"method": "GET", "route": "health_check", "status": "2xx"}
+    before = _sample("dignifi_http_request_duration_seconds_count", **labels)
+    queries_before = _sample("dignifi_db_queries_per_request_sum", route="health_check")
+
+    Client().get("/health/")
+
+    assert _sample("dignifi_http_request_duration_seconds_count", **labels) == before + 1
+    # health_check runs SELECT 1
+    assert _sample("dignifi_db_queries_per_request_sum", route="health_check") == (
+        queries_before + 1
+    )
+
+
+def test_count_gauges_zero_out_vanished_labels(session):
+    metrics.refresh_counts()
+    assert _sample("dignifi_intake_sessions", status=session.status) == 1
+
+    session.delete()
+    metrics.refresh_counts()
+    assert _sample("dignifi_intake_sessions", status=session.status) == 0
+
+
+def test_count_gauges_read_the_status_counters(session, django_assert_num_queries):
+    GeneratedForm.objects.create(
+        session=session, form_type="form_101", status="generated", form_data={}
+    )
+    IntakeSession.objects.filter(pk=session.pk).update(status="completed")  # no signal
+
+    with django_assert_num_queries(1):
+        metrics.refresh_counts()
+
+    # The counters (not a GROUP BY) are the source until reconciliation.
+    assert _sample("dignifi_intake_sessions", status="started") == 1
+    assert _sample("dignifi_intake_sessions", status="completed") == 0
+    assert _sample("dignifi_generated_forms", form_type="form_101", status="generated") == 1
+
+    reconcile()
+    metrics.refresh_counts()
+    assert _sample("dignifi_intake_sessions", status="completed") == 1
+
+
+def test_multiprocess_directory_is_merged(tmp_path, monkeypatch):
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    payload, content_type = metrics.render_latest()
+    assert payload == b""  # no worker has written to the shared directory yet
+    assert content_type.startswith("text/plain")
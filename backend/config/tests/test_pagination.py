@@ -0,0 +1,96 @@
+"""Tests for keyset pagination and the opt-in estimated count header."""
+
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from apps.districts.models import District
+from apps.forms.models import GeneratedForm
+from apps.intake.models import DebtInfo, IntakeSession
+from apps.users.models import User
+from config.pagination import ESTIMATED_COUNT_HEADER, estimated_count
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def session():
+    district = District.objects.create(
+        code="ILND",
+        name="Northern District of Illinois",
+        state="IL",
+        court_name="U.S. Bankruptcy Court",
+        filing_fee_chapter_7=Decimal("338"),
+    )
+    user = User.objects.create_user(username="pager", password="pw")
+    return IntakeSession.objects.create(user=user, district=district)
+
+
+@pytest.fixture
+def client(session):
+    api = APIClient()
+    api.force_authenticate(user=session.user)
+    return api
+
+
+def _debts(session, n):
+    return [
+        DebtInfo.objects.create(
+            session=session,
+            creditor_name=f"Creditor {i}",
+            amount_owed=Decimal(100 + i),
+            debt_type="credit_card",
+        ).id
+        for i in range(n)
+    ]
+
+
+def _walk(client, url, **params):
+    response = client.get(url, params)
+    ids = [row["id"] for row in response.data["results"]]
+    while response.data["next"]:
+        response = client.get(response.data["next"])
+        ids += [row["id"] for row in response.data["results"]]
+    return ids
+
+
+def test_debts_page_by_id_without_count(client, session):
+    created = _debts(session, 5)
+    response = client.get("/api/intake/debts/", {"page_size": 2})
+    assert set(response.data) == {"next", "previous", "results"}
+    assert ESTIMATED_COUNT_HEADER not in response
+    assert _walk(client, "/api/intake/debts/", page_size=2) == created
+
+
+def test_forms_page_newest_first(client, session):
+    created = [
+        GeneratedForm.objects.create(
+            session=session, form_type=form_type, form_data={}, generated_by=session.user
+        ).id
+        for form_type in ("form_101", "form_106dec", "form_121")
+    ]
+    assert _walk(client, "/api/forms/", page_size=2) == created[::-1]
+
+
+def test_estimated_count_header_is_opt_in_and_cached(client, session, django_assert_num_queries):
+    _debts(session, 3)
+    response = client.get("/api/intake/debts/", {"include_count": "1", "page_size": 1})
+    assert response[ESTIMATED_COUNT_HEADER] == "3"
+
+    _debts(session, 1)
+    response = client.get("/api/intake/debts/", {"include_count": "1", "page_size": 1})
+    assert response[ESTIMATED_COUNT_HEADER] == "3"  # served from cache
+
+    queryset = DebtInfo.objects.filter(session=session)
+    assert estimated_count(queryset) == 4
+    with django_assert_num_queries(0):
+        assert estimated_count(queryset) == 4
@@ -0,0 +1,117 @@
+"""Tests for request performance instrumentation."""
+
+import json
+import logging
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+
+from config import perf
+from config.logging import JSONFormatter
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def perf_records():
+    # dignifi.perf does not propagate, so caplog's root handler never sees it.
+    logger = logging.getLogger("dignifi.perf")
+    handler = _ListHandler()
+    logger.addHandler(handler)
+    yield handler.records
+    logger.removeHandler(handler)
+
+
+def _enabled(**overrides):
+    values = {
+        "PERF_INSTRUMENTATION_ENABLED": True,
+        "PERF_SLOW_REQUEST_MS": 10_000,
+        "PERF_SLOW_SAMPLE_RATE": 1.0,
+        "PERF_SAMPLE_RATE": 1.0,
+    }
+    values.update(overrides)
+    return override_settings(**values)
+
+
+def test_spans_are_noops_outside_a_measured_request():
+    assert perf.current_stats() is None
+    with perf.span("anything"):
+        pass
+    assert perf.timed("x")(lambda: 42)() == 42
+
+
+def test_middleware_removes_itself_when_disabled():
+    with override_settings(PERF_INSTRUMENTATION_ENABLED=False):
+        with pytest.raises(MiddlewareNotUsed):
+            perf.PerformanceMiddleware(lambda request: HttpResponse())
+
+
+@pytest.mark.django_db
+def test_middleware_records_db_crypto_and_spans(perf_records):
+    from encrypted_model_fields import fields
+
+    @perf.timed("generator")
+    def generate():
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.execute("SELECT 2")
+        fields.decrypt_str(fields.encrypt_str("123-45-6789").decode())
+
+    def view(request):
+        generate()
+        with perf.span("pdf_fill"):
+            pass
+        return HttpResponse(status=201)
+
+    with _enabled():
+        middleware = perf.PerformanceMiddleware(view)
+        response = middleware(RequestFactory().get("/api/forms/"))
+
+    assert response.status_code == 201
+    assert perf.current_stats() is None
+    (record,) = perf_records
+    assert record.levelno == logging.INFO
+    assert record.status_code == 201
+    stats = record.perf
+    assert stats["db_queries"] == 2
+    assert stats["crypto_calls"] == 2
+    assert stats["spans"]["generator"]["count"] == 1
+    assert stats["spans"]["pdf_fill"]["count"] == 1
+    assert stats["wall_ms"] >= stats["spans"]["generator"]["ms"]
+
+    line = json.loads(JSONFormatter().format(record))
+    assert line["perf"]["db_queries"] == 2
+    assert line["path"] == "/api/forms/"
+
+
+def test_fast_requests_are_not_logged_unless_sampled(perf_records):
+    with _enabled(PERF_SAMPLE_RATE=0.0):
+        perf.PerformanceMiddleware(lambda request: HttpResponse())(RequestFactory().get("/"))
+    assert perf_records == []
+
+
+def test_slow_requests_log_a_warning(perf_records):
+    with _enabled(PERF_SLOW_REQUEST_MS=0, PERF_SAMPLE_RATE=0.0):
+        perf.PerformanceMiddleware(lambda request: HttpResponse())(RequestFactory().get("/"))
+    (record,) = perf_records
+    assert record.levelno == logging.WARNING
+    assert record.getMessage() == "slow request GET /"
+
+
+@pytest.mark.django_db
+def test_perf_line_carries_the_request_id(perf_records):
+    with _enabled():
+        response = Client().get("/health/", HTTP_X_REQUEST_ID="req-123")
+    assert response["X-Request-ID"] == "req-123"
+    (record,) = [r for r in perf_records if r.path == "/health/"]
+    assert json.loads(JSONFormatter().format(record))["request_id"] == "req-123"
@@ -0,0 +1,113 @@
+"""Hot endpoints stay within their query budgets for every demo persona."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from apps.documents.models import DocumentType
+from apps.forms.models import GeneratedForm
+from apps.intake.management.commands.seed_demo_data import PERSONAS
+from apps.intake.models import IntakeSession
+from config.query_budget import QueryBudgetExceeded, observations, query_budget
+
+
+@pytest.fixture
+def persona_session(request, db):
+    call_command("loaddata", "ilnd_2025_data", verbosity=0)
+    call_command("seed_demo_data", persona=request.param, stdout=MagicMock())
+    session = IntakeSession.objects.select_related("user").get(
+        user__username=f"demo_{request.param}"
+    )
+    client = APIClient()
+    client.force_authenticate(user=session.user)
+    return client, session
+
+
+personas = pytest.mark.parametrize("persona_session", sorted(PERSONAS), indirect=True)
+
+
+@personas
+def test_summary(persona_session):
+    client, session = persona_session
+    response = client.get(f"/api/intake/sessions/{session.pk}/summary/")
+    assert response.status_code == 200
+
+
+@personas
+def test_bulk_answers(persona_session):
+    client, session = persona_session
+    answers = [
+        {"form_type": "form_107", "binding": f"answer:form_107.q{i}", "value": str(i)}
+        for i in range(10)
+    ]
+    answers.append({"form_type": "form_107", "binding": "sofa.has_business", "value": "False"})
+    response = client.post(
+        f"/api/intake/sessions/{session.pk}/answers/bulk/", {"answers": answers}, format="json"
+    )
+    assert response.status_code == 200
+
+
+@personas
+def test_preview(persona_session):
+    client, session = persona_session
+    response = client.post(
+        "/api/forms/preview/", {"session_id": session.pk, "form_type": "form_101"}, format="json"
+    )
+    assert response.status_code == 200
+
+
+@personas
+def test_generate_all_then_download(persona_session):
+    client, session = persona_session
+    response = client.post("/api/forms/generate_all/", {"session_id": session.pk}, format="json")
+    assert response.status_code == 200
+
+    form = GeneratedForm.objects.get(session=session, form_type="form_101")
+    response = client.get(f"/api/forms/{form.pk}/download/")
+    assert response.status_code == 200
+
+
+@personas
+def test_upload(persona_session, settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    client, session = persona_session
+    pdf = SimpleUploadedFile("bill.pdf", b"%PDF-1.4 fake", content_type="application/pdf")
+    with patch("apps.documents.views.ThreadPoolExecutor"):
+        response = client.post(
+            "/api/documents/upload/",
+            {"file": pdf, "document_type": DocumentType.CREDITOR_BILL, "session_id": session.pk},
+            format="multipart",
+        )
+    assert response.status_code == 202
+
+
+@pytest.mark.django_db
+def test_budget_raises_when_exceeded():
+    with pytest.raises(QueryBudgetExceeded) as exc:
+        with query_budget(1, "test.over"):
+            IntakeSession.objects.count()
+            IntakeSession.objects.count()
+    assert (exc.value.queries, exc.value.limit) == (2, 1)
+    assert observations.pop("test.over").counts == [2]
+
+
+@pytest.mark.django_db
+def test_budget_logs_in_log_mode():
+    with override_settings(QUERY_BUDGET_MODE="log"):
+        with patch("config.query_budget.logger") as logger:
+            with query_budget(0, "test.log"):
+                IntakeSession.objects.count()
+    logger.warning.assert_called_once()
+    observations.pop("test.log")
+
+
+@pytest.mark.django_db
+def test_budget_off_counts_nothing():
+    with override_settings(QUERY_BUDGET_MODE="off"):
+        with query_budget(0, "test.off"):
+            IntakeSession.objects.count()
+    assert "test.off" not in observations
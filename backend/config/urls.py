@@ -4,7 +4,7 @@ from django.views.generic import TemplateView
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .views import health_check, health_check_detailed, metrics
+from .views import health_check, health_check_detailed, metrics, metrics_json
 
 
 class ThrottledTokenObtainView(TokenObtainPairView):
@@ -26,6 +26,7 @@ urlpatterns = [
     path("health/", health_check, name="health_check"),
     path("health/detailed/", health_check_detailed, name="health_check_detailed"),
     path("metrics/", metrics, name="metrics"),
+    path("metrics/json/", metrics_json, name="metrics_json"),
     path("api/token/obtain/", ThrottledTokenObtainView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", ThrottledTokenRefreshView.as_view(), name="token_refresh"),
     path("api/users/", include("apps.users.urls")),
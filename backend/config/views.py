@@ -2,9 +2,11 @@
 Health check and metrics views for DigniFi.
 
 Provides liveness (/health/), detailed readiness (/health/detailed/),
-and admin-only metrics (/metrics/) endpoints.
+Prometheus metrics (/metrics/) and an admin-only JSON snapshot
+(/metrics/json/).
 """
 
+import hmac
 import shutil
 import time
 from functools import reduce
@@ -13,8 +15,7 @@ from pathlib import Path
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
 from django.db import connection
-from django.db.models import Count
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 
 # Module-level start time — captured once when the process loads.
 _START_TIME = time.monotonic()
@@ -96,14 +97,10 @@ def health_check_detailed(request):
 
 
 def _collect_session_metrics() -> dict:
-    """Aggregate intake session counts by status."""
-    from apps.intake.models import IntakeSession
+    """Intake session counts by status (signal-maintained StatusCounter rows)."""
+    from apps.intake.counters import SESSION_STATUS, read
 
-    counts = dict(
-        IntakeSession.objects.values_list("status")
-        .annotate(count=Count("id"))
-        .values_list("status", "count")
-    )
+    counts = read(SESSION_STATUS)[SESSION_STATUS]
     return {
         "active": counts.get("started", 0) + counts.get("in_progress", 0),
         "completed": counts.get("completed", 0),
@@ -113,19 +110,12 @@ def _collect_session_metrics() -> dict:
 
 
 def _collect_form_metrics() -> dict:
-    """Aggregate generated form counts by type and status."""
-    from apps.forms.models import GeneratedForm
+    """Generated form counts by type and status (signal-maintained StatusCounter rows)."""
+    from apps.intake.counters import FORM_STATUS, FORM_TYPE, read
 
-    by_type = dict(
-        GeneratedForm.objects.values_list("form_type")
-        .annotate(count=Count("id"))
-        .values_list("form_type", "count")
-    )
-    by_status = dict(
-        GeneratedForm.objects.values_list("status")
-        .annotate(count=Count("id"))
-        .values_list("status", "count")
-    )
+    counts = read(FORM_TYPE, FORM_STATUS)
+    by_type = {key: n for key, n in counts[FORM_TYPE].items() if n}
+    by_status = {key: n for key, n in counts[FORM_STATUS].items() if n}
     return {
         "by_type": by_type,
         "by_status": by_status,
@@ -133,14 +123,42 @@ def _collect_form_metrics() -> dict:
     }
 
 
-@staff_member_required
+def _collect_audit_buffer_metrics() -> dict:
+    """Buffered audit writer: queue depth, flush latency, spooled/dropped counts."""
+    from apps.audit.buffer import audit_buffer_metrics
+
+    return audit_buffer_metrics()
+
+
+def _metrics_authorized(request) -> bool:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated and user.is_staff:
+        return True
+    token = settings.METRICS_TOKEN
+    header = request.META.get("HTTP_AUTHORIZATION", "")
+    return bool(token) and hmac.compare_digest(header, f"Bearer {token}")
+
+
 def metrics(request):
-    """Admin-only metrics: sessions, forms, uptime."""
+    """Prometheus exposition for staff or a scraper holding METRICS_TOKEN."""
+    if not _metrics_authorized(request):
+        return HttpResponse(status=403)
+    from config.metrics import ensure_count_refresher, render_latest
+
+    ensure_count_refresher()
+    payload, content_type = render_latest()
+    return HttpResponse(payload, content_type=content_type)
+
+
+@staff_member_required
+def metrics_json(request):
+    """Admin-only metrics: sessions, forms, audit buffer, uptime."""
     return JsonResponse(
         {
             "version": VERSION,
             "uptime": _check_uptime(),
             "sessions": _collect_session_metrics(),
             "forms": _collect_form_metrics(),
+            "audit_buffer": _collect_audit_buffer_metrics(),
         }
     )
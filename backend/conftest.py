@@ -1,8 +1,12 @@
 import django
+import pytest
 from django.conf import settings
 
 # Configure Django settings for pytest
-django_settings_module = 'config.settings.test'
+django_settings_module = "config.settings.test"
+
+# Per-endpoint query counts in the terminal summary (config.query_budget).
+pytest_plugins = ["config.query_budget_plugin"]
 
 # Standalone manual test scripts — not pytest tests.
 collect_ignore = [
@@ -15,3 +19,19 @@ collect_ignore = [
 def pytest_configure():
     settings.DJANGO_SETTINGS_MODULE = django_settings_module
     django.setup()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_standards_catalog():
+    """Each test's database starts over, so the process-wide tables must too."""
+    from apps.eligibility.services import standards
+
+    standards.invalidate()
+    yield
+    standards.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings, tmp_path_factory):
+    """Uploads saved by any test go to a temporary directory, not backend/media/."""
+    settings.MEDIA_ROOT = str(tmp_path_factory.mktemp("media"))
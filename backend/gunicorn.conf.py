@@ -0,0 +1,36 @@
+"""
+Gunicorn settings shared by every deployment.
+
+Gunicorn loads ./gunicorn.conf.py automatically; command-line flags (bind,
+workers, timeout) still take precedence. The hooks here give
+prometheus_client a fresh shared directory so /metrics/ aggregates all
+workers (see config.metrics), and load the means-test tables in each worker
+before it takes requests.
+"""
+
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/dignifi-prometheus")
+
+
+def on_starting(server):
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def post_worker_init(worker):
+    from apps.eligibility.services.standards import warm
+
+    try:
+        warm()
+    except Exception:
+        # The catalog loads lazily on first use instead; never keep a worker down.
+        worker.log.exception("Could not preload the standards catalog")
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,31 @@
+#!/bin/sh
+# Periodic maintenance jobs.
+#
+# Runs as the `scheduler` service in docker-compose.prod.yml and the
+# `scheduler` process in heroku.yml: one long-lived loop, so no cron daemon or
+# scheduler add-on is needed. A failing job is logged and retried on the next
+# pass; it never stops the loop.
+#
+#   hourly  reconcile_status_counters  drift in the metrics status counters
+#   daily   purge_extraction_cache     cached OCR extractions past retention
+#   daily   maintain_audit_partitions  upcoming audit_logs months, expired ones pruned
+
+set -u
+
+DAY=86400
+last_daily=0
+
+run() {
+    python manage.py "$@" || echo "scheduler: '$*' failed" >&2
+}
+
+while true; do
+    now=$(date +%s)
+    run reconcile_status_counters
+    if [ $((now - last_daily)) -ge "$DAY" ]; then
+        run purge_extraction_cache
+        run maintain_audit_partitions
+        last_daily=$now
+    fi
+    sleep "${SCHEDULER_INTERVAL_SECONDS:-3600}"
+done
@@ -406,12 +406,19 @@ export interface GenerateAllFormsResponse {
 }
 
 export interface SessionSummaryResponse {
-  session: IntakeSession;
+  // Session fields only; nested intake data comes from getSession.
+  session: Omit<IntakeSession, 'updated_at'> & { district_name: string };
   progress: {
     current_step: number;
     status: string;
     completion_percentage: number;
   };
+  financial: {
+    asset_count: number;
+    debt_count: number;
+    total_asset_value: string; // decimal string
+    total_debt_amount: string; // decimal string
+  };
   means_test?: {
     passes: boolean;
     qualifies_fee_waiver: boolean;
@@ -420,6 +427,9 @@ export interface SessionSummaryResponse {
     generated_count: number;
     forms: Array<{ form_type: string; status: string }>;
   };
+  documents: {
+    ocr_pending: number; // uploads whose OCR is pending or processing
+  };
 }
 
 // ============================================================================